@@ -21,7 +21,7 @@ Hot-Swap Architecture (v1.2.0):
 """
 
 # Sales adapter system (hot-swap mock/live)
-from .sales.protocol import VendorAdapter, AdapterMode, AdapterConfig
+from .sales.protocol import VendorAdapter, AsyncVendorAdapter, AdapterMode, AdapterConfig
 from .sales.factory import (
     create_adapter,
     get_adapter_status,
@@ -30,10 +30,12 @@ from .sales.factory import (
     create_hubspot_adapter,
 )
 from .sales.mock_adapter import MockAdapter
+from .sales.async_adapter import AsyncAdapter, FanOutResult, as_async, fan_out
 
 __all__ = [
     # Protocol types
     "VendorAdapter",
+    "AsyncVendorAdapter",
     "AdapterMode",
     "AdapterConfig",
     
@@ -48,4 +50,10 @@ __all__ = [
     
     # Base implementations
     "MockAdapter",
+    
+    # Async adapters and multi-vendor fan-out
+    "AsyncAdapter",
+    "FanOutResult",
+    "as_async",
+    "fan_out",
 ]
@@ -0,0 +1,314 @@
+"""
+Async adapters and concurrent multi-vendor fan-out.
+
+Vendor adapters are synchronous (SafeClient). AsyncAdapter exposes any
+VendorAdapter through the AsyncVendorAdapter protocol by running its calls
+on a shared, bounded worker pool, so calls to different vendors overlap
+instead of running one after another.
+
+fan_out() queries N vendors for M keys (account IDs, domains, ...) at once:
+- Per-vendor concurrency caps (protects vendor rate limits); a slot is
+  held until the worker thread finishes, so calls abandoned at a deadline
+  still count against the vendor until they actually return
+- A deadline for the whole fan-out
+- Partial results: whatever finished before the deadline is returned,
+  with errors and timeouts reported per vendor/key
+
+Latency of a multi-source enrichment becomes the slowest vendor's latency
+rather than the sum of all vendors' latencies.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+from .protocol import AdapterMode, AsyncVendorAdapter, VendorAdapter
+
+
+# Worker threads shared by all async adapters (upper bound on in-flight vendor calls)
+MAX_WORKERS = int(os.getenv("SALES_ADAPTER_MAX_WORKERS", "32"))
+
+# Default fan-out limits
+DEFAULT_VENDOR_CONCURRENCY = int(os.getenv("SALES_FANOUT_VENDOR_CONCURRENCY", "4"))
+DEFAULT_DEADLINE_SECONDS = float(os.getenv("SALES_FANOUT_DEADLINE_SECONDS", "15"))
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+# vendor -> worker-pool calls still running after their fan-out stopped waiting for them
+_abandoned: Dict[str, Set[Future]] = {}
+_abandoned_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Shared worker pool for adapter calls (created on first use)."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="sales-adapter")
+    return _executor
+
+
+class AsyncAdapter:
+    """
+    AsyncVendorAdapter over a synchronous VendorAdapter.
+
+    Usage:
+        adapter = AsyncAdapter(create_adapter("clearbit"))
+        contacts = await adapter.fetch_contacts("acme.com")
+        company = await adapter.call("enrich_company", "acme.com")
+    """
+
+    def __init__(self, adapter: VendorAdapter, vendor: Optional[str] = None):
+        """
+        Args:
+            adapter: Synchronous vendor adapter
+            vendor: Vendor name (defaults to adapter.vendor or the class name)
+        """
+        self.adapter = adapter
+        self.vendor = vendor or getattr(adapter, "vendor", None) or type(adapter).__name__
+
+    async def call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Run any adapter method on the shared worker pool."""
+        return await asyncio.wrap_future(self.submit(method, *args, **kwargs))
+
+    def submit(self, method: str, *args: Any, **kwargs: Any) -> Future:
+        """Schedule an adapter method on the shared worker pool and return its future."""
+        func = getattr(self.adapter, method, None)
+        if func is None:
+            raise NotImplementedError(f"{self.vendor} adapter does not support {method}()")
+        return _get_executor().submit(partial(func, *args, **kwargs))
+
+    async def fetch_accounts(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Fetch accounts matching filters"""
+        return await self.call("fetch_accounts", filters)
+
+    async def fetch_contacts(self, account_id: str) -> List[Dict[str, Any]]:
+        """Fetch contacts for account"""
+        return await self.call("fetch_contacts", account_id)
+
+    async def fetch_opportunities(self, account_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Fetch opportunities (all or for specific account)"""
+        return await self.call("fetch_opportunities", account_id)
+
+    def get_mode(self) -> AdapterMode:
+        """Get current adapter mode"""
+        return self.adapter.get_mode()
+
+    async def validate_connection(self) -> bool:
+        """Test connection (returns True for mock mode)"""
+        return await self.call("validate_connection")
+
+
+def as_async(adapter: Union[VendorAdapter, AsyncVendorAdapter], vendor: Optional[str] = None) -> AsyncVendorAdapter:
+    """Return adapter as an AsyncVendorAdapter (wrapping synchronous adapters)."""
+    if asyncio.iscoroutinefunction(getattr(adapter, "fetch_accounts", None)):
+        return adapter
+    return AsyncAdapter(adapter, vendor=vendor)
+
+
+@dataclass
+class FanOutResult:
+    """
+    Outcome of a multi-vendor fan-out.
+
+    Attributes:
+        results: vendor -> key -> method result (only successful calls)
+        errors: vendor -> key -> error message
+        timed_out: (vendor, key) pairs that missed the deadline
+        elapsed_seconds: Wall-clock duration of the fan-out
+    """
+    results: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    errors: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    timed_out: List[Tuple[str, str]] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def complete(self) -> bool:
+        """True if every vendor answered for every key."""
+        return not self.errors and not self.timed_out
+
+    def for_key(self, key: str) -> Dict[str, Any]:
+        """Results of all vendors that answered for key."""
+        return {vendor: by_key[key] for vendor, by_key in self.results.items() if key in by_key}
+
+
+async def fan_out(
+    adapters: Mapping[str, Union[VendorAdapter, AsyncVendorAdapter]],
+    method: str,
+    keys: Iterable[str],
+    *,
+    concurrency: Union[int, Mapping[str, int]] = DEFAULT_VENDOR_CONCURRENCY,
+    deadline: Optional[float] = DEFAULT_DEADLINE_SECONDS,
+    trace_id: Optional[str] = None,
+    **kwargs: Any,
+) -> FanOutResult:
+    """
+    Call method(key, **kwargs) on every vendor for every key concurrently.
+
+    Args:
+        adapters: Vendor name -> adapter (sync adapters are wrapped with AsyncAdapter)
+        method: Adapter method, e.g. "fetch_contacts" or "enrich_company"
+        keys: Account IDs / domains / emails passed as the first argument
+        concurrency: Max in-flight calls per vendor (int for all, or per vendor)
+        deadline: Seconds until unfinished calls are abandoned (None waits for all)
+        trace_id: Optional trace ID for observability
+        **kwargs: Extra keyword arguments for method
+
+    Returns:
+        FanOutResult with partial results, errors and timeouts
+
+    Example:
+        >>> result = await fan_out(
+        ...     {"clearbit": clearbit, "zoominfo": zoominfo},
+        ...     "enrich_company",
+        ...     ["acme.com", "globex.com"],
+        ...     concurrency={"zoominfo": 2},
+        ...     deadline=5.0,
+        ... )
+        >>> result.for_key("acme.com")
+    """
+    started = time.monotonic()
+    keys = list(dict.fromkeys(keys))
+    result = FanOutResult()
+    tasks: Dict[asyncio.Task, Tuple[str, str]] = {}
+    holders: List[asyncio.Task] = []
+
+    for vendor, adapter in adapters.items():
+        async_adapter = as_async(adapter, vendor=vendor)
+        limit = concurrency.get(vendor, DEFAULT_VENDOR_CONCURRENCY) if isinstance(concurrency, Mapping) else concurrency
+        semaphore = asyncio.Semaphore(max(1, limit))
+        result.results[vendor] = {}
+        # Calls an earlier fan-out abandoned are still hitting the vendor; they take slots first
+        for future in _abandoned_calls(vendor):
+            holders.append(asyncio.create_task(_hold_slot(semaphore, future)))
+        for key in keys:
+            task = asyncio.create_task(_limited_call(semaphore, vendor, async_adapter, method, key, kwargs))
+            tasks[task] = (vendor, key)
+
+    if not tasks:
+        return result
+
+    try:
+        done, pending = await asyncio.wait(tasks, timeout=deadline)
+    finally:
+        for holder in holders:
+            holder.cancel()
+
+    for task in pending:
+        task.cancel()
+        result.timed_out.append(tasks[task])
+    result.timed_out.sort()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    for task in done:
+        vendor, key = tasks[task]
+        exc = task.exception()
+        if exc is None:
+            result.results[vendor][key] = task.result()
+        else:
+            result.errors.setdefault(vendor, {})[key] = f"{type(exc).__name__}: {exc}"
+
+    result.elapsed_seconds = time.monotonic() - started
+    _emit_fan_out_event(method, result, len(adapters), len(keys), trace_id)
+    return result
+
+
+async def _limited_call(
+    semaphore: asyncio.Semaphore,
+    vendor: str,
+    adapter: AsyncVendorAdapter,
+    method: str,
+    key: str,
+    kwargs: Dict[str, Any],
+) -> Any:
+    if not isinstance(adapter, AsyncAdapter):
+        async with semaphore:
+            func = getattr(adapter, method, None)
+            if func is None:
+                raise NotImplementedError(f"adapter does not support {method}()")
+            return await func(key, **kwargs)
+
+    await semaphore.acquire()
+    try:
+        future = adapter.submit(method, key, **kwargs)
+    except BaseException:
+        semaphore.release()
+        raise
+    # Cancelling this task cannot stop a running worker thread (e.g. a rate-limit
+    # back-off), so the slot is released when the thread finishes, not on cancel
+    loop = asyncio.get_running_loop()
+    future.add_done_callback(lambda _: _release_soon(loop, semaphore))
+    try:
+        return await asyncio.wrap_future(future)
+    except asyncio.CancelledError:
+        if not future.done():
+            _abandon(vendor, future)
+        raise
+
+
+def _release_soon(loop: asyncio.AbstractEventLoop, semaphore: asyncio.Semaphore) -> None:
+    """Release semaphore on its loop from a worker thread."""
+    try:
+        loop.call_soon_threadsafe(semaphore.release)
+    except RuntimeError:
+        pass  # Loop already closed; nothing is waiting for the slot
+
+
+def _abandon(vendor: str, future: Future) -> None:
+    """Track a running call nobody waits for until its worker thread finishes."""
+    with _abandoned_lock:
+        _abandoned.setdefault(vendor, set()).add(future)
+    future.add_done_callback(partial(_forget_abandoned, vendor))
+
+
+def _forget_abandoned(vendor: str, future: Future) -> None:
+    with _abandoned_lock:
+        _abandoned.get(vendor, set()).discard(future)
+
+
+def _abandoned_calls(vendor: str) -> List[Future]:
+    with _abandoned_lock:
+        return list(_abandoned.get(vendor, ()))
+
+
+async def _hold_slot(semaphore: asyncio.Semaphore, future: Future) -> None:
+    """Occupy one vendor slot until an abandoned call's worker thread finishes."""
+    async with semaphore:
+        try:
+            await asyncio.wrap_future(future)
+        except Exception:
+            pass  # Its result was already given up on
+
+
+def _emit_fan_out_event(
+    method: str,
+    result: FanOutResult,
+    vendor_count: int,
+    key_count: int,
+    trace_id: Optional[str],
+) -> None:
+    """Emit observability event (if collector available)."""
+    try:
+        from cuga.observability import emit_event
+        from cuga.observability.events import StructuredEvent, EventType
+
+        emit_event(StructuredEvent(
+            event_type=EventType.TOOL_CALL_COMPLETE,
+            trace_id=trace_id or "unknown",
+            attributes={
+                "tool_name": f"adapter_fan_out.{method}",
+                "vendors": vendor_count,
+                "keys": key_count,
+                "errors": sum(len(errors) for errors in result.errors.values()),
+                "timed_out": len(result.timed_out),
+            },
+            duration_ms=result.elapsed_seconds * 1000,
+            status="success" if result.complete else "warning",
+        ))
+    except ImportError:
+        pass  # Observability not available
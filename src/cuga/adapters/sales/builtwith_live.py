@@ -15,6 +15,7 @@ from typing import Dict, List, Optional, Any
 import httpx
 from cuga.adapters.sales.protocol import VendorAdapter, AdapterMode, AdapterConfig
 from cuga.security.http_client import SafeClient
+from cuga.adapters.sales.response_cache import cached_client
 from cuga.observability import emit_event
 
 
@@ -46,13 +47,13 @@ class BuiltWithLiveAdapter(VendorAdapter):
         self._validate_config()
         
         # Initialize HTTP client (API key passed as query param)
-        self.client = SafeClient(
+        self.client = cached_client(SafeClient(
             base_url="https://api.builtwith.com",
             headers={
                 "Content-Type": "application/json"
             },
             timeout=httpx.Timeout(connect=5.0, read=10.0, write=10.0, pool=10.0)
-        )
+        ), vendor="builtwith", credential=config.credentials['api_key'])
         
         self.api_key = config.credentials['api_key']
         
@@ -88,7 +89,7 @@ class BuiltWithLiveAdapter(VendorAdapter):
             response = self.client.get("/v21/api.json", params={
                 "KEY": self.api_key,
                 "LOOKUP": "example.com"
-            })
+            }, headers={"Cache-Control": "no-cache"})
             success = response.status_code == 200
             
             self._emit_event('connection_validated', {
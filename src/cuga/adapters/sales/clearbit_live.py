@@ -28,6 +28,7 @@ import httpx
 from cuga.adapters.sales.protocol import VendorAdapter, AdapterMode
 from cuga.adapters.sales.config import AdapterConfig
 from cuga.security.http_client import SafeClient
+from cuga.adapters.sales.response_cache import cached_client
 from cuga.observability import emit_event
 
 logger = logging.getLogger(__name__)
@@ -61,19 +62,19 @@ class ClearbitLiveAdapter(VendorAdapter):
         # Clearbit uses Basic auth with API key as username (password empty)
         api_key = config.credentials.get("api_key", "")
         
-        # SafeClient with enforced timeouts and retry
-        self.client = SafeClient(
+        # SafeClient with enforced timeouts and retry (enrichment reads cached)
+        self.client = cached_client(SafeClient(
             base_url="https://company.clearbit.com",
             auth=(api_key, ""),  # Basic auth: (username=api_key, password="")
             timeout=httpx.Timeout(connect=5.0, read=10.0, write=5.0, pool=10.0),
-        )
+        ), vendor="clearbit", credential=api_key)
         
         # Separate client for Person API (different base URL)
-        self.person_client = SafeClient(
+        self.person_client = cached_client(SafeClient(
             base_url="https://person.clearbit.com",
             auth=(api_key, ""),
             timeout=httpx.Timeout(connect=5.0, read=10.0, write=5.0, pool=10.0),
-        )
+        ), vendor="clearbit", credential=api_key)
         
         logger.info(f"ClearbitLiveAdapter initialized for profile: {config.profile}")
         self._emit_event("adapter_initialized", {"vendor": "clearbit", "mode": "live"})
@@ -111,6 +112,7 @@ class ClearbitLiveAdapter(VendorAdapter):
             response = self.client.get(
                 "/v2/companies/find",
                 params={"domain": "clearbit.com"},
+                headers={"Cache-Control": "no-cache"},
             )
             
             if response.status_code == 200:
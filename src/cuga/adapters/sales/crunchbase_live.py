@@ -16,6 +16,7 @@ from typing import Dict, List, Optional, Any
 import httpx
 from cuga.adapters.sales.protocol import VendorAdapter, AdapterMode, AdapterConfig
 from cuga.security.http_client import SafeClient
+from cuga.adapters.sales.response_cache import cached_client
 from cuga.observability import emit_event
 
 
@@ -47,14 +48,14 @@ class CrunchbaseLiveAdapter(VendorAdapter):
         self._validate_config()
         
         # Initialize HTTP client
-        self.client = SafeClient(
+        self.client = cached_client(SafeClient(
             base_url="https://api.crunchbase.com/api/v4",
             headers={
                 "X-cb-user-key": config.credentials['api_key'],
                 "Content-Type": "application/json"
             },
             timeout=httpx.Timeout(connect=5.0, read=10.0, write=10.0, pool=10.0)
-        )
+        ), vendor="crunchbase", credential=config.credentials['api_key'])
         
         # Emit initialization event
         self._emit_event('adapter_initialized', {
@@ -87,7 +88,7 @@ class CrunchbaseLiveAdapter(VendorAdapter):
             # Test API connection with simple search
             response = self.client.get("/searches/organizations", params={
                 "limit": 1
-            })
+            }, headers={"Cache-Control": "no-cache"})
             success = response.status_code == 200
             
             self._emit_event('connection_validated', {
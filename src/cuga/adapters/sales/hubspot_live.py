@@ -8,6 +8,7 @@ This adapter provides:
 - Activity-based buying signals
 - Custom property support
 - Pagination handling
+- Batch reads (no per-record lookups) with Retry-After aware throttling
 
 API Documentation: https://developers.hubspot.com/docs/api/crm/
 
@@ -16,7 +17,10 @@ Rate Limits: 100 requests per 10 seconds (per API key)
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
 from datetime import datetime, timedelta
 
 import httpx
@@ -28,6 +32,25 @@ from cuga.observability import emit_event
 
 logger = logging.getLogger(__name__)
 
+# HubSpot API maxima per batch request
+BATCH_READ_SIZE = 100           # /crm/v3/objects/{type}/batch/read inputs
+ASSOCIATION_BATCH_SIZE = 1000   # /crm/v4/associations/{from}/{to}/batch/read inputs
+
+# Concurrent batch requests for multi-account loads (rate limit: 100 requests / 10s)
+MAX_CONCURRENT_REQUESTS = 4
+
+# 429 handling: wait Retry-After (capped) and retry this many times before failing
+RATE_LIMIT_RETRIES = 3
+MAX_RETRY_AFTER_SECONDS = 30.0
+
+CONTACT_PROPERTIES = [
+    "email", "firstname", "lastname", "jobtitle", "company", "phone", "city", "state", "country",
+]
+
+DEAL_PROPERTIES = [
+    "dealname", "amount", "dealstage", "pipeline", "closedate", "createdate", "hs_lastmodifieddate",
+]
+
 
 class HubSpotLiveAdapter(VendorAdapter):
     """
@@ -39,6 +62,7 @@ class HubSpotLiveAdapter(VendorAdapter):
     - Deals (opportunities) with stages
     - Activity tracking (tasks, meetings, calls)
     - Pagination support (100 records per page)
+    - Batch reads for contacts/deals, across many companies at once
     - Buying signals derived from deal stage changes
     """
 
@@ -64,6 +88,10 @@ class HubSpotLiveAdapter(VendorAdapter):
             timeout=httpx.Timeout(connect=5.0, read=10.0, write=5.0, pool=10.0),
         )
         
+        # Shared 429 back-off: every worker waits until this monotonic time
+        self._rate_limit_lock = threading.Lock()
+        self._rate_limited_until = 0.0
+        
         logger.info(f"HubSpotLiveAdapter initialized for profile: {config.profile}")
         self._emit_event("adapter_initialized", {"vendor": "hubspot", "mode": "live"})
 
@@ -203,7 +231,8 @@ class HubSpotLiveAdapter(VendorAdapter):
             self._emit_event("fetch_contacts_start", {"account_id": account_id, "limit": limit})
             
             # Fetch associated contacts
-            response = self.client.get(
+            response = self._request(
+                "get",
                 f"/crm/v3/objects/companies/{account_id}/associations/contacts",
                 params={"limit": min(limit, 100)},
             )
@@ -216,19 +245,9 @@ class HubSpotLiveAdapter(VendorAdapter):
             response.raise_for_status()
             associations = response.json().get("results", [])
             
-            # Fetch full contact details
-            contacts = []
-            for assoc in associations[:limit]:
-                contact_id = assoc.get("id")
-                if contact_id:
-                    contact_response = self.client.get(
-                        f"/crm/v3/objects/contacts/{contact_id}",
-                        params={
-                            "properties": "email,firstname,lastname,jobtitle,company,phone,city,state,country"
-                        },
-                    )
-                    if contact_response.status_code == 200:
-                        contacts.append(contact_response.json())
+            # Fetch full contact details (one batch request per 100 contacts)
+            contact_ids = [assoc["id"] for assoc in associations[:limit] if assoc.get("id")]
+            contacts = self._batch_read("contacts", contact_ids, CONTACT_PROPERTIES)
             
             # Normalize to canonical schema
             normalized = [self._normalize_contact(contact) for contact in contacts]
@@ -259,7 +278,8 @@ class HubSpotLiveAdapter(VendorAdapter):
             self._emit_event("fetch_opportunities_start", {"account_id": account_id, "limit": limit})
             
             # Fetch associated deals
-            response = self.client.get(
+            response = self._request(
+                "get",
                 f"/crm/v3/objects/companies/{account_id}/associations/deals",
                 params={"limit": min(limit, 100)},
             )
@@ -272,19 +292,9 @@ class HubSpotLiveAdapter(VendorAdapter):
             response.raise_for_status()
             associations = response.json().get("results", [])
             
-            # Fetch full deal details
-            deals = []
-            for assoc in associations[:limit]:
-                deal_id = assoc.get("id")
-                if deal_id:
-                    deal_response = self.client.get(
-                        f"/crm/v3/objects/deals/{deal_id}",
-                        params={
-                            "properties": "dealname,amount,dealstage,pipeline,closedate,createdate,hs_lastmodifieddate"
-                        },
-                    )
-                    if deal_response.status_code == 200:
-                        deals.append(deal_response.json())
+            # Fetch full deal details (one batch request per 100 deals)
+            deal_ids = [assoc["id"] for assoc in associations[:limit] if assoc.get("id")]
+            deals = self._batch_read("deals", deal_ids, DEAL_PROPERTIES)
             
             # Normalize to canonical schema
             normalized = [self._normalize_deal(deal) for deal in deals]
@@ -297,6 +307,186 @@ class HubSpotLiveAdapter(VendorAdapter):
             self._emit_event("fetch_opportunities_error", {"account_id": account_id, "error": str(exc)})
             raise
 
+    def fetch_contacts_for_accounts(
+        self,
+        account_ids: Iterable[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch contacts of many companies with batch reads.
+        
+        Associations of up to 1000 companies and details of up to 100 contacts
+        are read per request, with up to MAX_CONCURRENT_REQUESTS requests in flight.
+        
+        Args:
+            account_ids: HubSpot company IDs
+            filters: Optional filters (limit per company)
+        
+        Returns:
+            Normalized contacts grouped by company ID
+        """
+        return self._fetch_associated_for_accounts(
+            "contacts", account_ids, filters, CONTACT_PROPERTIES, self._normalize_contact, "fetch_contacts_batch"
+        )
+
+    def fetch_opportunities_for_accounts(
+        self,
+        account_ids: Iterable[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch deals of many companies with batch reads.
+        
+        Args:
+            account_ids: HubSpot company IDs
+            filters: Optional filters (limit per company)
+        
+        Returns:
+            Normalized deals grouped by company ID
+        """
+        return self._fetch_associated_for_accounts(
+            "deals", account_ids, filters, DEAL_PROPERTIES, self._normalize_deal, "fetch_opportunities_batch"
+        )
+
+    def _fetch_associated_for_accounts(
+        self,
+        object_type: str,
+        account_ids: Iterable[str],
+        filters: Optional[Dict[str, Any]],
+        properties: List[str],
+        normalize: Callable[[Dict[str, Any]], Dict[str, Any]],
+        event: str,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Batch-read the objects of object_type associated with each company."""
+        account_ids = list(dict.fromkeys(str(account_id) for account_id in account_ids))
+        limit = (filters or {}).get("limit", 100)
+        try:
+            self._emit_event(f"{event}_start", {"account_count": len(account_ids), "limit": limit})
+            
+            associated = {
+                account_id: object_ids[:limit]
+                for account_id, object_ids in self._batch_associations(object_type, account_ids).items()
+            }
+            object_ids = [object_id for ids in associated.values() for object_id in ids]
+            records = {
+                str(record.get("id")): normalize(record)
+                for record in self._batch_read(object_type, object_ids, properties, concurrent=True)
+            }
+            grouped = {
+                account_id: [records[object_id] for object_id in associated.get(account_id, []) if object_id in records]
+                for account_id in account_ids
+            }
+            
+            self._emit_event(f"{event}_complete", {"account_count": len(account_ids), "count": len(records)})
+            return grouped
+            
+        except Exception as exc:
+            logger.error(f"Error batch fetching {object_type} for {len(account_ids)} companies: {exc}")
+            self._emit_event(f"{event}_error", {"account_count": len(account_ids), "error": str(exc)})
+            raise
+
+    def _batch_associations(self, to_object_type: str, company_ids: List[str]) -> Dict[str, List[str]]:
+        """
+        Read company → object associations for many companies at once.
+        
+        Companies without associations are omitted from the result.
+        """
+        def read(chunk: List[str]) -> List[Dict[str, Any]]:
+            response = self._request(
+                "post",
+                f"/crm/v4/associations/companies/{to_object_type}/batch/read",
+                json={"inputs": [{"id": company_id} for company_id in chunk]},
+            )
+            response.raise_for_status()
+            return response.json().get("results", [])
+        
+        associated: Dict[str, List[str]] = {}
+        for results in self._map_concurrent(read, self._chunks(company_ids, ASSOCIATION_BATCH_SIZE)):
+            for result in results:
+                associated[str(result["from"]["id"])] = [str(to["toObjectId"]) for to in result.get("to", [])]
+        return associated
+
+    def _batch_read(
+        self,
+        object_type: str,
+        object_ids: List[str],
+        properties: List[str],
+        concurrent: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Read objects by ID, BATCH_READ_SIZE per request, in the order of object_ids.
+        
+        IDs that no longer exist are skipped (HubSpot reports them as errors
+        in a 207 Multi-Status response).
+        """
+        object_ids = list(dict.fromkeys(str(object_id) for object_id in object_ids))
+        
+        def read(chunk: List[str]) -> List[Dict[str, Any]]:
+            response = self._request(
+                "post",
+                f"/crm/v3/objects/{object_type}/batch/read",
+                json={"properties": properties, "inputs": [{"id": object_id} for object_id in chunk]},
+            )
+            response.raise_for_status()
+            return response.json().get("results", [])
+        
+        chunks = self._chunks(object_ids, BATCH_READ_SIZE)
+        pages = self._map_concurrent(read, chunks) if concurrent else [read(chunk) for chunk in chunks]
+        by_id = {str(record.get("id")): record for page in pages for record in page}
+        return [by_id[object_id] for object_id in object_ids if object_id in by_id]
+
+    def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request, waiting out 429 responses instead of failing.
+        
+        Retry-After (capped at MAX_RETRY_AFTER_SECONDS) pauses every request of
+        this adapter, so concurrent workers back off together.
+        
+        Raises:
+            Exception: If still rate limited after RATE_LIMIT_RETRIES retries
+        """
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            self._wait_for_rate_limit()
+            response = getattr(self.client, method)(path, **kwargs)
+            if response.status_code != 429:
+                return response
+            
+            retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+            self._emit_event("rate_limit_exceeded", {"retry_after": retry_after, "attempt": attempt + 1})
+            if attempt < RATE_LIMIT_RETRIES:
+                logger.warning(f"Rate limit exceeded, retrying in {retry_after}s")
+                with self._rate_limit_lock:
+                    self._rate_limited_until = max(self._rate_limited_until, time.monotonic() + retry_after)
+        
+        raise Exception(f"Rate limit exceeded, retry after {retry_after}s")
+
+    def _wait_for_rate_limit(self) -> None:
+        """Sleep while a Retry-After window is open."""
+        with self._rate_limit_lock:
+            delay = self._rate_limited_until - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _parse_retry_after(self, value: Optional[str]) -> float:
+        """Parse Retry-After seconds (default 10s, capped)."""
+        try:
+            seconds = float(value) if value else 10.0
+        except (ValueError, TypeError):
+            seconds = 10.0
+        return min(max(seconds, 0.0), MAX_RETRY_AFTER_SECONDS)
+
+    def _map_concurrent(self, func: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+        """Apply func to items with up to MAX_CONCURRENT_REQUESTS threads, preserving order."""
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_REQUESTS, len(items))) as executor:
+            return list(executor.map(func, items))
+
+    @staticmethod
+    def _chunks(items: List[Any], size: int) -> List[List[Any]]:
+        """Split items into lists of at most size."""
+        return [items[start:start + size] for start in range(0, len(items), size)]
+
     def fetch_buying_signals(self, account_id: str, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Derive buying signals from deal stages and activities.
@@ -78,3 +78,42 @@ class VendorAdapter(Protocol):
     def validate_connection(self) -> bool:
         """Test connection (returns True for mock mode)"""
         ...
+
+
+class AsyncVendorAdapter(Protocol):
+    """
+    Async counterpart of VendorAdapter.
+    
+    Lets callers query several vendors concurrently (see
+    cuga.adapters.sales.async_adapter.fan_out). Any VendorAdapter can be
+    used through this protocol with async_adapter.AsyncAdapter.
+    """
+    
+    async def fetch_accounts(
+        self,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch accounts matching filters"""
+        ...
+    
+    async def fetch_contacts(
+        self,
+        account_id: str
+    ) -> List[Dict[str, Any]]:
+        """Fetch contacts for account"""
+        ...
+    
+    async def fetch_opportunities(
+        self,
+        account_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch opportunities (all or for specific account)"""
+        ...
+    
+    def get_mode(self) -> AdapterMode:
+        """Get current adapter mode"""
+        ...
+    
+    async def validate_connection(self) -> bool:
+        """Test connection (returns True for mock mode)"""
+        ...
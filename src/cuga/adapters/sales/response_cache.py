@@ -0,0 +1,495 @@
+"""
+Shared response cache for live sales adapters.
+
+Firmographic, technographic and enrichment data changes slowly, but agents
+ask for the same companies again and again across steps and sessions.
+Every such request costs a vendor round-trip and often paid API credits.
+
+CachedClient wraps an adapter's SafeClient and serves repeated reads from a
+two-tier cache shared by all adapters in the process:
+- In-process LRU (ResponseCache.max_entries)
+- On-disk SQLite (survives restarts, shared between processes)
+
+Per vendor, CachePolicy rules select which endpoints are cacheable and for
+how long (per entity TTL). Responses past their TTL but still inside the
+stale window are served immediately while a background request refreshes
+them (stale-while-revalidate). Refreshes are conditional (If-None-Match /
+If-Modified-Since) when the vendor sent an ETag or Last-Modified header, so
+unchanged data costs a 304 instead of a full response.
+
+Cache keys are canonical: vendor + base URL + method + path + normalized
+query params / JSON body (sorted keys, no None values, trimmed strings,
+lower-cased domains/emails). Credentials never appear in a key, but a hash
+of them does: responses are only shared between callers using the same
+API key, since vendor entitlements differ per key.
+
+Hits, misses, stale hits, background refreshes, 304 revalidations and
+credits saved are recorded in cuga.observability golden signals
+(cuga_adapter_cache_* metrics).
+
+Environment Variables:
+    SALES_ADAPTER_CACHE - "0" disables the cache (default: enabled)
+    SALES_ADAPTER_CACHE_DB - SQLite path ("" for memory only)
+    SALES_ADAPTER_CACHE_ENTRIES - In-process LRU size (default: 1024)
+    SALES_CACHE_TTL_<VENDOR>_<ENTITY> - TTL override in seconds
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from cuga.config import DBS_DIR
+
+logger = logging.getLogger(__name__)
+
+HOUR = 3600.0
+DAY = 24 * HOUR
+
+CACHE_ENABLED = os.getenv("SALES_ADAPTER_CACHE", "1") != "0"
+CACHE_DB_PATH = os.getenv("SALES_ADAPTER_CACHE_DB", os.path.join(DBS_DIR, "sales_adapter_cache.db"))
+CACHE_MAX_ENTRIES = int(os.getenv("SALES_ADAPTER_CACHE_ENTRIES", "1024"))
+
+# Response headers kept with cached entries
+_KEPT_HEADERS = ("content-type", "etag", "last-modified")
+
+# Query/body fields that carry credentials (hashed into the key's credential scope)
+_SECRET_FIELDS = {"key", "api_key", "apikey", "token", "api_token", "access_token", "user_key"}
+
+# Headers that carry credentials (Authorization, X-Api-Key, X-cb-user-key, ...)
+_SECRET_HEADERS = re.compile(r"authorization|api[-_]?key|user[-_]key|token", re.IGNORECASE)
+
+# Case-insensitive identifiers (lower-cased in cache keys)
+_CASE_INSENSITIVE_FIELDS = re.compile(r"domain|website|email|url", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    Caching rule for one kind of vendor endpoint.
+
+    Attributes:
+        entity: Entity name (used in metrics and TTL overrides)
+        ttl: Seconds a response is fresh
+        stale_ttl: Further seconds a response may be served while it is refreshed
+        credits: Vendor credits one uncached request costs (for credits-saved metrics)
+        methods: HTTP methods the rule applies to
+    """
+    entity: str
+    ttl: float
+    stale_ttl: float = 0.0
+    credits: float = 1.0
+    methods: Tuple[str, ...] = ("GET",)
+
+
+# vendor -> [(path regex, policy)]; unmatched endpoints (auth, health, CRM data) are never cached
+VENDOR_CACHE_POLICIES: Dict[str, List[Tuple[str, CachePolicy]]] = {
+    "clearbit": [
+        (r"^/v2/companies/find$", CachePolicy("companies", ttl=7 * DAY, stale_ttl=7 * DAY)),
+        (r"^/v2/(people|combined)/find$", CachePolicy("people", ttl=DAY, stale_ttl=6 * DAY)),
+    ],
+    "zoominfo": [
+        (r"^/company/lookup$", CachePolicy("companies", ttl=7 * DAY, stale_ttl=7 * DAY)),
+        (r"^/search/company$", CachePolicy("company_search", ttl=DAY, stale_ttl=DAY, methods=("POST",))),
+        (r"^/search/contact$", CachePolicy("contacts", ttl=DAY, stale_ttl=DAY, methods=("POST",))),
+        (r"^/company/[^/]+/scoops$", CachePolicy("scoops", ttl=6 * HOUR, stale_ttl=6 * HOUR)),
+    ],
+    "builtwith": [
+        (r"^/v21/api\.json$", CachePolicy("technologies", ttl=7 * DAY, stale_ttl=7 * DAY)),
+        (r"^/v16/api\.json$", CachePolicy("technology_history", ttl=7 * DAY, stale_ttl=7 * DAY)),
+        (r"^/v1/api\.json$", CachePolicy("technology_lists", ttl=DAY, stale_ttl=DAY)),
+    ],
+    "crunchbase": [
+        (r"^/searches/organizations$", CachePolicy("organizations", ttl=DAY, stale_ttl=6 * DAY, methods=("GET", "POST"))),
+        (r"^/entities/organizations/[^/]+/funding_rounds$", CachePolicy("funding_rounds", ttl=DAY, stale_ttl=6 * DAY)),
+    ],
+    "sixsense": [
+        (r"^/v1/accounts/by-domain/[^/]+$", CachePolicy("account_scores", ttl=DAY, stale_ttl=DAY)),
+        (r"^/v1/accounts/by-domain/[^/]+/(segments|keywords)$", CachePolicy("intent_segments", ttl=DAY, stale_ttl=DAY)),
+        (r"^/v1/accounts/[^/]+/intent$", CachePolicy("intent", ttl=6 * HOUR, stale_ttl=6 * HOUR)),
+    ],
+    "apollo": [
+        (r"^/v1/organizations/search$", CachePolicy("organizations", ttl=DAY, stale_ttl=6 * DAY, methods=("POST",))),
+        (r"^/v1/people/search$", CachePolicy("people", ttl=DAY, stale_ttl=DAY, methods=("POST",))),
+        (r"^/v1/people/match$", CachePolicy("people_match", ttl=7 * DAY, stale_ttl=7 * DAY, methods=("POST",))),
+        (r"^/v1/email_verifier/verify$", CachePolicy("email_verification", ttl=7 * DAY, methods=("POST",))),
+    ],
+}
+
+
+@dataclass
+class CacheEntry:
+    """Cached vendor response."""
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    expires_at: float
+    stale_until: float
+
+    def to_response(self, method: str, url: str) -> httpx.Response:
+        """Rebuild an httpx.Response (raise_for_status/json work as usual)."""
+        return httpx.Response(
+            status_code=self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=httpx.Request(method, url),
+        )
+
+
+class ResponseCache:
+    """
+    Two-tier (memory LRU + SQLite) cache of vendor responses.
+
+    Thread-safe; one instance is shared by all adapters (get_response_cache()).
+    """
+
+    def __init__(self, db_path: Optional[str] = CACHE_DB_PATH, max_entries: int = CACHE_MAX_ENTRIES):
+        """
+        Args:
+            db_path: SQLite file for the disk tier (None or "" for memory only)
+            max_entries: Entries kept in the in-process LRU
+        """
+        self.db_path = db_path or None
+        self.max_entries = max(1, max_entries)
+        self._memory: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Entry for key (memory first, then disk), or None."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+            row = self._execute(
+                "SELECT status_code, headers, content, expires_at, stale_until FROM responses WHERE key = ?",
+                (key,),
+            )
+            row = row.fetchone() if row is not None else None
+            if row is None:
+                return None
+            entry = CacheEntry(row[0], json.loads(row[1]), bytes(row[2]), row[3], row[4])
+            self._remember(key, entry)
+            return entry
+
+    def put(self, key: str, entry: CacheEntry, vendor: str = "", entity: str = "") -> None:
+        """Store entry in both tiers."""
+        with self._lock:
+            self._remember(key, entry)
+            self._execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, vendor, entity, status_code, headers, content, expires_at, stale_until) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, vendor, entity, entry.status_code, json.dumps(entry.headers), entry.content,
+                 entry.expires_at, entry.stale_until),
+                commit=True,
+            )
+
+    def invalidate(self, vendor: Optional[str] = None) -> None:
+        """Drop all entries (or all entries of vendor)."""
+        with self._lock:
+            if vendor is None:
+                self._memory.clear()
+                self._execute("DELETE FROM responses", (), commit=True)
+            else:
+                prefix = f"{vendor}:"
+                for key in [k for k in self._memory if k.startswith(prefix)]:
+                    del self._memory[key]
+                self._execute("DELETE FROM responses WHERE vendor = ?", (vendor,), commit=True)
+
+    def purge_expired(self) -> None:
+        """Delete disk entries that can no longer be served."""
+        with self._lock:
+            self._execute("DELETE FROM responses WHERE stale_until <= ?", (time.time(),), commit=True)
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _execute(self, sql: str, params: tuple, commit: bool = False) -> Optional[sqlite3.Cursor]:
+        """Run sql on the disk tier; disk errors degrade to memory-only caching."""
+        if self.db_path is None:
+            return None
+        try:
+            if self._conn is None:
+                self._connect()
+            cursor = self._conn.execute(sql, params)
+            if commit:
+                self._conn.commit()
+            return cursor
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning(f"Sales adapter cache disk tier disabled ({self.db_path}): {exc}")
+            self.db_path = None
+            return None
+
+    def _connect(self) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, vendor TEXT, entity TEXT, status_code INTEGER, "
+            "headers TEXT, content BLOB, expires_at REAL, stale_until REAL)"
+        )
+        self._conn.execute("DELETE FROM responses WHERE stale_until <= ?", (time.time(),))
+        self._conn.commit()
+
+
+_shared_cache: Optional[ResponseCache] = None
+_shared_cache_lock = threading.Lock()
+
+# Background refreshes for stale-while-revalidate
+_refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sales-cache-refresh")
+
+
+def get_response_cache() -> ResponseCache:
+    """Process-wide cache shared by all adapters."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ResponseCache()
+        return _shared_cache
+
+
+def canonicalize(value: Any, field_name: str = "") -> Any:
+    """Normalize filters for cache keys (sorted keys, no None/secrets, trimmed strings)."""
+    if isinstance(value, dict):
+        return {
+            str(k): canonicalize(v, str(k))
+            for k, v in sorted(value.items(), key=lambda item: str(item[0]))
+            if v is not None and str(k).lower() not in _SECRET_FIELDS
+        }
+    if isinstance(value, (list, tuple)):
+        return [canonicalize(v, field_name) for v in value]
+    if isinstance(value, str):
+        value = value.strip()
+        return value.lower() if _CASE_INSENSITIVE_FIELDS.search(field_name) else value
+    return value
+
+
+class CachedClient:
+    """
+    SafeClient wrapper serving cacheable vendor reads from ResponseCache.
+
+    Requests that match no policy of the vendor, or that send
+    "Cache-Control: no-cache", go straight to the wrapped client. Only 200
+    responses are cached. Other attributes are delegated to the wrapped client.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        vendor: str,
+        cache: Optional[ResponseCache] = None,
+        policies: Optional[List[Tuple[str, CachePolicy]]] = None,
+        credential: Optional[str] = None,
+    ):
+        """
+        Args:
+            client: SafeClient (or compatible) to wrap
+            vendor: Vendor name (selects policies, namespaces keys and metrics)
+            cache: Cache to use (defaults to the shared process-wide cache)
+            policies: Override VENDOR_CACHE_POLICIES[vendor]
+            credential: API key (or other caller identity) scoping cached
+                responses, for credentials not sent as client headers
+        """
+        self.client = client
+        self.vendor = vendor
+        self._credential = credential or ""
+        self.cache = cache or get_response_cache()
+        rules = VENDOR_CACHE_POLICIES.get(vendor, []) if policies is None else policies
+        self._policies = [(re.compile(pattern), self._with_ttl_override(policy)) for pattern, policy in rules]
+        self._refreshing: set = set()
+        self._refreshing_lock = threading.Lock()
+
+    def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """GET (cached if a policy matches)."""
+        return self._request("GET", self.client.get, url, kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        """POST (cached if a policy matches, e.g. search endpoints)."""
+        return self._request("POST", self.client.post, url, kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+
+    def _request(
+        self,
+        method: str,
+        send: Callable[..., httpx.Response],
+        url: str,
+        kwargs: Dict[str, Any],
+    ) -> httpx.Response:
+        policy = self._policy_for(method, url)
+        if policy is None or self._bypass(kwargs):
+            return send(url, **kwargs)
+
+        key = self._key(method, url, kwargs)
+        full_url = self._full_url(url)
+        entry = self.cache.get(key)
+        now = time.time()
+
+        if entry is not None and now < entry.expires_at:
+            self._record("hit", policy)
+            return entry.to_response(method, full_url)
+
+        if entry is not None and now < entry.stale_until:
+            self._record("stale", policy)
+            self._refresh_in_background(key, policy, send, method, url, kwargs, entry)
+            return entry.to_response(method, full_url)
+
+        return self._fetch(key, policy, send, method, url, kwargs, entry)
+
+    def _fetch(
+        self,
+        key: str,
+        policy: CachePolicy,
+        send: Callable[..., httpx.Response],
+        method: str,
+        url: str,
+        kwargs: Dict[str, Any],
+        entry: Optional[CacheEntry],
+        background: bool = False,
+    ) -> httpx.Response:
+        """Request from the vendor (conditionally if entry has validators) and store the result."""
+        request_kwargs = dict(kwargs)
+        if entry is not None:
+            validators = {}
+            if etag := entry.headers.get("etag"):
+                validators["If-None-Match"] = etag
+            if last_modified := entry.headers.get("last-modified"):
+                validators["If-Modified-Since"] = last_modified
+            if validators:
+                request_kwargs["headers"] = {**(kwargs.get("headers") or {}), **validators}
+
+        response = send(url, **request_kwargs)
+        now = time.time()
+
+        if response.status_code == 304 and entry is not None:
+            entry = replace(entry, expires_at=now + policy.ttl, stale_until=now + policy.ttl + policy.stale_ttl)
+            self.cache.put(key, entry, self.vendor, policy.entity)
+            self._record("revalidated", policy)
+            return entry.to_response(method, self._full_url(url))
+
+        self._record("refreshed" if background else "miss", policy)
+        if response.status_code == 200:
+            headers = {name: response.headers[name] for name in _KEPT_HEADERS if name in response.headers}
+            self.cache.put(
+                key,
+                CacheEntry(200, headers, response.content, now + policy.ttl, now + policy.ttl + policy.stale_ttl),
+                self.vendor,
+                policy.entity,
+            )
+        return response
+
+    def _refresh_in_background(
+        self,
+        key: str,
+        policy: CachePolicy,
+        send: Callable[..., httpx.Response],
+        method: str,
+        url: str,
+        kwargs: Dict[str, Any],
+        entry: CacheEntry,
+    ) -> None:
+        """Refresh a stale entry once, off the caller's thread."""
+        with self._refreshing_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh() -> None:
+            try:
+                self._fetch(key, policy, send, method, url, kwargs, entry, background=True)
+            except Exception as exc:
+                logger.warning(f"Background refresh of cached {self.vendor} {policy.entity} failed: {exc}")
+            finally:
+                with self._refreshing_lock:
+                    self._refreshing.discard(key)
+
+        _refresh_executor.submit(refresh)
+
+    def _policy_for(self, method: str, url: str) -> Optional[CachePolicy]:
+        path = httpx.URL(url).path.rstrip("/") or "/"
+        for pattern, policy in self._policies:
+            if method in policy.methods and pattern.search(path):
+                return policy
+        return None
+
+    @staticmethod
+    def _bypass(kwargs: Dict[str, Any]) -> bool:
+        headers = kwargs.get("headers") or {}
+        return any(
+            name.lower() == "cache-control" and "no-cache" in str(value).lower()
+            for name, value in headers.items()
+        )
+
+    def _key(self, method: str, url: str, kwargs: Dict[str, Any]) -> str:
+        request = {
+            "base_url": str(getattr(self.client, "base_url", "")),
+            "method": method,
+            "path": httpx.URL(url).path.rstrip("/"),
+            "params": canonicalize(dict(httpx.URL(url).params) | dict(kwargs.get("params") or {})),
+            "json": canonicalize(kwargs.get("json")),
+            "credential": self._credential_scope(url, kwargs),
+        }
+        digest = hashlib.sha256(json.dumps(request, sort_keys=True, default=str).encode()).hexdigest()
+        return f"{self.vendor}:{digest}"
+
+    def _credential_scope(self, url: str, kwargs: Dict[str, Any]) -> str:
+        """Hash of every credential the request is sent with (client, headers, params, body)."""
+        secrets = [self._credential]
+        headers = {**dict(getattr(self.client, "headers", None) or {}), **(kwargs.get("headers") or {})}
+        secrets += [f"{name.lower()}={value}" for name, value in sorted(headers.items()) if _SECRET_HEADERS.search(name)]
+        params = dict(httpx.URL(url).params) | dict(kwargs.get("params") or {})
+        body = kwargs.get("json") if isinstance(kwargs.get("json"), dict) else {}
+        for fields in (params, body):
+            secrets += [f"{name.lower()}={value}" for name, value in sorted(fields.items()) if name.lower() in _SECRET_FIELDS]
+        return hashlib.sha256("\n".join(secrets).encode()).hexdigest()
+
+    def _full_url(self, url: str) -> str:
+        base_url = getattr(self.client, "base_url", None)
+        if base_url is None or httpx.URL(url).is_absolute_url:
+            return url
+        return str(base_url).rstrip("/") + "/" + url.lstrip("/")
+
+    def _with_ttl_override(self, policy: CachePolicy) -> CachePolicy:
+        override = os.getenv(f"SALES_CACHE_TTL_{self.vendor.upper()}_{policy.entity.upper()}")
+        if override is None:
+            return policy
+        try:
+            return replace(policy, ttl=float(override))
+        except ValueError:
+            logger.warning(f"Ignoring invalid cache TTL override for {self.vendor}/{policy.entity}: {override}")
+            return policy
+
+    def _record(self, outcome: str, policy: CachePolicy) -> None:
+        """Record cache outcome in golden signals (if observability is available)."""
+        try:
+            from cuga.observability import get_collector
+
+            # Stale hits are paid for by their refresh; 304 revalidations are not billed
+            credits_saved = policy.credits if outcome in ("hit", "revalidated") else 0.0
+            get_collector().signals.record_adapter_cache(self.vendor, policy.entity, outcome, credits_saved)
+        except ImportError:
+            pass  # Observability not available
+
+
+def cached_client(client: Any, vendor: str, credential: Optional[str] = None) -> Any:
+    """Wrap client with CachedClient when caching is enabled and vendor has policies."""
+    if not CACHE_ENABLED or not VENDOR_CACHE_POLICIES.get(vendor):
+        return client
+    return CachedClient(client, vendor, credential=credential)
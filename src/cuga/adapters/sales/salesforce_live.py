@@ -8,12 +8,17 @@ Implements live API integration for Salesforce with:
 - SafeClient (AGENTS.md compliant)
 - Rate limiting and retry logic
 - Schema normalization (Salesforce → canonical)
-- Bulk API support for large datasets
+- Paginated streaming reads (nextRecordsUrl) with next-page prefetch
+- Bulk API 2.0 support for large datasets
 - Observability integration
 """
 
+import csv
+import io
 import os
-from typing import Dict, Any, Optional, List
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Iterable, Iterator, Callable, Tuple, Union
 from datetime import datetime, timedelta
 import httpx
 from urllib.parse import urljoin
@@ -21,6 +26,58 @@ from urllib.parse import urljoin
 from cuga.security.http_client import SafeClient
 from cuga.adapters.sales.protocol import VendorAdapter, AdapterMode, AdapterConfig
 
+API_PATH = "/services/data/v58.0"
+
+# Account IDs per "AccountId IN (...)" query (keeps SOQL well under its length limit)
+SOQL_IN_CHUNK_SIZE = 200
+
+# Bulk API 2.0 result page size and job polling
+BULK_PAGE_SIZE = int(os.getenv("SALES_SFDC_BULK_PAGE_SIZE", "10000"))
+BULK_POLL_INTERVAL = 2.0
+BULK_JOB_TIMEOUT = 900.0
+
+ACCOUNT_FIELDS = [
+    "Id",
+    "Name",
+    "Industry",
+    "AnnualRevenue",
+    "NumberOfEmployees",
+    "BillingStreet",
+    "BillingCity",
+    "BillingState",
+    "BillingCountry",
+    "BillingPostalCode",
+    "Phone",
+    "Website",
+    "Description",
+    "CreatedDate",
+    "LastModifiedDate",
+]
+
+CONTACT_FIELDS = [
+    "Id", "AccountId", "FirstName", "LastName", "Email", "Phone", "Title",
+    "Department", "MailingStreet", "MailingCity", "MailingState",
+    "MailingCountry", "MailingPostalCode", "CreatedDate",
+]
+
+OPPORTUNITY_FIELDS = [
+    "Id", "Name", "AccountId", "StageName", "Amount", "Probability",
+    "CloseDate", "Type", "LeadSource", "Description", "CreatedDate",
+    "LastModifiedDate", "IsClosed", "IsWon",
+]
+
+# Non-string fields of the lists above (Bulk API CSV returns every value as a string)
+FIELD_TYPES: Dict[str, type] = {
+    "AnnualRevenue": float,
+    "NumberOfEmployees": int,
+    "Amount": float,
+    "Probability": float,
+    "IsClosed": bool,
+    "IsWon": bool,
+}
+
+Page = Tuple[List[Dict[str, Any]], Optional[str]]
+
 
 class SalesforceLiveAdapter(VendorAdapter):
     """
@@ -202,15 +259,8 @@ class SalesforceLiveAdapter(VendorAdapter):
             # Build SOQL query
             soql = self._build_accounts_query(filters or {})
             
-            # Execute query
-            response = self.client.get(
-                "/services/data/v58.0/query",
-                params={"q": soql},
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            records = data.get("records", [])
+            # Execute query (all pages up to LIMIT)
+            records = [record for page in self._query_pages(soql) for record in page]
             
             # Normalize schema
             normalized = self._normalize_accounts(records)
@@ -252,28 +302,13 @@ class SalesforceLiveAdapter(VendorAdapter):
             })
             raise
     
-    def _build_accounts_query(self, filters: Dict[str, Any]) -> str:
-        """Build SOQL query for Account object."""
-        # Base fields (standard Salesforce Account fields)
-        fields = [
-            "Id",
-            "Name",
-            "Industry",
-            "AnnualRevenue",
-            "NumberOfEmployees",
-            "BillingStreet",
-            "BillingCity",
-            "BillingState",
-            "BillingCountry",
-            "BillingPostalCode",
-            "Phone",
-            "Website",
-            "Description",
-            "CreatedDate",
-            "LastModifiedDate",
-        ]
-        
-        query = f"SELECT {', '.join(fields)} FROM Account"
+    def _build_accounts_query(
+        self,
+        filters: Dict[str, Any],
+        default_limit: Optional[int] = 100,
+    ) -> str:
+        """Build SOQL query for Account object (no LIMIT if default_limit is None and none is given)."""
+        query = f"SELECT {', '.join(ACCOUNT_FIELDS)} FROM Account"
         
         # Add WHERE clauses
         where_clauses = []
@@ -294,8 +329,9 @@ class SalesforceLiveAdapter(VendorAdapter):
             query += f" WHERE {' AND '.join(where_clauses)}"
         
         # Add LIMIT
-        limit = filters.get("limit", 100)
-        query += f" LIMIT {limit}"
+        limit = filters.get("limit", default_limit)
+        if limit is not None:
+            query += f" LIMIT {limit}"
         
         return query
     
@@ -349,22 +385,9 @@ class SalesforceLiveAdapter(VendorAdapter):
         
         try:
             # SOQL query for contacts
-            soql = f"""
-                SELECT Id, FirstName, LastName, Email, Phone, Title,
-                       Department, MailingStreet, MailingCity, MailingState,
-                       MailingCountry, MailingPostalCode, CreatedDate
-                FROM Contact
-                WHERE AccountId = '{account_id}'
-                LIMIT 500
-            """
-            
-            response = self.client.get(
-                "/services/data/v58.0/query",
-                params={"q": soql},
-            )
-            response.raise_for_status()
+            soql = self._build_contacts_query([account_id], limit=500)
             
-            records = response.json().get("records", [])
+            records = [record for page in self._query_pages(soql) for record in page]
             normalized = self._normalize_contacts(records)
             
             self._emit_event("adapter_fetch_complete", {
@@ -394,6 +417,7 @@ class SalesforceLiveAdapter(VendorAdapter):
         for record in records:
             normalized.append({
                 "id": record.get("Id"),
+                "account_id": record.get("AccountId"),
                 "first_name": record.get("FirstName"),
                 "last_name": record.get("LastName"),
                 "email": record.get("Email"),
@@ -435,25 +459,9 @@ class SalesforceLiveAdapter(VendorAdapter):
         
         try:
             # SOQL query for opportunities
-            soql = """
-                SELECT Id, Name, AccountId, StageName, Amount, Probability,
-                       CloseDate, Type, LeadSource, Description, CreatedDate,
-                       LastModifiedDate, IsClosed, IsWon
-                FROM Opportunity
-            """
-            
-            if account_id:
-                soql += f" WHERE AccountId = '{account_id}'"
-            
-            soql += " LIMIT 500"
-            
-            response = self.client.get(
-                "/services/data/v58.0/query",
-                params={"q": soql},
-            )
-            response.raise_for_status()
+            soql = self._build_opportunities_query([account_id] if account_id else None, limit=500)
             
-            records = response.json().get("records", [])
+            records = [record for page in self._query_pages(soql) for record in page]
             normalized = self._normalize_opportunities(records)
             
             self._emit_event("adapter_fetch_complete", {
@@ -501,6 +509,253 @@ class SalesforceLiveAdapter(VendorAdapter):
         
         return normalized
     
+    # ------------------------------------------------------------------
+    # Streaming reads
+    # ------------------------------------------------------------------
+    
+    def iter_accounts(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        bulk: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream all accounts matching filters, one normalized record at a time.
+        
+        Unlike fetch_accounts(), no LIMIT is applied unless filters["limit"] is set,
+        and at most two result pages are held in memory regardless of org size.
+        
+        Args:
+            filters: Same filters as fetch_accounts()
+            bulk: Use a Bulk API 2.0 query job (recommended for full extracts)
+        
+        Yields:
+            Normalized account records
+        """
+        soql = self._build_accounts_query(filters or {}, default_limit=None)
+        for page in self._pages(soql, bulk):
+            yield from self._normalize_accounts(page)
+    
+    def iter_contacts(
+        self,
+        account_ids: Union[str, Iterable[str]],
+        bulk: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream contacts of one or many accounts.
+        
+        Accounts are queried SOQL_IN_CHUNK_SIZE at a time with
+        "WHERE AccountId IN (...)" instead of one query per account.
+        
+        Args:
+            account_ids: Salesforce Account ID or IDs
+            bulk: Use Bulk API 2.0 query jobs
+        
+        Yields:
+            Normalized contact records (with account_id)
+        """
+        for chunk in self._chunk_ids(account_ids):
+            for page in self._pages(self._build_contacts_query(chunk), bulk):
+                yield from self._normalize_contacts(page)
+    
+    def iter_opportunities(
+        self,
+        account_ids: Optional[Union[str, Iterable[str]]] = None,
+        bulk: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream opportunities of the given accounts (or of the whole org).
+        
+        Args:
+            account_ids: Optional Salesforce Account ID or IDs
+            bulk: Use Bulk API 2.0 query jobs
+        
+        Yields:
+            Normalized opportunity records
+        """
+        chunks = [None] if account_ids is None else self._chunk_ids(account_ids)
+        for chunk in chunks:
+            for page in self._pages(self._build_opportunities_query(chunk), bulk):
+                yield from self._normalize_opportunities(page)
+    
+    def fetch_contacts_for_accounts(
+        self,
+        account_ids: Iterable[str],
+        bulk: bool = False,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch contacts of many accounts with batched queries, grouped by account ID."""
+        account_ids = list(account_ids)
+        grouped: Dict[str, List[Dict[str, Any]]] = {account_id: [] for account_id in account_ids}
+        for contact in self.iter_contacts(account_ids, bulk=bulk):
+            grouped.setdefault(contact["account_id"], []).append(contact)
+        return grouped
+    
+    def fetch_opportunities_for_accounts(
+        self,
+        account_ids: Iterable[str],
+        bulk: bool = False,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch opportunities of many accounts with batched queries, grouped by account ID."""
+        account_ids = list(account_ids)
+        grouped: Dict[str, List[Dict[str, Any]]] = {account_id: [] for account_id in account_ids}
+        for opp in self.iter_opportunities(account_ids, bulk=bulk):
+            grouped.setdefault(opp["account_id"], []).append(opp)
+        return grouped
+    
+    def _build_contacts_query(self, account_ids: List[str], limit: Optional[int] = None) -> str:
+        """Build SOQL query for the contacts of account_ids."""
+        query = f"SELECT {', '.join(CONTACT_FIELDS)} FROM Contact WHERE {self._account_id_clause(account_ids)}"
+        if limit is not None:
+            query += f" LIMIT {limit}"
+        return query
+    
+    def _build_opportunities_query(self, account_ids: Optional[List[str]], limit: Optional[int] = None) -> str:
+        """Build SOQL query for opportunities (of account_ids, or all)."""
+        query = f"SELECT {', '.join(OPPORTUNITY_FIELDS)} FROM Opportunity"
+        if account_ids:
+            query += f" WHERE {self._account_id_clause(account_ids)}"
+        if limit is not None:
+            query += f" LIMIT {limit}"
+        return query
+    
+    @staticmethod
+    def _account_id_clause(account_ids: List[str]) -> str:
+        """AccountId filter with quoted (escaped) IDs."""
+        quoted = [
+            "'" + account_id.replace("\\", "\\\\").replace("'", "\\'") + "'"
+            for account_id in account_ids
+        ]
+        if len(quoted) == 1:
+            return f"AccountId = {quoted[0]}"
+        return f"AccountId IN ({', '.join(quoted)})"
+    
+    @staticmethod
+    def _chunk_ids(account_ids: Union[str, Iterable[str]]) -> Iterator[List[str]]:
+        """Split account IDs into de-duplicated chunks for IN clauses."""
+        if isinstance(account_ids, str):
+            account_ids = [account_ids]
+        unique = list(dict.fromkeys(account_ids))
+        for start in range(0, len(unique), SOQL_IN_CHUNK_SIZE):
+            yield unique[start:start + SOQL_IN_CHUNK_SIZE]
+    
+    def _pages(self, soql: str, bulk: bool) -> Iterator[List[Dict[str, Any]]]:
+        """Result pages of soql using the REST query API or a Bulk API 2.0 job."""
+        return self._bulk_query_pages(soql) if bulk else self._query_pages(soql)
+    
+    def _query_pages(self, soql: str) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Result pages of a REST SOQL query, following nextRecordsUrl.
+        
+        Salesforce returns at most 2000 records per response; the remaining
+        records are behind nextRecordsUrl.
+        """
+        def fetch_page(next_url: Optional[str]) -> Page:
+            if next_url is None:
+                data = self._get_json(f"{API_PATH}/query", params={"q": soql})
+            else:
+                data = self._get_json(next_url)
+            return data.get("records", []), data.get("nextRecordsUrl")
+        
+        return self._prefetched_pages(fetch_page)
+    
+    def _bulk_query_pages(self, soql: str) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Result pages of a Bulk API 2.0 query job.
+        
+        Results are downloaded BULK_PAGE_SIZE rows at a time (Sforce-Locator
+        paging) and parsed from CSV page by page. Empty values become None and
+        FIELD_TYPES fields are coerced, so records match REST query results.
+        
+        Docs: https://developer.salesforce.com/docs/atlas.en-us.api_asynch.meta/api_asynch/queries.htm
+        """
+        self._ensure_auth()
+        response = self.client.post(
+            f"{API_PATH}/jobs/query",
+            json={"operation": "query", "query": soql},
+        )
+        response.raise_for_status()
+        job_id = response.json()["id"]
+        self._emit_event("adapter_bulk_job_start", {"vendor": "salesforce", "job_id": job_id})
+        self._wait_for_bulk_job(job_id)
+        
+        def fetch_page(locator: Optional[str]) -> Page:
+            params: Dict[str, Any] = {"maxRecords": BULK_PAGE_SIZE}
+            if locator:
+                params["locator"] = locator
+            page_response = self._get(
+                f"{API_PATH}/jobs/query/{job_id}/results",
+                params=params,
+                headers={"Accept": "text/csv"},
+            )
+            next_locator = page_response.headers.get("Sforce-Locator")
+            rows = [
+                {key: self._coerce_csv_value(key, value) for key, value in row.items()}
+                for row in csv.DictReader(io.StringIO(page_response.text))
+            ]
+            return rows, None if next_locator in (None, "", "null") else next_locator
+        
+        return self._prefetched_pages(fetch_page)
+    
+    @staticmethod
+    def _coerce_csv_value(field: str, value: str) -> Any:
+        """Convert a Bulk API CSV value to the type the REST API returns for field."""
+        if value == "":
+            return None
+        field_type = FIELD_TYPES.get(field)
+        if field_type is bool:
+            return value.lower() == "true"
+        if field_type is int:
+            return int(float(value))
+        if field_type is float:
+            return float(value)
+        return value
+    
+    def _wait_for_bulk_job(self, job_id: str) -> None:
+        """Poll a Bulk API 2.0 query job until its results are available."""
+        deadline = time.monotonic() + BULK_JOB_TIMEOUT
+        while True:
+            job = self._get_json(f"{API_PATH}/jobs/query/{job_id}")
+            state = job.get("state")
+            if state == "JobComplete":
+                self._emit_event("adapter_bulk_job_complete", {
+                    "vendor": "salesforce",
+                    "job_id": job_id,
+                    "records": job.get("numberRecordsProcessed"),
+                })
+                return
+            if state in ("Failed", "Aborted"):
+                raise RuntimeError(
+                    f"Salesforce bulk query job {job_id} {state.lower()}: {job.get('errorMessage')}"
+                )
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Salesforce bulk query job {job_id} still {state} after {BULK_JOB_TIMEOUT}s")
+            time.sleep(BULK_POLL_INTERVAL)
+    
+    @staticmethod
+    def _prefetched_pages(fetch_page: Callable[[Optional[str]], Page]) -> Iterator[List[Dict[str, Any]]]:
+        """Yield pages while the next page is downloaded in the background."""
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="sfdc-prefetch") as prefetch:
+            records, cursor = fetch_page(None)
+            while True:
+                pending = prefetch.submit(fetch_page, cursor) if cursor else None
+                yield records
+                if pending is None:
+                    return
+                records, cursor = pending.result()
+    
+    def _get(self, path: str, **kwargs: Any) -> httpx.Response:
+        """GET with a single re-authentication on 401 (long extracts can outlive a token)."""
+        self._ensure_auth()
+        response = self.client.get(path, **kwargs)
+        if response.status_code == 401:
+            self._authenticate()
+            response = self.client.get(path, **kwargs)
+        response.raise_for_status()
+        return response
+    
+    def _get_json(self, path: str, **kwargs: Any) -> Dict[str, Any]:
+        """GET a JSON document (see _get)."""
+        return self._get(path, **kwargs).json()
+    
     def fetch_buying_signals(
         self,
         account_id: str
@@ -535,7 +790,7 @@ class SalesforceLiveAdapter(VendorAdapter):
             """
             
             response = self.client.get(
-                "/services/data/v58.0/query",
+                f"{API_PATH}/query",
                 params={"q": soql},
             )
             response.raise_for_status()
@@ -590,7 +845,7 @@ class SalesforceLiveAdapter(VendorAdapter):
             self._ensure_auth()
             
             # Query limits endpoint (low-cost health check)
-            response = self.client.get("/services/data/v58.0/limits")
+            response = self.client.get(f"{API_PATH}/limits")
             response.raise_for_status()
             
             return True
@@ -599,14 +854,29 @@ class SalesforceLiveAdapter(VendorAdapter):
             return False
     
     def _emit_event(self, event_type: str, metadata: Dict[str, Any]) -> None:
-        """Emit observability event (if collector available)."""
+        """Emit observability event (if collector available).
+
+        Event names map to tool-call events by suffix (``*_start``,
+        ``*_complete``, ``*_error``); the original name is kept in the
+        attributes. Observability failures never break the adapter call.
+        """
         try:
             from cuga.observability import emit_event
-            
-            emit_event(
-                event_type=event_type,
-                trace_id=self.trace_id,
-                metadata=metadata,
-            )
+            from cuga.observability.events import StructuredEvent, EventType
         except ImportError:
-            pass  # Observability not configured - silent fallback
+            return  # Observability not configured - silent fallback
+        
+        if event_type.endswith("_complete"):
+            mapped_type = EventType.TOOL_CALL_COMPLETE
+        elif event_type.endswith(("_error", "_rate_limit")):
+            mapped_type = EventType.TOOL_CALL_ERROR
+        else:
+            mapped_type = EventType.TOOL_CALL_START
+        try:
+            emit_event(StructuredEvent(
+                event_type=mapped_type,
+                trace_id=self.trace_id or "unknown",
+                attributes={**metadata, "original_event_type": event_type},
+            ))
+        except Exception:
+            pass  # Exporter errors must not fail (or strand) the vendor call
@@ -15,6 +15,7 @@ from typing import Dict, List, Optional, Any
 import httpx
 from cuga.adapters.sales.protocol import VendorAdapter, AdapterMode, AdapterConfig
 from cuga.security.http_client import SafeClient
+from cuga.adapters.sales.response_cache import cached_client
 from cuga.observability import emit_event
 
 
@@ -46,14 +47,14 @@ class SixSenseLiveAdapter(VendorAdapter):
         self._validate_config()
         
         # Initialize HTTP client
-        self.client = SafeClient(
+        self.client = cached_client(SafeClient(
             base_url="https://api.6sense.com",
             headers={
                 "Authorization": f"Bearer {config.credentials['api_key']}",
                 "Content-Type": "application/json"
             },
             timeout=httpx.Timeout(connect=5.0, read=10.0, write=10.0, pool=10.0)
-        )
+        ), vendor="sixsense", credential=config.credentials['api_key'])
         
         # Emit initialization event
         self._emit_event('adapter_initialized', {
@@ -19,6 +19,7 @@ from datetime import datetime
 import httpx
 
 from cuga.security.http_client import SafeClient
+from cuga.adapters.sales.response_cache import cached_client
 from cuga.adapters.sales.protocol import VendorAdapter, AdapterMode, AdapterConfig
 
 
@@ -50,14 +51,14 @@ class ZoomInfoLiveAdapter(VendorAdapter):
         self._validate_config()
         
         # Initialize SafeClient (AGENTS.md compliant)
-        self.client = SafeClient(
+        self.client = cached_client(SafeClient(
             base_url="https://api.zoominfo.com/v1",
             headers={
                 "Authorization": f"Bearer {config.credentials['api_key']}",
                 "Content-Type": "application/json",
             },
             timeout=httpx.Timeout(connect=5.0, read=10.0, write=10.0, pool=10.0),
-        )
+        ), vendor="zoominfo", credential=config.credentials['api_key'])
     
     def _validate_config(self) -> None:
         """Validate required configuration fields."""
@@ -0,0 +1,279 @@
+"""
+SQLite-backed task results for ActivityTracker experiments.
+
+``ResultsStore`` behaves like the ``{task_id: task_data}`` dict the tracker
+used to keep in memory, but rows live in ``results.db`` with indexes on the
+columns the tracker filters by (site, score, exception, agent version).
+``results.json`` and ``results.csv`` are exported from it: a newly finished
+task is appended to both files, and only edits or removals re-export them.
+"""
+
+import csv
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from loguru import logger
+
+# Column order of results.csv
+RESULT_COLUMNS = [
+    'task_id',
+    'site',
+    'intent',
+    'agent_answer',
+    'eval',
+    'score',
+    'exception',
+    'num_steps',
+    'fail_category',
+    'agent_v',
+    'duration',
+    'total_llm_calls',
+    'total_tokens',
+    'api_calls',
+    'total_cost',
+    'total_cache_input_tokens',
+]
+
+# Task fields mirrored into indexed columns; the full task is kept as JSON in ``data``
+_INDEXED_FIELDS = ("site", "score", "exception", "agent_v")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_id TEXT NOT NULL UNIQUE,
+    site,
+    score,
+    exception,
+    agent_v,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_site ON tasks (site);
+CREATE INDEX IF NOT EXISTS idx_tasks_score ON tasks (score);
+CREATE INDEX IF NOT EXISTS idx_tasks_exception ON tasks (exception);
+CREATE INDEX IF NOT EXISTS idx_tasks_agent_v ON tasks (agent_v);
+"""
+
+_FETCH_SIZE = 500
+
+
+def _indexed_values(task: Dict[str, Any]) -> Tuple[Any, ...]:
+    score = task.get("score")
+    exception = task.get("exception")
+    return (
+        task.get("site"),
+        score if isinstance(score, (int, float)) and not isinstance(score, bool) else None,
+        int(exception) if isinstance(exception, bool) else None,
+        task.get("agent_v"),
+    )
+
+
+def _json_entry(task_id: str, task: Dict[str, Any]) -> str:
+    """One ``"task_id": {...}`` member formatted exactly as ``json.dump(indent=2)`` would."""
+    return json.dumps({task_id: task}, indent=2, ensure_ascii=False)[2:-2]
+
+
+def _csv_row(task_id: str, task: Dict[str, Any]) -> List[Any]:
+    row = {**task, "task_id": task_id}
+    return [row.get(column) for column in RESULT_COLUMNS]
+
+
+class ResultsStore(MutableMapping):
+    """
+    Mapping of task IDs to task result dicts, persisted in SQLite.
+
+    Iteration follows insertion order, like a dict. ``path=None`` keeps the
+    database in memory (used when the tracker is not writing files).
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path or ":memory:", check_same_thread=False)
+        if path:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __getitem__(self, task_id: str) -> Dict[str, Any]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        if row is None:
+            raise KeyError(task_id)
+        return json.loads(row[0])
+
+    def __setitem__(self, task_id: str, task: Dict[str, Any]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO tasks (task_id, site, score, exception, agent_v, data) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(task_id) DO UPDATE SET site = excluded.site, score = excluded.score, "
+                "exception = excluded.exception, agent_v = excluded.agent_v, data = excluded.data",
+                (task_id, *_indexed_values(task), json.dumps(task, ensure_ascii=False)),
+            )
+
+    def __delitem__(self, task_id: str) -> None:
+        with self._lock, self._conn:
+            deleted = self._conn.execute("DELETE FROM tasks WHERE task_id = ?", (task_id,)).rowcount
+        if not deleted:
+            raise KeyError(task_id)
+
+    def __contains__(self, task_id: object) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM tasks WHERE task_id = ?", (task_id,)).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            task_ids = [row[0] for row in self._conn.execute("SELECT task_id FROM tasks ORDER BY seq")]
+        return iter(task_ids)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM tasks")
+
+    def items(self, where: str = "", params: Tuple[Any, ...] = ()) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Stream ``(task_id, task)`` pairs in insertion order without loading every row."""
+        last_seq = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT seq, task_id, data FROM tasks WHERE seq > ? {where} ORDER BY seq LIMIT ?",
+                    (last_seq, *params, _FETCH_SIZE),
+                ).fetchall()
+            for seq, task_id, data in rows:
+                last_seq = seq
+                yield task_id, json.loads(data)
+            if len(rows) < _FETCH_SIZE:
+                return
+
+    def values(self) -> Iterator[Dict[str, Any]]:
+        return (task for _, task in self.items())
+
+    def find(self, field: str, value: Any) -> Dict[str, Dict[str, Any]]:
+        """
+        Tasks whose ``field`` equals ``value``, using the column index.
+
+        Args:
+            field (str): One of ``site``, ``score``, ``exception`` or ``agent_v``.
+            value (Any): Value to match.
+
+        Returns:
+            Dict containing matching tasks
+        """
+        if field not in _INDEXED_FIELDS:
+            raise ValueError(f"Unsupported filter field: {field}")
+        if field == "exception":
+            value = int(value) if isinstance(value, bool) else value
+        return dict(self.items(f"AND {field} = ?", (value,)))
+
+    def statistics(self) -> Dict[str, Any]:
+        """Counts and score aggregates computed in SQL."""
+        with self._lock:
+            total, with_exc, without_exc, sites, versions, scored, avg, lo, hi = self._conn.execute(
+                "SELECT COUNT(*), "
+                "COALESCE(SUM(exception = 1), 0), COALESCE(SUM(exception = 0), 0), "
+                "COUNT(DISTINCT NULLIF(site, '')), COUNT(DISTINCT NULLIF(agent_v, '')), "
+                "COUNT(score), AVG(score), MIN(score), MAX(score) FROM tasks"
+            ).fetchone()
+        if not total:
+            return {"total_tasks": 0}
+        stats = {
+            "total_tasks": total,
+            "tasks_with_exceptions": with_exc,
+            "tasks_without_exceptions": without_exc,
+            "unique_sites": sites,
+            "unique_agent_versions": versions,
+        }
+        if scored:
+            stats["average_score"] = avg
+            stats["min_score"] = lo
+            stats["max_score"] = hi
+        return stats
+
+    def write_json(self, path: str) -> None:
+        """Export all tasks to ``path`` in the ``results.json`` format, streaming rows."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            first = True
+            for task_id, task in self.items():
+                f.write(("{\n" if first else ",\n") + _json_entry(task_id, task))
+                first = False
+            f.write("{}" if first else "\n}")
+        os.replace(tmp_path, path)
+
+    def append_json(self, path: str, task_id: str) -> None:
+        """Add one task to an exported ``results.json`` without rewriting the file."""
+        entry = _json_entry(task_id, self[task_id])
+        try:
+            with open(path, 'rb+') as f:
+                f.seek(0, os.SEEK_END)
+                size = f.tell()
+                f.seek(max(size - 2, 0))
+                tail = f.read()
+                if size == 2 and tail == b"{}":
+                    f.seek(0)
+                    f.write(("{\n" + entry + "\n}").encode("utf-8"))
+                    return
+                if size > 2 and tail == b"\n}":
+                    f.seek(size - 2)
+                    f.write((",\n" + entry + "\n}").encode("utf-8"))
+                    return
+        except FileNotFoundError:
+            pass
+        logger.debug(f"Re-exporting {path}: not in the expected format for appending")
+        self.write_json(path)
+
+    def write_csv(self, path: str) -> None:
+        """Export all tasks to ``path`` in the ``results.csv`` format, streaming rows."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(RESULT_COLUMNS)
+            for task_id, task in self.items():
+                writer.writerow(_csv_row(task_id, task))
+        os.replace(tmp_path, path)
+
+    def append_csv(self, path: str, task_id: str) -> None:
+        """Add one task row to an exported ``results.csv``."""
+        try:
+            with open(path, 'r', encoding='utf-8', newline='') as f:
+                header = next(csv.reader(f), None)
+        except FileNotFoundError:
+            header = None
+        if header != RESULT_COLUMNS:
+            self.write_csv(path)
+            return
+        with open(path, 'a', encoding='utf-8', newline='') as f:
+            csv.writer(f).writerow(_csv_row(task_id, self[task_id]))
+
+    @staticmethod
+    def iter_experiment(experiment_dir: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Stream the task results of an experiment folder.
+
+        Reads ``results.db`` when present, falling back to ``results.json``
+        for experiments recorded before the store existed.
+        """
+        db_path = os.path.join(experiment_dir, "results.db")
+        if os.path.exists(db_path):
+            store = ResultsStore(db_path)
+            try:
+                yield from store.items()
+            finally:
+                store.close()
+            return
+        json_path = os.path.join(experiment_dir, "results.json")
+        if not os.path.exists(json_path):
+            raise FileNotFoundError(json_path)
+        with open(json_path, 'r', encoding='utf-8') as f:
+            yield from json.load(f).items()
@@ -1,4 +1,5 @@
 import copy
+import csv
 import json
 import os
 import shutil
@@ -9,6 +10,8 @@ import time
 import pandas as pd
 
 
+from cuga.backend.activity_tracker.results_store import RESULT_COLUMNS, ResultsStore
+from cuga.backend.activity_tracker.trajectory_writer import log_dir, read_trajectory, trajectory_writer
 from cuga.backend.cuga_graph.nodes.api.code_agent.model import CodeAgentOutput
 
 from cuga.backend.tools_env.registry.utils.types import AppDefinition
@@ -80,10 +83,14 @@ class ActivityTracker(object):
     score: float = 0.0
     tools: Dict[str, List[StructuredTool]] = {}
     apps: List[AppDefinition] = []
+    # Incremented by set_tools so consumers can tell when runtime tools changed
+    tools_version: int = 0
     # Task management attributes
-    tasks: Dict[str, Dict[str, Any]] = {}
+    tasks: ResultsStore = ResultsStore()
     experiment_folder: Optional[str] = None
     tasks_metadata: Optional[TasksMetadata] = None
+    # The next logged step starts a new trajectory file (the previous run's one is discarded)
+    _trajectory_fresh: bool = True
     if settings.advanced_features.enable_memory:
         from cuga.backend.memory.memory import Memory
 
@@ -246,6 +253,7 @@ class ActivityTracker(object):
         """
 
         self.tools = {}
+        self.tools_version += 1
         # logger.debug(f"tools:  {tools}")
 
         # Common prefixes to exclude (HTTP methods, etc.)
@@ -379,6 +387,7 @@ class ActivityTracker(object):
         self.task_id = task_id
         self.intent = intent
         self.user_id = None
+        self._trajectory_fresh = True
 
     def reload_steps(self, task_id: Optional[str] = None) -> bool:
         """
@@ -405,14 +414,14 @@ class ActivityTracker(object):
             logger.error(f"No trajectory path found for task_id: {target_task_id}")
             return False
 
-        if not os.path.exists(trajectory_path):
+        if not os.path.exists(trajectory_path) and not os.path.isdir(log_dir(trajectory_path)):
             logger.error(f"Trajectory file does not exist: {trajectory_path}")
             return False
 
         try:
-            # Read the JSON file
-            with open(trajectory_path, 'r', encoding='utf-8') as f:
-                trajectory_data = json.load(f)
+            # Read the trajectory log (or the compacted JSON file)
+            trajectory_writer.flush()
+            trajectory_data = read_trajectory(trajectory_path) or {}
 
             # Extract steps from the JSON
             steps_data = trajectory_data.get('steps', [])
@@ -480,8 +489,12 @@ class ActivityTracker(object):
             # Initialize empty files
             self._initialize_experiment_files(experiment_dir)
 
-        # Reset tasks dictionary
-        self.tasks = {}
+        # Reset tasks store
+        self.tasks.close()
+        if settings.advanced_features.tracker_enabled:
+            self.tasks = ResultsStore(os.path.join(experiment_dir, "results.db"))
+        else:
+            self.tasks = ResultsStore()
 
         if settings.advanced_features.enable_memory:
             from cuga.backend.memory.agentic_memory.client.exceptions import NamespaceNotFoundException
@@ -498,24 +511,10 @@ class ActivityTracker(object):
 
     def _initialize_experiment_files(self, experiment_dir: str) -> None:
         """Initialize empty result files for the experiment."""
-        # Define column order for CSV
-        columns = [
-            'task_id',
-            'site',
-            'intent',
-            'agent_answer',
-            'eval',
-            'score',
-            'exception',
-            'num_steps',
-            'fail_category',
-            'agent_v',
-        ]
-
-        # Create empty results.csv
+        # Create empty results.csv (header only, so finished tasks can be appended)
         results_csv_path = os.path.join(experiment_dir, "results.csv")
-        df = pd.DataFrame(columns=columns)
-        df.to_csv(results_csv_path, index=False, encoding='utf-8')
+        with open(results_csv_path, 'w', encoding='utf-8', newline='') as f:
+            csv.writer(f).writerow(RESULT_COLUMNS)
 
         # Create empty results.json
         results_json_path = os.path.join(experiment_dir, "results.json")
@@ -652,7 +651,7 @@ class ActivityTracker(object):
             # Include intent in step metadata so it's available during tip extraction
             step_data = step.model_dump()
             step_data['intent'] = self.intent  # Add the user's task intent
-            self.memory.add_step(
+            self.memory.enqueue_step(
                 namespace_id='memory',
                 run_id=self.experiment_folder,
                 step=step_data,
@@ -663,11 +662,17 @@ class ActivityTracker(object):
         self.steps.append(step)
 
         if settings.advanced_features.enable_memory and step.name == "FinalAnswerAgent":
-            # End run and execute any background processing.
-            self.memory.end_run(namespace_id="memory", run_id=self.experiment_folder)
+            # End run and execute any background processing once the queued steps are stored.
+            self.memory.enqueue_end_run(namespace_id="memory", run_id=self.experiment_folder)
 
         if settings.advanced_features.tracker_enabled:
-            self.to_file()
+            trajectory_writer.append_step(
+                self._trajectory_file(),
+                self._trajectory_header(),
+                step.model_dump(),
+                fresh=self._trajectory_fresh,
+            )
+            self._trajectory_fresh = False
         self.prompts = []
 
     def collect_step_external(self, step: Step, full_path: Optional[str] = None) -> None:
@@ -711,66 +716,19 @@ class ActivityTracker(object):
 
     def _to_file_external_append(self, full_path: str, new_step: Step):
         """
-        Append a new step to an existing JSON file or create a new file if it doesn't exist.
+        Append a new step to the trajectory log for an external file.
 
-        This method reads the existing file, appends the new step, and saves it back.
+        The write completes before returning so that the process owning the
+        task sees the step on its next ``reload_steps``.
 
         Args:
             full_path (str): The full file path to save/append to.
             new_step (Step): The new step to append.
         """
         try:
-            # Check if file exists and read existing data
-            if os.path.exists(full_path):
-                with open(full_path, 'r', encoding='utf-8') as f:
-                    try:
-                        existing_data = json.load(f)
-                        # Ensure the existing data has the expected structure
-                        if not isinstance(existing_data, dict) or 'steps' not in existing_data:
-                            logger.warning(f"Invalid JSON structure in {full_path}, creating new file")
-                            existing_data = None
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Invalid JSON in {full_path}, creating new file: {e}")
-                        existing_data = None
-            else:
-                existing_data = None
-
-            # If no valid existing data, create new structure
-            if existing_data is None:
-                data_to_save = {
-                    "intent": self.intent,
-                    "dataset_name": self.dataset_name,
-                    "actions_count": self.actions_count,
-                    "task_id": self.task_id,
-                    "eval": self.eval,
-                    "steps": [new_step.model_dump()],
-                    "score": self.score,
-                }
-            else:
-                # Update existing data with new step
-                existing_data["steps"].append(new_step.model_dump())
-                # Update other fields that might have changed
-                existing_data.update(
-                    {
-                        "intent": self.intent,
-                        "dataset_name": self.dataset_name,
-                        "actions_count": self.actions_count,
-                        "task_id": self.task_id,
-                        "eval": self.eval,
-                        "score": self.score,
-                    }
-                )
-                data_to_save = existing_data
-
-            # Write the updated data back to file
-            with open(full_path, 'w', encoding='utf-8') as f:
-                json.dump(
-                    data_to_save,
-                    f,
-                    ensure_ascii=False,
-                    indent=4,
-                )
-
+            trajectory_writer.append_step(
+                full_path, self._trajectory_header(), new_step.model_dump(), external=True, wait=True
+            )
         except Exception as e:
             logger.error(f"Failed to append step to file {full_path}: {e}")
             raise
@@ -784,7 +742,7 @@ class ActivityTracker(object):
         """
         self.score = score
         if settings.advanced_features.tracker_enabled:
-            self.to_file()
+            trajectory_writer.append_header(self._trajectory_file(), self._trajectory_header())
 
     def collect_step_with_pass(self) -> None:
         """
@@ -792,8 +750,8 @@ class ActivityTracker(object):
         """
         pass
 
-    def to_file(self):
-        """Save current task data to file in the experiment directory."""
+    def _trajectory_file(self) -> str:
+        """Path of the current task's trajectory JSON file."""
         if self.experiment_folder:
             # Save to experiment directory
             source_dir = os.path.join(self._base_dir, self.experiment_folder)
@@ -804,23 +762,29 @@ class ActivityTracker(object):
         os.makedirs(source_dir, exist_ok=True)
 
         filename = self.task_id if self.task_id != "default" else self.session_id
-        filepath = os.path.join(source_dir, f"{filename}.json")
-
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(
-                {
-                    "intent": self.intent,
-                    "dataset_name": self.dataset_name,
-                    "actions_count": self.actions_count,
-                    "task_id": self.task_id,
-                    "eval": self.eval,
-                    "steps": [d.model_dump() for d in self.steps],
-                    "score": self.score,
-                },
-                f,
-                ensure_ascii=False,
-                indent=4,
-            )
+        return os.path.join(source_dir, f"{filename}.json")
+
+    def _trajectory_header(self) -> Dict[str, Any]:
+        return {
+            "intent": self.intent,
+            "dataset_name": self.dataset_name,
+            "actions_count": self.actions_count,
+            "task_id": self.task_id,
+            "eval": self.eval,
+            "score": self.score,
+        }
+
+    def compact_trajectory(self) -> None:
+        """
+        Fold the current task's trajectory log into the legacy ``<task>.json`` file.
+
+        Called on every exit path of a run, including ones that do not finish
+        the task (a human-in-the-loop interrupt, a stop or a disconnect), so
+        the JSON file is up to date whenever a run ends. A task that continues
+        later appends to the compacted trajectory.
+        """
+        if settings.advanced_features.tracker_enabled:
+            trajectory_writer.compact(self._trajectory_file())
 
     def finish_task(
         self,
@@ -863,7 +827,8 @@ class ActivityTracker(object):
 
         # Calculate number of api calls
         api_calls_num = len([step for step in self.steps if "api_call" in step.name])
-        # Add task to internal storage
+        is_new_task = task_id not in self.tasks
+        # Add task to the results store
         self.tasks[task_id] = {
             "site": site,
             "intent": intent,
@@ -884,68 +849,33 @@ class ActivityTracker(object):
 
         # Update result files only if tracker is enabled
         if settings.advanced_features.tracker_enabled:
-            self._update_result_files()
+            self.compact_trajectory()
+            self._update_result_files(appended_task_id=task_id if is_new_task else None)
             self._add_to_progress_file(task_id)
 
         return task_id
 
-    def _update_result_files(self) -> None:
-        """Update both JSON and CSV result files."""
+    def _update_result_files(self, appended_task_id: Optional[str] = None) -> None:
+        """
+        Update both JSON and CSV result files.
+
+        Args:
+            appended_task_id (str, optional): A task that was just added; it is appended
+                to both files instead of re-exporting every task.
+        """
         if not self.experiment_folder:
             return
 
         experiment_dir = os.path.join(self._base_dir, self.experiment_folder)
-
-        # Update results.json
         results_json_path = os.path.join(experiment_dir, "results.json")
-        with open(results_json_path, 'w', encoding='utf-8') as f:
-            json.dump(self.tasks, f, indent=2, ensure_ascii=False)
-
-        # Update results.csv
-        self._save_csv(experiment_dir)
-
-    def _save_csv(self, experiment_dir: str) -> None:
-        """Save current tasks to CSV file using pandas."""
-        # Define the column order
-        columns = [
-            'task_id',
-            'site',
-            'intent',
-            'agent_answer',
-            'eval',
-            'score',
-            'exception',
-            'num_steps',
-            'fail_category',
-            'agent_v',
-            'duration',
-            'total_llm_calls',
-            'total_tokens',
-            'api_calls',
-            'total_cost',
-            'total_cache_input_tokens',
-        ]
+        results_csv_path = os.path.join(experiment_dir, "results.csv")
 
-        if not self.tasks:
-            # Create empty DataFrame with headers if no tasks
-            df = pd.DataFrame(columns=columns)
+        if appended_task_id is not None:
+            self.tasks.append_json(results_json_path, appended_task_id)
+            self.tasks.append_csv(results_csv_path, appended_task_id)
         else:
-            # Convert tasks dictionary to list of dictionaries for DataFrame
-            data = []
-            for task_id, task_data in self.tasks.items():
-                row = {'task_id': task_id}
-                row.update(task_data)
-                data.append(row)
-
-            # Create DataFrame
-            df = pd.DataFrame(data)
-
-            # Reorder columns to match the desired order
-            df = df.reindex(columns=columns)
-
-        # Save to CSV
-        results_csv_path = os.path.join(experiment_dir, "results.csv")
-        df.to_csv(results_csv_path, index=False, encoding='utf-8')
+            self.tasks.write_json(results_json_path)
+            self.tasks.write_csv(results_csv_path)
 
     def _add_to_progress_file(self, task_id: str) -> None:
         """Add a task ID to the .progress file."""
@@ -987,28 +917,24 @@ class ActivityTracker(object):
         Returns:
             bool: True if task was updated, False if task not found
         """
-        if task_id not in self.tasks:
+        task = self.tasks.get(task_id)
+        if task is None:
             return False
 
         # Update only provided fields
-        if site is not None:
-            self.tasks[task_id]["site"] = site
-        if intent is not None:
-            self.tasks[task_id]["intent"] = intent
-        if agent_answer is not None:
-            self.tasks[task_id]["agent_answer"] = agent_answer
-        if eval is not None:
-            self.tasks[task_id]["eval"] = eval
-        if score is not None:
-            self.tasks[task_id]["score"] = score
-        if exception is not None:
-            self.tasks[task_id]["exception"] = exception
-        if num_steps is not None:
-            self.tasks[task_id]["num_steps"] = num_steps
-        if fail_category is not None:
-            self.tasks[task_id]["fail_category"] = fail_category
-        if agent_v is not None:
-            self.tasks[task_id]["agent_v"] = agent_v
+        updates = {
+            "site": site,
+            "intent": intent,
+            "agent_answer": agent_answer,
+            "eval": eval,
+            "score": score,
+            "exception": exception,
+            "num_steps": num_steps,
+            "fail_category": fail_category,
+            "agent_v": agent_v,
+        }
+        task.update({field: value for field, value in updates.items() if value is not None})
+        self.tasks[task_id] = task
 
         if settings.advanced_features.tracker_enabled:
             self._update_result_files()
@@ -1050,7 +976,7 @@ class ActivityTracker(object):
         Returns:
             Dict containing all tasks
         """
-        return self.tasks.copy()
+        return dict(self.tasks.items())
 
     def find_tasks_by_score(self, score: float) -> Dict[str, Dict[str, Any]]:
         """
@@ -1062,7 +988,7 @@ class ActivityTracker(object):
         Returns:
             Dict containing matching tasks
         """
-        return {task_id: task for task_id, task in self.tasks.items() if task.get("score") == score}
+        return self.tasks.find("score", score)
 
     def find_tasks_by_site(self, site: str) -> Dict[str, Dict[str, Any]]:
         """
@@ -1074,7 +1000,7 @@ class ActivityTracker(object):
         Returns:
             Dict containing matching tasks
         """
-        return {task_id: task for task_id, task in self.tasks.items() if task.get("site") == site}
+        return self.tasks.find("site", site)
 
     def find_tasks_by_exception(self, exception: bool) -> Dict[str, Dict[str, Any]]:
         """
@@ -1086,7 +1012,7 @@ class ActivityTracker(object):
         Returns:
             Dict containing matching tasks
         """
-        return {task_id: task for task_id, task in self.tasks.items() if task.get("exception") == exception}
+        return self.tasks.find("exception", exception)
 
     def find_tasks_by_agent_version(self, agent_v: str) -> Dict[str, Dict[str, Any]]:
         """
@@ -1098,11 +1024,11 @@ class ActivityTracker(object):
         Returns:
             Dict containing matching tasks
         """
-        return {task_id: task for task_id, task in self.tasks.items() if task.get("agent_v") == agent_v}
+        return self.tasks.find("agent_v", agent_v)
 
     def clear_all_tasks(self) -> None:
         """Remove all tasks from result files."""
-        self.tasks = {}
+        self.tasks.clear()
         if self.experiment_folder and settings.advanced_features.tracker_enabled:
             self._update_result_files()
             # Clear progress file
@@ -1126,27 +1052,7 @@ class ActivityTracker(object):
         Returns:
             Dict containing task statistics
         """
-        if not self.tasks:
-            return {"total_tasks": 0}
-
-        stats = {
-            "total_tasks": len(self.tasks),
-            "tasks_with_exceptions": len([t for t in self.tasks.values() if t.get("exception") is True]),
-            "tasks_without_exceptions": len([t for t in self.tasks.values() if t.get("exception") is False]),
-            "unique_sites": len(set(t.get("site") for t in self.tasks.values() if t.get("site"))),
-            "unique_agent_versions": len(
-                set(t.get("agent_v") for t in self.tasks.values() if t.get("agent_v"))
-            ),
-        }
-
-        # Score statistics
-        scores = [t.get("score") for t in self.tasks.values() if t.get("score") is not None]
-        if scores:
-            stats["average_score"] = sum(scores) / len(scores)
-            stats["min_score"] = min(scores)
-            stats["max_score"] = max(scores)
-
-        return stats
+        return self.tasks.statistics()
 
     def get_dataframe(self) -> pd.DataFrame:
         """
@@ -1260,36 +1166,28 @@ class ActivityTracker(object):
             description=description,
         )
 
-        merged_tasks = {}
+        # The merged experiment's store receives each source row as it is read
+        merged_tasks = self.tasks
         all_task_ids = set()
-        task_source_mapping = {}  # Track which folder each task came from
 
-        # First pass: collect all tasks and identify duplicates
+        # Stream tasks from every source folder, resolving duplicates as they arrive
         for folder_name in experiment_folders:
             folder_path = os.path.join(self._base_dir, folder_name)
-            results_json_path = os.path.join(folder_path, "results.json")
-
-            if not os.path.exists(results_json_path):
-                logger.warning(f"Results file not found in {folder_name}, skipping")
-                continue
 
             try:
-                with open(results_json_path, 'r', encoding='utf-8') as f:
-                    folder_tasks = json.load(f)
-
-                logger.info(f"Processing {len(folder_tasks)} tasks from {folder_name}")
-
-                for task_id, task_data in folder_tasks.items():
+                processed = 0
+                for task_id, task_data in ResultsStore.iter_experiment(folder_path):
+                    processed += 1
                     all_task_ids.add(task_id)
+                    existing = merged_tasks.get(task_id)
 
-                    if task_id not in merged_tasks:
+                    if existing is None:
                         # First occurrence of this task
                         merged_tasks[task_id] = {**task_data, 'source_experiment': folder_name}
-                        task_source_mapping[task_id] = folder_name
                         logger.debug(f"Added new task {task_id} from {folder_name}")
                     else:
                         # Task already exists, apply preference logic
-                        existing_score = merged_tasks[task_id].get('score', 0.0)
+                        existing_score = existing.get('score', 0.0)
                         new_score = task_data.get('score', 0.0)
                         if existing_score == 1.0 and new_score != 1.0:
                             # Keep existing (perfect score)
@@ -1306,7 +1204,6 @@ class ActivityTracker(object):
 
                         if should_replace:
                             merged_tasks[task_id] = {**task_data, 'source_experiment': folder_name}
-                            task_source_mapping[task_id] = folder_name
                             logger.debug(
                                 f"Replaced task {task_id}: {existing_score} -> {new_score} from {folder_name}"
                             )
@@ -1315,13 +1212,15 @@ class ActivityTracker(object):
                                 f"Kept existing task {task_id}: score {existing_score} vs {new_score}"
                             )
 
+                logger.info(f"Processed {processed} tasks from {folder_name}")
+
+            except FileNotFoundError:
+                logger.warning(f"Results file not found in {folder_name}, skipping")
+                continue
             except Exception as e:
                 logger.error(f"Error processing {folder_name}: {e}")
                 continue
 
-        # Update the merged experiment with final task list
-        self.tasks = merged_tasks
-
         # Update metadata with actual task IDs
         if self.tasks_metadata:
             self.tasks_metadata.task_ids = list(all_task_ids)
@@ -0,0 +1,317 @@
+"""
+Append-only trajectory log used by ActivityTracker.
+
+A trajectory that used to live in ``<task>.json`` is written as a
+``<task>.traj/`` directory of JSONL segments instead. Each record is a
+single step or header update, so collecting a step costs one append
+rather than re-serializing the whole trajectory. Large strings
+(screenshots) are stored once under ``blobs/`` by content hash and
+referenced from the step. ``compact`` folds the log back into the legacy
+``<task>.json`` document; logs a process leaves uncompacted (a run that
+ended without finishing its task) are compacted when it exits.
+
+Every process writes its own segments (``<pid>-<n>.jsonl``), so the agent
+and the registry server can log to the same trajectory without coordinating;
+readers merge the segments by timestamp.
+"""
+
+import atexit
+import hashlib
+import itertools
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+
+SEGMENT_MAX_BYTES = int(os.getenv("CUGA_TRAJECTORY_SEGMENT_BYTES", str(8 * 1024 * 1024)))
+BLOB_MIN_CHARS = int(os.getenv("CUGA_TRAJECTORY_BLOB_MIN_CHARS", "4096"))
+
+# Step fields that are moved out-of-line when they are large
+BLOB_FIELDS = ("image_before",)
+BLOB_PREFIX = "blob:sha256:"
+
+# Top-level keys of the legacy trajectory document, in their original order
+HEADER_FIELDS = ("intent", "dataset_name", "actions_count", "task_id", "eval", "score")
+
+
+def log_dir(path: str) -> str:
+    """Directory holding the segmented log for the trajectory file ``path``."""
+    root, ext = os.path.splitext(path)
+    return (root if ext == ".json" else path) + ".traj"
+
+
+def _resolve_blobs(directory: str, step: Dict[str, Any], cache: Dict[str, str]) -> Dict[str, Any]:
+    for field in BLOB_FIELDS:
+        value = step.get(field)
+        if not isinstance(value, str) or not value.startswith(BLOB_PREFIX):
+            continue
+        digest = value[len(BLOB_PREFIX) :]
+        if digest not in cache:
+            try:
+                with open(os.path.join(directory, "blobs", digest), "r", encoding="utf-8") as f:
+                    cache[digest] = f.read()
+            except OSError:
+                logger.warning(f"Missing trajectory blob {digest} in {directory}")
+                cache[digest] = ""
+        step[field] = cache[digest]
+    return step
+
+
+def read_trajectory(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a trajectory in the legacy document shape.
+
+    Reads the segmented log when one exists, otherwise the legacy JSON file.
+
+    Args:
+        path (str): Path of the legacy ``<task>.json`` trajectory file.
+
+    Returns:
+        Optional[Dict[str, Any]]: The trajectory, or None if neither form exists.
+    """
+    directory = log_dir(path)
+    if not os.path.isdir(directory):
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    records: List[Dict[str, Any]] = []
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(".jsonl"):
+            continue
+        with open(os.path.join(directory, name), "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # Torn tail of a write still in progress in another process
+                    continue
+    records.sort(key=lambda record: (record["ts"], record.get("pid", 0), record["seq"]))
+
+    header: Dict[str, Any] = {}
+    external_header: Dict[str, Any] = {}
+    steps: List[Dict[str, Any]] = []
+    blob_cache: Dict[str, str] = {}
+    for record in records:
+        if record["kind"] == "step":
+            steps.append(_resolve_blobs(directory, record["step"], blob_cache))
+        elif record["kind"] == "header":
+            (external_header if record.get("external") else header).update(record["header"])
+
+    merged = {**external_header, **header}
+    document: Dict[str, Any] = {field: merged.get(field) for field in HEADER_FIELDS if field != "score"}
+    document["steps"] = steps
+    document["score"] = merged.get("score")
+    return document
+
+
+class TrajectoryWriter:
+    """
+    Background writer for segmented trajectory logs.
+
+    Records are queued by the caller and written in batches by a daemon
+    thread; ``flush`` waits for everything queued so far to reach disk.
+    """
+
+    def __init__(self, segment_max_bytes: int = SEGMENT_MAX_BYTES, blob_min_chars: int = BLOB_MIN_CHARS):
+        self.segment_max_bytes = segment_max_bytes
+        self.blob_min_chars = blob_min_chars
+        self._queue: "queue.Queue[Tuple[Optional[str], Optional[Dict[str, Any]], bool, Optional[threading.Event]]]" = (
+            queue.Queue()
+        )
+        self._seq = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._segments: Dict[str, int] = {}
+        # Trajectories this process has logged to since they were last compacted
+        self._uncompacted: Set[str] = set()
+        atexit.register(self.close)
+
+    def append_step(
+        self,
+        path: str,
+        header: Dict[str, Any],
+        step: Dict[str, Any],
+        fresh: bool = False,
+        external: bool = False,
+        wait: bool = False,
+    ) -> None:
+        """
+        Queue a step (and the current header fields) for the trajectory at ``path``.
+
+        Args:
+            path (str): Path of the legacy ``<task>.json`` trajectory file.
+            header (Dict[str, Any]): Current values of the top-level trajectory fields.
+            step (Dict[str, Any]): The serialized step.
+            fresh (bool): Discard any previous trajectory at ``path`` first.
+            external (bool): The header comes from a process that does not own the task.
+            wait (bool): Block until the record is on disk, so other processes can read it.
+        """
+        self._put(path, self._record("header", header=header, external=external), fresh, None)
+        self._put(path, self._record("step", step=step), False, threading.Event() if wait else None)
+
+    def append_header(self, path: str, header: Dict[str, Any], external: bool = False) -> None:
+        """Queue an update of the top-level trajectory fields (e.g. the score)."""
+        self._put(path, self._record("header", header=header, external=external), False, None)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every record queued so far has been written."""
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        self._queue.put((None, None, False, done))
+        return done.wait(timeout)
+
+    def compact(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Fold the segmented log for ``path`` into the legacy JSON file and remove the log.
+
+        Args:
+            path (str): Path of the legacy ``<task>.json`` trajectory file.
+
+        Returns:
+            Optional[Dict[str, Any]]: The compacted trajectory, or None if nothing was logged.
+        """
+        self.flush()
+        directory = log_dir(path)
+        with self._io_lock:
+            if not os.path.isdir(directory):
+                return None
+            document = read_trajectory(path)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(document, f, ensure_ascii=False, indent=4)
+            os.replace(tmp_path, path)
+            shutil.rmtree(directory, ignore_errors=True)
+            self._segments.pop(path, None)
+            self._uncompacted.discard(path)
+        return document
+
+    def close(self) -> None:
+        """Write queued records and compact every trajectory this process left as a log."""
+        self.flush()
+        for path in list(self._uncompacted):
+            try:
+                self.compact(path)
+            except Exception as e:
+                logger.error(f"Failed to compact trajectory {path}: {e}")
+
+    def _record(self, kind: str, **fields: Any) -> Dict[str, Any]:
+        return {"kind": kind, "ts": time.time_ns(), "pid": os.getpid(), "seq": next(self._seq), **fields}
+
+    def _put(
+        self, path: str, record: Dict[str, Any], fresh: bool, done: Optional[threading.Event]
+    ) -> None:
+        self._ensure_thread()
+        self._queue.put((path, record, fresh, done))
+        if done is not None:
+            done.wait()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="trajectory-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                with self._io_lock:
+                    self._write_batch(batch)
+            except Exception as e:
+                logger.error(f"Failed to write trajectory records: {e}")
+            finally:
+                for _, _, _, done in batch:
+                    if done is not None:
+                        done.set()
+
+    def _write_batch(self, batch) -> None:
+        pending: Dict[str, List[str]] = {}
+        for path, record, fresh, _ in batch:
+            if path is None:
+                continue
+            if fresh:
+                self._write_lines(pending)
+                pending = {}
+                self._discard(path)
+            if path not in pending:
+                pending[path] = self._seed(path)
+            if record["kind"] == "step":
+                record["step"] = self._externalize_blobs(path, record["step"])
+            pending[path].append(json.dumps(record, ensure_ascii=False))
+        self._write_lines(pending)
+
+    def _discard(self, path: str) -> None:
+        shutil.rmtree(log_dir(path), ignore_errors=True)
+        if os.path.exists(path):
+            os.remove(path)
+        self._segments.pop(path, None)
+        self._uncompacted.discard(path)
+
+    def _seed(self, path: str) -> List[str]:
+        """Continue a trajectory that was already compacted by replaying its legacy JSON first."""
+        if os.path.isdir(log_dir(path)) or not os.path.exists(path):
+            return []
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                document = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Not seeding trajectory log from {path}: {e}")
+            return []
+        header = {field: document.get(field) for field in HEADER_FIELDS}
+        records = [{"kind": "header", "ts": 0, "pid": 0, "seq": 0, "header": header}]
+        for index, step in enumerate(document.get("steps", [])):
+            step = self._externalize_blobs(path, step)
+            records.append({"kind": "step", "ts": 0, "pid": 0, "seq": index + 1, "step": step})
+        return [json.dumps(record, ensure_ascii=False) for record in records]
+
+    def _externalize_blobs(self, path: str, step: Dict[str, Any]) -> Dict[str, Any]:
+        for field in BLOB_FIELDS:
+            value = step.get(field)
+            if not isinstance(value, str) or len(value) < self.blob_min_chars:
+                continue
+            digest = hashlib.sha256(value.encode("utf-8")).hexdigest()
+            blob_dir = os.path.join(log_dir(path), "blobs")
+            blob_path = os.path.join(blob_dir, digest)
+            if not os.path.exists(blob_path):
+                os.makedirs(blob_dir, exist_ok=True)
+                tmp_path = f"{blob_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(value)
+                os.replace(tmp_path, blob_path)
+            step = {**step, field: BLOB_PREFIX + digest}
+        return step
+
+    def _write_lines(self, pending: Dict[str, List[str]]) -> None:
+        for path, lines in pending.items():
+            if not lines:
+                continue
+            directory = log_dir(path)
+            os.makedirs(directory, exist_ok=True)
+            number = self._segments.get(path, 0)
+            segment = os.path.join(directory, f"{os.getpid()}-{number:06d}.jsonl")
+            if os.path.exists(segment) and os.path.getsize(segment) >= self.segment_max_bytes:
+                number += 1
+                segment = os.path.join(directory, f"{os.getpid()}-{number:06d}.jsonl")
+            self._segments[path] = number
+            self._uncompacted.add(path)
+            with open(segment, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+
+
+trajectory_writer = TrajectoryWriter()
@@ -12,6 +12,7 @@ from cuga.registry.loader import Registry
 from cuga.observability import propagate_trace
 from cuga.observability.collector import get_collector, set_collector
 from cuga.observability import ObservabilityCollector, OTELExporter, ConsoleExporter
+from cuga.mcp.telemetry.metrics import metrics as mcp_metrics
 from pathlib import Path
 
 registry_path = Path("docs/mcp/registry.yaml")
@@ -97,7 +98,7 @@ async def metrics():
     Returns metrics in Prometheus text format for scraping.
     """
     collector = get_collector()
-    return collector.get_prometheus_metrics()
+    return collector.get_prometheus_metrics() + mcp_metrics.to_prometheus()
 
 
 @app.post("/plan")
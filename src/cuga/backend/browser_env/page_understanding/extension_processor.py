@@ -4,17 +4,20 @@ from cuga.backend.browser_env.page_understanding.pu_extractor_chrome_extension i
 )
 from cuga.backend.browser_env.page_understanding.pu_transform import PuAnswer
 from cuga.backend.browser_env.page_understanding.tranformer_utils.dom_transform_utils import (
-    flatten_domtree_to_str,
+    DomTreeSerializer,
 )
 from cuga.backend.browser_env.page_understanding.tranformer_utils.transform_utils import flatten_axtree_to_str
 
 
-from typing import Dict
+from typing import Dict, Optional
 
 
 class ExtensionProcessor:
     def __init__(self, extractor: PageUnderstandingExtractorProtocol) -> None:
         self.extractor = extractor
+        # Reused across observations so unchanged DOM nodes are not re-formatted
+        self._dom_serializer: Optional[DomTreeSerializer] = None
+        self._dom_serializer_url: Optional[str] = None
 
     async def extract(self, config: Dict = {}) -> PUExtractedChromeExtension:
         """Extract data and store it internally."""
@@ -42,10 +45,16 @@ class ExtensionProcessor:
 
         dom_tree = pu_extracted.dom_tree
         if dom_tree is not None:
-            rep = flatten_domtree_to_str(
-                dom_tree=dom_tree,
+            filter_visible_only = kwargs.get("filter_visible_only", False)
+            if self._dom_serializer is None or self._dom_serializer.filter_visible_only != filter_visible_only:
+                self._dom_serializer = DomTreeSerializer(filter_visible_only=filter_visible_only)
+            elif self._dom_serializer_url != pu_extracted.url:
+                self._dom_serializer.reset()
+            self._dom_serializer_url = pu_extracted.url
+            rep = self._dom_serializer.serialize(
+                dom_tree,
                 extra_properties=pu_extracted.extra_properties or {},
-                filter_visible_only=kwargs.get("filter_visible_only", False),
+                max_chars=kwargs.get("max_chars"),
             )
         else:
             rep = flatten_axtree_to_str(
@@ -3,6 +3,8 @@
 # Licensed under the Apache License, Version 2.0
 
 import ast
+from typing import Dict, List, Optional, Tuple, Union
+
 from ..types.dom_tree_types import DomTreeResult, NodeData, TextNodeData
 
 IGNORED_DOM_TAGS = ["br"]
@@ -37,16 +39,167 @@ def flatten_domtree_to_str(
     hide_all_children: bool = False,
     hide_all_bids: bool = False,
     include_xpath: bool = False,
+    max_chars: Optional[int] = None,
 ) -> str:
-    """Formats the DOM tree into a string text similar to accessibility tree format"""
+    """Formats the DOM tree into a string text similar to accessibility tree format
 
-    def dfs(node_id: str, depth: int, parent_node_filtered: bool, parent_node_name: str) -> str:
-        tree_str = ""
-        node = dom_tree.get_node(node_id)
-        if node is None:
-            return tree_str
+    If max_chars is set, output stops before the first line that would exceed it.
+    """
+    serializer = DomTreeSerializer(
+        with_visible=with_visible,
+        with_clickable=with_clickable,
+        with_center_coords=with_center_coords,
+        with_bounding_box_coords=with_bounding_box_coords,
+        with_som=with_som,
+        skip_generic=skip_generic,
+        filter_visible_only=filter_visible_only,
+        filter_with_bid_only=filter_with_bid_only,
+        filter_som_only=filter_som_only,
+        coord_decimals=coord_decimals,
+        ignored_tags=ignored_tags,
+        ignored_attributes=ignored_attributes,
+        remove_redundant_text=remove_redundant_text,
+        hide_bid_if_invisible=hide_bid_if_invisible,
+        hide_all_children=hide_all_children,
+        hide_all_bids=hide_all_bids,
+        include_xpath=include_xpath,
+        incremental=False,
+    )
+    return serializer.serialize(dom_tree, extra_properties=extra_properties, max_chars=max_chars)
+
+
+class DomTreeSerializer:
+    """
+    Serializer behind flatten_domtree_to_str, reusable across observations of a page.
+
+    The tree is walked iteratively in document order and the lines are joined
+    once at the end, so the cost is linear in the size of the page and deep
+    DOMs cannot overflow the recursion limit. With incremental=True the
+    rendered line of every node is kept until the next serialize call and
+    reused when the node and its extra properties are unchanged, so only the
+    nodes that changed between consecutive observations are re-formatted.
+    Trees are compared by value, so pass a freshly extracted tree each time
+    rather than mutating the previous one in place.
+    """
 
-        indent = "\t" * depth
+    def __init__(
+        self,
+        with_visible: bool = False,
+        with_clickable: bool = False,
+        with_center_coords: bool = False,
+        with_bounding_box_coords: bool = False,
+        with_som: bool = False,
+        skip_generic: bool = True,
+        filter_visible_only: bool = False,
+        filter_with_bid_only: bool = False,
+        filter_som_only: bool = False,
+        coord_decimals: int = 0,
+        ignored_tags=IGNORED_DOM_TAGS,
+        ignored_attributes=IGNORED_DOM_ATTRIBUTES,
+        remove_redundant_text: bool = True,
+        hide_bid_if_invisible: bool = False,
+        hide_all_children: bool = False,
+        hide_all_bids: bool = False,
+        include_xpath: bool = False,
+        incremental: bool = True,
+    ):
+        self.with_visible = with_visible
+        self.with_clickable = with_clickable
+        self.with_center_coords = with_center_coords
+        self.with_bounding_box_coords = with_bounding_box_coords
+        self.with_som = with_som
+        self.skip_generic = skip_generic
+        self.filter_visible_only = filter_visible_only
+        self.filter_with_bid_only = filter_with_bid_only
+        self.filter_som_only = filter_som_only
+        self.coord_decimals = coord_decimals
+        self.ignored_tags = ignored_tags
+        self.ignored_attributes = ignored_attributes
+        self.remove_redundant_text = remove_redundant_text
+        self.hide_bid_if_invisible = hide_bid_if_invisible
+        self.hide_all_children = hide_all_children
+        self.hide_all_bids = hide_all_bids
+        self.include_xpath = include_xpath
+        self.incremental = incremental
+        # node_id -> (node, extra properties, parent filtered, parent name, rendered node)
+        self._memo: Dict[str, Tuple] = {}
+        self._memo_had_extra_properties = False
+        self.reused_nodes = 0
+        self.rendered_nodes = 0
+
+    def reset(self) -> None:
+        """Forget the previous observation (e.g. after navigating to another page)."""
+        self._memo = {}
+
+    def serialize(self, dom_tree: DomTreeResult, extra_properties: dict = None, max_chars: Optional[int] = None) -> str:
+        """Formats the DOM tree, reusing unchanged nodes from the previous call when incremental"""
+        extra_properties = extra_properties or {}
+        # hide_bid_if_invisible depends on whether any extra properties were given at all
+        previous = self._memo if bool(extra_properties) == self._memo_had_extra_properties else {}
+        memo: Dict[str, Tuple] = {}
+        self.reused_nodes = 0
+        self.rendered_nodes = 0
+
+        lines: List[str] = []
+        size = -1  # no separator before the first line
+        stack = [(dom_tree.root_id, 0, False, "")]
+        while stack:
+            node_id, depth, parent_node_filtered, parent_node_name = stack.pop()
+            node = dom_tree.get_node(node_id)
+            if node is None:
+                continue
+
+            node_extra = extra_properties.get(node.dom_tree_id) if isinstance(node, NodeData) else None
+            cached = previous.get(node_id) if self.incremental else None
+            if (
+                cached is not None
+                and cached[2] == parent_node_filtered
+                and cached[3] == parent_node_name
+                and cached[1] == node_extra
+                and cached[0] == node
+            ):
+                rendered = cached[4]
+                self.reused_nodes += 1
+            else:
+                rendered = self._render_node(node, parent_node_filtered, parent_node_name, extra_properties)
+                self.rendered_nodes += 1
+            if self.incremental:
+                memo[node_id] = (node, node_extra, parent_node_filtered, parent_node_name, rendered)
+
+            node_str, skip_node, filter_node, node_name = rendered
+            if node_str is not None:
+                line = "\t" * depth + node_str
+                if max_chars is not None:
+                    size += len(line) + 1
+                    if size > max_chars:
+                        break
+                lines.append(line)
+
+            if isinstance(node, NodeData):
+                child_depth = depth if skip_node else (depth + 1)
+                for child_id in reversed(node.children):
+                    if child_id == node_id:  # avoid self-reference
+                        continue
+                    stack.append((child_id, child_depth, filter_node, node_name))
+
+        self._memo = memo
+        self._memo_had_extra_properties = bool(extra_properties)
+        return "\n".join(lines)
+
+    def _render_node(
+        self,
+        node: Union[NodeData, TextNodeData],
+        parent_node_filtered: bool,
+        parent_node_name: str,
+        extra_properties: dict,
+    ) -> Tuple[Optional[str], bool, bool, str]:
+        """
+        Format a single node, without indentation.
+
+        Returns:
+            The node string (None if the node is not printed), whether the node
+            is skipped, whether it is filtered along with its children, and its name.
+        """
         skip_node = False  # node will not be printed, with no effect on children nodes
         filter_node = False  # node will not be printed, possibly along with its children nodes
 
@@ -57,140 +210,118 @@ def flatten_domtree_to_str(
                 skip_node = True
             elif parent_node_filtered:
                 skip_node = True
-            elif remove_redundant_text and node_text in parent_node_name:
+            elif self.remove_redundant_text and node_text in parent_node_name:
                 skip_node = True
-            elif filter_visible_only and not node.is_visible:
+            elif self.filter_visible_only and not node.is_visible:
                 skip_node = True
 
-            if not skip_node:
-                tree_str += f'{indent}text "{node_text}"'
-            return tree_str
+            return (None if skip_node else f'text "{node_text}"'), skip_node, filter_node, ""
 
         # Handle element nodes
-        elif isinstance(node, NodeData):
-            node_tag = node.tag_name.lower()
-            node_name = ""
-            node_value = None
-
-            # Extract name from various attributes
-            if "title" in node.attributes and node.attributes["title"]:
-                node_name = node.attributes["title"]
-            elif "alt" in node.attributes and node.attributes["alt"]:
-                node_name = node.attributes["alt"]
-            elif "placeholder" in node.attributes and node.attributes["placeholder"]:
-                node_name = node.attributes["placeholder"]
-            elif "value" in node.attributes and node.attributes["value"]:
-                node_value = node.attributes["value"]
-                node_name = node_value
-            elif "aria-label" in node.attributes and node.attributes["aria-label"]:
-                node_name = node.attributes["aria-label"]
-            elif "id" in node.attributes and node.attributes["id"]:
-                node_name = node.attributes["id"]
-            elif "class" in node.attributes and node.attributes["class"]:
-                node_name = node.attributes["class"]
-
-            # Check if we should skip this tag
-            if node_tag in ignored_tags:
-                skip_node = True
-
-            # Extract bid (assuming it might be in attributes or highlight_index)
-            bid = node.dom_tree_id if node.dom_tree_id is not None else None
-
-            # Extract node attributes
-            attributes = []
-            for attr_name, attr_value in node.attributes.items():
-                if attr_name in ignored_attributes or attr_value is None:
-                    continue
-                elif attr_name in ("required", "disabled", "checked", "selected"):
-                    if attr_value == "true" or attr_value == attr_name:
-                        attributes.append(attr_name)
-                elif attr_name not in ("title", "alt", "placeholder", "value", "aria-label", "id", "class"):
-                    # Only include non-name attributes
-                    attributes.append(f"{attr_name}={repr(attr_value)}")
-
-            # Add DOM-specific attributes
-            if node.is_interactive:
-                attributes.append("interactive")
-            if include_xpath:
-                attributes.append(f'xpath="{node.xpath}"')
-
-            if not node.highlight_index:
-                skip_node = True
-
-            if skip_generic and node_tag == "div" and not attributes and not node_name:
-                skip_node = True
+        node_tag = node.tag_name.lower()
+        node_name = ""
+        node_value = None
+
+        # Extract name from various attributes
+        if "title" in node.attributes and node.attributes["title"]:
+            node_name = node.attributes["title"]
+        elif "alt" in node.attributes and node.attributes["alt"]:
+            node_name = node.attributes["alt"]
+        elif "placeholder" in node.attributes and node.attributes["placeholder"]:
+            node_name = node.attributes["placeholder"]
+        elif "value" in node.attributes and node.attributes["value"]:
+            node_value = node.attributes["value"]
+            node_name = node_value
+        elif "aria-label" in node.attributes and node.attributes["aria-label"]:
+            node_name = node.attributes["aria-label"]
+        elif "id" in node.attributes and node.attributes["id"]:
+            node_name = node.attributes["id"]
+        elif "class" in node.attributes and node.attributes["class"]:
+            node_name = node.attributes["class"]
+
+        # Check if we should skip this tag
+        if node_tag in self.ignored_tags:
+            skip_node = True
+
+        # Extract bid (assuming it might be in attributes or highlight_index)
+        bid = node.dom_tree_id if node.dom_tree_id is not None else None
+
+        # Extract node attributes
+        attributes = []
+        for attr_name, attr_value in node.attributes.items():
+            if attr_name in self.ignored_attributes or attr_value is None:
+                continue
+            elif attr_name in ("required", "disabled", "checked", "selected"):
+                if attr_value == "true" or attr_value == attr_name:
+                    attributes.append(attr_name)
+            elif attr_name not in ("title", "alt", "placeholder", "value", "aria-label", "id", "class"):
+                # Only include non-name attributes
+                attributes.append(f"{attr_name}={repr(attr_value)}")
+
+        # Add DOM-specific attributes
+        if node.is_interactive:
+            attributes.append("interactive")
+        if self.include_xpath:
+            attributes.append(f'xpath="{node.xpath}"')
+
+        if not node.highlight_index:
+            skip_node = True
+
+        if self.skip_generic and node_tag == "div" and not attributes and not node_name:
+            skip_node = True
+
+        if self.hide_all_children and parent_node_filtered:
+            skip_node = True
+
+        # Process bid-related filtering and attributes
+        filter_node, extra_attributes_to_print = _process_bid_dom(
+            bid,
+            node,
+            extra_properties=extra_properties,
+            with_visible=self.with_visible,
+            with_clickable=self.with_clickable,
+            with_center_coords=self.with_center_coords,
+            with_bounding_box_coords=self.with_bounding_box_coords,
+            with_som=self.with_som,
+            filter_visible_only=self.filter_visible_only,
+            filter_with_bid_only=self.filter_with_bid_only,
+            filter_som_only=self.filter_som_only,
+            coord_decimals=self.coord_decimals,
+        )
+
+        # if either is True, skip the node
+        skip_node = skip_node or filter_node
+
+        # insert extra attributes before regular attributes
+        attributes = extra_attributes_to_print + attributes
+
+        # actually print the node string
+        if skip_node:
+            return None, skip_node, filter_node, node_name
+
+        if not node_name:
+            node_str = f"{node_tag}"
+        else:
+            node_str = f"{node_tag} {repr(node_name.strip())}"
+
+        if not (
+            self.hide_all_bids
+            or bid is None
+            or (
+                self.hide_bid_if_invisible
+                and extra_properties
+                and extra_properties.get(bid, {}).get("visibility", 0) < 0.5
+            )
+        ):
+            node_str = f"[{bid}] " + node_str
 
-            if hide_all_children and parent_node_filtered:
-                skip_node = True
+        if node_value is not None and node_value != node_name:
+            node_str += f' value={repr(node_value)}'
 
-            # Process bid-related filtering and attributes
-            filter_node, extra_attributes_to_print = _process_bid_dom(
-                bid,
-                node,
-                extra_properties=extra_properties,
-                with_visible=with_visible,
-                with_clickable=with_clickable,
-                with_center_coords=with_center_coords,
-                with_bounding_box_coords=with_bounding_box_coords,
-                with_som=with_som,
-                filter_visible_only=filter_visible_only,
-                filter_with_bid_only=filter_with_bid_only,
-                filter_som_only=filter_som_only,
-                coord_decimals=coord_decimals,
-            )
+        if not REMOVE_ATTRIBUTES and attributes:
+            node_str += ", ".join([""] + attributes)
 
-            # if either is True, skip the node
-            skip_node = skip_node or filter_node
-
-            # insert extra attributes before regular attributes
-            attributes = extra_attributes_to_print + attributes
-
-            # actually print the node string
-            if not skip_node:
-                if not node_name:
-                    node_str = f"{node_tag}"
-                else:
-                    node_str = f"{node_tag} {repr(node_name.strip())}"
-
-                if not (
-                    hide_all_bids
-                    or bid is None
-                    or (
-                        hide_bid_if_invisible
-                        and extra_properties
-                        and extra_properties.get(bid, {}).get("visibility", 0) < 0.5
-                    )
-                ):
-                    node_str = f"[{bid}] " + node_str
-
-                if node_value is not None and node_value != node_name:
-                    node_str += f' value={repr(node_value)}'
-
-                if not REMOVE_ATTRIBUTES and attributes:
-                    node_str += ", ".join([""] + attributes)
-
-                tree_str += f"{indent}{node_str}"
-
-            # Process children
-            for child_id in node.children:
-                if child_id == node_id:  # avoid self-reference
-                    continue
-                child_depth = depth if skip_node else (depth + 1)
-                child_str = dfs(
-                    child_id,
-                    child_depth,
-                    parent_node_filtered=filter_node,
-                    parent_node_name=node_name,
-                )
-                if child_str:
-                    if tree_str:
-                        tree_str += "\n"
-                    tree_str += child_str
-
-        return tree_str
-
-    tree_str = dfs(dom_tree.root_id, 0, False, "")
-    return tree_str
+        return node_str, skip_node, filter_node, node_name
 
 
 def _process_bid_dom(
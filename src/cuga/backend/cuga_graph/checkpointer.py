@@ -0,0 +1,444 @@
+"""
+Bounded LangGraph checkpointer that spills idle threads to SQLite.
+
+``BoundedCheckpointer`` is a ``MemorySaver`` that keeps at most
+``max_threads`` conversation threads resident. The least recently used
+threads, and threads idle for longer than ``idle_ttl_s``, are written to an
+SQLite database and dropped from memory; they are loaded back transparently
+the next time the graph touches them. Resident threads are written out on
+``flush``/``close`` so conversations survive a restart.
+
+Each checkpoint, pending write and channel blob is its own row, so a spill
+only appends what changed since the last one. Every spill bumps the thread's
+version inside the same transaction and stamps its rows with it. With
+``shared=True`` every checkpoint is written through to the database, and a
+resident thread loads the rows other processes stored since the version it
+last saw, so several uvicorn workers can serve the same threads without
+overwriting each other's checkpoints. ``max_history`` caps the checkpoints
+kept per thread and namespace; older ones are pruned together with their
+writes and the blobs no kept checkpoint references.
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, Iterator, List, Set, Tuple
+
+from langgraph.checkpoint.memory import MemorySaver
+from loguru import logger
+
+from cuga.config import DBS_DIR
+
+DEFAULT_DB_PATH = os.path.join(DBS_DIR, "checkpoints.db")
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS checkpoint_thread_versions (
+        thread_id TEXT PRIMARY KEY,
+        version INTEGER NOT NULL,
+        updated_at REAL NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS checkpoints (
+        thread_id TEXT NOT NULL,
+        checkpoint_ns TEXT NOT NULL,
+        checkpoint_id TEXT NOT NULL,
+        version INTEGER NOT NULL,
+        data BLOB NOT NULL,
+        PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS checkpoint_writes (
+        thread_id TEXT NOT NULL,
+        checkpoint_ns TEXT NOT NULL,
+        checkpoint_id TEXT NOT NULL,
+        task_id TEXT NOT NULL,
+        idx INTEGER NOT NULL,
+        version INTEGER NOT NULL,
+        data BLOB NOT NULL,
+        PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS checkpoint_blobs (
+        thread_id TEXT NOT NULL,
+        checkpoint_ns TEXT NOT NULL,
+        channel TEXT NOT NULL,
+        channel_version TEXT NOT NULL,
+        checkpoint_id TEXT NOT NULL,
+        version INTEGER NOT NULL,
+        data BLOB NOT NULL,
+        PRIMARY KEY (thread_id, checkpoint_ns, channel, channel_version)
+    )
+    """,
+)
+
+_ROW_TABLES = ("checkpoints", "checkpoint_writes", "checkpoint_blobs")
+
+
+class BoundedCheckpointer(MemorySaver):
+    """
+    MemorySaver with an LRU/TTL bound on resident threads and an SQLite spill store.
+
+    Args:
+        db_path: SQLite file for spilled threads.
+        max_threads: Maximum number of threads kept in memory.
+        idle_ttl_s: Threads untouched for this long are spilled (0 disables the TTL).
+        shared: Write every checkpoint through to the database and pick up
+            checkpoints written by other processes.
+        max_history: Checkpoints kept per thread and namespace (0 keeps all).
+    """
+
+    def __init__(
+        self,
+        db_path: str = DEFAULT_DB_PATH,
+        max_threads: int = 256,
+        idle_ttl_s: float = 1800.0,
+        shared: bool = False,
+        max_history: int = 100,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.db_path = db_path
+        self.max_threads = max(1, max_threads)
+        self.idle_ttl_s = idle_ttl_s
+        self.shared = shared
+        self.max_history = max(0, max_history)
+        self._lock = threading.RLock()
+        # thread_id -> last access (monotonic), least recently used first
+        self._resident: "OrderedDict[str, float]" = OrderedDict()
+        # Rows not yet in the database, as ("checkpoint", ns, id) / ("write", key, inner) / ("blob", key)
+        self._unsaved: Dict[str, Set[Tuple]] = {}
+        # Pruned rows to delete from the database, as (ns, checkpoint ids, blob keys)
+        self._pruned: Dict[str, List[Tuple]] = {}
+        # Highest stored version whose rows are in memory
+        self._versions: Dict[str, int] = {}
+        # Keys of ``self.writes`` per thread, and of ``self.blobs`` mapped to the checkpoint
+        # that stored them, so a thread can be spilled or pruned without a full scan
+        self._write_keys: Dict[str, Set[Tuple]] = defaultdict(set)
+        self._blob_keys: Dict[str, Dict[Tuple, str]] = defaultdict(dict)
+        self._counters = {"spills": 0, "loads": 0, "evictions": 0, "pruned": 0}
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+        self._conn.commit()
+
+    @classmethod
+    def from_env(cls) -> "BoundedCheckpointer":
+        """Build a checkpointer configured by ``CUGA_CHECKPOINT_*`` environment variables."""
+        return cls(
+            db_path=os.getenv("CUGA_CHECKPOINT_DB", DEFAULT_DB_PATH),
+            max_threads=int(os.getenv("CUGA_CHECKPOINT_MAX_THREADS", "256")),
+            idle_ttl_s=float(os.getenv("CUGA_CHECKPOINT_IDLE_TTL_S", "1800")),
+            shared=os.getenv("CUGA_CHECKPOINT_SHARED", "false").lower() in ("true", "1", "yes", "on"),
+            max_history=int(os.getenv("CUGA_CHECKPOINT_MAX_HISTORY", "100")),
+        )
+
+    # -- BaseCheckpointSaver API (the async variants delegate to these) --
+
+    def get_tuple(self, config):
+        with self._lock:
+            self._touch(config["configurable"]["thread_id"])
+            return super().get_tuple(config)
+
+    def list(self, config, *, filter=None, before=None, limit=None) -> Iterator:
+        """List checkpoints; without a config only resident threads are listed."""
+        with self._lock:
+            if config:
+                self._touch(config["configurable"]["thread_id"])
+            items = [*super().list(config, filter=filter, before=before, limit=limit)]
+        yield from items
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        with self._lock:
+            self._touch(thread_id)
+            result = super().put(config, checkpoint, metadata, new_versions)
+            unsaved = self._unsaved.setdefault(thread_id, set())
+            unsaved.add(("checkpoint", checkpoint_ns, checkpoint["id"]))
+            for channel, version in new_versions.items():
+                key = (thread_id, checkpoint_ns, channel, version)
+                self._blob_keys[thread_id][key] = checkpoint["id"]
+                unsaved.add(("blob", key))
+            if self.max_history and len(self.storage[thread_id][checkpoint_ns]) > self.max_history:
+                self._prune(thread_id, checkpoint_ns)
+            self._written(thread_id)
+            return result
+
+    def put_writes(self, config, writes, task_id, task_path=""):
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        key = (thread_id, checkpoint_ns, config["configurable"]["checkpoint_id"])
+        with self._lock:
+            self._touch(thread_id)
+            before = dict(self.writes.get(key, {}))
+            super().put_writes(config, writes, task_id, task_path)
+            added = [
+                inner for inner, value in self.writes.get(key, {}).items() if before.get(inner) is not value
+            ]
+            if not added:
+                return
+            self._write_keys[thread_id].add(key)
+            self._unsaved.setdefault(thread_id, set()).update(("write", key, inner) for inner in added)
+            self._written(thread_id)
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            self._drop(thread_id)
+            self._resident.pop(thread_id, None)
+            with self._conn:
+                self._conn.execute("DELETE FROM checkpoint_thread_versions WHERE thread_id = ?", (thread_id,))
+                for table in _ROW_TABLES:
+                    self._conn.execute(f"DELETE FROM {table} WHERE thread_id = ?", (thread_id,))
+
+    # -- Residency management --
+
+    def flush(self) -> None:
+        """Write every modified resident thread to the database."""
+        with self._lock:
+            for thread_id in set(self._unsaved) | set(self._pruned):
+                self._spill(thread_id)
+
+    def close(self) -> None:
+        """Flush resident threads and close the database."""
+        with self._lock:
+            self.flush()
+            self._conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Residency and memory-usage figures for monitoring."""
+        with self._lock:
+            resident_bytes = sum(self._thread_bytes(thread_id) for thread_id in self._resident)
+            (stored_threads,) = self._conn.execute(
+                "SELECT COUNT(*) FROM checkpoint_thread_versions"
+            ).fetchone()
+            stored_bytes = sum(
+                self._conn.execute(f"SELECT COALESCE(SUM(LENGTH(data)), 0) FROM {table}").fetchone()[0]
+                for table in _ROW_TABLES
+            )
+            return {
+                "resident_threads": len(self._resident),
+                "max_threads": self.max_threads,
+                "dirty_threads": len(set(self._unsaved) | set(self._pruned)),
+                "resident_bytes": resident_bytes,
+                "stored_threads": stored_threads,
+                "stored_bytes": stored_bytes,
+                "shared": self.shared,
+                **self._counters,
+            }
+
+    def _touch(self, thread_id: str) -> None:
+        if thread_id in self._resident:
+            known = self._versions.get(thread_id, 0)
+            if self.shared and self._stored_version(thread_id) > known:
+                self._load(thread_id, since=known)
+        else:
+            self._load(thread_id)
+        self._resident[thread_id] = time.monotonic()
+        self._resident.move_to_end(thread_id)
+        self._evict(keep=thread_id)
+
+    def _written(self, thread_id: str) -> None:
+        if self.shared:
+            self._spill(thread_id)
+
+    def _evict(self, keep: str) -> None:
+        now = time.monotonic()
+        for thread_id, last_used in list(self._resident.items()):
+            if thread_id == keep:
+                continue
+            over_capacity = len(self._resident) > self.max_threads
+            expired = self.idle_ttl_s and now - last_used > self.idle_ttl_s
+            if not over_capacity and not expired:
+                break
+            self._spill(thread_id)
+            self._drop(thread_id)
+            del self._resident[thread_id]
+            self._counters["evictions"] += 1
+
+    def _prune(self, thread_id: str, checkpoint_ns: str) -> None:
+        checkpoints = self.storage[thread_id][checkpoint_ns]
+        # Checkpoint IDs are time-ordered (uuid6), so the smallest are the oldest
+        ids = sorted(checkpoints)
+        pruned = ids[: len(ids) - self.max_history]
+        # Channel versions only grow, so a blob stored by a pruned checkpoint that a kept
+        # checkpoint still uses is used by the oldest kept one
+        oldest_kept = self.serde.loads_typed(checkpoints[ids[len(pruned)]][0])
+        in_use = {
+            (thread_id, checkpoint_ns, channel, version)
+            for channel, version in oldest_kept["channel_versions"].items()
+        }
+        pruned_ids = set(pruned)
+        blob_keys = self._blob_keys[thread_id]
+        stale_blobs = [key for key, origin in blob_keys.items() if origin in pruned_ids and key not in in_use]
+        for checkpoint_id in pruned:
+            del checkpoints[checkpoint_id]
+            write_key = (thread_id, checkpoint_ns, checkpoint_id)
+            self.writes.pop(write_key, None)
+            self._write_keys[thread_id].discard(write_key)
+        for key in stale_blobs:
+            self.blobs.pop(key, None)
+            del blob_keys[key]
+        self._pruned.setdefault(thread_id, []).append((checkpoint_ns, pruned, stale_blobs))
+        self._counters["pruned"] += len(pruned)
+
+    def _thread_bytes(self, thread_id: str) -> int:
+        total = 0
+        for checkpoints in self.storage.get(thread_id, {}).values():
+            total += sum(len(ckpt[1]) + len(meta[1]) for ckpt, meta, _ in checkpoints.values())
+        for key in self._write_keys.get(thread_id, ()):
+            total += sum(len(value[1]) for _, _, value, _ in self.writes.get(key, {}).values())
+        for key in self._blob_keys.get(thread_id, ()):
+            if key in self.blobs:
+                total += len(self.blobs[key][1])
+        return total
+
+    def _spill(self, thread_id: str) -> None:
+        unsaved = self._unsaved.pop(thread_id, set())
+        pruned = self._pruned.pop(thread_id, [])
+        if not unsaved and not pruned:
+            return
+        try:
+            with self._conn:
+                # The upsert takes the write lock, so the bump and the rows stamped with it are atomic
+                self._conn.execute(
+                    "INSERT INTO checkpoint_thread_versions (thread_id, version, updated_at) "
+                    "VALUES (?, 1, ?) ON CONFLICT(thread_id) DO UPDATE "
+                    "SET version = version + 1, updated_at = excluded.updated_at",
+                    (thread_id, time.time()),
+                )
+                version = self._stored_version(thread_id)
+                self._insert_rows(thread_id, unsaved, version)
+                for checkpoint_ns, checkpoint_ids, blob_keys in pruned:
+                    for table in ("checkpoints", "checkpoint_writes"):
+                        self._conn.executemany(
+                            f"DELETE FROM {table} "
+                            "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                            [(thread_id, checkpoint_ns, checkpoint_id) for checkpoint_id in checkpoint_ids],
+                        )
+                    self._conn.executemany(
+                        "DELETE FROM checkpoint_blobs "
+                        "WHERE thread_id = ? AND checkpoint_ns = ? AND channel = ? AND channel_version = ?",
+                        [(thread_id, checkpoint_ns, key[2], str(key[3])) for key in blob_keys],
+                    )
+        except sqlite3.Error:
+            # Keep the rows pending so the next flush retries them
+            self._unsaved.setdefault(thread_id, set()).update(unsaved)
+            self._pruned.setdefault(thread_id, [])[:0] = pruned
+            raise
+        known = self._versions.get(thread_id, 0)
+        if version > known + 1:
+            # Another process stored versions in between; pick up its rows too
+            self._load(thread_id, since=known)
+        self._versions[thread_id] = version
+        self._counters["spills"] += 1
+
+    def _insert_rows(self, thread_id: str, unsaved: Set[Tuple], version: int) -> None:
+        checkpoint_rows, write_rows, blob_rows = [], [], []
+        for kind, *ref in unsaved:
+            # Rows pruned since they were queued are no longer in memory and are skipped
+            if kind == "checkpoint":
+                checkpoint_ns, checkpoint_id = ref
+                saved = self.storage.get(thread_id, {}).get(checkpoint_ns, {}).get(checkpoint_id)
+                if saved is not None:
+                    checkpoint_rows.append((thread_id, checkpoint_ns, checkpoint_id, version, _dumps(saved)))
+            elif kind == "write":
+                key, (task_id, idx) = ref
+                value = self.writes.get(key, {}).get((task_id, idx))
+                if value is not None:
+                    write_rows.append((*key, task_id, idx, version, _dumps(value)))
+            else:
+                (key,) = ref
+                origin = self._blob_keys.get(thread_id, {}).get(key)
+                if origin is not None and key in self.blobs:
+                    _, checkpoint_ns, channel, channel_version = key
+                    blob_rows.append(
+                        (thread_id, checkpoint_ns, channel, str(channel_version), origin, version,
+                         _dumps((channel_version, self.blobs[key])))
+                    )
+        for table, rows in (
+            ("checkpoints", checkpoint_rows),
+            ("checkpoint_writes", write_rows),
+            ("checkpoint_blobs", blob_rows),
+        ):
+            if rows:
+                placeholders = ", ".join("?" * len(rows[0]))
+                self._conn.executemany(f"INSERT OR REPLACE INTO {table} VALUES ({placeholders})", rows)
+
+    def _load(self, thread_id: str, since: int = 0) -> None:
+        """Load the thread's rows stored after version ``since``."""
+        version = self._stored_version(thread_id)
+        if version <= since:
+            return
+        params = (thread_id, since)
+        rows = self._conn.execute(
+            "SELECT checkpoint_ns, checkpoint_id, data FROM checkpoints WHERE thread_id = ? AND version > ?",
+            params,
+        ).fetchall()
+        for checkpoint_ns, checkpoint_id, data in rows:
+            saved = _loads(data, thread_id)
+            if saved is not None:
+                self.storage[thread_id][checkpoint_ns][checkpoint_id] = saved
+        rows = self._conn.execute(
+            "SELECT checkpoint_ns, checkpoint_id, task_id, idx, data FROM checkpoint_writes "
+            "WHERE thread_id = ? AND version > ?",
+            params,
+        ).fetchall()
+        for checkpoint_ns, checkpoint_id, task_id, idx, data in rows:
+            value = _loads(data, thread_id)
+            if value is not None:
+                key = (thread_id, checkpoint_ns, checkpoint_id)
+                self.writes[key][(task_id, idx)] = value
+                self._write_keys[thread_id].add(key)
+        rows = self._conn.execute(
+            "SELECT checkpoint_ns, channel, checkpoint_id, data FROM checkpoint_blobs "
+            "WHERE thread_id = ? AND version > ?",
+            params,
+        ).fetchall()
+        for checkpoint_ns, channel, checkpoint_id, data in rows:
+            value = _loads(data, thread_id)
+            if value is not None:
+                channel_version, blob = value
+                key = (thread_id, checkpoint_ns, channel, channel_version)
+                self.blobs[key] = blob
+                self._blob_keys[thread_id][key] = checkpoint_id
+        self._versions[thread_id] = version
+        self._counters["loads"] += 1
+
+    def _drop(self, thread_id: str) -> None:
+        self.storage.pop(thread_id, None)
+        for key in self._write_keys.pop(thread_id, ()):
+            self.writes.pop(key, None)
+        for key in self._blob_keys.pop(thread_id, {}):
+            self.blobs.pop(key, None)
+        self._unsaved.pop(thread_id, None)
+        self._pruned.pop(thread_id, None)
+        self._versions.pop(thread_id, None)
+
+    def _stored_version(self, thread_id: str) -> int:
+        row = self._conn.execute(
+            "SELECT version FROM checkpoint_thread_versions WHERE thread_id = ?", (thread_id,)
+        ).fetchone()
+        return row[0] if row else 0
+
+
+def _dumps(value: Any) -> bytes:
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _loads(data: bytes, thread_id: str) -> Any:
+    try:
+        return pickle.loads(data)
+    except Exception as e:
+        logger.error(f"Discarding unreadable checkpoint data for thread {thread_id}: {e}")
+        return None
@@ -47,7 +47,7 @@ from cuga.backend.cuga_graph.nodes.cuga_lite.cuga_lite_node import CugaLiteNode
 
 
 class DynamicAgentGraph:
-    def __init__(self, configurations, langfuse_handler=None):
+    def __init__(self, configurations, langfuse_handler=None, checkpointer=None):
         self.task_decomposition_agent = TaskDecompositionNode(TaskDecompositionAgent.create())
         self.plan_controller_agent = PlanControllerNode(PlanControllerAgent.create())
         self.final_answer_agent = FinalAnswerNode(FinalAnswerAgent.create())
@@ -65,6 +65,7 @@ class DynamicAgentGraph:
         self.api_shortlister = ApiShortlister(ShortlisterAgent.create())
         self.api_coder = ApiCoder(CodeAgent.create())
         self.cuga_lite = CugaLiteNode(langfuse_handler=langfuse_handler)
+        self.checkpointer = checkpointer
         self.graph = None
 
     async def build_graph(self):
@@ -72,7 +73,7 @@ class DynamicAgentGraph:
         await self.add_nodes(graph)
         self.add_edges(graph)
         self.graph = graph.compile(
-            checkpointer=MemorySaver(),
+            checkpointer=self.checkpointer or MemorySaver(),
             interrupt_after=[self.action_agent.action_agent.name, self.interrupt_tool_node.name],
         )
 
@@ -0,0 +1,132 @@
+"""
+CugaAgent Cache
+
+Keeps initialized CugaAgent instances between CugaLiteNode invocations.
+
+Initializing an agent fetches apps and tools, builds a StructuredTool per API,
+renders the system prompt and compiles the CodeAct graph. None of that depends
+on the task being executed, so agents are cached by everything that does feed
+into it (app set, instructions, model settings, prompt flags) and reused until
+the tool catalog version changes.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from loguru import logger
+
+
+def _digest(value: Any) -> str:
+    text = value if isinstance(value, str) else json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def make_agent_key(
+    app_names: Optional[list],
+    instructions: Optional[str],
+    model_settings: Any,
+    task_loaded_from_file: bool,
+    is_autonomous_subtask: bool,
+    prompt_template: Any = None,
+) -> Tuple:
+    """Build the cache key for an agent configuration.
+
+    Args:
+        app_names: Apps the agent is restricted to (None for all apps)
+        instructions: Formatted special instructions
+        model_settings: Model configuration used to create the LLM
+        task_loaded_from_file: Prompt flag passed to the agent
+        is_autonomous_subtask: Prompt flag passed to the agent
+        prompt_template: Prompt template the agent renders
+
+    Returns:
+        Hashable key; equal keys produce interchangeable agents
+    """
+    template = getattr(prompt_template, "template", prompt_template)
+    return (
+        tuple(sorted(app_names)) if app_names else None,
+        _digest(instructions or ""),
+        _digest(model_settings),
+        bool(task_loaded_from_file),
+        bool(is_autonomous_subtask),
+        _digest(template if isinstance(template, str) else repr(template)),
+    )
+
+
+class AgentCache:
+    """
+    Bounded LRU cache of initialized agents.
+
+    Each entry remembers the catalog version it was built against; a lookup
+    with a different version rebuilds the agent. Concurrent misses for the
+    same key share a single initialization.
+    """
+
+    def __init__(self, max_entries: int = 16):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[Hashable, Any]]" = OrderedDict()
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        self._counters = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    async def get_or_create(
+        self,
+        key: Hashable,
+        version: Hashable,
+        factory: Callable[[], Awaitable[Any]],
+        langfuse_handler: Optional[Any] = None,
+    ) -> Any:
+        """Return a ready agent for ``key``, initializing one with ``factory`` if needed.
+
+        Args:
+            key: Agent configuration key (see make_agent_key)
+            version: Current tool catalog version
+            factory: Coroutine function creating and initializing a new agent
+            langfuse_handler: Callback handler for this invocation
+
+        Returns:
+            An initialized agent. Cached agents are returned as shallow copies
+            carrying ``langfuse_handler``, so concurrent invocations do not share
+            per-call state while still sharing tools and the compiled graph.
+        """
+        if self.max_entries <= 0:
+            return await factory()
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self._counters["hits"] += 1
+                agent = entry[1]
+            else:
+                if entry is not None:
+                    self._counters["invalidations"] += 1
+                    logger.info("Tool catalog changed, rebuilding cached CugaLite agent")
+                self._counters["misses"] += 1
+                agent = await factory()
+                self._entries[key] = (version, agent)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    evicted, _ = self._entries.popitem(last=False)
+                    self._locks.pop(evicted, None)
+
+        agent = copy.copy(agent)
+        agent.langfuse_handler = langfuse_handler
+        return agent
+
+    def clear(self) -> None:
+        """Drop every cached agent."""
+        self._entries.clear()
+        self._locks.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current size for monitoring."""
+        return {"entries": len(self._entries), "max_entries": self.max_entries, **self._counters}
+
+
+agent_cache = AgentCache(max_entries=int(os.getenv("CUGA_LITE_AGENT_CACHE_SIZE", "16")))
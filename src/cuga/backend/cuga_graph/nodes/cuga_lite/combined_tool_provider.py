@@ -12,7 +12,11 @@ from loguru import logger
 from langchain_core.tools import StructuredTool
 
 from cuga.backend.activity_tracker.tracker import ActivityTracker
-from cuga.backend.tools_env.registry.utils.api_utils import get_apps, get_registry_base_url
+from cuga.backend.tools_env.registry.utils.api_utils import (
+    fetch_registry_catalog,
+    get_apps,
+    get_registry_base_url,
+)
 from cuga.backend.tools_env.registry.utils.types import AppDefinition
 from cuga.backend.cuga_graph.nodes.cuga_lite.tool_provider_interface import (
     ToolProviderInterface,
@@ -243,6 +247,12 @@ class CombinedToolProvider(ToolProviderInterface):
         if app_name in self.tools_cache:
             return self.tools_cache[app_name]
 
+        return await self._load_tools(app_name)
+
+    async def _load_tools(
+        self, app_name: str, registry_apis: Optional[Dict[str, Any]] = None
+    ) -> List[StructuredTool]:
+        """Build and cache the tools of ``app_name``; ``registry_apis`` are prefetched registry definitions."""
         all_tools = []
 
         try:
@@ -276,34 +286,38 @@ class CombinedToolProvider(ToolProviderInterface):
             logger.warning(f"Error getting tools from tracker for {app_name}: {e}")
 
         if settings.advanced_features.registry:
-            try:
-                logger.debug(f"Getting tools from registry for: {app_name}")
-                registry_base = get_registry_base_url()
-                url = f'{registry_base}/applications/{app_name}/apis?include_response_schema=true'
-                headers = {'accept': 'application/json'}
-
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url, headers=headers) as response:
-                        if response.status == 200:
-                            api_dicts = await response.json()
-                            if api_dicts:
-                                for tool_name, tool_def in api_dicts.items():
-                                    if any(tool.name == tool_name for tool in all_tools):
-                                        continue
-                                    try:
-                                        tool = create_tool_from_api_dict(tool_name, tool_def, app_name)
-                                        all_tools.append(tool)
-                                        logger.debug(f"  ✓ {tool_name}")
-                                    except Exception as e:
-                                        logger.warning(f"  ✗ Failed to create tool {tool_name}: {e}")
-                                        continue
-                        else:
-                            error_text = await response.text()
-                            logger.warning(
-                                f"Registry request failed with status {response.status}: {error_text}"
-                            )
-            except Exception as e:
-                logger.warning(f"Error getting tools from registry for {app_name}: {e}")
+            api_dicts = registry_apis
+            if api_dicts is None:
+                try:
+                    logger.debug(f"Getting tools from registry for: {app_name}")
+                    registry_base = get_registry_base_url()
+                    url = f'{registry_base}/applications/{app_name}/apis?include_response_schema=true'
+                    headers = {'accept': 'application/json'}
+
+                    async with aiohttp.ClientSession() as session:
+                        async with session.get(url, headers=headers) as response:
+                            if response.status == 200:
+                                api_dicts = await response.json()
+                            else:
+                                error_text = await response.text()
+                                logger.warning(
+                                    f"Registry request failed with status {response.status}: {error_text}"
+                                )
+                except Exception as e:
+                    logger.warning(f"Error getting tools from registry for {app_name}: {e}")
+
+            if api_dicts:
+                existing_names = {tool.name for tool in all_tools}
+                for tool_name, tool_def in api_dicts.items():
+                    if tool_name in existing_names:
+                        continue
+                    try:
+                        tool = create_tool_from_api_dict(tool_name, tool_def, app_name)
+                        all_tools.append(tool)
+                        logger.debug(f"  ✓ {tool_name}")
+                    except Exception as e:
+                        logger.warning(f"  ✗ Failed to create tool {tool_name}: {e}")
+                        continue
 
         self.tools_cache[app_name] = all_tools
         logger.info(f"Loaded {len(all_tools)} tools for '{app_name}'")
@@ -314,6 +328,11 @@ class CombinedToolProvider(ToolProviderInterface):
         if not self.initialized:
             await self.initialize()
 
+        pending = [app.name for app in self.apps if app.name not in self.tools_cache]
+        catalog = await fetch_registry_catalog(pending)
+        for app_name, api_dicts in catalog.items():
+            await self._load_tools(app_name, api_dicts)
+
         all_tools = []
         for app in self.apps:
             tools = await self.get_tools(app.name)
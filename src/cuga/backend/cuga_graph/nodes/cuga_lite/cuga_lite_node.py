@@ -9,9 +9,11 @@ from loguru import logger
 from pydantic import BaseModel, Field
 
 from cuga.backend.cuga_graph.nodes.cuga_lite import CugaAgent
+from cuga.backend.cuga_graph.nodes.cuga_lite.agent_cache import agent_cache, make_agent_key
 from cuga.backend.cuga_graph.nodes.shared.base_node import BaseNode
 from cuga.backend.cuga_graph.state.agent_state import AgentState, SubTaskHistory
 from cuga.backend.activity_tracker.tracker import ActivityTracker
+from cuga.backend.tools_env.registry.utils.api_utils import get_catalog_version
 from cuga.backend.cuga_graph.nodes.api.api_planner_agent.prompts.load_prompt import ActionName
 from cuga.backend.cuga_graph.state.api_planner_history import CoderAgentHistoricalOutput
 from cuga.config import settings
@@ -102,9 +104,11 @@ class CugaLiteNode(BaseNode):
             return None
 
     async def create_agent(self, app_names=None, task_loaded_from_file=False, is_autonomous_subtask=False):
-        """Create and initialize a new CugaAgent with optional app filtering."""
-        logger.info("Initializing new CugaLite agent instance...")
+        """Return an initialized CugaAgent with optional app filtering.
 
+        Agents are reused from the agent cache while the app set, instructions,
+        model settings and tool catalog are unchanged.
+        """
         langfuse_handler = self.langfuse_handler
         if langfuse_handler is None and settings.advanced_features.langfuse_tracing:
             if LangfuseCallbackHandler is not None:
@@ -113,17 +117,32 @@ class CugaLiteNode(BaseNode):
             else:
                 logger.warning("Langfuse tracing enabled but langfuse package not available")
 
-        agent = CugaAgent(
-            app_names=app_names,
-            langfuse_handler=langfuse_handler,
-            instructions=get_all_instructions_formatted(),
-            task_loaded_from_file=task_loaded_from_file,
-            is_autonomous_subtask=is_autonomous_subtask,
-            prompt_template=self.prompt_template,
+        instructions = get_all_instructions_formatted()
+
+        async def build_agent():
+            logger.info("Initializing new CugaLite agent instance...")
+            agent = CugaAgent(
+                app_names=app_names,
+                langfuse_handler=langfuse_handler,
+                instructions=instructions,
+                task_loaded_from_file=task_loaded_from_file,
+                is_autonomous_subtask=is_autonomous_subtask,
+                prompt_template=self.prompt_template,
+            )
+            await agent.initialize()
+            logger.info(f"CugaLite agent initialized with {len(agent.tools)} tools")
+            return agent
+
+        key = make_agent_key(
+            app_names,
+            instructions,
+            settings.agent.code.model,
+            task_loaded_from_file,
+            is_autonomous_subtask,
+            self.prompt_template,
         )
-        await agent.initialize()
-        logger.info(f"CugaLite agent initialized with {len(agent.tools)} tools")
-        return agent
+        version = (tracker.tools_version, await get_catalog_version())
+        return await agent_cache.get_or_create(key, version, build_agent, langfuse_handler=langfuse_handler)
 
     async def node(self, state: AgentState) -> Command[Literal['FinalAnswerAgent']]:
         """Execute the CugaAgent for fast task execution.
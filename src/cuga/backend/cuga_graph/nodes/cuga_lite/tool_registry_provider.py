@@ -11,7 +11,13 @@ from loguru import logger
 from pydantic import create_model, Field
 from langchain_core.tools import StructuredTool
 
-from cuga.backend.tools_env.registry.utils.api_utils import get_apis, get_apps, get_registry_base_url
+from cuga.backend.tools_env.registry.utils.api_utils import (
+    fetch_registry_catalog,
+    get_apis,
+    get_apps,
+    get_registry_base_url,
+    tracker,
+)
 from cuga.backend.cuga_graph.nodes.cuga_lite.tool_provider_interface import (
     ToolProviderInterface,
     AppDefinition,
@@ -280,8 +286,10 @@ class ToolRegistryProvider(ToolProviderInterface):
             return self.tools_cache[app_name]
 
         logger.info(f"Loading tools for app: {app_name}")
-        api_dicts = await get_apis(app_name)
+        return self._build_tools(app_name, await get_apis(app_name))
 
+    def _build_tools(self, app_name: str, api_dicts: Optional[Dict[str, Any]]) -> List[StructuredTool]:
+        """Convert API definitions to tools and cache them for ``app_name``."""
         if not api_dicts:
             logger.warning(f"No APIs found for app '{app_name}'")
             return []
@@ -305,6 +313,16 @@ class ToolRegistryProvider(ToolProviderInterface):
         if not self.initialized:
             await self.initialize()
 
+        # Runtime tools registered in the tracker take precedence over the registry (see get_apis)
+        pending = [
+            app.name
+            for app in self.apps
+            if app.name not in self.tools_cache and not tracker.tools.get(app.name)
+        ]
+        catalog = await fetch_registry_catalog(pending)
+        for app_name, api_dicts in catalog.items():
+            self._build_tools(app_name, api_dicts)
+
         all_tools = []
         for app in self.apps:
             tools = await self.get_tools(app.name)
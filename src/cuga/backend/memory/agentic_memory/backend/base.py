@@ -1,11 +1,12 @@
 import json
 
-from collections.abc import Generator
+from collections.abc import Callable, Generator
+from json import JSONDecodeError
 
 from abc import ABC, abstractmethod
 
 from cuga.backend.memory.agentic_memory.db.sqlite_manager import SQLiteManager
-from cuga.backend.memory.agentic_memory.schema import Fact, RecordedFact, Message, Run, Namespace
+from cuga.backend.memory.agentic_memory.schema import Fact, RecordedFact, Message, Run, Namespace, StepInput
 from cuga.backend.memory.agentic_memory.utils.logging import Logging
 from cuga.backend.memory.agentic_memory.llm.tips.cuga_tips import extract_cuga_tips_from_data
 
@@ -79,6 +80,65 @@ class BaseMemoryBackend(ABC):
     def add_step(self, namespace_id: str, run_id: str, step: dict, prompt: str):
         pass
 
+    def add_steps(self, namespace_id: str, run_id: str, steps: list[StepInput]) -> list[str | None]:
+        """Add several steps into a run, returning their IDs in order (None for steps that were skipped)."""
+        return [self.add_step(namespace_id, run_id, item.step, item.prompt) for item in steps]
+
+    @staticmethod
+    def step_messages(step: dict, prompt: str) -> list[dict]:
+        """The LLM messages used to summarize one step."""
+        return [
+            {
+                "role": "system",
+                "content": prompt + '\n\nHere is the actual step you are working on:\n' + json.dumps(step, indent=4),
+            }
+        ]
+
+    @staticmethod
+    def summarize_steps(
+        steps: list[StepInput],
+        generate: Callable[[list[list[dict]]], list[str]],
+        clean: Callable[[str], str] | None = None,
+        attempts: int = 3,
+    ) -> list[dict | None]:
+        """Summarize a batch of steps with one ``generate`` call per attempt.
+
+        Only the steps whose LLM output could not be parsed as JSON are retried.
+        Steps still unparseable after ``attempts`` are None, so one bad step
+        does not fail the others.
+        """
+        parsed: list[dict | None] = [None] * len(steps)
+        outputs: list[str] = [''] * len(steps)
+        remaining = list(range(len(steps)))
+        for _ in range(attempts):
+            if not remaining:
+                break
+            responses = generate([BaseMemoryBackend.step_messages(steps[i].step, steps[i].prompt) for i in remaining])
+            failed = []
+            for i, response in zip(remaining, responses):
+                outputs[i] = response
+                try:
+                    parsed[i] = json.loads(clean(response) if clean else response)
+                except JSONDecodeError:
+                    failed.append(i)
+            remaining = failed
+        for i in remaining:
+            logger.warning(f"Skipping step, unable to parse JSON output from llm prompt:\n{outputs[i]}")
+        return parsed
+
+    @staticmethod
+    def unstored_steps(steps: list[StepInput], stored: dict[str, str]) -> list[int]:
+        """Positions of the steps not yet stored (``stored`` maps client step IDs to stored IDs)."""
+        return [i for i, item in enumerate(steps) if item.step_id is None or item.step_id not in stored]
+
+    @staticmethod
+    def step_metadata(extraction: dict, item: StepInput) -> dict:
+        """Metadata stored with a summarized step."""
+        metadata = {**extraction, "step": item.step}
+        if item.step_id is not None:
+            metadata["step_id"] = item.step_id
+        return metadata
+
     @abstractmethod
     def get_run(self, namespace_id: str, run_id: str) -> Run:
         pass
@@ -1,13 +1,15 @@
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from json import JSONDecodeError
 
 import json
+import os
 import uuid
 
 from cuga.backend.memory.agentic_memory.backend.base import BaseMemoryBackend
 from cuga.backend.memory.agentic_memory.db.sqlite_manager import SQLiteManager
 from cuga.backend.memory.agentic_memory.config import get_config
-from cuga.backend.memory.agentic_memory.schema import Fact, RecordedFact, Message, Run, Namespace
+from cuga.backend.memory.agentic_memory.schema import Fact, RecordedFact, Message, Run, Namespace, StepInput
 from cuga.backend.memory.agentic_memory.utils.utils import clean_llm_response
 from fastapi import HTTPException
 from mem0 import Memory
@@ -15,6 +17,9 @@ from mem0.configs.base import MemoryConfig
 from mem0.llms.base import LLMBase
 from pymilvus import MilvusClient
 
+# Maximum number of step summaries requested from the LLM at once
+STEP_SUMMARY_CONCURRENCY = int(os.getenv("MEMORY_STEP_SUMMARY_CONCURRENCY", "8"))
+
 
 class Mem0MemoryBackend(BaseMemoryBackend):
     # Cache for backend namespaces
@@ -200,6 +205,49 @@ class Mem0MemoryBackend(BaseMemoryBackend):
         else:
             raise HTTPException(status_code=500, detail="Unable to add step.")
 
+    def add_steps(self, namespace_id: str, run_id: str, steps: list[StepInput]) -> list[str | None]:
+        """Summarize a batch of steps with concurrent LLM calls, then store them.
+
+        Steps whose ``step_id`` is already stored in the run (e.g. by an earlier,
+        partially failed attempt of the same batch) are not summarized or added again.
+        """
+        if not steps:
+            return []
+        memory = self._get_namespace(namespace_id=namespace_id)
+        llm: LLMBase = memory.llm
+
+        # Look up only this batch's step IDs: listing the whole run is O(run length)
+        # per batch and capped by get_all's default limit
+        stored = {}
+        for client_id in dict.fromkeys(item.step_id for item in steps if item.step_id):
+            results = memory.get_all(
+                user_id='default_user', run_id=run_id, filters={'step_id': client_id}, limit=1
+            )['results']
+            if results:
+                stored[client_id] = results[0]['id']
+        todo = self.unstored_steps(steps, stored)
+
+        def generate(batch: list[list[dict]]) -> list[str]:
+            with ThreadPoolExecutor(max_workers=min(len(batch), STEP_SUMMARY_CONCURRENCY)) as executor:
+                return list(executor.map(llm.generate_response, batch))
+
+        extractions = self.summarize_steps([steps[i] for i in todo], generate, clean=clean_llm_response) if todo else []
+        step_ids = [stored.get(item.step_id) if item.step_id else None for item in steps]
+        for i, extraction in zip(todo, extractions):
+            if extraction is None:
+                continue
+            added_step = memory.add(
+                extraction['summary'],
+                user_id='default_user',
+                metadata=self.step_metadata(extraction, steps[i]),
+                run_id=run_id,
+                infer=False,
+            )
+            if len(added_step) == 0:
+                raise HTTPException(status_code=500, detail="Unable to add step.")
+            step_ids[i] = added_step['results'][0]['id']
+        return step_ids
+
     def get_run(self, namespace_id: str, run_id: str) -> Run:
         memory = self._get_namespace(namespace_id=namespace_id)
         steps = [
@@ -8,7 +8,15 @@ from fastapi import HTTPException
 from cuga.backend.memory.agentic_memory.backend.base import BaseMemoryBackend
 from cuga.backend.memory.agentic_memory.config import milvus_config
 from cuga.backend.memory.agentic_memory.db.sqlite_manager import SQLiteManager
-from cuga.backend.memory.agentic_memory.schema import fact_schema, Fact, RecordedFact, Message, Namespace, Run
+from cuga.backend.memory.agentic_memory.schema import (
+    fact_schema,
+    Fact,
+    RecordedFact,
+    Message,
+    Namespace,
+    Run,
+    StepInput,
+)
 from cuga.backend.memory.agentic_memory.utils.fact_extraction import process_messages
 from cuga.backend.memory.agentic_memory.utils.logging import Logging
 from cuga.backend.memory.agentic_memory.utils.utils import (
@@ -187,6 +195,56 @@ class MilvusMemoryBackend(BaseMemoryBackend):
         else:
             raise HTTPException(status_code=500, detail="Unable to add step.")
 
+    def add_steps(self, namespace_id: str, run_id: str, steps: list[StepInput]) -> list[str | None]:
+        """Summarize steps in one LLM batch, encode them together and insert them in one request.
+
+        Steps whose ``step_id`` is already stored (e.g. by a retried request) are not inserted again.
+        """
+        self.validate_namespace(namespace_id)
+        if not steps:
+            return []
+        stored = {}
+        client_ids = [item.step_id for item in steps if item.step_id]
+        if client_ids:
+            for row in self.milvus.query(
+                collection_name=namespace_id,
+                filter=f'metadata["step_id"] in {json.dumps(client_ids)}',
+                output_fields=['id', 'metadata'],
+            ):
+                stored[row['metadata']['step_id']] = str(row['id'])
+        todo = self.unstored_steps(steps, stored)
+
+        llm = get_chat_model(milvus_config.step_processing)
+        extractions = (
+            self.summarize_steps(
+                [steps[i] for i in todo], lambda batch: [message.content for message in llm.batch(batch)]
+            )
+            if todo
+            else []
+        )
+        parsed = [(i, extraction) for i, extraction in zip(todo, extractions) if extraction is not None]
+        step_ids = [stored.get(item.step_id) if item.step_id else None for item in steps]
+        if not parsed:
+            return step_ids
+
+        embeddings = self.embedding_model.encode([extraction['summary'] for _, extraction in parsed])
+        result = self.milvus.insert(
+            collection_name=namespace_id,
+            data=[
+                {
+                    'content': extraction['summary'],
+                    'embedding': embedding,
+                    'metadata': {**self.step_metadata(extraction, steps[i]), 'run_id': run_id},
+                }
+                for (i, extraction), embedding in zip(parsed, embeddings)
+            ],
+        )
+        if len(result['ids']) != len(parsed):
+            raise HTTPException(status_code=500, detail="Unable to add steps.")
+        for (i, _), step_id in zip(parsed, result['ids']):
+            step_ids[i] = str(step_id)
+        return step_ids
+
     def get_run(self, namespace_id: str, run_id: str) -> Run:
         self.validate_namespace(namespace_id)
         steps = [
@@ -401,6 +401,23 @@ class V1MemoryClient:
             },
         )
 
+    def add_steps(self, namespace_id: str, run_id: str, steps: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        Save several steps into memory with a single request
+        Args:
+            namespace_id: The namespace containing the run
+            run_id: The ID of the run
+            steps: Dictionaries with the ``step``, the ``prompt`` used to parse it and an optional
+                ``step_id`` (steps already stored under that ID are not added again), in order
+        Returns:
+            The IDs of the added steps (None for steps the service could not summarize)
+        """
+        return self._make_request(
+            "POST",
+            f"/v1/namespaces/{namespace_id}/runs/{run_id}/steps:batch",
+            json={"steps": steps},
+        )
+
     def search_runs(
         self, namespace_id: str, query: str | None = None, filters: dict[str, str] | None = None
     ) -> Run | None:
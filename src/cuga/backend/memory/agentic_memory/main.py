@@ -5,7 +5,7 @@ from dotenv import load_dotenv
 from cuga.backend.memory.agentic_memory.backend.mem0_backend import Mem0MemoryBackend
 from cuga.backend.memory.agentic_memory.config import get_config
 from cuga.backend.memory.agentic_memory.utils.logging import Logging
-from cuga.backend.memory.agentic_memory.schema import Fact, Message, RecordedFact, Run, Namespace
+from cuga.backend.memory.agentic_memory.schema import Fact, Message, RecordedFact, Run, Namespace, StepInput
 from fastapi import APIRouter, FastAPI, HTTPException, Path, Body, Query, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from mem0 import Memory
@@ -241,6 +241,21 @@ def add_step(
     return memory_backend.add_step(namespace_id, run_id, step, prompt)
 
 
+@router_v1.post(
+    "/namespaces/{namespace_id}/runs/{run_id}/steps:batch",
+    response_description='The IDs of the added steps, in order (null for steps that could not be summarized).',
+)
+def add_steps(
+    namespace_id: Annotated[
+        str, Path(description='The namespace which contains facts relevant to the user.')
+    ],
+    run_id: Annotated[str, Path(description='The run which contains the steps for an agentic workflow.')],
+    steps: Annotated[list[StepInput], Body(description='The steps to add, in order.', embed=True)],
+) -> list[str | None]:
+    """Add several steps into a run, summarizing and storing them together."""
+    return memory_backend.add_steps(namespace_id, run_id, steps)
+
+
 @router_v1.post("/namespaces/{namespace_id}/runs/search")
 def search_runs(
     namespace_id: Annotated[
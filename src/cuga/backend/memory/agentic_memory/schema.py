@@ -50,6 +50,18 @@ fact_schema = CollectionSchema(
 )
 
 
+class StepInput(BaseModel):
+    """A step of an agentic workflow waiting to be summarized into memory."""
+
+    step: dict = Field(description='The step, an arbitrary JSON object.')
+    prompt: str = Field(description='The prompt used by an LLM to parse a step.')
+    step_id: str | None = Field(
+        default=None,
+        description='Client-supplied ID of the step. A step whose ID is already stored in the run is not added '
+        'again, so retried requests do not duplicate steps.',
+    )
+
+
 class Message(BaseModel):
     """A message in a chat log."""
 
@@ -1,5 +1,6 @@
 from cuga.backend.memory.agentic_memory import V1MemoryClient
 from cuga.backend.memory.agentic_memory.schema import Run, RecordedFact, Namespace
+from cuga.backend.memory.step_queue import StepIngestionQueue
 from typing import List, Dict, Optional, TYPE_CHECKING
 import os
 import json
@@ -26,8 +27,16 @@ class Memory:
                 base_url=os.environ.get("MEMORY_BASE_URL", f"http://localhost:{port}"), timeout=600
             )
             self.user_id = None
+            self._step_queue: StepIngestionQueue | None = None
             Memory._initialized = True
 
+    @property
+    def step_queue(self) -> StepIngestionQueue:
+        """Background queue used to ingest agent steps without blocking the agent."""
+        if self._step_queue is None:
+            self._step_queue = StepIngestionQueue.from_env(self.memory_client)
+        return self._step_queue
+
     def health_check(self) -> bool:
         return self.memory_client.health_check()
 
@@ -133,6 +142,18 @@ class Memory:
         """Add a new step into a run."""
         return self.memory_client.add_step(namespace_id, run_id, step, prompt)
 
+    def enqueue_step(self, namespace_id: str, run_id: str, step: dict, prompt: str) -> None:
+        """Queue a step to be added into a run in the background."""
+        self.step_queue.enqueue_step(namespace_id, run_id, step, prompt)
+
+    def enqueue_end_run(self, namespace_id: str, run_id: str) -> None:
+        """End a run in the background, after its queued steps have been added."""
+        self.step_queue.enqueue_end_run(namespace_id, run_id)
+
+    def step_backlog(self) -> dict:
+        """Backlog metrics of the background step queue."""
+        return self.step_queue.stats()
+
     def _get_user_id(self, state: "AgentState") -> str:
         """Extract or generate user ID for memory scoping"""
         # Use the pi field from AgentState
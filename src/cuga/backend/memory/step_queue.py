@@ -0,0 +1,242 @@
+"""
+Background ingestion of agent steps into the memory service.
+
+Summarizing a step on the memory service takes an LLM round-trip, so the
+agent does not wait for it: ``StepIngestionQueue`` journals each step in a
+local SQLite file and returns immediately. A daemon thread sends the journal
+to the service in batches (``/steps:batch``), and ends runs only after all of
+their steps have been sent. Entries stay in the journal until the service
+has accepted them, so steps queued before a crash or restart are sent by the
+next process that opens the journal. Each step carries a ``step_id`` fixed at
+enqueue time, so re-sending a batch the service partially stored does not
+duplicate steps.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from cuga.config import DBS_DIR
+
+DEFAULT_DB_PATH = os.path.join(DBS_DIR, "memory_steps.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pending (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    owner INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    namespace_id TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    payload TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL
+)
+"""
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class StepIngestionQueue:
+    """
+    Durable queue sending agent steps to the memory service in batches.
+
+    Args:
+        client: Memory client exposing ``add_steps`` and ``end_run``.
+        db_path: SQLite journal of steps not yet accepted by the service.
+        batch_size: Maximum number of steps per ``add_steps`` request.
+        max_attempts: Failed requests are retried this many times before their steps are dropped.
+        retry_delay_s: Delay before retrying after a failed request.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        db_path: str = DEFAULT_DB_PATH,
+        batch_size: int = 16,
+        max_attempts: int = 5,
+        retry_delay_s: float = 5.0,
+    ) -> None:
+        self.client = client
+        self.db_path = db_path
+        self.batch_size = max(1, batch_size)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_delay_s = retry_delay_s
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._counters = {"sent_steps": 0, "sent_batches": 0, "ended_runs": 0, "failed_steps": 0, "retries": 0}
+        self._last_error: Optional[str] = None
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        if self._adopt_orphans():
+            self._ensure_thread()
+
+    @classmethod
+    def from_env(cls, client: Any) -> "StepIngestionQueue":
+        """Build a queue configured by ``MEMORY_STEP_QUEUE_*`` environment variables."""
+        return cls(
+            client,
+            db_path=os.getenv("MEMORY_STEP_QUEUE_DB", DEFAULT_DB_PATH),
+            batch_size=int(os.getenv("MEMORY_STEP_QUEUE_BATCH_SIZE", "16")),
+            max_attempts=int(os.getenv("MEMORY_STEP_QUEUE_MAX_ATTEMPTS", "5")),
+            retry_delay_s=float(os.getenv("MEMORY_STEP_QUEUE_RETRY_DELAY_S", "5")),
+        )
+
+    def enqueue_step(self, namespace_id: str, run_id: str, step: dict, prompt: str) -> None:
+        """Journal a step for ingestion and return without waiting for the service."""
+        payload = {"step": step, "prompt": prompt, "step_id": uuid.uuid4().hex}
+        self._insert("step", namespace_id, run_id, json.dumps(payload, default=str))
+
+    def enqueue_end_run(self, namespace_id: str, run_id: str) -> None:
+        """End a run once every step queued before it has been sent."""
+        self._insert("end_run", namespace_id, run_id, None)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until this process has no pending entries; returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._pending_count() > 0:
+            if not (self._thread and self._thread.is_alive()):
+                self._ensure_thread()
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            self._wakeup.set()
+            time.sleep(0.05)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Backlog size and ingestion counters for monitoring."""
+        with self._lock:
+            pending, steps, oldest = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(kind = 'step'), 0), MIN(created_at) FROM pending WHERE owner = ?",
+                (self._pid,),
+            ).fetchone()
+        return {
+            "pending": pending,
+            "pending_steps": steps,
+            "oldest_pending_age_s": round(time.time() - oldest, 3) if oldest is not None else 0.0,
+            "last_error": self._last_error,
+            **self._counters,
+        }
+
+    def _insert(self, kind: str, namespace_id: str, run_id: str, payload: Optional[str]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO pending (owner, kind, namespace_id, run_id, payload, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (self._pid, kind, namespace_id, run_id, payload, time.time()),
+            )
+        self._ensure_thread()
+        self._wakeup.set()
+
+    def _pending_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM pending WHERE owner = ?", (self._pid,)).fetchone()[0]
+
+    def _adopt_orphans(self) -> int:
+        """Take over entries journaled by processes that are no longer running."""
+        with self._lock, self._conn:
+            owners = [row[0] for row in self._conn.execute("SELECT DISTINCT owner FROM pending")]
+            adopted = 0
+            for owner in owners:
+                if owner == self._pid or not _pid_alive(owner):
+                    adopted += self._conn.execute(
+                        "UPDATE pending SET owner = ? WHERE owner = ?", (self._pid, owner)
+                    ).rowcount
+        if adopted:
+            logger.info(f"Resuming ingestion of {adopted} journaled memory entries")
+        return adopted
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="memory-step-ingestion", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(timeout=1.0)
+            self._wakeup.clear()
+            while self._drain_once():
+                pass
+
+    def _drain_once(self) -> bool:
+        """Send the oldest group of entries; returns True if more work may be waiting."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, kind, namespace_id, run_id, payload, attempts FROM pending WHERE owner = ? "
+                "ORDER BY seq LIMIT ?",
+                (self._pid, self.batch_size),
+            ).fetchall()
+        if not rows:
+            return False
+
+        group = self._leading_group(rows)
+        _, kind, namespace_id, run_id, _, attempts = group[0]
+        try:
+            if kind == "end_run":
+                self.client.end_run(namespace_id, run_id)
+                self._counters["ended_runs"] += 1
+            else:
+                step_ids = self.client.add_steps(namespace_id, run_id, [json.loads(row[4]) for row in group])
+                skipped = sum(1 for step_id in step_ids or [] if step_id is None)
+                if skipped:
+                    logger.warning(f"Memory service could not summarize {skipped} steps of run {run_id}")
+                self._counters["sent_steps"] += len(group) - skipped
+                self._counters["failed_steps"] += skipped
+                self._counters["sent_batches"] += 1
+        except Exception as e:
+            self._last_error = str(e)
+            if attempts + 1 >= self.max_attempts:
+                logger.error(f"Dropping {len(group)} memory entries for run {run_id} after {attempts + 1} attempts: {e}")
+                self._counters["failed_steps"] += len(group) if kind == "step" else 0
+                self._delete(group)
+                return True
+            logger.warning(f"Memory ingestion failed for run {run_id}, retrying in {self.retry_delay_s}s: {e}")
+            self._counters["retries"] += 1
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "UPDATE pending SET attempts = attempts + 1 WHERE seq = ?", [(row[0],) for row in group]
+                )
+            time.sleep(self.retry_delay_s)
+            return True
+
+        self._delete(group)
+        return True
+
+    @staticmethod
+    def _leading_group(rows: List[Tuple]) -> List[Tuple]:
+        """The first entry plus following steps of the same run (an end_run marker stands alone)."""
+        first = rows[0]
+        if first[1] == "end_run":
+            return [first]
+        group = [first]
+        for row in rows[1:]:
+            if row[1] != "step" or row[2:4] != first[2:4]:
+                break
+            group.append(row)
+        return group
+
+    def _delete(self, group: List[Tuple]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM pending WHERE seq = ?", [(row[0],) for row in group])
@@ -30,6 +30,7 @@ from cuga.backend.browser_env.browser.gym_obs.http_stream_comm import (
     ChromeExtensionCommunicatorProtocol,
 )
 from cuga.backend.cuga_graph.nodes.browser.action_agent.tools.tools import format_tools
+from cuga.backend.cuga_graph.checkpointer import BoundedCheckpointer
 from cuga.backend.cuga_graph.graph import DynamicAgentGraph
 from cuga.backend.cuga_graph.utils.controller import AgentRunner
 from cuga.backend.cuga_graph.utils.event_porcessors.action_agent_event_processor import (
@@ -111,7 +112,9 @@ class AppState:
         )
         # Per-thread cancellation events for concurrent user support
         # Using asyncio.Event for thread-safe cancellation signaling
+        # Events exist only while a stream for the thread is running
         self.stop_events: Dict[str, asyncio.Event] = {}
+        self.checkpointer: Optional[BoundedCheckpointer] = None
         self.output_format: OutputFormat = (
             OutputFormat.WXO if settings.advanced_features.wxo_integration else OutputFormat.DEFAULT
         )
@@ -266,7 +269,10 @@ async def lifespan(app: FastAPI):
         if settings.advanced_features.langfuse_tracing and CallbackHandler is not None
         else None
     )
-    app_state.agent = DynamicAgentGraph(None, langfuse_handler=langfuse_handler)
+    app_state.checkpointer = BoundedCheckpointer.from_env()
+    app_state.agent = DynamicAgentGraph(
+        None, langfuse_handler=langfuse_handler, checkpointer=app_state.checkpointer
+    )
     await app_state.agent.build_graph()
 
     logger.info("Application finished starting up...")
@@ -289,6 +295,10 @@ async def lifespan(app: FastAPI):
     yield
     logger.info("Application is shutting down...")
 
+    # Persist resident conversation threads so they survive a restart
+    if app_state.checkpointer is not None:
+        app_state.checkpointer.close()
+
     # Terminate the save_reuse server process if it's running
     if app_state.save_reuse_process and app_state.save_reuse_process.returncode is None:
         logger.info("Terminating save_reuse server...")
@@ -349,12 +359,14 @@ async def setup_page_info(state: AgentState, env: ExtensionEnv | BrowserEnvGymAs
 async def event_stream(query: str, api_mode=False, resume=None, thread_id: str = None):
     """Handles the main agent event stream."""
     # Create or get cancellation event for this thread
+    stop_event = None
     if thread_id:
         if thread_id not in app_state.stop_events:
             app_state.stop_events[thread_id] = asyncio.Event()
         else:
             # Reset the event for a new stream
             app_state.stop_events[thread_id].clear()
+        stop_event = app_state.stop_events[thread_id]
 
     # Create a local state object - retrieve from LangGraph if resuming or if thread_id exists, otherwise create new
     local_state = None
@@ -633,6 +645,15 @@ async def event_stream(query: str, api_mode=False, resume=None, thread_id: str =
             logger.warning(f"Failed to finish task in tracker on error: {tracker_error}")
 
         yield StreamEvent(name="Error", data=str(e)).format()
+    finally:
+        # Runs that end without finish_task (HITL interrupt, stop, disconnect) still get <task>.json
+        try:
+            local_tracker.compact_trajectory()
+        except Exception as tracker_error:
+            logger.warning(f"Failed to compact trajectory: {tracker_error}")
+        # Drop the thread's stop event once its stream ends so the dict does not grow without bound
+        if stop_event is not None and app_state.stop_events.get(thread_id) is stop_event:
+            del app_state.stop_events[thread_id]
 
 
 app = FastAPI(lifespan=lifespan)
@@ -686,6 +707,23 @@ except Exception as e:
     logger.warning(f"⚠️  Error loading capability health endpoints: {e}")
 
 
+@app.get("/api/checkpointer/stats")
+async def get_checkpointer_stats() -> dict:
+    """Resident/spilled conversation threads and their memory usage."""
+    stats = app_state.checkpointer.stats() if app_state.checkpointer is not None else {}
+    return {**stats, "active_streams": len(app_state.stop_events)}
+
+
+@app.get("/api/memory/backlog")
+async def get_memory_backlog() -> dict:
+    """Agent steps waiting to be ingested into agentic memory."""
+    if not settings.advanced_features.enable_memory:
+        return {"enabled": False}
+    from cuga.backend.memory.memory import Memory
+
+    return {"enabled": True, **Memory().step_backlog()}
+
+
 @app.get("/api/traces")
 async def get_traces(session_id: str):
     """
@@ -848,10 +886,9 @@ async def stop(request: Request):
 
     if thread_id:
         logger.info(f"Received stop request for thread_id: {thread_id}")
-        # Create event if it doesn't exist, then set it
-        if thread_id not in app_state.stop_events:
-            app_state.stop_events[thread_id] = asyncio.Event()
-        app_state.stop_events[thread_id].set()
+        # Only running streams have an event; a new stream starts with a cleared one anyway
+        if thread_id in app_state.stop_events:
+            app_state.stop_events[thread_id].set()
         return {"status": "success", "message": f"Stop request received for thread_id: {thread_id}"}
     else:
         logger.warning("Received stop request without thread_id, stopping all threads")
@@ -1,9 +1,15 @@
+import asyncio
+import importlib.util
 import json
+import os
 import re
-from typing import Any, Dict, List, Literal, Optional, TypeAlias
-from urllib.parse import urlencode
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, List, Literal, Optional, Tuple, TypeAlias
+from urllib.parse import urlencode, urlsplit
 
-import requests
+import httpx
 from loguru import logger
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel
@@ -488,34 +494,185 @@ def apply_authentication(auth, headers: dict, query_params: dict):
         logger.warning(f"Unknown auth type: {auth_type}")
 
 
-def create_handler(api, model, base_url: str, name: str, schemas: Dict[str, ServiceConfig]):
+_PATH_PARAM = re.compile(r"\{([^}]+)\}")
+
+
+class AsyncClientPool:
+    """Shared keep-alive ``httpx.AsyncClient`` per event loop and upstream origin.
+
+    OpenAPI servers each run their own event loop in a thread, and an async
+    client's connections belong to the loop that opened them, so clients are
+    keyed by the running loop as well as ``scheme://host:port``. Each client
+    caps its open connections (the per-host concurrency limit), keeps idle
+    connections alive and negotiates HTTP/2 when the ``h2`` package is
+    installed.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: Optional[bool] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = importlib.util.find_spec("h2") is not None if http2 is None else http2
+        self.transport = transport
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _origin(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def client_for(self, url: str) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        origin = self._origin(url)
+        with self._lock:
+            clients = self._clients.setdefault(loop, {})
+            client = clients.get(origin)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    http2=self.http2,
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_keepalive_connections,
+                        keepalive_expiry=self.keepalive_expiry,
+                    ),
+                    timeout=None,
+                    follow_redirects=True,
+                    transport=self.transport,
+                )
+                clients[origin] = client
+            return client
+
+    async def aclose(self) -> None:
+        """Close the clients owned by the running event loop."""
+        with self._lock:
+            clients = self._clients.pop(asyncio.get_running_loop(), {})
+        for client in clients.values():
+            await client.aclose()
+
+
+HTTP_CLIENT_POOL = AsyncClientPool(
+    max_connections=int(os.getenv("CUGA_TOOL_HTTP_MAX_CONNECTIONS", "20")),
+    max_keepalive_connections=int(os.getenv("CUGA_TOOL_HTTP_MAX_KEEPALIVE", "20")),
+    keepalive_expiry=float(os.getenv("CUGA_TOOL_HTTP_KEEPALIVE_EXPIRY_S", "30")),
+)
+
+
+@dataclass(frozen=True)
+class OperationTemplate:
+    """Request layout for one operation, derived once when its tool is registered."""
+
+    method: str
+    path_parts: Tuple[Tuple[bool, str], ...]  # (is_parameter, literal text or parameter name)
+    path_names: Tuple[str, ...]
+    query_names: Tuple[str, ...]
+    body_names: Tuple[str, ...]
+    use_json: bool
+    override_params: Optional[Dict[str, Dict[str, str]]]
+
+    @classmethod
+    def from_api(cls, api, schemas: Dict[str, ServiceConfig], app_name: str) -> "OperationTemplate":
+        path_parts: List[Tuple[bool, str]] = []
+        position = 0
+        for match in _PATH_PARAM.finditer(api.path):
+            if match.start() > position:
+                path_parts.append((False, api.path[position : match.start()]))
+            path_parts.append((True, match.group(1)))
+            position = match.end()
+        if position < len(api.path):
+            path_parts.append((False, api.path[position:]))
+
+        path_names, query_names, body_names = [], [], []
+        for param in api.parameters or []:
+            if param.in_ == "query":
+                query_names.append(param.name)
+            elif param.in_ == "path":
+                path_names.append(param.name)
+            else:
+                body_names.append(param.name)
+        if api.request_body:
+            for media in api.request_body.content.values():
+                if media.schema_field and media.schema_field.properties:
+                    body_names.extend(media.schema_field.properties.keys())
+
+        return cls(
+            method=api.method,
+            path_parts=tuple(path_parts),
+            path_names=tuple(path_names),
+            query_names=tuple(query_names),
+            body_names=tuple(body_names),
+            use_json=determine_content_type(api),
+            override_params=get_operation_override_parameters(
+                schema_urls=schemas, app_name=app_name, operation_id=api.operation_id
+            )
+            if app_name in schemas
+            else None,
+        )
+
+    def split_params(self, all_params: dict) -> Tuple[dict, dict, dict]:
+        """Same split as ``extract_url_params``/``extract_body_params`` without rescanning the operation."""
+        path_params = {name: all_params[name] for name in self.path_names if name in all_params}
+        query_params = {
+            name: all_params[name]
+            for name in self.query_names
+            if name in all_params and all_params[name] is not None
+        }
+        body_params = {name: all_params[name] for name in self.body_names if name in all_params}
+        return path_params, query_params, body_params
+
+    def render_url(self, base_url: str, path_params: dict, query_params: dict) -> str:
+        path = "".join(
+            (str(path_params[text]) if text in path_params else f"{{{text}}}") if is_param else text
+            for is_param, text in self.path_parts
+        )
+        final_url = base_url + path
+        if query_params:
+            final_url += "?" + urlencode(query_params)
+        return final_url
+
+
+def create_handler(
+    api,
+    model,
+    base_url: str,
+    name: str,
+    schemas: Dict[str, ServiceConfig],
+    client_pool: Optional[AsyncClientPool] = None,
+):
     """
-    Create a handler function for an API that processes parameters,
-    builds the URL, and handles the request.
+    Create an async handler function for an API that processes parameters,
+    builds the URL, and sends the request over a pooled keep-alive client.
     """
+    template = OperationTemplate.from_api(api, schemas, name)
+    pool = client_pool or HTTP_CLIENT_POOL
 
-    def handler(params: model, headers: dict = None):
+    async def handler(params: model, headers: dict = None):
         all_params = params.model_dump()
-        headers = headers if headers else {}
+        headers = dict(headers) if headers else {}
 
         try:
-            params = get_operation_override_parameters(
-                schema_urls=schemas, app_name=name, operation_id=api.operation_id
-            )
+            override_params = template.override_params
             additional_query_params = {}
             additional_body_params = {}
-            tokens = headers.get("_tokens", None)
-            if params and tokens is not None:
+            tokens = headers.pop("_tokens", None)
+            if override_params and tokens is not None:
                 tokens = json.loads(tokens)
                 file_system_token = tokens.get("file_system", None)
-                if "file_system_access_token" in params.keys() and file_system_token:
-                    if params["file_system_access_token"]["in"] == "query":
+                if "file_system_access_token" in override_params.keys() and file_system_token:
+                    if override_params["file_system_access_token"]["in"] == "query":
                         additional_query_params["file_system_access_token"] = file_system_token
-                    if params["file_system_access_token"]["in"] == "body":
+                    if override_params["file_system_access_token"]["in"] == "body":
                         additional_body_params["file_system_access_token"] = file_system_token
-            if "_tokens" in list(headers.keys()):
-                del headers['_tokens']
-            path_params, query_params = extract_url_params(api, all_params)
+            path_params, query_params, body_params = template.split_params(all_params)
             query_params.update(additional_query_params)
 
             # Apply authentication from service config
@@ -523,15 +680,16 @@ def create_handler(api, model, base_url: str, name: str, schemas: Dict[str, Serv
             if service_config and service_config.auth:
                 apply_authentication(service_config.auth, headers, query_params)
 
-            final_url = construct_final_url(base_url, api, path_params, query_params)
-            body_params = extract_body_params(api, all_params)
+            final_url = template.render_url(base_url, path_params, query_params)
             body_params.update(additional_body_params)
-            use_json = determine_content_type(api)
 
-            if use_json:
-                response = requests.request(api.method, final_url, headers=headers, json=body_params)
+            client = pool.client_for(final_url)
+            if template.use_json:
+                response = await client.request(template.method, final_url, headers=headers, json=body_params)
             else:
-                response = requests.request(api.method, final_url, headers=headers, data=body_params)
+                response = await client.request(
+                    template.method, final_url, headers=headers, data=body_params or None
+                )
 
             response.raise_for_status()
             return response.text
@@ -545,17 +703,18 @@ def create_handler(api, model, base_url: str, name: str, schemas: Dict[str, Serv
             }
 
             # Add HTTP-specific details if it's an HTTP error
-            if hasattr(e, 'response') and e.response is not None:
-                error_response["status_code"] = e.response.status_code
+            response = getattr(e, 'response', None) if isinstance(e, httpx.HTTPStatusError) else None
+            if response is not None:
+                error_response["status_code"] = response.status_code
                 error_response["url"] = final_url if 'final_url' in locals() else None
                 error_response["method"] = api.method
 
                 # Try to get response body for more details
                 try:
-                    if e.response.headers.get('content-type', '').startswith('application/json'):
-                        error_response["message"] += f" {json.dumps(e.response.json())}"
+                    if response.headers.get('content-type', '').startswith('application/json'):
+                        error_response["message"] += f" {json.dumps(response.json())}"
                     else:
-                        error_response["message"] += f" {e.response.text}"
+                        error_response["message"] += f" {response.text}"
                 except Exception:
                     pass
 
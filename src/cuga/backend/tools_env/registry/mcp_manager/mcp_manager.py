@@ -1,7 +1,6 @@
 import httpx
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import json
-import aiohttp
 from cuga.config import PACKAGE_ROOT
 import os
 import asyncio
@@ -20,13 +19,15 @@ except ImportError:
 from cuga.backend.tools_env.registry.config.config_loader import Auth
 from cuga.backend.tools_env.registry.config.config_loader import ServiceConfig, Service
 from cuga.backend.tools_env.registry.mcp_manager.openapi_parser import SimpleOpenAPIParser
-from cuga.backend.tools_env.registry.mcp_manager.adapter import new_mcp_from_custom_parser
+from cuga.backend.tools_env.registry.mcp_manager.adapter import HTTP_CLIENT_POOL, new_mcp_from_custom_parser
 import threading
+import hashlib
 from collections import defaultdict
 from urllib.parse import urlparse
 from loguru import logger
 from cuga.backend.tools_env.registry.mcp_manager.openapi_parser_v0 import OpenAPITransformer
 from cuga.backend.tools_env.registry.mcp_manager.response_schema import extract_response_schema
+from cuga.backend.tools_env.registry.mcp_manager.session_pool import MCPSessionPool
 import yaml
 from cuga.backend.utils.consts import ServiceType, LOCAL_ORCHESTRATE_URL, LOCAL_TRM_URL
 
@@ -44,6 +45,20 @@ class MCPManager:
         self.trm_tools = {}
         self.mcp_clients = {}  # Store MCP client connections
         self.fastmcp_client = None  # FastMCP client for standard MCP servers
+        self.mcp_transports = {}
+        # Transformed API catalogs keyed by (app, include_response_schema), plus app -> function -> metadata
+        self._api_cache: Dict[tuple, Dict[str, Any]] = {}
+        self._function_index: Dict[str, Dict[str, Any]] = {}
+        # Bumped on every catalog invalidation; the content-hash version is recomputed only when it moves
+        self._catalog_generation = 0
+        self._catalog_version: Optional[tuple] = None
+        # Long-lived sessions for external MCP servers plus shared keep-alive HTTP clients
+        self.session_pool = MCPSessionPool(
+            client_factory=lambda server_name: FastMCPClient(self.mcp_transports[server_name]),
+            max_concurrency=int(os.getenv("MCP_POOL_MAX_CONCURRENCY", "8")),
+            idle_timeout_s=float(os.getenv("MCP_POOL_IDLE_TIMEOUT_S", "300")),
+            health_check_interval_s=float(os.getenv("MCP_POOL_HEALTH_CHECK_INTERVAL_S", "30")),
+        )
 
     @staticmethod
     def _get_response_schema_from_tool(
@@ -416,9 +431,9 @@ class MCPManager:
         return {"success": trm_output_schema, "failure": {"error": "string"}}
 
     async def _get_trm_tools(self, app_name: str, url: str, app_tools: List[str], auth: Auth):
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url + '/api/v1/tools/', headers={auth.type: auth.value})
-            tools = response.json()
+        client = self.session_pool.httpx_client()
+        response = await client.get(url + '/api/v1/tools/', headers={auth.type: auth.value})
+        tools = response.json()
         for tool in tools:
             if tool['name'] in app_tools:
                 self.trm_tools[app_name + '_' + tool['name']] = {
@@ -438,17 +453,17 @@ class MCPManager:
             auth = self.auth_config[trm_tool.split("_")[0]]
             tool = self.trm_tools[trm_tool]
             tool_type = next(iter(tool['binding']))
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    LOCAL_TRM_URL + f"/api/v1/runtime/tools/{tool['id']}/run?tool_type={tool_type}",
-                    json={
-                        "args": args,
-                        "type": tool_type,
-                        "function": f"{tool['binding'][tool_type]['function']}",
-                    },
-                    headers={auth.type: auth.value},
-                )
-                response_json = response.json()
+            client = self.session_pool.httpx_client()
+            response = await client.post(
+                LOCAL_TRM_URL + f"/api/v1/runtime/tools/{tool['id']}/run?tool_type={tool_type}",
+                json={
+                    "args": args,
+                    "type": tool_type,
+                    "function": f"{tool['binding'][tool_type]['function']}",
+                },
+                headers={auth.type: auth.value},
+            )
+            response_json = response.json()
             return [TextContent(text=response_json['data']['tool_output'], type='text')]
 
         server = self.server_by_tool.get(tool_name)
@@ -464,6 +479,15 @@ class MCPManager:
             # Traditional MCP server call
             return await server.call_tool(tool_name, {"params": args, "headers": headers})
 
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Session pool hit/miss counters and per-server call latency."""
+        return self.session_pool.snapshot()
+
+    async def aclose(self):
+        """Close pooled MCP sessions and shared HTTP clients."""
+        await self.session_pool.aclose()
+        await HTTP_CLIENT_POOL.aclose()
+
     def get_server_names(self):
         return list(self.tools_by_server.keys())
 
@@ -476,6 +500,64 @@ class MCPManager:
         return tools
 
     def get_apis_for_application(self, app_name, include_response_schema=False):
+        """API catalog for ``app_name``, memoized until the app's schemas or auth change.
+
+        The returned mapping is shared between callers and must not be mutated.
+        """
+        key = (app_name, bool(include_response_schema))
+        apis = self._api_cache.get(key)
+        if apis is None:
+            apis = self._build_apis_for_application(app_name, include_response_schema)
+            self._api_cache[key] = apis
+        return apis
+
+    def get_function_metadata(self, app_name: str, function_name: str) -> Optional[Dict[str, Any]]:
+        """O(1) lookup of one function's catalog entry; raises KeyError for unknown apps."""
+        functions = self._function_index.get(app_name)
+        if functions is None:
+            apis = self.get_apis_for_application(app_name)
+            functions = dict(apis) if isinstance(apis, dict) else {}
+            self._function_index[app_name] = functions
+        return functions.get(function_name)
+
+    def invalidate_api_cache(self, app_name: Optional[str] = None):
+        """Drop memoized catalogs for ``app_name`` (or every app) after schemas or auth change."""
+        self._catalog_generation += 1
+        if app_name is None:
+            self._api_cache.clear()
+            self._function_index.clear()
+            return
+        self._api_cache.pop((app_name, False), None)
+        self._api_cache.pop((app_name, True), None)
+        self._function_index.pop(app_name, None)
+
+    @property
+    def catalog_version(self) -> str:
+        """Opaque version of the tool catalog: a hash of the loaded schemas, tools and auth.
+
+        Being content-derived, it is stable across registry restarts so clients
+        can keep snapshots of an unchanged catalog.
+        """
+        if self._catalog_version is None or self._catalog_version[0] != self._catalog_generation:
+            auth = {
+                app: auth.model_dump() if hasattr(auth, "model_dump") else auth
+                for app, auth in self.auth_config.items()
+            }
+            content = json.dumps(
+                [self.schemas, self.tools_by_server, self.trm_tools, auth], sort_keys=True, default=str
+            )
+            self._catalog_version = (self._catalog_generation, hashlib.sha256(content.encode()).hexdigest()[:16])
+        return self._catalog_version[1]
+
+    def set_schemas(self, app_name: str, schemas):
+        self.schemas[app_name] = schemas
+        self.invalidate_api_cache(app_name)
+
+    def set_auth_config(self, app_name: str, auth):
+        self.auth_config[app_name] = auth
+        self.invalidate_api_cache(app_name)
+
+    def _build_apis_for_application(self, app_name, include_response_schema=False):
         if "default" in app_name:
             return self.schemas[app_name]
         is_trm_app = any(app_name in item for item in list(self.trm_tools.keys()))
@@ -581,7 +663,7 @@ class MCPManager:
                         print(f"Timeout fetching tools from {name} after 15 seconds")
                         raise
 
-                    self.schemas[name] = {
+                    self.set_schemas(name, {
                         "tools": [
                             {
                                 "name": tool.name,
@@ -591,7 +673,7 @@ class MCPManager:
                             }
                             for tool in tools
                         ]
-                    }
+                    })
 
                     for tool in tools:
                         prefixed_name = f"{name}_{tool.name}"
@@ -615,11 +697,10 @@ class MCPManager:
 
                     print(f"✓ Connected to MCP server '{name}' with {len(tools)} tools")
                     self.mcp_clients[name] = config.url or config.command
-                    self.auth_config[name] = config.auth
+                    self.set_auth_config(name, config.auth)
 
-                    if not hasattr(self, 'mcp_transports'):
-                        self.mcp_transports = {}
                     self.mcp_transports[name] = transport
+                    await self.session_pool.invalidate(name)
 
                 except Exception as e:
                     print(f"Error connecting to MCP server {name}: {e}")
@@ -800,26 +881,20 @@ class MCPManager:
 
                 apply_authentication(auth, headers, query_params)
 
-            if hasattr(self, 'mcp_transports') and server_name in self.mcp_transports:
+            if server_name in self.mcp_transports:
                 original_tool_name = tool_name.replace(f"{server_name}_", "")
 
-                transport = self.mcp_transports[server_name]
-                client = FastMCPClient(transport)
-
-                async with client:
-                    result = await client.call_tool(original_tool_name, args)
-                    ##TODO add result.structured output if exists and retutn instead of text key  return [TextContent(text=result_text, type='text')]
-                    structured_content = (
-                        result.structured_content if hasattr(result, 'structured_content') else None
-                    )
-                    result_text = (
-                        structured_content
-                        if structured_content
-                        else (result.content[0].text if result.content else str(result))
-                    )
-                    if isinstance(result_text, dict):
-                        result_text = json.dumps(result_text)
-                    return [TextContent(text=result_text, type='text')]
+                result = await self.session_pool.call_tool(server_name, original_tool_name, args)
+                ##TODO add result.structured output if exists and retutn instead of text key  return [TextContent(text=result_text, type='text')]
+                structured_content = result.structured_content if hasattr(result, 'structured_content') else None
+                result_text = (
+                    structured_content
+                    if structured_content
+                    else (result.content[0].text if result.content else str(result))
+                )
+                if isinstance(result_text, dict):
+                    result_text = json.dumps(result_text)
+                return [TextContent(text=result_text, type='text')]
             else:
                 url = self.mcp_clients[server_name]
                 base_url = url.replace('/sse', '')
@@ -832,40 +907,40 @@ class MCPManager:
 
                     url_with_params = f"{base_url}?{urlencode(query_params)}"
 
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        f"{url_with_params}/call_tool",
-                        json={"name": original_tool_name, "arguments": args},
-                        headers=headers,
-                    ) as response:
-                        if response.status == 200:
-                            result = await response.json()
-                            structured_content = result.get('structured_content', None)
-                            result_text = (
-                                structured_content
-                                if structured_content
-                                else (
-                                    result.get('content', [{}])[0].get('text', '')
-                                    if result.get('content')
-                                    else str(result)
-                                )
+                session = self.session_pool.http_session()
+                async with session.post(
+                    f"{url_with_params}/call_tool",
+                    json={"name": original_tool_name, "arguments": args},
+                    headers=headers,
+                ) as response:
+                    if response.status == 200:
+                        result = await response.json()
+                        structured_content = result.get('structured_content', None)
+                        result_text = (
+                            structured_content
+                            if structured_content
+                            else (
+                                result.get('content', [{}])[0].get('text', '')
+                                if result.get('content')
+                                else str(result)
                             )
-                            if isinstance(result_text, dict):
-                                result_text = json.dumps(result_text)
-                            return [TextContent(text=result_text, type='text')]
-                        else:
-                            error_msg = f"MCP server call failed with status {response.status}"
-                            structured_content = result.get('structured_content', None)
-                            result_text = (
-                                structured_content
-                                if structured_content
-                                else (
-                                    result.get('content', [{}])[0].get('text', '')
-                                    if result.get('content')
-                                    else str(result)
-                                )
+                        )
+                        if isinstance(result_text, dict):
+                            result_text = json.dumps(result_text)
+                        return [TextContent(text=result_text, type='text')]
+                    else:
+                        error_msg = f"MCP server call failed with status {response.status}"
+                        structured_content = result.get('structured_content', None)
+                        result_text = (
+                            structured_content
+                            if structured_content
+                            else (
+                                result.get('content', [{}])[0].get('text', '')
+                                if result.get('content')
+                                else str(result)
                             )
-                            return [TextContent(text=error_msg, type='text')]
+                        )
+                        return [TextContent(text=error_msg, type='text')]
 
         except Exception as e:
             error_msg = f"Error calling MCP server tool: {e}"
@@ -904,12 +979,12 @@ class MCPManager:
 
     def add_trm_tools(self, services: List[Service]):
         for name, config in services:
-            self.auth_config[name] = config.auth
+            self.set_auth_config(name, config.auth)
             schemas = []
             for tool_name in config.tools:
                 schema_data = self.trm_tools[name + '_' + tool_name]
                 schemas.append(schema_data)
-            self.schemas[name] = schemas
+            self.set_schemas(name, schemas)
 
     async def initialize_servers(self, services: List[Service]):
         for name, config in services:
@@ -922,8 +997,8 @@ class MCPManager:
                 # Apply filtering and overrides
                 modified_schema = self._filter_and_override_schema(schema_data, config)
 
-                self.schemas[name] = modified_schema
-                self.auth_config[name] = config.auth
+                self.set_schemas(name, modified_schema)
+                self.set_auth_config(name, config.auth)
                 base_url = self._extract_base_url(config.url)
 
                 # Create parser from modified schema
@@ -961,6 +1036,7 @@ class MCPManager:
             }
             self.tools_by_server[mcp_server.name].append(tool_dict)
             self.server_by_tool[tool.name] = mcp_server
+        self.invalidate_api_cache(mcp_server.name)
 
     async def run_all_servers(self):
         for name, server in self.servers.items():
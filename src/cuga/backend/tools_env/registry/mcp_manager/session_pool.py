@@ -0,0 +1,290 @@
+"""
+Per-server pool of long-lived MCP client sessions.
+
+Opening a FastMCP client performs a full transport connect and MCP
+``initialize`` handshake, so doing it for every tool call dominates latency
+for small tools. :class:`MCPSessionPool` keeps one connected client per
+server, bounds concurrent calls per server, health-checks sessions that sat
+idle, replaces sessions that dropped, and evicts sessions that have not been
+used for ``idle_timeout_s``. A tool call is never sent twice: only failures
+to open a session are retried, since a call that failed mid-flight may
+already have run on the server. It also owns the
+keep-alive ``aiohttp``/``httpx`` clients used by the HTTP fallback and TRM
+paths so those stop paying a TCP/TLS handshake per call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+import aiohttp
+import httpx
+from loguru import logger
+
+from cuga.observability.golden_signals import LatencyHistogram
+
+_DEFAULT_MAX_CONCURRENCY = 8
+_DEFAULT_IDLE_TIMEOUT_S = 300.0
+_DEFAULT_HEALTH_CHECK_INTERVAL_S = 30.0
+
+# Errors that mean the session itself is gone, as opposed to the tool failing
+_CONNECTION_ERRORS: tuple = (ConnectionError, OSError, asyncio.TimeoutError, httpx.TransportError)
+try:
+    import anyio
+
+    _CONNECTION_ERRORS += (anyio.ClosedResourceError, anyio.BrokenResourceError, anyio.EndOfStream)
+except ImportError:  # pragma: no cover - anyio ships with httpx
+    pass
+
+
+@dataclass
+class _ServerSession:
+    semaphore: asyncio.Semaphore
+    connect_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    client: Any = None
+    last_used: float = field(default_factory=time.monotonic)
+    in_flight: int = 0
+
+
+@dataclass
+class PoolStats:
+    """Counters for pool reuse.
+
+    ``misses`` count new connections, ``reconnects`` retried connection
+    attempts and ``dropped`` sessions discarded after a call lost its connection.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    reconnects: int = 0
+    dropped: int = 0
+    health_check_failures: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "reconnects": self.reconnects,
+            "dropped": self.dropped,
+            "health_check_failures": self.health_check_failures,
+            "evictions": self.evictions,
+        }
+
+
+class MCPSessionPool:
+    """Pool of connected MCP clients keyed by server name.
+
+    ``client_factory(server_name)`` must return an unconnected client that
+    supports ``async with`` (``__aenter__``/``__aexit__``), ``call_tool`` and
+    optionally ``ping`` and ``is_connected``, which is the FastMCP ``Client``
+    interface. Sessions are bound to the event loop that opened them.
+    """
+
+    def __init__(
+        self,
+        client_factory: Callable[[str], Any],
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        idle_timeout_s: float = _DEFAULT_IDLE_TIMEOUT_S,
+        health_check_interval_s: float = _DEFAULT_HEALTH_CHECK_INTERVAL_S,
+    ) -> None:
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+        self.client_factory = client_factory
+        self.max_concurrency = max_concurrency
+        self.idle_timeout_s = idle_timeout_s
+        self.health_check_interval_s = health_check_interval_s
+        self.stats = PoolStats()
+        self.latency: Dict[str, LatencyHistogram] = {}
+        self._sessions: Dict[str, _ServerSession] = {}
+        self._last_sweep = time.monotonic()
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self._httpx_client: Optional[httpx.AsyncClient] = None
+
+    async def call_tool(self, server_name: str, tool_name: str, args: dict) -> Any:
+        """Call ``tool_name`` on a pooled session.
+
+        If the session drops during the call, the request may already have
+        run on the server (tools can be non-idempotent), so the error is
+        raised rather than the call re-sent; the session is replaced for the
+        next call. Failures to open the session are retried once in
+        :meth:`session`.
+        """
+        async with self.session(server_name) as client:
+            try:
+                return await client.call_tool(tool_name, args)
+            except Exception as exc:
+                if self._is_connection_error(client, exc):
+                    logger.warning(
+                        f"MCP session for {server_name} dropped during {tool_name} ({exc!r}); "
+                        "not retrying the call, reconnecting for the next one"
+                    )
+                    await self._discard(server_name, client)
+                raise
+
+    @asynccontextmanager
+    async def session(self, server_name: str) -> AsyncIterator[Any]:
+        """Borrow the connected client for ``server_name`` within the concurrency limit."""
+        await self._maybe_sweep()
+        entry = self._sessions.get(server_name)
+        if entry is None:
+            entry = _ServerSession(semaphore=asyncio.Semaphore(self.max_concurrency))
+            self._sessions[server_name] = entry
+        started = time.perf_counter()
+        async with entry.semaphore:
+            entry.in_flight += 1
+            try:
+                client = await self._checkout(server_name, entry)
+                yield client
+            finally:
+                entry.in_flight -= 1
+                entry.last_used = time.monotonic()
+                self._histogram(server_name).add((time.perf_counter() - started) * 1000)
+
+    async def _checkout(self, server_name: str, entry: _ServerSession) -> Any:
+        async with entry.connect_lock:
+            if entry.client is not None and not self._client_alive(entry.client):
+                await self._close_client(server_name, entry.client)
+                entry.client = None
+            if entry.client is not None and time.monotonic() - entry.last_used >= self.health_check_interval_s:
+                if not await self._healthy(entry.client):
+                    self.stats.health_check_failures += 1
+                    await self._close_client(server_name, entry.client)
+                    entry.client = None
+            if entry.client is not None:
+                self.stats.hits += 1
+                return entry.client
+            self.stats.misses += 1
+            try:
+                entry.client = await self._connect(server_name)
+            except _CONNECTION_ERRORS as exc:
+                # Nothing was sent yet, so retrying the connect is safe
+                logger.warning(f"Opening MCP session for {server_name} failed ({exc!r}); retrying once")
+                self.stats.reconnects += 1
+                entry.client = await self._connect(server_name)
+            return entry.client
+
+    async def _discard(self, server_name: str, stale: Any) -> None:
+        entry = self._sessions[server_name]
+        async with entry.connect_lock:
+            # Another caller may already have replaced the stale client
+            if entry.client is stale:
+                await self._close_client(server_name, stale)
+                entry.client = None
+                self.stats.dropped += 1
+
+    async def _connect(self, server_name: str) -> Any:
+        client = self.client_factory(server_name)
+        await client.__aenter__()
+        logger.debug(f"Opened pooled MCP session for {server_name}")
+        return client
+
+    @staticmethod
+    async def _close_client(server_name: str, client: Any) -> None:
+        try:
+            await client.__aexit__(None, None, None)
+        except Exception as exc:
+            logger.debug(f"Error closing MCP session for {server_name}: {exc}")
+
+    @staticmethod
+    def _client_alive(client: Any) -> bool:
+        is_connected = getattr(client, "is_connected", None)
+        return bool(is_connected()) if callable(is_connected) else True
+
+    @staticmethod
+    async def _healthy(client: Any) -> bool:
+        ping = getattr(client, "ping", None)
+        if ping is None:
+            return True
+        try:
+            return bool(await ping())
+        except Exception:
+            return False
+
+    def _is_connection_error(self, client: Any, exc: Exception) -> bool:
+        return isinstance(exc, _CONNECTION_ERRORS) or not self._client_alive(client)
+
+    def _histogram(self, server_name: str) -> LatencyHistogram:
+        histogram = self.latency.get(server_name)
+        if histogram is None:
+            histogram = self.latency[server_name] = LatencyHistogram()
+        return histogram
+
+    async def _maybe_sweep(self) -> None:
+        now = time.monotonic()
+        if now - self._last_sweep < self.idle_timeout_s / 2:
+            return
+        self._last_sweep = now
+        await self.evict_idle()
+
+    async def evict_idle(self) -> int:
+        """Close sessions idle for longer than ``idle_timeout_s``; returns how many were closed."""
+        now = time.monotonic()
+        evicted = 0
+        for server_name, entry in list(self._sessions.items()):
+            if entry.client is None or entry.in_flight or now - entry.last_used < self.idle_timeout_s:
+                continue
+            async with entry.connect_lock:
+                if entry.client is None or entry.in_flight:
+                    continue
+                await self._close_client(server_name, entry.client)
+                entry.client = None
+            evicted += 1
+        self.stats.evictions += evicted
+        return evicted
+
+    async def invalidate(self, server_name: str) -> None:
+        """Drop the pooled session for ``server_name`` (e.g. after its transport changed)."""
+        entry = self._sessions.get(server_name)
+        if entry is None:
+            return
+        async with entry.connect_lock:
+            if entry.client is not None:
+                await self._close_client(server_name, entry.client)
+                entry.client = None
+
+    def http_session(self) -> aiohttp.ClientSession:
+        """Shared keep-alive aiohttp session for plain HTTP MCP endpoints."""
+        if self._http_session is None or self._http_session.closed:
+            connector = aiohttp.TCPConnector(limit_per_host=self.max_concurrency, keepalive_timeout=self.idle_timeout_s)
+            self._http_session = aiohttp.ClientSession(connector=connector)
+        return self._http_session
+
+    def httpx_client(self) -> httpx.AsyncClient:
+        """Shared keep-alive httpx client for TRM requests."""
+        if self._httpx_client is None or self._httpx_client.is_closed:
+            limits = httpx.Limits(
+                max_keepalive_connections=self.max_concurrency, keepalive_expiry=self.idle_timeout_s
+            )
+            self._httpx_client = httpx.AsyncClient(limits=limits)
+        return self._httpx_client
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Pool counters, open sessions and per-server call latency percentiles (ms)."""
+        latency = {}
+        for server_name, histogram in self.latency.items():
+            p50, p95, p99 = histogram.percentiles([50, 95, 99])
+            latency[server_name] = {"count": histogram.total_count, "p50": p50, "p95": p95, "p99": p99}
+        return {
+            **self.stats.to_dict(),
+            "open_sessions": sum(1 for entry in self._sessions.values() if entry.client is not None),
+            "latency_ms": latency,
+        }
+
+    async def aclose(self) -> None:
+        """Close every pooled session and shared HTTP client."""
+        for server_name, entry in list(self._sessions.items()):
+            if entry.client is not None:
+                await self._close_client(server_name, entry.client)
+                entry.client = None
+        self._sessions.clear()
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
+        if self._httpx_client is not None:
+            await self._httpx_client.aclose()
+        self._httpx_client = None
@@ -0,0 +1,117 @@
+"""
+Tests for the memoized API catalog in MCPManager.
+
+Validates:
+1. The OpenAPI transform runs once per app and response-schema flag
+2. get_function_metadata serves single functions from the index
+3. Schema and auth updates invalidate the cached catalog and change its content-derived version
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from cuga.backend.tools_env.registry.mcp_manager import mcp_manager as mcp_manager_module
+from cuga.backend.tools_env.registry.mcp_manager.mcp_manager import MCPManager
+
+
+def _spec(summary="List accounts"):
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "CRM", "version": "1.0.0"},
+        "servers": [{"url": "http://localhost:9000"}],
+        "paths": {
+            "/accounts": {
+                "get": {
+                    "operationId": "list_accounts",
+                    "summary": summary,
+                    "security": [{"bearer": []}],
+                    "responses": {"200": {"description": "ok"}},
+                }
+            }
+        },
+    }
+
+
+@pytest.fixture
+def manager():
+    manager = MCPManager(config={})
+    manager.set_schemas("crm", _spec())
+    return manager
+
+
+@pytest.fixture
+def transform_calls():
+    real = mcp_manager_module.OpenAPITransformer.transform
+    calls = []
+
+    def counting(self):
+        calls.append(self)
+        return real(self)
+
+    with patch.object(mcp_manager_module.OpenAPITransformer, "transform", counting):
+        yield calls
+
+
+class TestApiCatalogCache:
+    """Test catalog memoization and invalidation."""
+
+    def test_transform_runs_once_per_flag(self, manager, transform_calls):
+        first = manager.get_apis_for_application("crm")
+        second = manager.get_apis_for_application("crm")
+        manager.get_apis_for_application("crm", include_response_schema=True)
+
+        assert first is second
+        assert len(transform_calls) == 2
+
+    def test_function_metadata_uses_index(self, manager, transform_calls):
+        name = next(iter(manager.get_apis_for_application("crm")))
+
+        for _ in range(5):
+            info = manager.get_function_metadata("crm", name)
+
+        assert info["secure"] is True
+        assert manager.get_function_metadata("crm", "missing") is None
+        assert len(transform_calls) == 1
+
+    def test_unknown_app_raises_key_error(self, manager):
+        with pytest.raises(KeyError):
+            manager.get_function_metadata("unknown", "anything")
+
+    def test_schema_reload_invalidates(self, manager, transform_calls):
+        name = next(iter(manager.get_apis_for_application("crm")))
+
+        manager.set_schemas("crm", _spec(summary="Reloaded"))
+        reloaded = manager.get_function_metadata("crm", name)
+
+        assert "Reloaded" in reloaded["description"]
+        assert len(transform_calls) == 2
+
+    def test_auth_change_invalidates_only_that_app(self, manager, transform_calls):
+        manager.set_schemas("billing", _spec())
+        manager.get_apis_for_application("crm")
+        manager.get_apis_for_application("billing")
+
+        manager.set_auth_config("crm", None)
+        manager.get_apis_for_application("crm")
+        manager.get_apis_for_application("billing")
+
+        assert len(transform_calls) == 3
+
+    def test_catalog_version_tracks_content(self, manager):
+        before = manager.catalog_version
+        manager.get_apis_for_application("crm")
+        assert manager.catalog_version == before
+
+        manager.set_schemas("crm", _spec(summary="Reloaded"))
+        assert manager.catalog_version != before
+
+        reloaded = manager.catalog_version
+        manager.set_auth_config("crm", {"type": "bearer", "value": "token"})
+        assert manager.catalog_version != reloaded
+
+    def test_catalog_version_is_stable_across_restarts(self, manager):
+        restarted = MCPManager(config={})
+        restarted.set_schemas("crm", _spec())
+
+        assert restarted.catalog_version == manager.catalog_version
@@ -0,0 +1,124 @@
+"""
+Tests for the async OpenAPI tool handlers.
+
+Validates:
+1. Requests are built from the precomputed operation template
+2. One keep-alive client is shared per upstream origin
+3. Concurrent calls overlap instead of blocking the event loop
+4. HTTP errors keep the existing error payload shape
+"""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from cuga.backend.tools_env.registry.mcp_manager.adapter import (
+    AsyncClientPool,
+    build_model,
+    construct_final_url,
+    create_handler,
+    extract_field_definitions,
+    extract_url_params,
+)
+from cuga.backend.tools_env.registry.mcp_manager.openapi_parser import SimpleOpenAPIParser
+
+SPEC = {
+    "openapi": "3.0.0",
+    "info": {"title": "CRM", "version": "1.0.0"},
+    "paths": {
+        "/accounts/{account_id}/notes": {
+            "post": {
+                "operationId": "add_note",
+                "parameters": [
+                    {"name": "account_id", "in": "path", "required": True, "schema": {"type": "string"}},
+                    {"name": "notify", "in": "query", "required": False, "schema": {"type": "boolean"}},
+                ],
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {"type": "object", "properties": {"text": {"type": "string"}}}
+                        }
+                    }
+                },
+                "responses": {"200": {"description": "ok"}},
+            }
+        }
+    },
+}
+
+
+def _handler(responder, base_url="http://crm.local"):
+    api = next(iter(SimpleOpenAPIParser(SPEC).apis()))
+    model = build_model("AddNoteInput", extract_field_definitions(api))
+    pool = AsyncClientPool(transport=httpx.MockTransport(responder))
+    return api, model, pool, create_handler(api, model, base_url, "crm", {}, client_pool=pool)
+
+
+class TestAsyncHandler:
+    """Test request construction, client pooling and error handling."""
+
+    @pytest.mark.asyncio
+    async def test_builds_same_request_as_sync_helpers(self):
+        seen = []
+
+        def responder(request):
+            seen.append(request)
+            return httpx.Response(200, text="created")
+
+        api, model, _, handler = _handler(responder)
+        params = model(account_id="a 1", notify=True, text="hello")
+
+        result = await handler(params)
+
+        path_params, query_params = extract_url_params(api, params.model_dump())
+        assert result == "created"
+        assert str(seen[0].url) == str(
+            httpx.URL(construct_final_url("http://crm.local", api, path_params, query_params))
+        )
+        assert seen[0].method == "POST"
+        assert json.loads(seen[0].content) == {"text": "hello"}
+
+    @pytest.mark.asyncio
+    async def test_reuses_client_per_origin(self):
+        _, model, pool, handler = _handler(lambda request: httpx.Response(200, text="ok"))
+        params = model(account_id="1", text="x")
+
+        await handler(params)
+        first = pool.client_for("http://crm.local/other")
+        await handler(params)
+
+        assert pool.client_for("http://crm.local/accounts") is first
+        assert pool.client_for("http://billing.local/") is not first
+        await pool.aclose()
+        assert first.is_closed
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_overlap(self):
+        async def responder(request):
+            await asyncio.sleep(0.1)
+            return httpx.Response(200, text="ok")
+
+        _, model, _, handler = _handler(responder)
+        params = model(account_id="1", text="x")
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(handler(params) for _ in range(10)))
+
+        assert results == ["ok"] * 10
+        assert time.perf_counter() - started < 0.5
+
+    @pytest.mark.asyncio
+    async def test_http_error_payload(self):
+        _, model, _, handler = _handler(lambda request: httpx.Response(404, json={"detail": "no account"}))
+
+        result = await handler(model(account_id="missing", text="x"))
+
+        assert result["status"] == "exception"
+        assert result["error_type"] == "HTTPStatusError"
+        assert result["status_code"] == 404
+        assert result["method"] == "POST"
+        assert result["url"] == "http://crm.local/accounts/missing/notes"
+        assert "no account" in result["message"]
@@ -0,0 +1,199 @@
+"""
+Tests for the pooled MCP client sessions.
+
+Validates:
+1. Sessions are reused across calls (pool hits vs. misses)
+2. Per-server concurrency limits
+3. Dropped sessions are replaced without re-sending the failed call
+4. Health checks and idle eviction
+5. MCPManager routes external MCP tool calls through the pool
+"""
+
+import asyncio
+
+import pytest
+
+from cuga.backend.tools_env.registry.mcp_manager.mcp_manager import MCPManager
+from cuga.backend.tools_env.registry.mcp_manager.session_pool import MCPSessionPool
+
+
+class _Result:
+    def __init__(self, text):
+        self.structured_content = None
+        self.content = [type("Content", (), {"text": text})()]
+
+
+class FakeClient:
+    """Stands in for fastmcp.Client; records lifecycle and call concurrency."""
+
+    instances = []
+
+    def __init__(self, server_name, fail_with=None, delay=0.0, connect_error=None):
+        self.server_name = server_name
+        self.fail_with = fail_with
+        self.connect_error = connect_error
+        self.calls = 0
+        self.delay = delay
+        self.connected = False
+        self.entered = 0
+        self.exited = 0
+        self.healthy = True
+        self.active = 0
+        self.max_active = 0
+        FakeClient.instances.append(self)
+
+    async def __aenter__(self):
+        if self.connect_error is not None:
+            raise self.connect_error
+        self.entered += 1
+        self.connected = True
+        return self
+
+    async def __aexit__(self, *exc):
+        self.exited += 1
+        self.connected = False
+
+    def is_connected(self):
+        return self.connected
+
+    async def ping(self):
+        return self.healthy
+
+    async def call_tool(self, name, args):
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail_with is not None:
+                error, self.fail_with = self.fail_with, None
+                raise error
+            return _Result(f"{self.server_name}:{name}:{args}")
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture(autouse=True)
+def _reset_instances():
+    FakeClient.instances = []
+
+
+def _pool(**kwargs):
+    return MCPSessionPool(client_factory=lambda name: FakeClient(name), **kwargs)
+
+
+class TestMCPSessionPool:
+    """Test session reuse, limits and recovery."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_session_across_calls(self):
+        pool = _pool()
+
+        for i in range(3):
+            result = await pool.call_tool("crm", "lookup", {"i": i})
+
+        assert result.content[0].text == "crm:lookup:{'i': 2}"
+        assert len(FakeClient.instances) == 1
+        assert FakeClient.instances[0].entered == 1
+        snapshot = pool.snapshot()
+        assert (snapshot["hits"], snapshot["misses"], snapshot["open_sessions"]) == (2, 1, 1)
+        assert snapshot["latency_ms"]["crm"]["count"] == 3
+        await pool.aclose()
+        assert FakeClient.instances[0].exited == 1
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency_per_server(self):
+        pool = MCPSessionPool(client_factory=lambda name: FakeClient(name, delay=0.01), max_concurrency=2)
+
+        await asyncio.gather(*(pool.call_tool("crm", "lookup", {}) for _ in range(6)))
+
+        assert len(FakeClient.instances) == 1
+        assert FakeClient.instances[0].max_active == 2
+
+    @pytest.mark.asyncio
+    async def test_dropped_call_is_not_resent(self):
+        clients = iter([FakeClient("crm", fail_with=ConnectionResetError("gone")), FakeClient("crm")])
+        pool = MCPSessionPool(client_factory=lambda name: next(clients))
+
+        with pytest.raises(ConnectionResetError):
+            await pool.call_tool("crm", "create_order", {})
+
+        assert FakeClient.instances[0].calls == 1
+        assert FakeClient.instances[0].exited == 1
+        assert pool.stats.dropped == 1
+
+        result = await pool.call_tool("crm", "lookup", {})
+        assert result.content[0].text == "crm:lookup:{}"
+        assert FakeClient.instances[1].calls == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_failed_connect_once(self):
+        clients = iter([FakeClient("crm", connect_error=ConnectionRefusedError("down")), FakeClient("crm")])
+        pool = MCPSessionPool(client_factory=lambda name: next(clients))
+
+        result = await pool.call_tool("crm", "lookup", {})
+
+        assert result.content[0].text == "crm:lookup:{}"
+        assert pool.stats.reconnects == 1
+        assert FakeClient.instances[0].calls == 0
+
+    @pytest.mark.asyncio
+    async def test_tool_errors_do_not_reconnect(self):
+        pool = MCPSessionPool(client_factory=lambda name: FakeClient(name, fail_with=ValueError("bad args")))
+
+        with pytest.raises(ValueError):
+            await pool.call_tool("crm", "lookup", {})
+
+        assert pool.stats.reconnects == 0
+        assert FakeClient.instances[0].connected
+
+    @pytest.mark.asyncio
+    async def test_failed_health_check_replaces_session(self):
+        pool = _pool(health_check_interval_s=0.0)
+        await pool.call_tool("crm", "lookup", {})
+        FakeClient.instances[0].healthy = False
+
+        await pool.call_tool("crm", "lookup", {})
+
+        assert len(FakeClient.instances) == 2
+        assert pool.stats.health_check_failures == 1
+        assert FakeClient.instances[0].exited == 1
+
+    @pytest.mark.asyncio
+    async def test_evicts_idle_sessions(self):
+        pool = _pool(idle_timeout_s=0.0)
+        await pool.call_tool("crm", "lookup", {})
+
+        assert await pool.evict_idle() == 1
+        assert pool.snapshot()["open_sessions"] == 0
+
+        await pool.call_tool("crm", "lookup", {})
+        assert pool.stats.misses == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_http_clients_are_reused(self):
+        pool = _pool()
+
+        assert pool.httpx_client() is pool.httpx_client()
+        assert pool.http_session() is pool.http_session()
+        await pool.aclose()
+
+
+class TestMCPManagerPooling:
+    """Test MCPManager integration with the pool."""
+
+    @pytest.mark.asyncio
+    async def test_external_tool_calls_share_one_session(self):
+        manager = MCPManager(config={})
+        manager.mcp_clients["crm"] = "http://localhost:9000/sse"
+        manager.mcp_transports["crm"] = object()
+        manager.server_by_tool["crm_lookup"] = "crm"
+        manager.session_pool.client_factory = lambda name: FakeClient(name)
+
+        first = await manager.call_tool("crm_lookup", {"id": 1})
+        await manager.call_tool("crm_lookup", {"id": 2})
+
+        assert first[0].text == "crm:lookup:{'id': 1}"
+        assert len(FakeClient.instances) == 1
+        assert manager.get_pool_stats()["hits"] == 1
+        await manager.aclose()
@@ -91,6 +91,16 @@ class ApiRegistry:
             logger.error(f"Error getting APIs for app '{app_name}': {type(e).__name__}: {e}")
             raise
 
+    async def get_function_info(self, app_name: str, function_name: str) -> Dict[str, Any]:
+        """Catalog entry for a single function, served from the manager's index."""
+        if app_name == "web" and self._is_web_search_enabled():
+            return self._get_web_search_api_definition().get(function_name, {})
+        try:
+            return self.mcp_client.get_function_metadata(app_name, function_name) or {}
+        except KeyError:
+            logger.error(f"Application '{app_name}' not found in registry.")
+            raise HTTPException(status_code=404, detail=f"Application '{app_name}' not found in registry")
+
     async def show_all_apis(self, include_response_schema) -> List[Dict[str, str]]:
         """Gets all API definitions."""
         logger.debug("ApiRegistry: show_all_apis() called.")
@@ -60,6 +60,7 @@ async def lifespan(app: FastAPI):
     registry = ApiRegistry(client=mcp_manager)
     await registry.start_servers()
     yield
+    await mcp_manager.aclose()
 
 
 # --- FastAPI Server Setup ---
@@ -109,6 +110,15 @@ async def list_all_apis(include_response_schema: bool = False):
     return await registry.show_all_apis(include_response_schema)
 
 
+@app.get("/catalog/version", tags=["APIs"])
+async def catalog_version():
+    """
+    Version of the tool catalog; changes whenever schemas or app authentication change.
+    """
+    global mcp_manager
+    return {"version": mcp_manager.catalog_version}
+
+
 class AuthAppsRequest(BaseModel):
     apps: List[str]
 
@@ -124,7 +134,7 @@ async def authenticate_apps(request: AuthAppsRequest):
 @app.post("/functions/onboard", tags=["Functions"])
 async def onboard_function(request: FunctionCallOnboardRequest):
     global registry, mcp_manager
-    mcp_manager.schemas[request.app_name] = request.schemas
+    mcp_manager.set_schemas(request.app_name, request.schemas)
     return {"status": f"Loaded successfully {len(request.schemas)} tools"}
 
 
@@ -142,8 +152,7 @@ async def call_mcp_function(request: FunctionCallRequest, trajectory_path: Optio
     print(f"Received request to call function: {request.function_name} with args: {request.args}")
     try:
         global mcp_manager
-        apis = await registry.show_apis_for_app(request.app_name)
-        api_info = apis.get(request.function_name, {})
+        api_info = await registry.get_function_info(request.app_name, request.function_name)
         is_secure = api_info.get("secure", False)
         logger.debug(f"is_secure: {is_secure}")
         if trajectory_path:
@@ -1,8 +1,11 @@
+import asyncio
 import json
-from typing import List
+import os
+from typing import Any, Dict, List, Optional
 
 import aiohttp
 
+from cuga.backend.tools_env.registry.utils.catalog_snapshot import load_catalog_snapshot, save_catalog_snapshot
 from cuga.backend.tools_env.registry.utils.types import AppDefinition
 from cuga.config import settings
 from loguru import logger
@@ -10,6 +13,9 @@ from cuga.backend.activity_tracker.tracker import ActivityTracker
 
 tracker = ActivityTracker()
 
+# Maximum number of per-app catalog requests in flight at once
+REGISTRY_FETCH_CONCURRENCY = int(os.getenv("CUGA_REGISTRY_FETCH_CONCURRENCY", "8"))
+
 
 def get_registry_base_url() -> str:
     """
@@ -29,11 +35,15 @@ def get_registry_base_url() -> str:
         return f'http://localhost:{settings.server_ports.registry}'
 
 
-async def get_apis(app_name: str):
+async def get_apis(app_name: str, session: Optional[aiohttp.ClientSession] = None):
     """
     Execute an asynchronous GET request to retrieve Petstore APIs from localhost:8001
     and return the result as formatted JSON.
 
+    Args:
+        app_name: Name of the app
+        session: Optional shared session; a new one is opened when omitted
+
     Returns:
         dict: The JSON response data as a Python dictionary
 
@@ -60,18 +70,14 @@ async def get_apis(app_name: str):
     headers = {'accept': 'application/json'}
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                # Check if the request was successful
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(f"Request failed with status {response.status}: {error_text}")
-
-                # Parse JSON response
-                json_data = await response.json()
-                if json_data:
-                    all_tools.update(json_data)
-                return all_tools
+        if session is None:
+            async with aiohttp.ClientSession() as own_session:
+                json_data = await _get_json(own_session, url, headers)
+        else:
+            json_data = await _get_json(session, url, headers)
+        if json_data:
+            all_tools.update(json_data)
+        return all_tools
 
     except Exception as e:
         if len(all_tools) > 0:
@@ -82,6 +88,92 @@ async def get_apis(app_name: str):
             raise e
 
 
+async def _get_json(session: aiohttp.ClientSession, url: str, headers: Dict[str, str]) -> Any:
+    async with session.get(url, headers=headers) as response:
+        # Check if the request was successful
+        if response.status != 200:
+            error_text = await response.text()
+            raise Exception(f"Request failed with status {response.status}: {error_text}")
+        return await response.json()
+
+
+async def get_all_apis(session: Optional[aiohttp.ClientSession] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Retrieve the API definitions of every registry app in a single request.
+
+    Args:
+        session: Optional shared session; a new one is opened when omitted
+
+    Returns:
+        dict: Mapping of app name to its API definitions
+    """
+    url = f'{get_registry_base_url()}/apis?include_response_schema=true'
+    headers = {'accept': 'application/json'}
+    if session is None:
+        async with aiohttp.ClientSession() as own_session:
+            return await _get_json(own_session, url, headers) or {}
+    return await _get_json(session, url, headers) or {}
+
+
+async def fetch_registry_catalog(app_names: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch registry API definitions for several apps at once.
+
+    Apps are served from the on-disk catalog snapshot when it matches the
+    registry's catalog version. The rest come from one bulk ``/apis`` request
+    when more than one app is needed, and any apps that are still missing are
+    fetched concurrently, at most REGISTRY_FETCH_CONCURRENCY at a time, over
+    one shared session. Apps whose definitions could not be fetched are left
+    out of the result.
+
+    Args:
+        app_names: Names of the apps to fetch
+
+    Returns:
+        dict: Mapping of app name to its API definitions
+    """
+    if not settings.advanced_features.registry or not app_names:
+        return {}
+
+    version = await get_catalog_version()
+    catalog = load_catalog_snapshot(version, app_names)
+    missing = [name for name in app_names if name not in catalog]
+    if not missing:
+        logger.debug(f"Loaded {len(catalog)} app catalogs from snapshot")
+        return catalog
+
+    fetched: Dict[str, Dict[str, Any]] = {}
+    headers = {'accept': 'application/json'}
+    registry_base = get_registry_base_url()
+    async with aiohttp.ClientSession() as session:
+        if len(missing) > 1:
+            try:
+                all_apis = await get_all_apis(session)
+                fetched.update({name: all_apis[name] for name in missing if name in all_apis})
+            except Exception as e:
+                logger.warning(f"Bulk catalog request failed, fetching apps individually: {e}")
+
+        semaphore = asyncio.Semaphore(max(1, REGISTRY_FETCH_CONCURRENCY))
+
+        async def fetch_app(name: str):
+            url = f'{registry_base}/applications/{name}/apis?include_response_schema=true'
+            async with semaphore:
+                try:
+                    return name, await _get_json(session, url, headers)
+                except Exception as e:
+                    logger.warning(f"Error getting tools from registry for {name}: {e}")
+                    return name, None
+
+        remaining = [name for name in missing if name not in fetched]
+        for name, apis in await asyncio.gather(*(fetch_app(name) for name in remaining)):
+            if apis is not None:
+                fetched[name] = apis
+
+    save_catalog_snapshot(version, fetched)
+    catalog.update(fetched)
+    return catalog
+
+
 async def get_apps() -> List[AppDefinition]:
     """
     Execute an asynchronous GET request to retrieve Petstore APIs from localhost:8001
@@ -128,6 +220,26 @@ async def get_apps() -> List[AppDefinition]:
             raise e
 
 
+async def get_catalog_version(timeout: float = 2.0) -> Optional[str]:
+    """Fetch the registry's tool catalog version.
+
+    Returns:
+        The version string, or None when the registry is disabled or unreachable
+    """
+    if not settings.advanced_features.registry:
+        return None
+    url = f'{get_registry_base_url()}/catalog/version'
+    try:
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=timeout)) as session:
+            async with session.get(url, headers={'accept': 'application/json'}) as response:
+                if response.status != 200:
+                    return None
+                return (await response.json()).get("version")
+    except Exception as e:
+        logger.debug(f"Could not fetch registry catalog version: {e}")
+        return None
+
+
 async def count_total_tools() -> int:
     """Count total number of tools across all apps.
 
@@ -0,0 +1,70 @@
+"""
+On-disk snapshot of the registry tool catalog.
+
+Stores the API definitions fetched from the registry together with the
+registry's catalog version, so a restarted agent can rebuild its tools
+without re-downloading every app's definitions while the registry has not
+changed.
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from cuga.config import DBS_DIR
+
+CATALOG_SNAPSHOT_PATH = os.getenv("CUGA_CATALOG_SNAPSHOT", os.path.join(DBS_DIR, "tool_catalog.json"))
+
+
+def load_catalog_snapshot(
+    version: Optional[str], app_names: List[str], path: str = CATALOG_SNAPSHOT_PATH
+) -> Dict[str, Dict[str, Any]]:
+    """Return the snapshotted API definitions of ``app_names`` recorded for ``version``.
+
+    Args:
+        version: Current registry catalog version; None disables the snapshot
+        app_names: Apps to look up
+        path: Snapshot file
+
+    Returns:
+        Mapping of app name to API definitions for the apps found in the snapshot
+    """
+    if not version or not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable tool catalog snapshot {path}: {e}")
+        return {}
+    if snapshot.get("version") != version:
+        return {}
+    apps = snapshot.get("apps", {})
+    return {name: apps[name] for name in app_names if name in apps}
+
+
+def save_catalog_snapshot(
+    version: Optional[str], catalog: Dict[str, Dict[str, Any]], path: str = CATALOG_SNAPSHOT_PATH
+) -> None:
+    """Record ``catalog`` for ``version``, merging with apps already saved for the same version."""
+    if not version or not catalog:
+        return
+    apps: Dict[str, Dict[str, Any]] = {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+        if snapshot.get("version") == version:
+            apps = snapshot.get("apps", {})
+    except (OSError, json.JSONDecodeError):
+        pass
+    apps.update(catalog)
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": version, "apps": apps}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not write tool catalog snapshot {path}: {e}")
@@ -14,6 +14,7 @@ class PoolConfig(BaseModel):
     max_active: int = 4
     min_idle: int = 0
     idle_ttl_s: float = 30.0
+    max_in_flight: int = 32
 
 
 class MCPConfig(BaseModel):
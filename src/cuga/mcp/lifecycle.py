@@ -5,8 +5,9 @@ from __future__ import annotations
 import asyncio
 import time
 from collections import defaultdict, deque
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional, Set
 
+from cuga.mcp.config import PoolConfig
 from cuga.mcp.errors import CallTimeout, StartupError, ToolUnavailable
 from cuga.mcp.interfaces import ToolRequest, ToolResponse, ToolSpec
 from cuga.mcp.registry import MCPRegistry
@@ -39,42 +40,105 @@ class CircuitState:
         return True
 
 
+# Used when a tool names no pool and no "default" pool is configured: one process per alias
+_SINGLE_RUNNER_POOL = PoolConfig(name="single", max_active=1, min_idle=1)
+
+
 class LifecycleManager:
+    """Starts MCP runners on demand and dispatches calls to them.
+
+    Each alias gets a warm pool of runner processes in ``self.pool``, sized
+    by the tool's ``PoolConfig``: ``min_idle`` processes are started up front,
+    more are added in the background (up to ``max_active``) while every
+    runner is busy, and extras idle for ``idle_ttl_s`` are stopped. Calls go
+    to the least-loaded runner; each runner pipelines up to
+    ``max_in_flight`` requests.
+    """
+
     def __init__(self, registry: Optional[MCPRegistry] = None) -> None:
         self.registry = registry or MCPRegistry()
-        self.runners: Dict[Tuple[str, str], SubprocessStdioRunner] = {}
         self.circuits: Dict[str, CircuitState] = defaultdict(CircuitState)
         self.pool: Dict[str, deque[SubprocessStdioRunner]] = defaultdict(deque)
+        self._pool_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._growing: Set[str] = set()
+        self._background: Set[asyncio.Task] = set()
 
-    def _runner_key(self, spec: ToolSpec) -> Tuple[str, str]:
-        return (spec.alias, spec.transport)
+    def _pool_config(self, spec: ToolSpec) -> PoolConfig:
+        pools = self.registry.config.pools
+        return pools.get(spec.pool or "default") or _SINGLE_RUNNER_POOL
 
-    async def ensure_runner(self, spec: ToolSpec) -> SubprocessStdioRunner:
-        key = self._runner_key(spec)
-        if spec.transport != "stdio":
-            raise ToolUnavailable(f"Unsupported transport: {spec.transport}")
-        if key in self.runners and self.runners[key].is_healthy():
-            return self.runners[key]
-        runner = SubprocessStdioRunner(
+    def _new_runner(self, spec: ToolSpec, pool_config: PoolConfig) -> SubprocessStdioRunner:
+        return SubprocessStdioRunner(
             command=spec.command or "python",
             args=spec.args,
             env=spec.env,
             working_dir=spec.working_dir,
             allowed_commands=self.registry.config.allow_commands,
+            max_in_flight=pool_config.max_in_flight,
         )
-        await runner.start()
-        self.runners[key] = runner
+
+    async def ensure_runner(self, spec: ToolSpec) -> SubprocessStdioRunner:
+        if spec.transport != "stdio":
+            raise ToolUnavailable(f"Unsupported transport: {spec.transport}")
+        pool_config = self._pool_config(spec)
+        runners = self.pool[spec.alias]
+        async with self._pool_locks[spec.alias]:
+            for runner in [runner for runner in runners if not runner.is_healthy()]:
+                runners.remove(runner)
+                self._spawn_background(runner.stop())
+            if not runners:
+                warm = max(1, min(pool_config.min_idle, pool_config.max_active))
+                started = [self._new_runner(spec, pool_config) for _ in range(warm)]
+                results = await asyncio.gather(*(runner.start() for runner in started), return_exceptions=True)
+                errors = [result for result in results if isinstance(result, BaseException)]
+                if errors:
+                    await asyncio.gather(*(runner.stop() for runner in started))
+                    raise errors[0]
+                runners.extend(started)
+                metrics.counter("mcp.pool.started", {"alias": spec.alias}).inc(len(started))
+            runner = min(runners, key=lambda candidate: candidate.in_flight)
+        if runner.in_flight and len(runners) < pool_config.max_active and spec.alias not in self._growing:
+            self._growing.add(spec.alias)
+            self._spawn_background(self._grow(spec, pool_config))
+        self._evict_idle(spec.alias, pool_config)
         return runner
 
+    async def _grow(self, spec: ToolSpec, pool_config: PoolConfig) -> None:
+        try:
+            runner = self._new_runner(spec, pool_config)
+            await runner.start()
+            self.pool[spec.alias].append(runner)
+            metrics.counter("mcp.pool.started", {"alias": spec.alias}).inc()
+        except Exception:  # noqa: BLE001 - callers keep using the existing runners
+            LOGGER.warning("Failed to grow MCP runner pool", extra={"extra_fields": {"alias": spec.alias}})
+        finally:
+            self._growing.discard(spec.alias)
+
+    def _evict_idle(self, alias: str, pool_config: PoolConfig) -> None:
+        runners = self.pool[alias]
+        keep = max(1, pool_config.min_idle)
+        now = time.monotonic()
+        for runner in list(runners):
+            if len(runners) <= keep:
+                break
+            if runner.in_flight == 0 and now - runner.last_used >= pool_config.idle_ttl_s:
+                runners.remove(runner)
+                metrics.counter("mcp.pool.evicted", {"alias": alias}).inc()
+                self._spawn_background(runner.stop())
+
+    def _spawn_background(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
     async def stop_runner(self, alias: str, transport: str = "stdio") -> None:
-        key = (alias, transport)
-        runner = self.runners.pop(key, None)
-        if runner:
-            await runner.stop()
+        runners = self.pool.pop(alias, None)
+        if runners:
+            await asyncio.gather(*(runner.stop() for runner in runners))
 
     async def call(self, alias: str, request: ToolRequest) -> ToolResponse:
         spec = self.registry.get(alias)
-        metrics.counter("mcp.calls").inc()
+        metrics.counter("mcp.calls", {"alias": alias}).inc()
         circuit = self.circuits[alias]
         if not circuit.allow():
             return ToolResponse(ok=False, error="circuit open", metrics={"transport": spec.transport})
@@ -82,13 +146,13 @@ class LifecycleManager:
             runner = await self.ensure_runner(spec)
         except ToolUnavailable as exc:
             circuit.record_failure()
-            metrics.counter("mcp.errors", {"kind": "unavailable"}).inc()
+            metrics.counter("mcp.errors", {"alias": alias, "kind": "unavailable"}).inc()
             return ToolResponse(ok=False, error=str(exc), metrics={"transport": spec.transport})
         except StartupError as exc:
             circuit.record_failure()
-            metrics.counter("mcp.errors", {"kind": "startup"}).inc()
+            metrics.counter("mcp.errors", {"alias": alias, "kind": "startup"}).inc()
             return ToolResponse(ok=False, error=str(exc), metrics={"transport": spec.transport})
-        stop_timer = metrics.time_block("mcp.latency_ms")
+        stop_timer = metrics.time_block("mcp.latency_ms", {"alias": alias})
         try:
             payload = {"method": request.method, "params": request.params}
             raw = await runner.call_with_retry(payload, timeout=request.timeout_s or spec.timeout_s)
@@ -96,24 +160,27 @@ class LifecycleManager:
             return ToolResponse(ok=True, result=raw.get("result"), metrics={"transport": spec.transport})
         except CallTimeout as exc:
             circuit.record_failure()
-            metrics.counter("mcp.errors", {"kind": "timeout"}).inc()
+            metrics.counter("mcp.errors", {"alias": alias, "kind": "timeout"}).inc()
             return ToolResponse(ok=False, error=str(exc), metrics={"transport": spec.transport})
         except StartupError as exc:
             circuit.record_failure()
-            metrics.counter("mcp.errors", {"kind": "startup"}).inc()
+            metrics.counter("mcp.errors", {"alias": alias, "kind": "startup"}).inc()
             return ToolResponse(ok=False, error=str(exc), metrics={"transport": spec.transport})
         except ToolUnavailable as exc:
             circuit.record_failure()
-            metrics.counter("mcp.errors", {"kind": "unavailable"}).inc()
+            metrics.counter("mcp.errors", {"alias": alias, "kind": "unavailable"}).inc()
             return ToolResponse(ok=False, error=str(exc), metrics={"transport": spec.transport})
         except Exception:  # REVIEW-FIX: keep callers stable by returning error
             circuit.record_failure()
-            metrics.counter("mcp.errors", {"kind": "unexpected"}).inc()
+            metrics.counter("mcp.errors", {"alias": alias, "kind": "unexpected"}).inc()
             LOGGER.exception("Unexpected MCP failure", extra={"alias": alias})
             return ToolResponse(ok=False, error="unexpected error", metrics={"transport": spec.transport})
         finally:
             stop_timer()
 
     async def stop_all(self) -> None:
-        await asyncio.gather(*(runner.stop() for runner in list(self.runners.values())))
-        self.runners.clear()
+        if self._background:
+            await asyncio.gather(*list(self._background), return_exceptions=True)
+        runners = [runner for alias_runners in self.pool.values() for runner in alias_runners]
+        await asyncio.gather(*(runner.stop() for runner in runners))
+        self.pool.clear()
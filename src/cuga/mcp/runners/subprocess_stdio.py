@@ -7,9 +7,11 @@ import json
 import os
 import random
 import signal
+import time
 from asyncio.subprocess import Process
+from collections import OrderedDict
 from collections.abc import Iterable
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from cuga.mcp.errors import CallTimeout, StartupError
 from cuga.mcp.interfaces import Runner
@@ -56,6 +58,17 @@ def _command_is_allowed(command: str, allowlist: Optional[Iterable[str]]) -> boo
 
 
 class SubprocessStdioRunner(Runner):
+    """Line-delimited JSON runner for a stdio MCP server subprocess.
+
+    Each request carries an ``id``; a background reader task routes responses
+    to the waiting caller by that id, so up to ``max_in_flight`` calls can be
+    pipelined over one process. Responses without an ``id`` (a ``result`` or
+    ``error`` member) are matched to the oldest outstanding request, which
+    keeps in-order servers working; notifications and unparseable lines are
+    ignored. A request that times out keeps its place until its late reply
+    arrives, so that reply is dropped instead of reaching the next caller.
+    """
+
     def __init__(
         self,
         command: str,
@@ -65,6 +78,7 @@ class SubprocessStdioRunner(Runner):
         startup_timeout: float = 10.0,
         max_restarts: int = 2,
         allowed_commands: Optional[Iterable[str]] = None,
+        max_in_flight: int = 32,
     ) -> None:
         self.command = command
         self.args = args or []
@@ -75,7 +89,19 @@ class SubprocessStdioRunner(Runner):
         self.allowed_commands = list(allowed_commands) if allowed_commands is not None else None
         self.process: Optional[Process] = None
         self.restarts = 0
+        self.max_in_flight = max_in_flight
+        self.last_used = time.monotonic()
         self._ready = False
+        self._generation = 0
+        self._next_id = 0
+        self._pending: Dict[int, asyncio.Future] = OrderedDict()
+        self._reader: Optional[asyncio.Task] = None
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._restart_lock = asyncio.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        return sum(1 for future in self._pending.values() if not future.done())
 
     async def start(self) -> None:
         if not _command_is_allowed(self.command, self.allowed_commands):
@@ -105,6 +131,10 @@ class SubprocessStdioRunner(Runner):
         except Exception:
             await self.stop()
             raise
+        self._generation += 1
+        # A fresh pending map per process so a dying reader cannot fail the new process' calls
+        self._pending = OrderedDict()
+        self._reader = asyncio.create_task(self._read_responses(self.process, self._pending))
 
     async def _wait_for_ready(self) -> None:
         if not self.process or self.process.returncode is not None:
@@ -137,33 +167,121 @@ class SubprocessStdioRunner(Runner):
                 self.process.kill()
         self.process = None
         self._ready = False
+        await self._stop_reader()
+
+    async def _stop_reader(self) -> None:
+        reader, self._reader = self._reader, None
+        if reader is None or reader is asyncio.current_task():
+            return
+        reader.cancel()
+        try:
+            await reader
+        except asyncio.CancelledError:
+            pass
+
+    async def _read_responses(self, process: Process, pending: Dict[int, asyncio.Future]) -> None:
+        try:
+            while True:
+                raw = await process.stdout.readline()
+                if not raw:
+                    break
+                try:
+                    message = json.loads(raw.decode("utf-8"))
+                except Exception:  # noqa: BLE001
+                    # Cannot tell which request it belonged to; failing one at random would be worse
+                    LOGGER.warning("Ignoring invalid JSON from MCP server", extra={"extra_fields": {"line": raw[:200]}})
+                    continue
+                request_id = message.get("id") if isinstance(message, dict) else None
+                self._dispatch(pending, request_id, message=message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # noqa: BLE001
+            LOGGER.warning("MCP stdio reader failed", extra={"extra_fields": {"error": repr(exc)}})
+        finally:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(StartupError("EOF before response"))
+            pending.clear()
+
+    @staticmethod
+    def _dispatch(
+        pending: Dict[int, asyncio.Future],
+        request_id: Optional[int],
+        message: Optional[dict] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        is_response = isinstance(message, dict) and ("result" in message or "error" in message)
+        if request_id is None and isinstance(message, dict) and "method" in message and not is_response:
+            LOGGER.debug("Ignoring MCP notification", extra={"extra_fields": {"method": message.get("method")}})
+            return
+        if request_id in pending:
+            future = pending.pop(request_id)
+        elif request_id is None and pending and (is_response or error is not None):
+            # Server does not echo ids: it answers in order
+            future = pending.pop(next(iter(pending)))
+        else:
+            LOGGER.debug("Dropping MCP response for unknown request", extra={"extra_fields": {"id": request_id}})
+            return
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(message)
 
     def is_healthy(self) -> bool:
-        return bool(self.process and self.process.returncode is None)
+        reader_alive = self._reader is None or not self._reader.done()
+        return bool(self.process and self.process.returncode is None and reader_alive)
 
     async def request(self, payload: dict, timeout: float) -> dict:
-        if not self.process or self.process.returncode is not None:
+        if not self.is_healthy():
             raise StartupError("Process not running")
         if not self.process.stdin or not self.process.stdout:
             raise StartupError("Process missing stdio")
-        message = json.dumps(payload) + "\n"
-        self.process.stdin.write(message.encode("utf-8"))
-        await self.process.stdin.drain()
-        try:
-            raw = await asyncio.wait_for(self.process.stdout.readline(), timeout=timeout)
-        except asyncio.TimeoutError as exc:
-            raise CallTimeout("MCP call timed out") from exc
-        if not raw:
-            raise StartupError("EOF before handshake")
-        try:
-            return json.loads(raw.decode("utf-8"))
-        except Exception as exc:  # noqa: BLE001
-            raise StartupError("Invalid JSON from MCP server") from exc
+        async with self._slots:
+            self._next_id += 1
+            request_id = self._next_id
+            pending = self._pending
+            future = asyncio.get_running_loop().create_future()
+            pending[request_id] = future
+            sent = False
+            try:
+                message = json.dumps({**payload, "id": request_id}) + "\n"
+                self.process.stdin.write(message.encode("utf-8"))
+                await self.process.stdin.drain()
+                sent = True
+                return await asyncio.wait_for(future, timeout=timeout)
+            except asyncio.TimeoutError as exc:
+                raise CallTimeout("MCP call timed out") from exc
+            except (BrokenPipeError, ConnectionResetError) as exc:
+                raise StartupError("Process not running") from exc
+            finally:
+                if sent and request_id in pending:
+                    # The reply may still come; keep the (cancelled) entry so it is dropped on arrival
+                    future.cancel()
+                    self._prune_abandoned(pending)
+                else:
+                    pending.pop(request_id, None)
+                self.last_used = time.monotonic()
+
+    def _prune_abandoned(self, pending: Dict[int, asyncio.Future]) -> None:
+        # Bound entries for replies that never come; the oldest ones go first
+        abandoned = [request_id for request_id, future in pending.items() if future.done()]
+        for request_id in abandoned[: max(0, len(abandoned) - self.max_in_flight)]:
+            pending.pop(request_id, None)
+
+    async def restart(self, generation: int) -> None:
+        """Restart the process unless a concurrent caller already replaced ``generation``."""
+        async with self._restart_lock:
+            if self._generation == generation or not self.is_healthy():
+                await self.stop()
+                await self.start()
 
     async def call_with_retry(self, payload: dict, timeout: float, attempts: int = 3) -> dict:
         last_error: Exception | None = None
         original_startup: StartupError | None = None
         for attempt in range(1, attempts + 1):
+            generation = self._generation
             try:
                 return await self.request(payload, timeout)
             except CallTimeout as exc:
@@ -175,8 +293,7 @@ class SubprocessStdioRunner(Runner):
                 if original_startup is None:
                     original_startup = exc
                 last_error = exc
-                await self.stop()
-                await self.start()
+                await self.restart(generation)
                 if attempt == attempts:
                     raise original_startup
         raise StartupError(str(last_error) if last_error else "Retries exhausted")
@@ -1,51 +1,237 @@
 from __future__ import annotations
 
+import importlib
+import math
+import re
+import threading
 import time
+from bisect import bisect_left
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Cumulative histogram bounds in milliseconds (``+Inf`` implied)
+DEFAULT_BUCKETS_MS: Tuple[float, ...] = (
+    1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0, 5000.0, 10000.0, 30000.0, 60000.0,
+)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Optional[Dict[str, str]]) -> LabelKey:
+    return tuple(sorted((str(k), str(v)) for k, v in (labels or {}).items()))
 
 
-@dataclass
 class Counter:
-    name: str
-    count: int = 0
+    """Monotonic counter sharded per thread.
+
+    Each thread only ever writes its own slot, so ``inc`` needs no lock and
+    cannot lose updates; ``count`` sums the shards.
+    """
+
+    def __init__(self, name: str, labels: LabelKey = ()) -> None:
+        self.name = name
+        self.labels = labels
+        self._shards: Dict[int, int] = {}
 
     def inc(self, value: int = 1) -> None:
-        self.count += value
+        ident = threading.get_ident()
+        self._shards[ident] = self._shards.get(ident, 0) + value
+
+    @property
+    def count(self) -> int:
+        return sum(list(self._shards.values()))
 
 
 @dataclass
 class Histogram:
+    """Fixed-size bucketed histogram; memory does not grow with observations."""
+
     name: str
-    values: list[float] = field(default_factory=list)
+    labels: LabelKey = ()
+    bounds: Tuple[float, ...] = DEFAULT_BUCKETS_MS
+    counts: List[int] = field(init=False)
+    count: int = field(init=False, default=0)
+    sum: float = field(init=False, default=0.0)
+    _lock: threading.Lock = field(init=False, repr=False, default_factory=threading.Lock)
+
+    def __post_init__(self) -> None:
+        self.counts = [0] * (len(self.bounds) + 1)
 
     def observe(self, value: float) -> None:
-        self.values.append(value)
+        index = bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def buckets(self) -> List[Tuple[float, int]]:
+        """Cumulative ``(upper_bound, count)`` pairs ending with ``(inf, count)``."""
+        pairs: List[Tuple[float, int]] = []
+        running = 0
+        for bound, bucket_count in zip(self.bounds + (math.inf,), list(self.counts)):
+            running += bucket_count
+            pairs.append((bound, running))
+        return pairs
+
+    def percentile(self, p: float) -> float:
+        """Estimate percentile ``p`` (0-100) by interpolating within its bucket."""
+        total = self.count
+        if total == 0:
+            return 0.0
+        rank = min(max(p, 0.0), 100.0) / 100.0 * total
+        lower = 0.0
+        running = 0
+        for bound, bucket_count in zip(self.bounds + (math.inf,), list(self.counts)):
+            if bucket_count and running + bucket_count >= rank:
+                if math.isinf(bound):
+                    return lower
+                return lower + (bound - lower) * (rank - running) / bucket_count
+            running += bucket_count
+            lower = bound
+        return lower
+
+    def percentiles(self, ps: Sequence[float]) -> List[float]:
+        return [self.percentile(p) for p in ps]
+
+
+def _prom_name(name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_:]", "_", name)
+
+
+def _prom_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _prom_labels(labels: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{_prom_name(key)}="{_prom_escape(value)}"' for key, value in pairs) + "}"
 
 
 class Metrics:
-    def __init__(self) -> None:
-        self.counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Counter] = {}
-        self.histograms: Dict[str, Histogram] = {}
+    """Registry of labeled counters and histograms for MCP calls.
 
-    def counter(self, name: str, labels: Optional[Dict[str, str]] = None) -> Counter:
-        key = (name, tuple(sorted((labels or {}).items())))
-        if key not in self.counters:
-            self.counters[key] = Counter(name)
-        return self.counters[key]
+    ``to_prometheus`` renders the text exposition format for scraping and
+    ``register_otel`` publishes the same series through OpenTelemetry
+    observable instruments, so an OTLP exporter on the meter provider pushes
+    them on its own schedule.
+    """
 
-    def histogram(self, name: str) -> Histogram:
-        if name not in self.histograms:
-            self.histograms[name] = Histogram(name)
-        return self.histograms[name]
+    def __init__(self) -> None:
+        self.counters: Dict[Tuple[str, LabelKey], Counter] = {}
+        self.histograms: Dict[Tuple[str, LabelKey], Histogram] = {}
+        self._lock = threading.Lock()
+        self._meter: Any = None
+        self._otel_names: set[str] = set()
 
-    def time_block(self, name: str):
+    def counter(self, name: str, labels: Optional[Dict[str, str]] = None) -> Counter:
+        key = (name, _label_key(labels))
+        counter = self.counters.get(key)
+        if counter is None:
+            with self._lock:
+                counter = self.counters.setdefault(key, Counter(name, key[1]))
+            self._register_otel_instrument(name, "counter")
+        return counter
+
+    def histogram(self, name: str, labels: Optional[Dict[str, str]] = None) -> Histogram:
+        key = (name, _label_key(labels))
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(key, Histogram(name, key[1]))
+            self._register_otel_instrument(name, "histogram")
+        return histogram
+
+    def time_block(self, name: str, labels: Optional[Dict[str, str]] = None):
         start = time.perf_counter()
 
         def _done() -> None:
-            self.histogram(name).observe((time.perf_counter() - start) * 1000)
+            self.histogram(name, labels).observe((time.perf_counter() - start) * 1000)
 
         return _done
 
+    def to_prometheus(self) -> str:
+        """Render all series in Prometheus text exposition format."""
+        lines: List[str] = []
+        counter_families: Dict[str, List[Counter]] = {}
+        for (name, _), counter in sorted(self.counters.items()):
+            counter_families.setdefault(name, []).append(counter)
+        for name, counters in counter_families.items():
+            metric = _prom_name(name)
+            metric = metric if metric.endswith("_total") else f"{metric}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.extend(f"{metric}{_prom_labels(c.labels)} {c.count}" for c in counters)
+
+        histogram_families: Dict[str, List[Histogram]] = {}
+        for (name, _), histogram in sorted(self.histograms.items()):
+            histogram_families.setdefault(name, []).append(histogram)
+        for name, histograms in histogram_families.items():
+            metric = _prom_name(name)
+            lines.append(f"# TYPE {metric} histogram")
+            for hist in histograms:
+                for bound, cumulative in hist.buckets():
+                    le = "+Inf" if math.isinf(bound) else f"{bound:g}"
+                    lines.append(f"{metric}_bucket{_prom_labels(hist.labels, ('le', le))} {cumulative}")
+                lines.append(f"{metric}_sum{_prom_labels(hist.labels)} {hist.sum:.3f}")
+                lines.append(f"{metric}_count{_prom_labels(hist.labels)} {hist.count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def register_otel(self, meter: Any = None) -> bool:
+        """Publish series through OpenTelemetry observable instruments.
+
+        Counters become observable counters; each histogram becomes a
+        ``<name>.count`` counter plus a ``<name>.quantiles`` gauge carrying
+        p50/p95/p99 in a ``quantile`` attribute. Returns ``False`` when
+        OpenTelemetry is not installed.
+        """
+        try:
+            otel_metrics = importlib.import_module("opentelemetry.metrics")
+        except ImportError:
+            return False
+        self._meter = meter or otel_metrics.get_meter("cuga.mcp")
+        self._otel_names = set()
+        for name, _ in list(self.counters):
+            self._register_otel_instrument(name, "counter")
+        for name, _ in list(self.histograms):
+            self._register_otel_instrument(name, "histogram")
+        return True
+
+    def _register_otel_instrument(self, name: str, kind: str) -> None:
+        if self._meter is None or name in self._otel_names:
+            return
+        self._otel_names.add(name)
+        observation = importlib.import_module("opentelemetry.metrics").Observation
+
+        if kind == "counter":
+
+            def observe_counter(_options):
+                return [
+                    observation(c.count, dict(c.labels)) for (n, _), c in list(self.counters.items()) if n == name
+                ]
+
+            self._meter.create_observable_counter(name, callbacks=[observe_counter])
+            return
+
+        def observe_count(_options):
+            return [observation(h.count, dict(h.labels)) for (n, _), h in list(self.histograms.items()) if n == name]
+
+        def observe_quantiles(_options):
+            points = []
+            for (n, _), hist in list(self.histograms.items()):
+                if n != name:
+                    continue
+                for quantile, value in zip(("p50", "p95", "p99"), hist.percentiles((50, 95, 99))):
+                    points.append(observation(value, {**dict(hist.labels), "quantile": quantile}))
+            return points
+
+        self._meter.create_observable_counter(f"{name}.count", callbacks=[observe_count])
+        self._meter.create_observable_gauge(f"{name}.quantiles", callbacks=[observe_quantiles])
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
 
 metrics = Metrics()
@@ -4,7 +4,7 @@ import threading
 import time
 import warnings
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 from .config import AgentConfig
 from .llm.interface import LLM, MockLLM
@@ -79,6 +79,7 @@ from cuga.orchestrator.planning import (
     BudgetError,
     create_planning_authority,
 )
+from cuga.orchestrator.tool_index import ToolRankingIndex
 
 # Failure modes and retry (v1.3.1+)
 from cuga.orchestrator.failures import (
@@ -369,26 +370,16 @@ class PlannerAgent:
             )
 
     def _rank_tools(self, goal: str) -> List[tuple[Any, float]]:
-        import re
-
-        terms = set(re.split(r"\W+", goal.lower()))
-        ranked: List[tuple[Any, float]] = []
-        
-        # Handle both list-based (tools.py) and dict-based (tools/__init__.py) registries
-        tools_iter = self.registry.tools if isinstance(self.registry.tools, list) else self.registry.tools.values()
-        
-        for tool in tools_iter:
-            # Handle both ToolSpec objects and simple tool objects
-            tool_name = getattr(tool, 'name', 'unknown')
-            tool_desc = getattr(tool, 'description', '')
-            corpus_text = f"{tool_name} {tool_desc}".lower()
-            corpus = set(re.split(r"\W+", corpus_text))
-            overlap = len(terms.intersection(corpus))
-            score = overlap / max(len(terms), 1)
-            if score > 0:
-                ranked.append((tool, score))
-        ranked.sort(key=lambda item: item[1], reverse=True)
-        return ranked
+        index = getattr(self.registry, "ranking_index", None)
+        if index is None:
+            # Registries without a maintained index (e.g. dict-based) get a transient one
+            tools_iter = self.registry.tools if isinstance(self.registry.tools, list) else self.registry.tools.values()
+            index = ToolRankingIndex()
+            index.sync(
+                (id(tool), f"{getattr(tool, 'name', 'unknown')} {getattr(tool, 'description', '')}", tool)
+                for tool in tools_iter
+            )
+        return index.rank(goal, scoring=self.config.tool_scoring)
 
 
 @dataclass
@@ -1109,6 +1100,7 @@ class CoordinatorAgent(OrchestratorProtocol):
                     token_ceiling=100000,
                     policy="warn",
                 ),
+                tool_index=_shared_tool_index(self.planner),
             )
         
         if self.audit_trail is None:
@@ -1889,6 +1881,7 @@ def create_coordinator(
     planning_authority = create_planning_authority(
         max_steps=max_plan_steps,
         budget=default_budget,
+        tool_index=_shared_tool_index(planner),
     )
     
     return CoordinatorAgent(
@@ -1900,6 +1893,18 @@ def create_coordinator(
     )
 
 
+def _shared_tool_index(planner: Any) -> Optional[Callable[[], ToolRankingIndex]]:
+    """Return a provider of the planner registry's ranking index so planning authorities reuse it.
+
+    A provider (rather than the index itself) routes every lookup through
+    ``ToolRegistry.ranking_index``, which reconciles direct edits of ``tools``.
+    """
+    registry = getattr(planner, "registry", None)
+    if isinstance(registry, ToolRegistry):
+        return lambda: registry.ranking_index
+    return None
+
+
 def build_default_registry() -> ToolRegistry:
     """Build default registry with echo tool for testing."""
     def echo_handler(inputs: Dict[str, Any], ctx: Dict[str, Any]) -> str:
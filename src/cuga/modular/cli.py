@@ -34,9 +34,34 @@ def _persist_memory(memory: VectorMemory, state_path: Path) -> None:
 def handle_ingest(args: argparse.Namespace) -> None:
     state_path = Path(args.state)
     loader = RagLoader(backend=args.backend, profile=args.profile)
-    added = loader.ingest(Path(p) for p in args.paths)
+    if not args.stream:
+        added = loader.ingest(Path(p) for p in args.paths)
+        _persist_memory(loader.memory, state_path)
+        LOGGER.info(json.dumps({"event": "ingest", "added": added, "trace_id": args.trace_id}))
+        return
+    if state_path.exists():
+        loader.memory = _load_memory(state_path, backend=args.backend, profile=args.profile)
+    stats = loader.ingest_stream(
+        (Path(p) for p in args.paths),
+        chunk_size=args.chunk_size,
+        overlap=args.overlap,
+        batch_size=args.batch_size,
+        workers=args.workers,
+        manifest_path=Path(args.manifest) if args.manifest else None,
+    )
     _persist_memory(loader.memory, state_path)
-    LOGGER.info(json.dumps({"event": "ingest", "added": added, "trace_id": args.trace_id}))
+    LOGGER.info(
+        json.dumps(
+            {
+                "event": "ingest",
+                "added": stats.files_ingested,
+                "skipped": stats.files_skipped,
+                "chunks": stats.chunks,
+                "throughput": stats.throughput(),
+                "trace_id": args.trace_id,
+            }
+        )
+    )
 
 
 def handle_query(args: argparse.Namespace) -> None:
@@ -75,6 +100,12 @@ def build_parser() -> argparse.ArgumentParser:
 
     ingest = subparsers.add_parser("ingest", help="ingest files")
     ingest.add_argument("paths", nargs="+")
+    ingest.add_argument("--stream", action="store_true", help="chunk, embed and upsert in batches")
+    ingest.add_argument("--chunk-size", dest="chunk_size", type=int, default=200)
+    ingest.add_argument("--overlap", type=int, default=40)
+    ingest.add_argument("--batch-size", dest="batch_size", type=int, default=256)
+    ingest.add_argument("--workers", type=int, default=0)
+    ingest.add_argument("--manifest", default=None, help="content-hash manifest used to skip unchanged files")
     ingest.set_defaults(func=handle_ingest)
 
     query = subparsers.add_parser("query", help="query memory")
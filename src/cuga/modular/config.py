@@ -20,6 +20,7 @@ class AgentConfig:
     vector_backend: str = "local"
     rag_enabled: bool = False
     langfuse_host: Optional[str] = None
+    tool_scoring: Literal["overlap", "tfidf", "bm25"] = "overlap"
 
     @classmethod
     def from_env(cls) -> "AgentConfig":
@@ -38,6 +39,7 @@ class AgentConfig:
             vector_backend=os.getenv("VECTOR_BACKEND", "local"),
             rag_enabled=os.getenv("RAG_ENABLED", "false").lower() == "true",
             langfuse_host=os.getenv("LANGFUSE_HOST"),
+            tool_scoring=_parse_choice("PLANNER_TOOL_SCORING", default="overlap", choices=("overlap", "tfidf", "bm25")),
         )
 
 
@@ -58,6 +60,19 @@ def _parse_int(key: str, default: int, min_value: int, max_value: int) -> int:
     return clamped
 
 
+def _parse_choice(key: str, default: str, choices: tuple[str, ...]) -> str:
+    import os
+
+    raw = os.getenv(key)
+    if raw is None:
+        return default
+    value = raw.strip().lower()
+    if value not in choices:
+        LOGGER.warning("Invalid value %r for %s (expected one of %s); using default %s", raw, key, ", ".join(choices), default)
+        return default
+    return value
+
+
 def _parse_float(key: str, default: float, min_value: float, max_value: float) -> float:
     import os
 
@@ -1,22 +1,70 @@
 from __future__ import annotations
 
 import hashlib
-from typing import Final
+import zlib
+from functools import lru_cache
+from typing import Final, Iterable, Literal
 
 _DIM: Final = 64
+_CACHE_SIZE: Final = 65536
+
+HashName = Literal["sha256", "crc32"]
 
 
 class HashingEmbedder:
-    """Deterministic offline embedder using hashing."""
+    """Deterministic offline embedder using hashing.
+
+    ``hash_name="sha256"`` (default) reproduces the original vectors exactly;
+    ``"crc32"`` is a cheaper non-cryptographic bucket hash. Token → bucket
+    lookups are memoized in a bounded LRU, and ``embed_batch`` returns a
+    contiguous float32 matrix for bulk ingestion.
+    """
+
+    def __init__(self, dim: int = _DIM, hash_name: HashName = "sha256", cache_size: int = _CACHE_SIZE) -> None:
+        if dim <= 0:
+            raise ValueError("dim must be positive")
+        if hash_name not in ("sha256", "crc32"):
+            raise ValueError(f"Unsupported hash {hash_name}")
+        self.dim = dim
+        self.hash_name = hash_name
+        self._bucket = lru_cache(maxsize=cache_size)(self._bucket_uncached)
+
+    def _bucket_uncached(self, token: str) -> int:
+        data = token.encode("utf-8")
+        if self.hash_name == "crc32":
+            return zlib.crc32(data) % self.dim
+        digest = hashlib.sha256(data).digest()
+        if self.dim <= 256:
+            # First-byte bucketing keeps vectors identical to the original embedder
+            return digest[0] % self.dim
+        return int.from_bytes(digest[:8], "big") % self.dim
 
     def embed(self, text: str) -> list[float]:
-        tokens = text.lower().split()
-        vector = [0.0 for _ in range(_DIM)]
-        for token in tokens:
-            digest = hashlib.sha256(token.encode("utf-8")).digest()
-            idx = digest[0] % _DIM
-            vector[idx] += 1.0
+        vector = [0.0 for _ in range(self.dim)]
+        for token in text.lower().split():
+            vector[self._bucket(token)] += 1.0
         norm = sum(v * v for v in vector) ** 0.5
         if norm > 0:
             vector = [v / norm for v in vector]
         return vector
+
+    def embed_batch(self, texts: Iterable[str]):
+        """Embed many texts into an ``(n, dim)`` float32 NumPy array of L2-normalized rows."""
+        import numpy as np
+
+        rows: list[int] = []
+        cols: list[int] = []
+        count = 0
+        for row, text in enumerate(texts):
+            count = row + 1
+            for token in text.lower().split():
+                rows.append(row)
+                cols.append(self._bucket(token))
+        if count == 0:
+            return np.zeros((0, self.dim), dtype=np.float32)
+
+        flat = np.asarray(rows, dtype=np.int64) * self.dim + np.asarray(cols, dtype=np.int64)
+        matrix = np.bincount(flat, minlength=count * self.dim).astype(np.float64).reshape(count, self.dim)
+        norms = np.sqrt((matrix * matrix).sum(axis=1, keepdims=True))
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix.astype(np.float32)
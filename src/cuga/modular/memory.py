@@ -1,16 +1,16 @@
 from __future__ import annotations
 
 import logging
-import re
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 from .embeddings.interface import Embedder
 from .embeddings.hashing import HashingEmbedder
-from .types import MemoryRecord
+from .types import MemoryRecord, VersionedList
 from .vector_backends.base import EmbeddedRecord, SearchHit, VectorBackend
 from .vector_backends.chroma_backend import ChromaBackend
 from .vector_backends.faiss_backend import FaissBackend
+from .vector_backends.local_backend import LocalTermBackend, tokenize_terms
 from .vector_backends.qdrant_backend import QdrantBackend
 
 LOGGER = logging.getLogger(__name__)
@@ -29,7 +29,12 @@ class VectorMemory:
     backend_name: str = "local"
     embedder: Embedder = field(default_factory=HashingEmbedder)
     backend: Optional[VectorBackend] = None
-    store: List[MemoryRecord] = field(default_factory=list)
+    store: List[MemoryRecord] = field(default_factory=VersionedList)
+    _local_index: LocalTermBackend = field(
+        default_factory=LocalTermBackend, init=False, repr=False, compare=False
+    )
+    _indexed_store: Optional[List[MemoryRecord]] = field(default=None, init=False, repr=False, compare=False)
+    _indexed_version: Optional[int] = field(default=None, init=False, repr=False, compare=False)
 
     def connect_backend(self) -> None:
         if self.backend_name == "local":
@@ -53,7 +58,11 @@ class VectorMemory:
         if metadata:
             merged_metadata.update(metadata)
         record = MemoryRecord(text=text, metadata=merged_metadata)
+        index_synced = self.backend_name == "local" and self._index_synced()
         self.store.append(record)
+        if index_synced:
+            self._local_index.upsert([record])
+            self._mark_indexed()
         if self.backend_name != "local":
             if self.backend is None:
                 self.connect_backend()
@@ -62,28 +71,114 @@ class VectorMemory:
             embedding = self.embedder.embed(text)
             self.backend.upsert([EmbeddedRecord(embedding=embedding, record=record)])
 
+    def remember_many(
+        self,
+        texts: Sequence[str],
+        metadatas: Optional[Sequence[Optional[Dict[str, str]]]] = None,
+        embeddings: Optional[Sequence[List[float]]] = None,
+    ) -> List[MemoryRecord]:
+        """Store many records with a single backend upsert.
+
+        ``embeddings`` may be supplied when the caller already embedded the
+        texts (e.g. in an ingestion worker); otherwise they are computed with
+        ``embed_batch`` when the embedder offers it.
+        """
+        if metadatas is not None and len(metadatas) != len(texts):
+            raise ValueError("metadatas must match texts in length")
+        if embeddings is not None and len(embeddings) != len(texts):
+            raise ValueError("embeddings must match texts in length")
+        records: List[MemoryRecord] = []
+        for position, text in enumerate(texts):
+            merged_metadata = {"profile": self.profile}
+            if metadatas is not None and metadatas[position]:
+                merged_metadata.update(metadatas[position])
+            records.append(MemoryRecord(text=text, metadata=merged_metadata))
+        if not records:
+            return records
+        index_synced = self.backend_name == "local" and self._index_synced()
+        self.store.extend(records)
+        if index_synced:
+            self._local_index.upsert(records)
+            self._mark_indexed()
+        if self.backend_name != "local":
+            if self.backend is None:
+                self.connect_backend()
+            if self.backend is None:
+                return records
+            if embeddings is None:
+                embeddings = self.embed_many(texts)
+            self.backend.upsert(
+                [EmbeddedRecord(embedding=list(vector), record=record) for vector, record in zip(embeddings, records)]
+            )
+        return records
+
+    def forget(self, where: Dict[str, str]) -> None:
+        """Remove records whose metadata contains every key/value in ``where``."""
+        if not where:
+            return
+        kept = [
+            record for record in self.store
+            if not all(record.metadata.get(key) == value for key, value in where.items())
+        ]
+        if len(kept) != len(self.store):
+            # The local index notices the changed store and rebuilds on next search
+            self.store[:] = kept
+        if self.backend is not None:
+            self.backend.delete(where)
+
+    def save(self) -> None:
+        """Persist backend state that is not written on every upsert (e.g. a FAISS index file)."""
+        save = getattr(self.backend, "save", None)
+        if save is not None:
+            save()
+
+    def embed_many(self, texts: Sequence[str]) -> List[List[float]]:
+        embed_batch = getattr(self.embedder, "embed_batch", None)
+        if embed_batch is not None:
+            try:
+                return embed_batch(texts).tolist()
+            except ImportError:
+                pass
+        return [self.embedder.embed(text) for text in texts]
+
     def search(self, query: str, top_k: int = 3) -> List[SearchHit]:
         if self.backend is not None:
             query_vector = self.embedder.embed(query)
             return self.backend.search(query_vector, top_k)
         return self._local_search(query, top_k)
 
+    def search_batch(self, queries: List[str], top_k: int = 3) -> List[List[SearchHit]]:
+        if self.backend is not None:
+            return [self.backend.search(self.embedder.embed(query), top_k) for query in queries]
+        return self._ensure_local_index().search_batch(queries, top_k)
+
     def _local_search(self, query: str, top_k: int) -> List[SearchHit]:
-        query_terms = self._normalize_words(query)
-        if not query_terms:
-            return []
-        scored: List[SearchHit] = []
-        for record in self.store:
-            record_terms = self._normalize_words(record.text)
-            overlap = len(query_terms & record_terms)
-            if overlap == 0:
-                continue
-            score = overlap / max(len(query_terms), 1)
-            scored.append(SearchHit(text=record.text, metadata=record.metadata, score=float(score)))
-        scored.sort(key=lambda hit: hit.score, reverse=True)
-        return scored[:top_k]
+        return self._ensure_local_index().search(query, top_k)
+
+    def _ensure_local_index(self) -> LocalTermBackend:
+        # Edits made to ``store`` directly bypass remember(); reindex if so
+        if not self._index_synced():
+            self._local_index.clear()
+            self._local_index.upsert(self.store)
+            self._mark_indexed()
+        return self._local_index
+
+    def _index_synced(self) -> bool:
+        """Whether the local index mirrors ``store``.
+
+        The default ``VersionedList`` store counts its mutations, so the check
+        is O(1). A plain list assigned by the caller is compared slot by slot.
+        Editing a stored record's text in place is visible to neither check.
+        """
+        store = self.store
+        if isinstance(store, VersionedList):
+            return self._indexed_store is store and self._indexed_version == store.version
+        return self._local_index.is_synced_with(store)
+
+    def _mark_indexed(self) -> None:
+        self._indexed_store = self.store
+        self._indexed_version = getattr(self.store, "version", None)
 
     @staticmethod
     def _normalize_words(text: str) -> set[str]:
-        tokens = re.findall(r"[a-z0-9]+", text.lower())
-        return set(tokens)
+        return tokenize_terms(text)
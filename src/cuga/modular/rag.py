@@ -1,12 +1,31 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from .embeddings.hashing import HashingEmbedder
 from .memory import VectorMemory
 from .vector_backends.base import SearchHit
 
+LOGGER = logging.getLogger(__name__)
+
+_DEFAULT_CHUNK_WORDS = 200
+_DEFAULT_OVERLAP_WORDS = 40
+_DEFAULT_BATCH_SIZE = 256
+# Prepared files buffered per pool worker (bounds memory when upserts are slower than workers)
+_PREFETCH_PER_WORKER = 2
+
+# Manifest value per file: (size, mtime_ns, sha256 hex digest)
+_ManifestEntry = Tuple[int, int, str]
+
 
 @dataclass
 class RagDocument:
@@ -21,6 +40,125 @@ class RagHit:
     metadata: dict
 
 
+@dataclass
+class IngestStats:
+    """Progress and per-stage timing for a streaming ingest run."""
+
+    files_seen: int = 0
+    files_ingested: int = 0
+    files_skipped: int = 0
+    files_removed: int = 0
+    chunks: int = 0
+    bytes_read: int = 0
+    read_seconds: float = 0.0
+    embed_seconds: float = 0.0
+    upsert_seconds: float = 0.0
+    started_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    def throughput(self) -> Dict[str, float]:
+        """Per-stage throughput; stage seconds are summed across workers."""
+
+        def _rate(count: float, seconds: float) -> float:
+            return count / seconds if seconds > 0 else 0.0
+
+        return {
+            "read_bytes_per_s": _rate(self.bytes_read, self.read_seconds),
+            "embed_chunks_per_s": _rate(self.chunks, self.embed_seconds),
+            "upsert_chunks_per_s": _rate(self.chunks, self.upsert_seconds),
+            "files_per_s": _rate(self.files_seen, self.elapsed_seconds),
+        }
+
+
+@dataclass
+class _PreparedFile:
+    path: str
+    digest: str
+    size: int
+    mtime_ns: int
+    # None when the content hash matched despite a new size/mtime (only the manifest entry changes)
+    chunks: Optional[List[str]]
+    embeddings: Optional[List[List[float]]]
+    read_seconds: float
+    embed_seconds: float
+
+
+def chunk_text(text: str, chunk_size: int = _DEFAULT_CHUNK_WORDS, overlap: int = _DEFAULT_OVERLAP_WORDS) -> List[str]:
+    """Split text into windows of ``chunk_size`` words sharing ``overlap`` words."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    if not 0 <= overlap < chunk_size:
+        raise ValueError("overlap must be in [0, chunk_size)")
+    words = text.split()
+    if not words:
+        return []
+    step = chunk_size - overlap
+    chunks: List[str] = []
+    for start in range(0, len(words), step):
+        chunks.append(" ".join(words[start : start + chunk_size]))
+        if start + chunk_size >= len(words):
+            break
+    return chunks
+
+
+_WORKER_EMBEDDERS: Dict[Tuple[int, str], HashingEmbedder] = {}
+
+
+def _prepare_file(
+    path: str,
+    chunk_size: int,
+    overlap: int,
+    embedder_spec: Optional[Tuple[int, str]],
+    known: Optional[_ManifestEntry],
+) -> Optional[_PreparedFile]:
+    # Runs inside pool workers: keep arguments and results picklable
+    started = time.perf_counter()
+    # Stat before reading so a write racing the read shows up as a new mtime next run
+    stat = os.stat(path)
+    if known is not None and known[:2] == (stat.st_size, stat.st_mtime_ns):
+        return None
+    data = Path(path).read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    if known is not None and digest == known[2]:
+        # Touched (or recorded by an older manifest) but unchanged: refresh the entry only
+        return _PreparedFile(
+            path=path,
+            digest=digest,
+            size=len(data),
+            mtime_ns=stat.st_mtime_ns,
+            chunks=None,
+            embeddings=None,
+            read_seconds=time.perf_counter() - started,
+            embed_seconds=0.0,
+        )
+    chunks = chunk_text(data.decode("utf-8", errors="ignore"), chunk_size, overlap)
+    read_seconds = time.perf_counter() - started
+
+    embeddings = None
+    embed_seconds = 0.0
+    if embedder_spec is not None and chunks:
+        started = time.perf_counter()
+        embedder = _WORKER_EMBEDDERS.get(embedder_spec)
+        if embedder is None:
+            embedder = HashingEmbedder(dim=embedder_spec[0], hash_name=embedder_spec[1])
+            _WORKER_EMBEDDERS[embedder_spec] = embedder
+        embeddings = [embedder.embed(chunk) for chunk in chunks]
+        embed_seconds = time.perf_counter() - started
+    return _PreparedFile(
+        path=path,
+        digest=digest,
+        size=len(data),
+        mtime_ns=stat.st_mtime_ns,
+        chunks=chunks,
+        embeddings=embeddings,
+        read_seconds=read_seconds,
+        embed_seconds=embed_seconds,
+    )
+
+
 class RagLoader:
     def __init__(self, backend: Optional[str] = None, profile: str = "default") -> None:
         self.memory = VectorMemory(backend_name=backend or "local", profile=profile)
@@ -34,8 +172,197 @@ class RagLoader:
             text = path.read_text(encoding="utf-8", errors="ignore")
             self.memory.remember(text, metadata={"path": str(path), "profile": self.memory.profile})
             added += 1
+        self.memory.save()
         return added
 
+    def ingest_stream(
+        self,
+        files: Iterable[Path],
+        *,
+        chunk_size: int = _DEFAULT_CHUNK_WORDS,
+        overlap: int = _DEFAULT_OVERLAP_WORDS,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        workers: int = 0,
+        manifest_path: Optional[Path] = None,
+        progress: Optional[Callable[[IngestStats], None]] = None,
+    ) -> IngestStats:
+        """Chunk, embed and upsert files in batches.
+
+        With ``workers > 1`` files are read, chunked and (for the hashing
+        embedder) embedded in a process pool, with at most a few prepared
+        files per worker buffered ahead of the upserts. Chunks are upserted in
+        batches of ``batch_size``. When ``manifest_path`` is given, it records
+        each file's size, mtime and SHA-256: files whose size and mtime match
+        are skipped without being read, files whose hash still matches are
+        skipped after one read, and chunks of changed files are removed
+        before their new chunks are added. Chunks of manifest files that no
+        longer exist are removed too. The manifest is rewritten after each
+        batch once its upsert has succeeded. The backend index is saved at
+        the end (FAISS writes its index file only then). ``progress`` is
+        called after every upserted batch.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        chunk_text("", chunk_size, overlap)  # validate before spawning workers
+        manifest = self._load_manifest(manifest_path)
+        stats = IngestStats()
+        embedder_spec = self._worker_embedder_spec()
+
+        texts: List[str] = []
+        metadatas: List[Dict[str, str]] = []
+        embeddings: List[List[float]] = []
+        # Files whose chunks are all buffered; recorded in the manifest once upserted
+        completed: Dict[str, _ManifestEntry] = {}
+
+        def flush() -> None:
+            if texts:
+                if embedder_spec is None and self.memory.backend_name != "local":
+                    started = time.perf_counter()
+                    embeddings.extend(self.memory.embed_many(texts))
+                    stats.embed_seconds += time.perf_counter() - started
+                started = time.perf_counter()
+                self.memory.remember_many(texts, metadatas, embeddings or None)
+                stats.upsert_seconds += time.perf_counter() - started
+                texts.clear()
+                metadatas.clear()
+                embeddings.clear()
+                if progress is not None:
+                    progress(stats)
+            if completed and manifest_path is not None:
+                manifest.update(completed)
+                self._write_manifest(manifest_path, manifest)
+            completed.clear()
+
+        for prepared in self._prepare_all(files, chunk_size, overlap, embedder_spec, manifest, workers, stats):
+            stats.bytes_read += prepared.size
+            stats.read_seconds += prepared.read_seconds
+            if prepared.chunks is None:
+                stats.files_skipped += 1
+                completed[prepared.path] = (prepared.size, prepared.mtime_ns, prepared.digest)
+                continue
+            stats.files_ingested += 1
+            stats.embed_seconds += prepared.embed_seconds
+            if prepared.path in manifest:
+                # Changed since the last run: drop its previous chunks before adding the new ones
+                self.memory.forget({"path": prepared.path})
+            for position, chunk in enumerate(prepared.chunks):
+                texts.append(chunk)
+                metadatas.append(
+                    {"path": prepared.path, "chunk": str(position), "profile": self.memory.profile}
+                )
+                if prepared.embeddings is not None:
+                    embeddings.append(prepared.embeddings[position])
+                stats.chunks += 1
+                if len(texts) >= batch_size:
+                    flush()
+            completed[prepared.path] = (prepared.size, prepared.mtime_ns, prepared.digest)
+        flush()
+        if manifest_path is not None:
+            self._prune_deleted(manifest, manifest_path, stats)
+        self.memory.save()
+
+        LOGGER.info(
+            "RAG ingest complete",
+            extra={
+                "files_ingested": stats.files_ingested,
+                "files_skipped": stats.files_skipped,
+                "files_removed": stats.files_removed,
+                "chunks": stats.chunks,
+                **stats.throughput(),
+            },
+        )
+        return stats
+
+    def _prune_deleted(self, manifest: Dict[str, _ManifestEntry], manifest_path: Path, stats: IngestStats) -> None:
+        removed = [key for key in manifest if not os.path.isfile(key)]
+        for key in removed:
+            self.memory.forget({"path": key})
+            del manifest[key]
+        if removed:
+            stats.files_removed += len(removed)
+            self._write_manifest(manifest_path, manifest)
+
+    def _worker_embedder_spec(self) -> Optional[Tuple[int, str]]:
+        # Local memory does not embed; only the hashing embedder can be rebuilt in workers
+        if self.memory.backend_name == "local":
+            return None
+        embedder = self.memory.embedder
+        if type(embedder) is HashingEmbedder:
+            return (embedder.dim, embedder.hash_name)
+        return None
+
+    def _prepare_all(
+        self,
+        files: Iterable[Path],
+        chunk_size: int,
+        overlap: int,
+        embedder_spec: Optional[Tuple[int, str]],
+        manifest: Dict[str, _ManifestEntry],
+        workers: int,
+        stats: IngestStats,
+    ) -> Iterator[_PreparedFile]:
+        def jobs() -> Iterator[Tuple[str, int, int, Optional[Tuple[int, str]], Optional[_ManifestEntry]]]:
+            for path in files:
+                if not path.is_file():
+                    continue
+                stats.files_seen += 1
+                key = str(path)
+                yield (key, chunk_size, overlap, embedder_spec, manifest.get(key))
+
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = self._bounded_map(pool, jobs(), workers * _PREFETCH_PER_WORKER)
+                yield from self._count_skipped(results, stats)
+        else:
+            yield from self._count_skipped((_prepare_file(*job) for job in jobs()), stats)
+
+    @staticmethod
+    def _bounded_map(
+        pool: ProcessPoolExecutor, jobs: Iterable[Tuple], window: int
+    ) -> Iterator[Optional[_PreparedFile]]:
+        """Like ``pool.map`` but in order with at most ``window`` files in flight or buffered."""
+        pending: deque = deque()
+        for job in jobs:
+            pending.append(pool.submit(_prepare_file, *job))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    @staticmethod
+    def _count_skipped(results: Iterable[Optional[_PreparedFile]], stats: IngestStats) -> Iterator[_PreparedFile]:
+        for prepared in results:
+            if prepared is None:
+                stats.files_skipped += 1
+                continue
+            yield prepared
+
+    @staticmethod
+    def _write_manifest(manifest_path: Path, manifest: Dict[str, _ManifestEntry]) -> None:
+        tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+        os.replace(tmp_path, manifest_path)
+
+    @staticmethod
+    def _load_manifest(manifest_path: Optional[Path]) -> Dict[str, _ManifestEntry]:
+        if manifest_path is None or not manifest_path.exists():
+            return {}
+        try:
+            data = json.loads(manifest_path.read_text())
+        except (OSError, json.JSONDecodeError):
+            LOGGER.warning("Ignoring unreadable ingest manifest", extra={"path": str(manifest_path)})
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        manifest: Dict[str, _ManifestEntry] = {}
+        for key, value in data.items():
+            if isinstance(value, str):
+                # Digest-only entry from an older manifest: hashed once, then upgraded
+                manifest[str(key)] = (-1, -1, value)
+            elif isinstance(value, list) and len(value) == 3:
+                manifest[str(key)] = (int(value[0]), int(value[1]), str(value[2]))
+        return manifest
+
 
 class RagRetriever:
     def __init__(self, backend: Optional[str] = None, profile: str = "default") -> None:
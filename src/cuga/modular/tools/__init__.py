@@ -4,6 +4,10 @@ import importlib
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, Iterable, List, Optional
 
+from cuga.orchestrator.tool_index import ToolRankingIndex
+
+from ..types import VersionedList
+
 
 Handler = Callable[[Dict[str, Any], Dict[str, Any]], Any]
 
@@ -21,11 +25,56 @@ class ToolRegistry:
     """Canonical ToolRegistry using list-based storage with ToolSpec objects."""
     
     def __init__(self, tools: Optional[Iterable[ToolSpec]] = None) -> None:
-        self.tools: List[ToolSpec] = list(tools or [])
+        self.tools = list(tools or [])
+        self._ranking_index = ToolRankingIndex()
+
+    @property
+    def tools(self) -> List[ToolSpec]:
+        return self._tools
+
+    @tools.setter
+    def tools(self, tools: Iterable[ToolSpec]) -> None:
+        self._tools = VersionedList(tools)
+        self._indexed_version: Optional[int] = None
 
     def register(self, tool: ToolSpec) -> None:
         """Register a ToolSpec object (new API)."""
-        self.tools.append(tool)
+        in_sync = self._indexed_version == self._tools.version
+        self._tools.append(tool)
+        if in_sync:
+            self._ranking_index.add(id(tool), _index_text(tool), tool)
+            self._indexed_version = self._tools.version
+
+    def unregister(self, name: str) -> Optional[ToolSpec]:
+        """Remove the first tool with the given name, returns it or None."""
+        tool = self.get(name)
+        if tool is None:
+            return None
+        in_sync = self._indexed_version == self._tools.version
+        self._tools.remove(tool)
+        if in_sync:
+            self._ranking_index.remove(id(tool))
+            self._indexed_version = self._tools.version
+        return tool
+
+    @property
+    def ranking_index(self) -> ToolRankingIndex:
+        """Inverted index over tool name/description, kept in sync incrementally.
+
+        Mutations of ``tools`` through list methods (append, slot
+        replacement, removal, reassigning the list) bump a counter and are
+        reconciled via ``ToolRankingIndex.sync``, which only re-tokenizes
+        changed tools. Editing a registered tool's name or description in
+        place is not visible to the counter; call :meth:`reindex` after.
+        """
+        if self._indexed_version != self._tools.version:
+            self.reindex()
+        return self._ranking_index
+
+    def reindex(self) -> None:
+        """Reconcile the ranking index with every tool's current name/description."""
+        self._ranking_index.sync((id(tool), _index_text(tool), tool) for tool in self._tools)
+        self._indexed_version = self._tools.version
 
     def get(self, name: str) -> Optional[ToolSpec]:
         """Get tool by name, returns ToolSpec or None."""
@@ -49,6 +98,10 @@ class ToolRegistry:
         return cls(registry_tools)
 
 
+def _index_text(tool: Any) -> str:
+    return f"{getattr(tool, 'name', 'unknown')} {getattr(tool, 'description', '')}"
+
+
 def _load_handler(module_path: str) -> Handler:
     """Load handler with allowlist enforcement (cuga.modular.tools.* only)."""
     if not module_path.startswith("cuga.modular.tools."):
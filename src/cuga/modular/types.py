@@ -1,10 +1,32 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict
+from typing import Any, Callable, Dict
 
 
 @dataclass
 class MemoryRecord:
     text: str
     metadata: Dict[str, str]
+
+
+class VersionedList(list):
+    """List that counts in-place mutations, so index staleness checks are O(1)."""
+
+    version = 0
+
+
+def _counted(method: Callable) -> Callable:
+    def mutate(self: VersionedList, *args: Any, **kwargs: Any) -> Any:
+        self.version += 1
+        return method(self, *args, **kwargs)
+
+    mutate.__name__ = method.__name__
+    return mutate
+
+
+for _name in (
+    "append", "extend", "insert", "remove", "pop", "clear", "sort", "reverse",
+    "__setitem__", "__delitem__", "__iadd__", "__imul__",
+):
+    setattr(VersionedList, _name, _counted(getattr(list, _name)))
@@ -25,3 +25,7 @@ class VectorBackend(Protocol):
     def upsert(self, records: list[EmbeddedRecord]) -> None: ...
 
     def search(self, query_vector: list[float], top_k: int) -> list[SearchHit]: ...
+
+    def delete(self, where: dict[str, str]) -> None:
+        """Remove records whose metadata contains every key/value in ``where``."""
+        ...
@@ -25,6 +25,14 @@ class ChromaBackend(VectorBackend):
         documents = [rec.record.text for rec in records]
         self._collection.upsert(ids=ids, embeddings=embeddings, metadatas=metadatas, documents=documents)
 
+    def delete(self, where: dict[str, str]) -> None:
+        if self._collection is None or not where:
+            return
+        if len(where) > 1:
+            self._collection.delete(where={"$and": [{key: value} for key, value in where.items()]})
+        else:
+            self._collection.delete(where=dict(where))
+
     def search(self, query_vector: list[float], top_k: int) -> list[SearchHit]:
         if self._collection is None:
             return []
@@ -1,43 +1,327 @@
 from __future__ import annotations
 
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Literal, Optional
+
+from ..types import MemoryRecord
 from .base import EmbeddedRecord, SearchHit, VectorBackend
 
+IndexType = Literal["flat", "ivf", "hnsw"]
+
+_DEFAULT_NLIST = 1024
+_DEFAULT_NPROBE = 16
+_DEFAULT_HNSW_M = 32
+# Fraction of tombstoned vectors at which the index is rebuilt without them
+_DEFAULT_COMPACT_RATIO = 0.2
+# Training points per IVF list below which faiss warns and clustering is poor
+_IVF_MIN_POINTS_PER_LIST = 39
+
+
+class _RecordStore:
+    """On-disk record/metadata store keyed by FAISS vector id.
+
+    Embeddings are kept alongside each record so the index file can be rebuilt
+    or caught up if it was saved before the latest appends. Deleted records
+    are tombstoned (vector ids are positions, so vectors stay in the index).
+    """
+
+    def __init__(self, path: Path, read_only: bool) -> None:
+        if read_only:
+            self._conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+            return
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS records ("
+            "id INTEGER PRIMARY KEY, text TEXT NOT NULL, metadata TEXT NOT NULL, embedding BLOB NOT NULL)"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS deleted (id INTEGER PRIMARY KEY)")
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def append(self, start_id: int, records: list[EmbeddedRecord], embeddings) -> None:
+        rows = [
+            (start_id + offset, rec.record.text, json.dumps(rec.record.metadata), embeddings[offset].tobytes())
+            for offset, rec in enumerate(records)
+        ]
+        with self._conn:
+            self._conn.executemany("INSERT INTO records VALUES (?, ?, ?, ?)", rows)
+
+    def get_many(self, ids: list[int]) -> dict[int, MemoryRecord]:
+        if not ids:
+            return {}
+        placeholders = ",".join("?" for _ in ids)
+        rows = self._conn.execute(
+            f"SELECT id, text, metadata FROM records WHERE id IN ({placeholders}) "
+            "AND id NOT IN (SELECT id FROM deleted)",
+            ids,
+        )
+        return {row[0]: MemoryRecord(text=row[1], metadata=json.loads(row[2])) for row in rows}
+
+    def delete(self, where: dict[str, str]) -> None:
+        clause = " AND ".join("json_extract(metadata, ?) = ?" for _ in where)
+        params: list[str] = []
+        for key, value in where.items():
+            params += [f'$."{key}"', value]
+        with self._conn:
+            self._conn.execute(f"INSERT OR IGNORE INTO deleted SELECT id FROM records WHERE {clause}", params)
+
+    def compact(self) -> list[bytes]:
+        """Drop tombstoned rows and renumber the rest from 0; returns their embeddings in id order."""
+        rows = self._conn.execute(
+            "SELECT text, metadata, embedding FROM records WHERE id NOT IN (SELECT id FROM deleted) ORDER BY id"
+        ).fetchall()
+        with self._conn:
+            self._conn.execute("DELETE FROM records")
+            self._conn.execute("DELETE FROM deleted")
+            self._conn.executemany(
+                "INSERT INTO records VALUES (?, ?, ?, ?)",
+                [(position, *row) for position, row in enumerate(rows)],
+            )
+        return [row[2] for row in rows]
+
+    def deleted_count(self) -> int:
+        try:
+            return self._conn.execute("SELECT COUNT(*) FROM deleted").fetchone()[0]
+        except sqlite3.OperationalError:
+            # Read-only store written before deletions were supported
+            return 0
+
+    def embeddings_from(self, start_id: int):
+        return self._conn.execute("SELECT embedding FROM records WHERE id >= ? ORDER BY id", (start_id,))
+
+    def close(self) -> None:
+        self._conn.close()
+
 
 class FaissBackend(VectorBackend):
-    def __init__(self) -> None:
+    """FAISS vector backend, in-memory by default or persistent when given a path.
+
+    With ``index_path`` set (or ``FAISS_INDEX_PATH``), the index is saved to
+    that file and records go to a SQLite store at ``<index_path>.records``.
+    ``read_only`` workers load the index with ``IO_FLAG_MMAP`` so several
+    processes can share one file without copying it into memory. ``index_type``
+    selects a flat (exact), IVF or HNSW index. An IVF index starts as a flat
+    index and is trained once the corpus holds enough vectors for ``nlist``
+    lists (about 39 per list), so small or incrementally ingested corpora are
+    not stuck with lists trained on a handful of points; ``nprobe`` lists are
+    scanned per query. Deleted records are tombstoned and the index is rebuilt
+    without them once they exceed ``compact_ratio`` of the vectors.
+    """
+
+    def __init__(
+        self,
+        index_path: Optional[str | Path] = None,
+        index_type: Optional[IndexType] = None,
+        read_only: Optional[bool] = None,
+        nlist: int = _DEFAULT_NLIST,
+        hnsw_m: int = _DEFAULT_HNSW_M,
+        nprobe: Optional[int] = None,
+        compact_ratio: float = _DEFAULT_COMPACT_RATIO,
+    ) -> None:
+        index_path = index_path or os.getenv("FAISS_INDEX_PATH") or None
+        self.index_path = Path(index_path) if index_path else None
+        self.index_type: str = index_type or os.getenv("FAISS_INDEX_TYPE", "flat")
+        if self.index_type not in ("flat", "ivf", "hnsw"):
+            raise ValueError(f"Unsupported FAISS index type {self.index_type}")
+        if read_only is None:
+            read_only = os.getenv("FAISS_READ_ONLY", "false").lower() == "true"
+        self.read_only = read_only
+        self.nlist = nlist
+        self.hnsw_m = hnsw_m
+        self.nprobe = nprobe or int(os.getenv("FAISS_NPROBE", str(_DEFAULT_NPROBE)))
+        self.compact_ratio = compact_ratio
         self._index = None
         self._metadata: list[EmbeddedRecord] = []
+        self._deleted: set[int] = set()
+        self._store: Optional[_RecordStore] = None
         self._faiss = None
         self._np = None
 
+    @property
+    def records_path(self) -> Optional[Path]:
+        if self.index_path is None:
+            return None
+        return self.index_path.with_name(self.index_path.name + ".records")
+
     def connect(self) -> None:
         import importlib
 
         self._faiss = importlib.import_module("faiss")
         self._np = importlib.import_module("numpy")
         self._index = None
+        if self.index_path is None:
+            return
+        if self.read_only and not self.records_path.exists():
+            raise RuntimeError(f"No FAISS record store at {self.records_path}")
+        if not self.read_only:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self._store = _RecordStore(self.records_path, read_only=self.read_only)
+        if self.index_path.exists():
+            self._index = self._read_index()
+            if self._index.ntotal > len(self._store):
+                # Saved before a compaction renumbered the records; rebuild from the store
+                self._index = None
+        self._catch_up()
+        self._apply_nprobe()
 
-    def _ensure_index(self, dim: int) -> None:
-        if self._index is None:
+    def _read_index(self):
+        if self.read_only:
+            flags = self._faiss.IO_FLAG_MMAP | self._faiss.IO_FLAG_READ_ONLY
+            try:
+                return self._faiss.read_index(str(self.index_path), flags)
+            except RuntimeError:
+                # Not every index type supports mmap loading
+                pass
+        return self._faiss.read_index(str(self.index_path))
+
+    def _catch_up(self) -> None:
+        # Records appended after the last save(): add their stored vectors to the index
+        indexed = self._index.ntotal if self._index is not None else 0
+        if self._store is None or len(self._store) <= indexed:
+            return
+        vectors = self._np.stack(
+            [self._np.frombuffer(blob, dtype="float32") for (blob,) in self._store.embeddings_from(indexed)]
+        )
+        if self.read_only:
+            # Keep the mmapped file untouched; index the tail in a private copy
+            self._index = self._faiss.clone_index(self._index) if self._index is not None else None
+        self._ensure_index(vectors)
+        self._index.add(vectors)
+        self._maybe_train_ivf()
+
+    def _ensure_index(self, embeddings) -> None:
+        if self._index is not None:
+            return
+        dim = embeddings.shape[1]
+        if self.index_type == "hnsw":
+            self._index = self._faiss.IndexHNSWFlat(dim, self.hnsw_m)
+        else:
+            # IVF buffers in a flat index until _maybe_train_ivf has enough training points
             self._index = self._faiss.IndexFlatL2(dim)
 
+    def _maybe_train_ivf(self) -> None:
+        """Move to a trained IVF index once the corpus can fill ``nlist`` lists.
+
+        Also retrains IVF indexes trained with fewer lists (e.g. saved by an
+        older version). Vector ids are positions, so re-adding all vectors in
+        order keeps them stable.
+        """
+        if self.index_type != "ivf" or self.read_only or self._index is None:
+            return
+        ntotal = self._index.ntotal
+        if ntotal < _IVF_MIN_POINTS_PER_LIST * self.nlist:
+            return
+        ivf = self._faiss.try_extract_index_ivf(self._index)
+        if ivf is not None:
+            if ivf.nlist >= self.nlist:
+                return
+            ivf.make_direct_map()
+        vectors = self._index.reconstruct_n(0, ntotal)
+        dim = vectors.shape[1]
+        index = self._faiss.IndexIVFFlat(self._faiss.IndexFlatL2(dim), dim, self.nlist)
+        index.train(vectors)
+        index.add(vectors)
+        self._index = index
+        self._apply_nprobe()
+
+    def _apply_nprobe(self) -> None:
+        ivf = self._faiss.try_extract_index_ivf(self._index) if self._index is not None else None
+        if ivf is not None:
+            ivf.nprobe = min(self.nprobe, ivf.nlist)
+
     def upsert(self, records: list[EmbeddedRecord]) -> None:
         if not records or self._faiss is None or self._np is None:
             return
-        dim = len(records[0].embedding)
-        self._ensure_index(dim)
+        if self.read_only:
+            raise RuntimeError("FAISS backend is read-only")
         embeddings = self._np.stack([self._np.array(rec.embedding, dtype="float32") for rec in records])
+        self._ensure_index(embeddings)
+        start_id = self._index.ntotal
         self._index.add(embeddings)
-        self._metadata.extend(records)
+        if self._store is not None:
+            self._store.append(start_id, records, embeddings)
+        else:
+            self._metadata.extend(records)
+        self._maybe_train_ivf()
+
+    def delete(self, where: dict[str, str]) -> None:
+        """Tombstone records whose metadata matches ``where``; they are no longer returned by search."""
+        if not where or self._faiss is None:
+            return
+        if self.read_only:
+            raise RuntimeError("FAISS backend is read-only")
+        if self._store is not None:
+            self._store.delete(where)
+        else:
+            for idx, rec in enumerate(self._metadata):
+                if all(rec.record.metadata.get(key) == value for key, value in where.items()):
+                    self._deleted.add(idx)
+        if self._index is not None and self._deleted_count() > self.compact_ratio * self._index.ntotal:
+            self.compact()
+
+    def compact(self) -> None:
+        """Rebuild the index without tombstoned records and save it.
+
+        Vector ids are renumbered, so read-only workers must reconnect to see
+        the compacted index.
+        """
+        if self._faiss is None or self.read_only or self._deleted_count() == 0:
+            return
+        if self._store is not None:
+            vectors = [self._np.frombuffer(blob, dtype="float32") for blob in self._store.compact()]
+        else:
+            self._metadata = [rec for idx, rec in enumerate(self._metadata) if idx not in self._deleted]
+            self._deleted = set()
+            vectors = [self._np.array(rec.embedding, dtype="float32") for rec in self._metadata]
+        self._index = None
+        if vectors:
+            embeddings = self._np.stack(vectors)
+            self._ensure_index(embeddings)
+            self._index.add(embeddings)
+            self._maybe_train_ivf()
+        self.save()
+
+    def _deleted_count(self) -> int:
+        return self._store.deleted_count() if self._store is not None else len(self._deleted)
+
+    def save(self) -> None:
+        """Write the index file atomically; records are already durable."""
+        if self.index_path is None or self._index is None or self.read_only:
+            return
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        self._faiss.write_index(self._index, str(tmp_path))
+        os.replace(tmp_path, self.index_path)
+
+    def close(self) -> None:
+        self.save()
+        if self._store is not None:
+            self._store.close()
+            self._store = None
 
     def search(self, query_vector: list[float], top_k: int) -> list[SearchHit]:
         if self._index is None or self._np is None:
             return []
-        top_k = min(top_k, len(self._metadata))
-        distances, indices = self._index.search(self._np.array(query_vector, dtype="float32")[None, :], top_k)
+        if top_k <= 0 or self._index.ntotal == 0:
+            return []
+        # Over-fetch by the number of tombstones so deleted records do not shrink the result
+        fetch_k = min(top_k + self._deleted_count(), self._index.ntotal)
+        distances, indices = self._index.search(self._np.array(query_vector, dtype="float32")[None, :], fetch_k)
+        pairs = [(float(dist), int(idx)) for dist, idx in zip(distances[0], indices[0]) if idx >= 0]
+        if self._store is not None:
+            stored = self._store.get_many([idx for _, idx in pairs])
+            records = [stored.get(idx) for _, idx in pairs]
+        else:
+            records = [None if idx in self._deleted else self._metadata[idx].record for _, idx in pairs]
         hits: list[SearchHit] = []
-        for dist, idx in zip(distances[0], indices[0]):
-            record = self._metadata[int(idx)].record
+        for (dist, _), record in zip(pairs, records):
+            if record is None:
+                continue
             score = float(1.0 / (1.0 + dist))
             hits.append(SearchHit(text=record.text, metadata=record.metadata, score=score))
-        return hits
+        return hits[:top_k]
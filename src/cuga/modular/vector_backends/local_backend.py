@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import heapq
+import operator
+import re
+from array import array
+from typing import Dict, Iterable, List
+
+from ..types import MemoryRecord
+from .base import SearchHit
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Upper bound on query×record score cells materialized per batch chunk
+_MAX_BATCH_CELLS = 1 << 22
+
+
+def tokenize_terms(text: str) -> set[str]:
+    return set(_TOKEN_RE.findall(text.lower()))
+
+
+def _load_numpy():
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - defensive
+        return None
+    return numpy
+
+
+class LocalTermBackend:
+    """Term-overlap search over records tokenized once at insert time.
+
+    Records are stored as term → record-id postings (compact int32 arrays). A
+    query scores every record in one vectorized ``bincount`` over the postings
+    of its terms and selects top-k with ``partition``, so cost tracks the
+    postings touched rather than total corpus bytes. Scores match the legacy
+    ``VectorMemory`` overlap score (matched query terms / query terms), with
+    ties broken by insertion order. Falls back to pure Python without NumPy.
+    """
+
+    def __init__(self) -> None:
+        self._vocab: Dict[str, int] = {}
+        self._postings: List[array] = []
+        self._records: List[MemoryRecord] = []
+        self._np = _load_numpy()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def connect(self) -> None:
+        return None
+
+    def clear(self) -> None:
+        self._vocab.clear()
+        self._postings.clear()
+        self._records.clear()
+
+    def upsert(self, records: Iterable[MemoryRecord]) -> None:
+        for record in records:
+            record_id = len(self._records)
+            self._records.append(record)
+            for term in tokenize_terms(record.text):
+                term_id = self._vocab.get(term)
+                if term_id is None:
+                    term_id = len(self._postings)
+                    self._vocab[term] = term_id
+                    self._postings.append(array("i"))
+                self._postings[term_id].append(record_id)
+
+    def search(self, query: str, top_k: int) -> List[SearchHit]:
+        return self.search_batch([query], top_k)[0]
+
+    def search_batch(self, queries: List[str], top_k: int) -> List[List[SearchHit]]:
+        term_sets = [tokenize_terms(query) for query in queries]
+        if not self._records or top_k <= 0:
+            return [[] for _ in queries]
+        if self._np is None:
+            return [self._search_python(terms, top_k) for terms in term_sets]
+
+        chunk = max(1, _MAX_BATCH_CELLS // len(self._records))
+        results: List[List[SearchHit]] = []
+        for start in range(0, len(term_sets), chunk):
+            results.extend(self._search_numpy(term_sets[start : start + chunk], top_k))
+        return results
+
+    def _search_numpy(self, term_sets: List[set[str]], top_k: int) -> List[List[SearchHit]]:
+        np = self._np
+        n_records = len(self._records)
+        rows = []
+        cols = []
+        for query_idx, terms in enumerate(term_sets):
+            for term in terms:
+                term_id = self._vocab.get(term)
+                if term_id is None:
+                    continue
+                postings = np.frombuffer(self._postings[term_id], dtype=np.intc)
+                cols.append(postings.astype(np.int64))
+                rows.append(np.full(len(postings), query_idx, dtype=np.int64))
+        if not cols:
+            return [[] for _ in term_sets]
+
+        flat = np.concatenate(rows) * n_records + np.concatenate(cols)
+        counts = np.bincount(flat, minlength=len(term_sets) * n_records).reshape(len(term_sets), n_records)
+        norms = np.array([max(len(terms), 1) for terms in term_sets], dtype=np.float64)
+        scores = counts / norms[:, None]
+
+        return [self._top_k_numpy(row, top_k) for row in scores]
+
+    def _top_k_numpy(self, row, top_k: int) -> List[SearchHit]:
+        np = self._np
+        candidates = np.flatnonzero(row > 0)
+        if candidates.size > top_k:
+            values = row[candidates]
+            kth = np.partition(values, values.size - top_k)[values.size - top_k]
+            above = candidates[values > kth]
+            ties = candidates[values == kth][: top_k - above.size]
+            candidates = np.concatenate([above, ties])
+        order = candidates[np.lexsort((candidates, -row[candidates]))]
+        return [self._hit(int(idx), float(row[idx])) for idx in order]
+
+    def _search_python(self, terms: set[str], top_k: int) -> List[SearchHit]:
+        if not terms:
+            return []
+        counts: Dict[int, int] = {}
+        for term in terms:
+            term_id = self._vocab.get(term)
+            if term_id is None:
+                continue
+            for record_id in self._postings[term_id]:
+                counts[record_id] = counts.get(record_id, 0) + 1
+        best = heapq.nsmallest(top_k, counts.items(), key=lambda item: (-item[1], item[0]))
+        return [self._hit(record_id, count / len(terms)) for record_id, count in best]
+
+    def _hit(self, record_id: int, score: float) -> SearchHit:
+        record = self._records[record_id]
+        return SearchHit(text=record.text, metadata=record.metadata, score=score)
+
+    def is_synced_with(self, store: List[MemoryRecord]) -> bool:
+        """Check slot by slot that the index holds exactly the records of ``store``."""
+        return len(self._records) == len(store) and all(map(operator.is_, self._records, store))
@@ -37,6 +37,18 @@ class QdrantBackend(VectorBackend):
             )
         self._client.upsert(collection_name=self._collection_name, points=payload)
 
+    def delete(self, where: dict[str, str]) -> None:
+        if self._client is None or not where:
+            return
+        conditions = [
+            self._models.FieldCondition(key=key, match=self._models.MatchValue(value=value))
+            for key, value in where.items()
+        ]
+        self._client.delete(
+            collection_name=self._collection_name,
+            points_selector=self._models.FilterSelector(filter=self._models.Filter(must=conditions)),
+        )
+
     def search(self, query_vector: list[float], top_k: int) -> list[SearchHit]:
         if self._client is None:
             return []
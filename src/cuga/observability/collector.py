@@ -7,8 +7,11 @@ Integrates with existing InMemoryTracer and extends with structured events.
 
 from __future__ import annotations
 
+import logging
 import threading
-from typing import Any, Dict, List, Optional
+import time
+from collections import deque
+from typing import Any, Dict, List, Literal, Optional
 
 from .events import (
     EventType,
@@ -22,6 +25,20 @@ from .events import (
 from .golden_signals import GoldenSignals
 from .exporters import OTELExporter, ConsoleExporter
 
+LOGGER = logging.getLogger(__name__)
+
+DropPolicy = Literal["drop_newest", "drop_oldest", "block"]
+
+
+class _FlushRequest:
+    """Control marker asking the export worker to export every event queued before it."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+_STOP = object()
+
 
 class ObservabilityCollector:
     """
@@ -34,6 +51,7 @@ class ObservabilityCollector:
     - Automatic event processing and golden signal updates
     - Multi-exporter support (OTEL, console, custom)
     - Thread-safe event buffering
+    - Background, batched export (emit_event only enqueues)
     - Periodic metrics export
     - Integration with existing InMemoryTracer
     """
@@ -43,18 +61,49 @@ class ObservabilityCollector:
         exporters: Optional[List[OTELExporter | ConsoleExporter]] = None,
         auto_export: bool = True,
         buffer_size: int = 1000,
+        async_export: bool = True,
+        queue_size: int = 10000,
+        export_batch_size: int = 100,
+        export_interval_s: float = 1.0,
+        drop_policy: DropPolicy = "drop_newest",
     ) -> None:
         """
         Initialize observability collector.
         
         Args:
             exporters: List of exporters to use (default: console exporter)
-            auto_export: Whether to auto-export events immediately
+            auto_export: Whether to auto-export events as they are emitted
             buffer_size: Maximum event buffer size before forced flush
+            async_export: Export auto-exported events from a background worker
+                in batches instead of calling exporters inline
+            queue_size: Capacity of the bounded export queue
+            export_batch_size: Events per ``export_events_batch`` call
+            export_interval_s: Maximum time an event waits before export
+            drop_policy: What to do when the export queue is full
+                ("drop_newest", "drop_oldest" or "block")
         """
+        if drop_policy not in ("drop_newest", "drop_oldest", "block"):
+            raise ValueError(f"Unsupported drop policy {drop_policy}")
         self.exporters = exporters or [ConsoleExporter(pretty=False)]
         self.auto_export = auto_export
         self.buffer_size = buffer_size
+        self.async_export = async_export
+        self.export_batch_size = max(1, export_batch_size)
+        self.export_interval_s = export_interval_s
+        self.drop_policy = drop_policy
+        
+        # Export pipeline (started lazily on first enqueue). Flush/stop markers
+        # live outside the bounded event queue so drop policies never evict them;
+        # the condition's lock also guards the export counters.
+        self.queue_size = max(1, queue_size)
+        self._export_events: deque[StructuredEvent] = deque()
+        self._export_control: deque[Any] = deque()
+        self._export_cond = threading.Condition()
+        self._export_thread: Optional[threading.Thread] = None
+        self._export_thread_lock = threading.Lock()
+        self._dropped_events = 0
+        self._exported_events = 0
+        self._export_errors = 0
         
         # Golden signals tracker
         self.signals = GoldenSignals()
@@ -79,6 +128,15 @@ class ObservabilityCollector:
         # Update golden signals
         self._update_signals(event)
         
+        if self.auto_export and self.async_export:
+            self._enqueue_export(event)
+            # Events are already queued for export; the buffer is only kept for inspection
+            with self._buffer_lock:
+                self._event_buffer.append(event)
+                if len(self._event_buffer) >= self.buffer_size:
+                    self._event_buffer.clear()
+            return
+        
         # Buffer event
         with self._buffer_lock:
             self._event_buffer.append(event)
@@ -92,6 +150,107 @@ class ObservabilityCollector:
             if len(self._event_buffer) >= self.buffer_size:
                 self._flush_buffer()
     
+    def _enqueue_export(self, event: StructuredEvent) -> None:
+        self._ensure_export_worker()
+        with self._export_cond:
+            if len(self._export_events) >= self.queue_size:
+                if self.drop_policy == "block":
+                    self._export_cond.wait_for(lambda: len(self._export_events) < self.queue_size)
+                elif self.drop_policy == "drop_oldest":
+                    self._export_events.popleft()
+                    self._dropped_events += 1
+                else:
+                    self._dropped_events += 1
+                    return
+            self._export_events.append(event)
+            self._export_cond.notify_all()
+    
+    def _send_control(self, marker: Any) -> None:
+        with self._export_cond:
+            self._export_control.append(marker)
+            self._export_cond.notify_all()
+    
+    def _ensure_export_worker(self) -> None:
+        if self._export_thread is not None and self._export_thread.is_alive():
+            return
+        with self._export_thread_lock:
+            if self._export_thread is None or not self._export_thread.is_alive():
+                self._export_thread = threading.Thread(
+                    target=self._export_loop,
+                    name="cuga-observability-export",
+                    daemon=True,
+                )
+                self._export_thread.start()
+    
+    def _export_loop(self) -> None:
+        batch: List[StructuredEvent] = []
+        deadline: Optional[float] = None
+        while True:
+            with self._export_cond:
+                while not self._export_events and not self._export_control:
+                    timeout = None if deadline is None else deadline - time.monotonic()
+                    if timeout is not None and timeout <= 0:
+                        break
+                    self._export_cond.wait(timeout)
+                control = self._export_control.popleft() if self._export_control else None
+                # A flush or stop covers every event queued before it
+                wanted = len(self._export_events) if control is not None else self.export_batch_size - len(batch)
+                taken = [self._export_events.popleft() for _ in range(min(wanted, len(self._export_events)))]
+                # Wake producers blocked on a full queue
+                self._export_cond.notify_all()
+            
+            if taken and deadline is None:
+                deadline = time.monotonic() + self.export_interval_s
+            batch.extend(taken)
+            if control is None and len(batch) < self.export_batch_size and (
+                deadline is None or time.monotonic() < deadline
+            ):
+                continue
+            
+            # Size limit reached, interval elapsed, flush requested or stopping
+            for start in range(0, len(batch), self.export_batch_size):
+                self._export_batch(batch[start : start + self.export_batch_size])
+            batch = []
+            deadline = None
+            if isinstance(control, _FlushRequest):
+                control.done.set()
+            elif control is _STOP:
+                return
+    
+    def _export_batch(self, batch: List[StructuredEvent]) -> None:
+        if not batch:
+            return
+        errors = 0
+        for exporter in self.exporters:
+            try:
+                exporter.export_events_batch(batch)
+            except Exception:
+                errors += 1
+                LOGGER.exception("Observability exporter failed", extra={"exporter": type(exporter).__name__})
+        with self._export_cond:
+            self._export_errors += errors
+            self._exported_events += len(batch)
+    
+    def _drain_export_queue(self, timeout: float = 5.0) -> None:
+        """Block until events enqueued so far have been exported."""
+        if self._export_thread is None or not self._export_thread.is_alive():
+            return
+        request = _FlushRequest()
+        self._send_control(request)
+        if not request.done.wait(timeout):
+            LOGGER.warning("Timed out waiting for observability export flush")
+    
+    @property
+    def export_stats(self) -> Dict[str, int]:
+        """Counters for the background export pipeline."""
+        with self._export_cond:
+            return {
+                "queued": len(self._export_events),
+                "exported": self._exported_events,
+                "dropped": self._dropped_events,
+                "errors": self._export_errors,
+            }
+    
     def start_trace(self, trace_id: str, metadata: Optional[Dict[str, Any]] = None) -> None:
         """
         Start a new trace.
@@ -121,10 +280,11 @@ class ObservabilityCollector:
                 duration_ms = (__import__('time').time() - trace_data["start_time"]) * 1000
                 
                 # Record trace completion
+                profile = trace_data["metadata"].get("profile")
                 if success:
-                    self.signals.record_request_success(duration_ms)
+                    self.signals.record_request_success(duration_ms, profile=profile)
                 else:
-                    self.signals.record_request_failure(duration_ms)
+                    self.signals.record_request_failure(duration_ms, profile=profile)
     
     def _update_signals(self, event: StructuredEvent) -> None:
         """Update golden signals based on event type."""
@@ -191,6 +351,11 @@ class ObservabilityCollector:
     
     def flush(self) -> None:
         """Force flush event buffer to all exporters."""
+        if self.auto_export and self.async_export:
+            self._drain_export_queue()
+            with self._buffer_lock:
+                self._event_buffer.clear()
+            return
         with self._buffer_lock:
             self._flush_buffer()
     
@@ -245,6 +410,10 @@ class ObservabilityCollector:
     def shutdown(self) -> None:
         """Shutdown collector and all exporters."""
         self.flush()
+        thread = self._export_thread
+        if thread is not None and thread.is_alive():
+            self._send_control(_STOP)
+            thread.join(timeout=5.0)
         self.export_metrics()
         
         for exporter in self.exporters:
@@ -12,45 +12,174 @@ Agent-specific signals:
 - Tool error rate by tool
 - Approval wait time (p50, p95, p99)
 - Budget utilization
+- Vendor adapter cache hit rate and credits saved
 
 All metrics are computed from structured events and exportable to Prometheus/OTEL.
 """
 
 from __future__ import annotations
 
+import math
+import statistics
 import time
+from array import array
+from bisect import bisect_left
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
-import statistics
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+# Log-linear (HDR-style) bucket layout: each power-of-two range is split into
+# _SUB_BUCKETS linear buckets, giving ~3% relative error from 1µs to ~12 days.
+_SUB_BUCKETS = 32
+_MIN_EXP = -10
+_MAX_EXP = 30
+_NUM_BUCKETS = (_MAX_EXP - _MIN_EXP) * _SUB_BUCKETS + 1
+
+# Cumulative Prometheus histogram bounds in milliseconds (``+Inf`` implied)
+PROMETHEUS_BUCKETS_MS = (1.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0, 5000.0, 10000.0, 30000.0, 60000.0)
+
+
+def _bucket_index(value: float) -> int:
+    if value <= 0.0:
+        return 0
+    mantissa, exponent = math.frexp(value)  # value = mantissa * 2**exponent, mantissa in [0.5, 1)
+    exponent -= 1
+    if exponent < _MIN_EXP:
+        return 0
+    if exponent >= _MAX_EXP:
+        return _NUM_BUCKETS - 1
+    sub = int((mantissa * 2.0 - 1.0) * _SUB_BUCKETS)
+    return (exponent - _MIN_EXP) * _SUB_BUCKETS + sub + 1
+
+
+def _bucket_bounds(index: int) -> tuple[float, float]:
+    if index == 0:
+        return 0.0, math.ldexp(1.0, _MIN_EXP)
+    exponent, sub = divmod(index - 1, _SUB_BUCKETS)
+    base = math.ldexp(1.0, exponent + _MIN_EXP)
+    width = base / _SUB_BUCKETS
+    return base + sub * width, base + (sub + 1) * width
 
 
 @dataclass
 class LatencyHistogram:
-    """Track latency percentiles with rolling window."""
+    """
+    Streaming latency sketch over a rolling window.
+
+    Raw samples live in a preallocated ring buffer of ``max_samples`` slots,
+    and each sample is also counted in a fixed log-linear bucket array. When
+    the ring wraps, the evicted sample's bucket is decremented, so ``add`` is
+    O(1) and percentile reads scan the buckets (O(buckets)) instead of sorting
+    the window. Lifetime counts against ``PROMETHEUS_BUCKETS_MS`` back a real
+    Prometheus histogram.
+    """
     
-    samples: List[float] = field(default_factory=list)
     max_samples: int = 1000
     
+    def __post_init__(self) -> None:
+        if self.max_samples <= 0:
+            raise ValueError("max_samples must be positive")
+        self._ring = array("d", bytes(8 * self.max_samples))
+        self._head = 0
+        self._size = 0
+        self._window_sum = 0.0
+        self._counts = array("q", bytes(8 * _NUM_BUCKETS))
+        self._prom_counts = array("q", bytes(8 * (len(PROMETHEUS_BUCKETS_MS) + 1)))
+        self.total_count = 0
+        self.total_sum = 0.0
+    
+    @property
+    def samples(self) -> List[float]:
+        """Samples currently in the window, oldest first."""
+        if self._size < self.max_samples:
+            return list(self._ring[: self._size])
+        return list(self._ring[self._head :]) + list(self._ring[: self._head])
+    
+    @property
+    def count(self) -> int:
+        """Number of samples in the window."""
+        return self._size
+    
     def add(self, value: float) -> None:
         """Add latency sample."""
-        self.samples.append(value)
-        if len(self.samples) > self.max_samples:
-            self.samples.pop(0)
+        value = float(value)
+        if self._size == self.max_samples:
+            evicted = self._ring[self._head]
+            self._counts[_bucket_index(evicted)] -= 1
+            self._window_sum -= evicted
+        else:
+            self._size += 1
+        self._ring[self._head] = value
+        self._head = (self._head + 1) % self.max_samples
+        self._counts[_bucket_index(value)] += 1
+        self._window_sum += value
+        self._prom_counts[bisect_left(PROMETHEUS_BUCKETS_MS, value)] += 1
+        self.total_count += 1
+        self.total_sum += value
     
     def percentile(self, p: float) -> float:
         """Calculate percentile (0-100)."""
-        if not self.samples:
-            return 0.0
-        return statistics.quantiles(self.samples, n=100)[int(p) - 1] if len(self.samples) > 1 else self.samples[0]
+        return self.percentiles((p,))[0]
+    
+    def percentiles(self, ps: Sequence[float]) -> List[float]:
+        """Estimate several percentiles (0-100) in a single bucket scan."""
+        if self._size == 0:
+            return [0.0 for _ in ps]
+        if self._size == 1:
+            return [self._ring[(self._head - 1) % self.max_samples] for _ in ps]
+        order = sorted(range(len(ps)), key=lambda i: ps[i])
+        results = [0.0] * len(ps)
+        cumulative = 0
+        bucket = 0
+        for position in order:
+            rank = min(max(ps[position], 0.0), 100.0) / 100.0 * (self._size - 1)
+            while cumulative + self._counts[bucket] <= rank:
+                cumulative += self._counts[bucket]
+                bucket += 1
+            lower, upper = _bucket_bounds(bucket)
+            fraction = (rank - cumulative + 0.5) / self._counts[bucket]
+            results[position] = lower + min(fraction, 1.0) * (upper - lower)
+        return results
     
     def mean(self) -> float:
         """Calculate mean latency."""
-        return statistics.mean(self.samples) if self.samples else 0.0
+        return self._window_sum / self._size if self._size else 0.0
+    
+    def prometheus_buckets(self) -> List[tuple[str, int]]:
+        """Cumulative lifetime ``(le, count)`` pairs including ``+Inf``."""
+        pairs: List[tuple[str, int]] = []
+        running = 0
+        for bound, bucket_count in zip(PROMETHEUS_BUCKETS_MS, self._prom_counts):
+            running += bucket_count
+            pairs.append((f"{bound:g}", running))
+        pairs.append(("+Inf", self.total_count))
+        return pairs
     
     def clear(self) -> None:
         """Clear all samples."""
-        self.samples.clear()
+        self.__post_init__()
+
+
+def _prometheus_histogram(name: str, help_text: str, series: Dict[str, "LatencyHistogram"], label: str) -> List[str]:
+    """Render labeled histograms as a single Prometheus histogram family."""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for label_value, hist in series.items():
+        escaped = str(label_value).replace("\\", "\\\\").replace('"', '\\"')
+        prefix = f'{label}="{escaped}",' if label else ""
+        for le, cumulative in hist.prometheus_buckets():
+            lines.append(f'{name}_bucket{{{prefix}le="{le}"}} {cumulative}')
+        suffix = f'{{{label}="{escaped}"}}' if label else ""
+        lines.append(f"{name}_sum{suffix} {hist.total_sum:.2f}")
+        lines.append(f"{name}_count{suffix} {hist.total_count}")
+    lines.append("")
+    return lines
+
+
+def _latency_summary(hist: LatencyHistogram, ps: Sequence[int]) -> Dict[str, float]:
+    summary = {f"p{p}": value for p, value in zip(ps, hist.percentiles(ps))}
+    summary["mean"] = hist.mean()
+    return summary
 
 
 @dataclass
@@ -91,6 +220,7 @@ class GoldenSignals:
     # Latency tracking
     end_to_end_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
     tool_latency: Dict[str, LatencyHistogram] = field(default_factory=lambda: defaultdict(LatencyHistogram))
+    profile_latency: Dict[str, LatencyHistogram] = field(default_factory=lambda: defaultdict(LatencyHistogram))
     planning_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
     routing_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
     
@@ -117,6 +247,10 @@ class GoldenSignals:
     # Traffic tracking
     requests_by_profile: Dict[str, Counter] = field(default_factory=lambda: defaultdict(Counter))
     
+    # Vendor adapter response cache: (vendor, entity, outcome) -> count
+    adapter_cache_requests: Dict[Tuple[str, str, str], Counter] = field(default_factory=lambda: defaultdict(Counter))
+    adapter_cache_credits_saved: Dict[str, float] = field(default_factory=lambda: defaultdict(float))
+    
     # Timestamp for rate calculation
     _start_time: float = field(default_factory=time.time)
     
@@ -125,15 +259,19 @@ class GoldenSignals:
         self.total_requests.increment()
         self.requests_by_profile[profile].increment()
     
-    def record_request_success(self, duration_ms: float) -> None:
+    def record_request_success(self, duration_ms: float, profile: Optional[str] = None) -> None:
         """Record successful request completion."""
         self.successful_requests.increment()
         self.end_to_end_latency.add(duration_ms)
+        if profile is not None:
+            self.profile_latency[profile].add(duration_ms)
     
-    def record_request_failure(self, duration_ms: float) -> None:
+    def record_request_failure(self, duration_ms: float, profile: Optional[str] = None) -> None:
         """Record failed request."""
         self.failed_requests.increment()
         self.end_to_end_latency.add(duration_ms)
+        if profile is not None:
+            self.profile_latency[profile].add(duration_ms)
     
     def record_plan_created(self, steps_count: int, duration_ms: float) -> None:
         """Record plan creation."""
@@ -188,6 +326,26 @@ class GoldenSignals:
         self.budget_exceeded.increment()
         self.budget_utilization[budget_type].append(utilization_pct)
     
+    def record_adapter_cache(self, vendor: str, entity: str, outcome: str, credits_saved: float = 0.0) -> None:
+        """Record a vendor adapter cache lookup (hit, stale, miss, refreshed, revalidated)."""
+        self.adapter_cache_requests[(vendor, entity, outcome)].increment()
+        if credits_saved:
+            self.adapter_cache_credits_saved[vendor] += credits_saved
+    
+    def adapter_cache_hit_rate(self) -> float:
+        """Calculate share of cacheable adapter reads served without a vendor round-trip (0-100)."""
+        served = sum(
+            counter.get() for (_, _, outcome), counter in self.adapter_cache_requests.items()
+            if outcome in ("hit", "stale", "miss")
+        )
+        if served == 0:
+            return 0.0
+        hits = sum(
+            counter.get() for (_, _, outcome), counter in self.adapter_cache_requests.items()
+            if outcome in ("hit", "stale")
+        )
+        return (hits / served) * 100
+    
     def success_rate(self) -> float:
         """Calculate success rate (0-100)."""
         total = self.total_requests.get()
@@ -229,6 +387,8 @@ class GoldenSignals:
         Returns:
             Prometheus-compatible metric export
         """
+        e2e_p50, e2e_p95, e2e_p99 = self.end_to_end_latency.percentiles((50, 95, 99))
+        approval_p50, approval_p95, approval_p99 = self.approval_wait_times.percentiles((50, 95, 99))
         lines = [
             "# HELP cuga_requests_total Total number of requests",
             "# TYPE cuga_requests_total counter",
@@ -248,11 +408,11 @@ class GoldenSignals:
             "",
             "# HELP cuga_latency_ms End-to-end latency in milliseconds",
             "# TYPE cuga_latency_ms summary",
-            f'cuga_latency_ms{{quantile="0.5"}} {self.end_to_end_latency.percentile(50):.2f}',
-            f'cuga_latency_ms{{quantile="0.95"}} {self.end_to_end_latency.percentile(95):.2f}',
-            f'cuga_latency_ms{{quantile="0.99"}} {self.end_to_end_latency.percentile(99):.2f}',
-            f"cuga_latency_ms_sum {sum(self.end_to_end_latency.samples):.2f}",
-            f"cuga_latency_ms_count {len(self.end_to_end_latency.samples)}",
+            f'cuga_latency_ms{{quantile="0.5"}} {e2e_p50:.2f}',
+            f'cuga_latency_ms{{quantile="0.95"}} {e2e_p95:.2f}',
+            f'cuga_latency_ms{{quantile="0.99"}} {e2e_p99:.2f}',
+            f"cuga_latency_ms_sum {self.end_to_end_latency.mean() * self.end_to_end_latency.count:.2f}",
+            f"cuga_latency_ms_count {self.end_to_end_latency.count}",
             "",
             "# HELP cuga_steps_per_task Mean steps per task",
             "# TYPE cuga_steps_per_task gauge",
@@ -276,9 +436,9 @@ class GoldenSignals:
             "",
             "# HELP cuga_approval_wait_ms Approval wait time in milliseconds",
             "# TYPE cuga_approval_wait_ms summary",
-            f'cuga_approval_wait_ms{{quantile="0.5"}} {self.approval_wait_times.percentile(50):.2f}',
-            f'cuga_approval_wait_ms{{quantile="0.95"}} {self.approval_wait_times.percentile(95):.2f}',
-            f'cuga_approval_wait_ms{{quantile="0.99"}} {self.approval_wait_times.percentile(99):.2f}',
+            f'cuga_approval_wait_ms{{quantile="0.5"}} {approval_p50:.2f}',
+            f'cuga_approval_wait_ms{{quantile="0.95"}} {approval_p95:.2f}',
+            f'cuga_approval_wait_ms{{quantile="0.99"}} {approval_p99:.2f}',
             "",
             "# HELP cuga_budget_warnings_total Budget warnings",
             "# TYPE cuga_budget_warnings_total counter",
@@ -292,14 +452,63 @@ class GoldenSignals:
         
         # Per-tool metrics
         for tool_name, hist in self.tool_latency.items():
+            p50, p95 = hist.percentiles((50, 95))
             lines.extend([
                 f"# HELP cuga_tool_latency_ms_{tool_name} Latency for {tool_name}",
                 f"# TYPE cuga_tool_latency_ms_{tool_name} summary",
-                f'cuga_tool_latency_ms_{tool_name}{{quantile="0.5"}} {hist.percentile(50):.2f}',
-                f'cuga_tool_latency_ms_{tool_name}{{quantile="0.95"}} {hist.percentile(95):.2f}',
+                f'cuga_tool_latency_ms_{tool_name}{{quantile="0.5"}} {p50:.2f}',
+                f'cuga_tool_latency_ms_{tool_name}{{quantile="0.95"}} {p95:.2f}',
                 "",
             ])
         
+        # Vendor adapter cache
+        if self.adapter_cache_requests:
+            lines.extend([
+                "# HELP cuga_adapter_cache_requests_total Cacheable vendor adapter reads by outcome",
+                "# TYPE cuga_adapter_cache_requests_total counter",
+            ])
+            for (vendor, entity, outcome), counter in sorted(self.adapter_cache_requests.items()):
+                lines.append(
+                    f'cuga_adapter_cache_requests_total{{vendor="{vendor}",entity="{entity}",outcome="{outcome}"}} '
+                    f"{counter.get()}"
+                )
+            lines.extend([
+                "",
+                "# HELP cuga_adapter_cache_credits_saved_total Vendor API credits saved by the adapter cache",
+                "# TYPE cuga_adapter_cache_credits_saved_total counter",
+            ])
+            for vendor, credits in sorted(self.adapter_cache_credits_saved.items()):
+                lines.append(f'cuga_adapter_cache_credits_saved_total{{vendor="{vendor}"}} {credits:g}')
+            lines.extend([
+                "",
+                "# HELP cuga_adapter_cache_hit_rate Adapter cache hit rate percentage",
+                "# TYPE cuga_adapter_cache_hit_rate gauge",
+                f"cuga_adapter_cache_hit_rate {self.adapter_cache_hit_rate():.2f}",
+                "",
+            ])
+        
+        # Cumulative histograms (lifetime counts) for server-side aggregation
+        lines.extend(_prometheus_histogram(
+            "cuga_request_duration_ms",
+            "End-to-end request duration in milliseconds",
+            {"": self.end_to_end_latency},
+            label="",
+        ))
+        if self.tool_latency:
+            lines.extend(_prometheus_histogram(
+                "cuga_tool_duration_ms",
+                "Tool call duration in milliseconds",
+                self.tool_latency,
+                label="tool",
+            ))
+        if self.profile_latency:
+            lines.extend(_prometheus_histogram(
+                "cuga_profile_request_duration_ms",
+                "End-to-end request duration by profile in milliseconds",
+                self.profile_latency,
+                label="profile",
+            ))
+        
         return "\n".join(lines)
     
     def to_dict(self) -> Dict[str, Any]:
@@ -321,40 +530,22 @@ class GoldenSignals:
             "tool_calls": self.tool_calls.get(),
             "tool_errors": self.tool_errors.get(),
             "latency": {
-                "end_to_end": {
-                    "p50": self.end_to_end_latency.percentile(50),
-                    "p95": self.end_to_end_latency.percentile(95),
-                    "p99": self.end_to_end_latency.percentile(99),
-                    "mean": self.end_to_end_latency.mean(),
-                },
-                "planning": {
-                    "p50": self.planning_latency.percentile(50),
-                    "p95": self.planning_latency.percentile(95),
-                    "mean": self.planning_latency.mean(),
-                },
-                "routing": {
-                    "p50": self.routing_latency.percentile(50),
-                    "p95": self.routing_latency.percentile(95),
-                    "mean": self.routing_latency.mean(),
-                },
+                "end_to_end": _latency_summary(self.end_to_end_latency, (50, 95, 99)),
+                "planning": _latency_summary(self.planning_latency, (50, 95)),
+                "routing": _latency_summary(self.routing_latency, (50, 95)),
                 "tools": {
-                    tool: {
-                        "p50": hist.percentile(50),
-                        "p95": hist.percentile(95),
-                        "mean": hist.mean(),
-                    }
+                    tool: _latency_summary(hist, (50, 95))
                     for tool, hist in self.tool_latency.items()
                 },
+                "profiles": {
+                    profile: _latency_summary(hist, (50, 95, 99))
+                    for profile, hist in self.profile_latency.items()
+                },
             },
             "approval": {
                 "requests": self.approval_requests.get(),
                 "timeouts": self.approval_timeouts.get(),
-                "wait_time": {
-                    "p50": self.approval_wait_times.percentile(50),
-                    "p95": self.approval_wait_times.percentile(95),
-                    "p99": self.approval_wait_times.percentile(99),
-                    "mean": self.approval_wait_times.mean(),
-                },
+                "wait_time": _latency_summary(self.approval_wait_times, (50, 95, 99)),
             },
             "budget": {
                 "warnings": self.budget_warnings.get(),
@@ -364,6 +555,14 @@ class GoldenSignals:
                     for budget_type, values in self.budget_utilization.items()
                 },
             },
+            "adapter_cache": {
+                "hit_rate": self.adapter_cache_hit_rate(),
+                "credits_saved": dict(self.adapter_cache_credits_saved),
+                "requests": {
+                    f"{vendor}.{entity}.{outcome}": counter.get()
+                    for (vendor, entity, outcome), counter in self.adapter_cache_requests.items()
+                },
+            },
         }
     
     def reset(self) -> None:
@@ -373,6 +572,7 @@ class GoldenSignals:
         self.failed_requests.reset()
         self.end_to_end_latency.clear()
         self.tool_latency.clear()
+        self.profile_latency.clear()
         self.planning_latency.clear()
         self.routing_latency.clear()
         self.steps_per_task.clear()
@@ -387,4 +587,6 @@ class GoldenSignals:
         self.budget_exceeded.reset()
         self.budget_utilization.clear()
         self.requests_by_profile.clear()
+        self.adapter_cache_requests.clear()
+        self.adapter_cache_credits_saved.clear()
         self._start_time = time.time()
@@ -81,6 +81,8 @@ from .planning import (
     BudgetError,
 )
 
+from .tool_index import ToolRankingIndex
+
 from .audit import (
     # Audit Records
     DecisionRecord,
@@ -171,6 +173,7 @@ __all__ = [
     "PlanningStage",
     "ToolBudget",
     "BudgetError",
+    "ToolRankingIndex",
     
     # Audit Trail (Canonical)
     "DecisionRecord",
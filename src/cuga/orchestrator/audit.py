@@ -15,18 +15,25 @@ See docs/orchestrator/AUDIT_TRAIL.md for detailed architecture.
 
 from __future__ import annotations
 
+import atexit
 import json
+import logging
 import os
 import sqlite3
+import threading
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import asdict, dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from .planning import Plan, PlanStep, PlanningStage, ToolBudget
 from .routing import RoutingDecision
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class DecisionRecord:
@@ -173,48 +180,176 @@ class AuditBackend(ABC):
     def query_recent(self, limit: int = 100) -> List[DecisionRecord]:
         """Query most recent records."""
         ...
+    
+    def flush(self) -> None:
+        """Persist any buffered records (no-op for unbuffered backends)."""
+    
+    def close(self) -> None:
+        """Flush and release backend resources."""
+        self.flush()
 
 
 class JSONAuditBackend(AuditBackend):
     """
     JSON file-based audit backend.
     
-    Stores decision records as JSON lines in a file. Simple but
-    not suitable for high-volume production use.
+    Stores decision records as JSON lines. The active segment is
+    ``file_path``; once it reaches ``max_segment_bytes`` it is renamed to
+    ``<stem>.<n><suffix>`` and a new active segment is started.
+    
+    A sidecar index (``<file_path>.idx``, one ``[segment, offset, length,
+    trace_id, decision_type]`` line per record) maps traces and types to
+    byte ranges, so ``query_by_trace``/``query_by_type`` read only the
+    matching lines. ``query_recent`` reads segments backwards from the tail.
+    Appends made by other processes to the active segment are picked up on
+    the next query; rotation assumes a single writer.
     """
     
-    def __init__(self, file_path: Path | str):
+    _TAIL_BLOCK_BYTES = 64 * 1024
+    
+    def __init__(self, file_path: Path | str, max_segment_bytes: Optional[int] = 64 * 1024 * 1024):
         """
         Initialize JSON audit backend.
         
         Args:
-            file_path: Path to JSON audit file
+            file_path: Path to JSON audit file (the active segment)
+            max_segment_bytes: Rotate the active segment beyond this size (None disables rotation)
         """
         self.file_path = Path(file_path)
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_segment_bytes = max_segment_bytes
+        self.index_path = self.file_path.with_name(self.file_path.name + ".idx")
+        self._lock = threading.Lock()
+        self._by_trace: Dict[str, List[tuple[int, int, int]]] = {}
+        self._by_type: Dict[str, List[tuple[int, int, int]]] = {}
+        self._indexed_end: Dict[int, int] = {}
+        self._active_id = max(self._rotated_segment_ids(), default=0) + 1
+        self._load_index()
+    
+    # -- segments -------------------------------------------------------------
+    
+    def _segment_path(self, segment_id: int) -> Path:
+        if segment_id == self._active_id:
+            return self.file_path
+        return self.file_path.with_name(f"{self.file_path.stem}.{segment_id:06d}{self.file_path.suffix}")
+    
+    def _rotated_segment_ids(self) -> List[int]:
+        ids = []
+        prefix = f"{self.file_path.stem}."
+        for path in self.file_path.parent.glob(f"{self.file_path.stem}.*{self.file_path.suffix}"):
+            middle = path.name[len(prefix) : len(path.name) - len(self.file_path.suffix)]
+            if middle.isdigit():
+                ids.append(int(middle))
+        return sorted(ids)
+    
+    def _segment_ids(self) -> List[int]:
+        return [*self._rotated_segment_ids(), self._active_id]
+    
+    def _rotate(self) -> None:
+        self.file_path.rename(self.file_path.with_name(
+            f"{self.file_path.stem}.{self._active_id:06d}{self.file_path.suffix}"
+        ))
+        self._active_id += 1
+    
+    # -- index ----------------------------------------------------------------
+    
+    def _add_to_index(self, segment_id: int, offset: int, length: int, trace_id: str, decision_type: str) -> None:
+        entry = (segment_id, offset, length)
+        self._by_trace.setdefault(trace_id, []).append(entry)
+        self._by_type.setdefault(decision_type, []).append(entry)
+        self._indexed_end[segment_id] = max(self._indexed_end.get(segment_id, 0), offset + length)
+    
+    def _load_index(self) -> None:
+        if self.index_path.exists():
+            with open(self.index_path, "r") as f:
+                for line in f:
+                    try:
+                        segment_id, offset, length, trace_id, decision_type = json.loads(line)
+                    except (ValueError, TypeError):
+                        continue  # torn trailing line from an interrupted write
+                    self._add_to_index(segment_id, offset, length, trace_id, decision_type)
+        self._catch_up()
+    
+    def _catch_up(self) -> None:
+        """Index records appended to segments beyond what the sidecar covers."""
+        new_entries = []
+        for segment_id in self._segment_ids():
+            path = self._segment_path(segment_id)
+            if not path.exists():
+                continue
+            start = self._indexed_end.get(segment_id, 0)
+            if path.stat().st_size <= start:
+                continue
+            with open(path, "rb") as f:
+                f.seek(start)
+                offset = start
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        break  # partial line still being written
+                    if raw.strip():
+                        data = json.loads(raw)
+                        entry = [segment_id, offset, len(raw), data["trace_id"], data["decision_type"]]
+                        self._add_to_index(*entry)
+                        new_entries.append(entry)
+                    offset += len(raw)
+        if new_entries:
+            with open(self.index_path, "a") as f:
+                f.writelines(json.dumps(entry) + "\n" for entry in new_entries)
+    
+    def _read_entries(self, entries: List[tuple[int, int, int]]) -> List[DecisionRecord]:
+        records: List[DecisionRecord] = []
+        handles: Dict[int, Any] = {}
+        try:
+            for segment_id, offset, length in entries:
+                handle = handles.get(segment_id)
+                if handle is None:
+                    handle = handles[segment_id] = open(self._segment_path(segment_id), "rb")
+                handle.seek(offset)
+                records.append(DecisionRecord.from_dict(json.loads(handle.read(length))))
+        finally:
+            for handle in handles.values():
+                handle.close()
+        return records
+    
+    # -- AuditBackend ---------------------------------------------------------
     
     def store_record(self, record: DecisionRecord) -> None:
-        """Append record to JSON file."""
-        with open(self.file_path, "a") as f:
-            f.write(json.dumps(record.to_dict()) + "\n")
+        """Append record to the active segment and the sidecar index."""
+        line = (json.dumps(record.to_dict()) + "\n").encode("utf-8")
+        with self._lock:
+            with open(self.file_path, "ab") as f:
+                offset = f.seek(0, os.SEEK_END)
+                f.write(line)
+            if self._indexed_end.get(self._active_id, 0) != offset:
+                self._catch_up()  # another writer appended since our last look
+            else:
+                entry = [self._active_id, offset, len(line), record.trace_id, record.decision_type]
+                self._add_to_index(*entry)
+                with open(self.index_path, "a") as f:
+                    f.write(json.dumps(entry) + "\n")
+            if self.max_segment_bytes is not None and offset + len(line) >= self.max_segment_bytes:
+                self._rotate()
     
     def _read_records(self) -> List[DecisionRecord]:
-        """Read all records from file."""
-        if not self.file_path.exists():
-            return []
-        
+        """Read all records from every segment."""
         records: List[DecisionRecord] = []
-        with open(self.file_path, "r") as f:
-            for line in f:
-                if line.strip():
-                    data = json.loads(line)
-                    records.append(DecisionRecord.from_dict(data))
+        for segment_id in self._segment_ids():
+            path = self._segment_path(segment_id)
+            if not path.exists():
+                continue
+            with open(path, "r") as f:
+                for line in f:
+                    if line.strip():
+                        data = json.loads(line)
+                        records.append(DecisionRecord.from_dict(data))
         return records
     
     def query_by_trace(self, trace_id: str) -> List[DecisionRecord]:
         """Query records by trace ID."""
-        records = self._read_records()
-        return [r for r in records if r.trace_id == trace_id]
+        with self._lock:
+            self._catch_up()
+            entries = list(self._by_trace.get(trace_id, []))
+        return self._read_entries(entries)
     
     def query_by_type(
         self,
@@ -222,14 +357,62 @@ class JSONAuditBackend(AuditBackend):
         limit: int = 100,
     ) -> List[DecisionRecord]:
         """Query records by decision type."""
-        records = self._read_records()
-        filtered = [r for r in records if r.decision_type == decision_type]
-        return filtered[-limit:]
+        if limit <= 0:
+            return []
+        with self._lock:
+            self._catch_up()
+            entries = self._by_type.get(decision_type, [])[-limit:]
+        return self._read_entries(entries)
     
     def query_recent(self, limit: int = 100) -> List[DecisionRecord]:
-        """Query most recent records."""
-        records = self._read_records()
-        return records[-limit:]
+        """Query most recent records by reading segments backwards from the tail."""
+        if limit <= 0:
+            return []
+        with self._lock:
+            segment_ids = self._segment_ids()
+        lines: List[bytes] = []
+        for segment_id in reversed(segment_ids):
+            path = self._segment_path(segment_id)
+            if not path.exists():
+                continue
+            lines.extend(self._tail_lines(path, limit - len(lines)))
+            if len(lines) >= limit:
+                break
+        return [DecisionRecord.from_dict(json.loads(line)) for line in reversed(lines)]
+    
+    def _tail_lines(self, path: Path, count: int) -> List[bytes]:
+        """Return up to ``count`` complete non-empty lines from the end of ``path``, newest first."""
+        lines: List[bytes] = []
+        with open(path, "rb") as f:
+            position = f.seek(0, os.SEEK_END)
+            remainder = b""
+            # Ignore a trailing partial line that is still being written
+            if position:
+                f.seek(position - 1)
+                if f.read(1) != b"\n":
+                    while position > 0:
+                        step = min(self._TAIL_BLOCK_BYTES, position)
+                        f.seek(position - step)
+                        block = f.read(step)
+                        newline = block.rfind(b"\n")
+                        if newline >= 0:
+                            position = position - step + newline + 1
+                            break
+                        position -= step
+            while position > 0 and len(lines) < count:
+                step = min(self._TAIL_BLOCK_BYTES, position)
+                position -= step
+                f.seek(position)
+                chunk = f.read(step) + remainder
+                parts = chunk.split(b"\n")
+                remainder = parts[0] if position > 0 else b""
+                candidates = parts[1:] if position > 0 else parts
+                for line in reversed(candidates):
+                    if line.strip():
+                        lines.append(line)
+                        if len(lines) >= count:
+                            break
+        return lines
 
 
 class SQLiteAuditBackend(AuditBackend):
@@ -238,82 +421,260 @@ class SQLiteAuditBackend(AuditBackend):
     
     Stores decision records in SQLite database with indexed queries.
     Suitable for production use with moderate volume.
+    
+    A single long-lived connection in WAL mode is reused for all operations.
+    With ``write_behind=True``, ``store_record`` only enqueues the row; a
+    writer thread inserts pending rows with ``executemany`` in one
+    transaction every ``flush_interval_s`` seconds or once ``batch_size``
+    rows are waiting. Queries flush pending rows first, so reads still see
+    every stored record. The backend is closed at interpreter exit, so
+    queued records survive a normal shutdown; they are lost only if the
+    process is killed.
+    
+    Duplicate record IDs are ignored in both modes. A row SQLite rejects
+    (e.g. a NULL required column) is appended to the dead-letter log
+    ``<db_path>.deadletter.jsonl``: synchronous writes also raise, while a
+    write-behind batch that fails ``max_batch_failures`` times in a row is
+    retried row by row so one bad row cannot wedge the queue.
+    
+    ``retention_days`` / ``max_rows`` bound the table; ``compact()`` applies
+    them and runs every ``compaction_interval_s`` seconds when set.
     """
     
-    def __init__(self, db_path: Path | str):
+    _COLUMNS = (
+        "record_id, timestamp, trace_id, decision_type, stage, "
+        "target, reason, alternatives, confidence, metadata"
+    )
+    # ON CONFLICT (not OR IGNORE): only duplicate IDs are skipped; OR IGNORE would also
+    # silently drop rows violating NOT NULL instead of dead-lettering them
+    _INSERT = (
+        f"INSERT INTO decisions ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+        "ON CONFLICT(record_id) DO NOTHING"
+    )
+    
+    def __init__(
+        self,
+        db_path: Path | str,
+        write_behind: bool = False,
+        flush_interval_s: float = 0.5,
+        batch_size: int = 500,
+        retention_days: Optional[float] = None,
+        max_rows: Optional[int] = None,
+        compaction_interval_s: Optional[float] = None,
+        max_batch_failures: int = 3,
+        dead_letter_path: Optional[Path | str] = None,
+    ):
         """
         Initialize SQLite audit backend.
         
         Args:
             db_path: Path to SQLite database file
+            write_behind: Buffer writes and insert them from a writer thread
+            flush_interval_s: Maximum delay before buffered rows are written
+            batch_size: Pending rows that trigger an immediate write
+            retention_days: Delete records older than this many days on compaction
+            max_rows: Keep at most this many most recent records on compaction
+            compaction_interval_s: Run ``compact()`` periodically in the background
+            max_batch_failures: Failed attempts before a write-behind batch is retried row by row
+            dead_letter_path: JSONL file for rejected rows (default ``<db_path>.deadletter.jsonl``)
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.write_behind = write_behind
+        self.flush_interval_s = flush_interval_s
+        self.batch_size = max(1, batch_size)
+        self.retention_days = retention_days
+        self.max_rows = max_rows
+        self.compaction_interval_s = compaction_interval_s
+        self.max_batch_failures = max(1, max_batch_failures)
+        self.dead_letter_path = (
+            Path(dead_letter_path) if dead_letter_path else self.db_path.with_name(self.db_path.name + ".deadletter.jsonl")
+        )
+        self._batch_failures = 0
+        
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._pending: deque[tuple] = deque()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._writer: Optional[threading.Thread] = None
         self._init_db()
+        
+        if write_behind or compaction_interval_s:
+            self._writer = threading.Thread(target=self._writer_loop, name="cuga-audit-writer", daemon=True)
+            self._writer.start()
+            # The daemon writer is killed at exit; flush what it has not written yet
+            atexit.register(self.close)
     
     def _init_db(self) -> None:
         """Initialize database schema."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS decisions (
-                record_id TEXT PRIMARY KEY,
-                timestamp TEXT NOT NULL,
-                trace_id TEXT NOT NULL,
-                decision_type TEXT NOT NULL,
-                stage TEXT NOT NULL,
-                target TEXT NOT NULL,
-                reason TEXT NOT NULL,
-                alternatives TEXT,
-                confidence REAL,
-                metadata TEXT
-            )
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_trace_id ON decisions(trace_id)
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_decision_type ON decisions(decision_type)
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_timestamp ON decisions(timestamp)
-        """)
-        
-        conn.commit()
-        conn.close()
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS decisions (
+                    record_id TEXT PRIMARY KEY,
+                    timestamp TEXT NOT NULL,
+                    trace_id TEXT NOT NULL,
+                    decision_type TEXT NOT NULL,
+                    stage TEXT NOT NULL,
+                    target TEXT NOT NULL,
+                    reason TEXT NOT NULL,
+                    alternatives TEXT,
+                    confidence REAL,
+                    metadata TEXT
+                )
+            """)
+            
+            # Composite indexes serve both the filter and the ORDER BY of
+            # query_by_trace/query_by_type; they supersede the single-column ones.
+            cursor.execute("DROP INDEX IF EXISTS idx_trace_id")
+            cursor.execute("DROP INDEX IF EXISTS idx_decision_type")
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_trace_timestamp ON decisions(trace_id, timestamp)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_type_timestamp ON decisions(decision_type, timestamp)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_timestamp ON decisions(timestamp)
+            """)
+            
+            self._conn.commit()
+    
+    @staticmethod
+    def _record_to_row(record: DecisionRecord) -> tuple:
+        return (
+            record.record_id,
+            record.timestamp,
+            record.trace_id,
+            record.decision_type,
+            record.stage,
+            record.target,
+            record.reason,
+            json.dumps(record.alternatives),
+            record.confidence,
+            json.dumps(record.metadata),
+        )
     
     def store_record(self, record: DecisionRecord) -> None:
-        """Store record in database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        """Store record in database (or enqueue it in write-behind mode)."""
+        row = self._record_to_row(record)
+        if self.write_behind:
+            self._pending.append(row)
+            if len(self._pending) >= self.batch_size:
+                self._wake.set()
+            return
         
-        cursor.execute(
-            """
-            INSERT INTO decisions (
-                record_id, timestamp, trace_id, decision_type, stage,
-                target, reason, alternatives, confidence, metadata
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                record.record_id,
-                record.timestamp,
-                record.trace_id,
-                record.decision_type,
-                record.stage,
-                record.target,
-                record.reason,
-                json.dumps(record.alternatives),
-                record.confidence,
-                json.dumps(record.metadata),
-            ),
-        )
+        with self._lock:
+            try:
+                with self._conn:
+                    self._conn.execute(self._INSERT, row)
+            except sqlite3.Error as exc:
+                self._dead_letter(row, exc)
+                raise
+    
+    def flush(self) -> None:
+        """Write all buffered records, one transaction per batch."""
+        with self._lock:
+            while self._pending:
+                batch = list(islice(self._pending, self.batch_size))
+                try:
+                    with self._conn:
+                        self._conn.executemany(self._INSERT, batch)
+                except sqlite3.Error:
+                    self._batch_failures += 1
+                    if self._batch_failures < self.max_batch_failures:
+                        raise
+                    # Persistent failure: isolate the offending rows instead of retrying forever
+                    self._insert_rows_individually(batch)
+                self._batch_failures = 0
+                # Drop rows only once committed (or dead-lettered) so a failed batch is retried
+                for _ in batch:
+                    self._pending.popleft()
+    
+    def _insert_rows_individually(self, rows: List[tuple]) -> None:
+        for row in rows:
+            try:
+                with self._conn:
+                    self._conn.execute(self._INSERT, row)
+            except sqlite3.Error as exc:
+                self._dead_letter(row, exc)
+    
+    def _dead_letter(self, row: tuple, error: Exception) -> None:
+        columns = [column.strip() for column in self._COLUMNS.split(",")]
+        entry = {
+            "failed_at": datetime.now(timezone.utc).isoformat(),
+            "error": f"{type(error).__name__}: {error}",
+            "record": dict(zip(columns, row)),
+        }
+        with open(self.dead_letter_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, default=str) + "\n")
+        logger.error(f"Audit record {row[0]} rejected ({error}); written to {self.dead_letter_path}")
+    
+    def _writer_loop(self) -> None:
+        next_compaction = self._next_compaction()
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval_s if self.write_behind else self.compaction_interval_s)
+            self._wake.clear()
+            try:
+                self.flush()
+                if next_compaction is not None and datetime.now(timezone.utc).timestamp() >= next_compaction:
+                    self.compact()
+                    next_compaction = self._next_compaction()
+            except Exception:
+                # Keep the writer alive; an exiting thread would silently stop all audit writes
+                logger.exception("Audit writer failed; pending records kept for retry")
+    
+    def _next_compaction(self) -> Optional[float]:
+        if not self.compaction_interval_s:
+            return None
+        return datetime.now(timezone.utc).timestamp() + self.compaction_interval_s
+    
+    def compact(self, vacuum: bool = False) -> int:
+        """
+        Apply retention limits and checkpoint the WAL.
         
-        conn.commit()
-        conn.close()
+        Args:
+            vacuum: Also rebuild the database file to reclaim space
+            
+        Returns:
+            Number of deleted records
+        """
+        self.flush()
+        deleted = 0
+        with self._lock:
+            with self._conn:
+                if self.retention_days is not None:
+                    cutoff = (datetime.now(timezone.utc) - timedelta(days=self.retention_days)).isoformat()
+                    deleted += self._conn.execute("DELETE FROM decisions WHERE timestamp < ?", (cutoff,)).rowcount
+                if self.max_rows is not None:
+                    deleted += self._conn.execute(
+                        """
+                        DELETE FROM decisions WHERE record_id IN (
+                            SELECT record_id FROM decisions ORDER BY timestamp DESC LIMIT -1 OFFSET ?
+                        )
+                    """,
+                        (self.max_rows,),
+                    ).rowcount
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            if vacuum:
+                self._conn.execute("VACUUM")
+        return deleted
+    
+    def close(self) -> None:
+        """Stop the writer thread, flush pending records and close the connection."""
+        if self._writer is not None:
+            atexit.unregister(self.close)
+            self._stop.set()
+            self._wake.set()
+            self._writer.join(timeout=5.0)
+            self._writer = None
+        self.flush()
+        with self._lock:
+            self._conn.close()
     
     def _row_to_record(self, row: tuple) -> DecisionRecord:
         """Convert database row to DecisionRecord."""
@@ -330,21 +691,22 @@ class SQLiteAuditBackend(AuditBackend):
             metadata=json.loads(row[9]) if row[9] else {},
         )
     
+    def _query(self, sql: str, params: tuple) -> List[DecisionRecord]:
+        try:
+            self.flush()
+        except sqlite3.Error:
+            # A failing batch stays queued for the writer; still answer from what is stored
+            logger.exception("Audit flush before query failed")
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._row_to_record(row) for row in rows]
+    
     def query_by_trace(self, trace_id: str) -> List[DecisionRecord]:
         """Query records by trace ID."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            """
-            SELECT * FROM decisions WHERE trace_id = ? ORDER BY timestamp
-        """,
+        return self._query(
+            f"SELECT {self._COLUMNS} FROM decisions WHERE trace_id = ? ORDER BY timestamp",
             (trace_id,),
         )
-        
-        records = [self._row_to_record(row) for row in cursor.fetchall()]
-        conn.close()
-        return records
     
     def query_by_type(
         self,
@@ -352,38 +714,17 @@ class SQLiteAuditBackend(AuditBackend):
         limit: int = 100,
     ) -> List[DecisionRecord]:
         """Query records by decision type."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            """
-            SELECT * FROM decisions 
-            WHERE decision_type = ? 
-            ORDER BY timestamp DESC 
-            LIMIT ?
-        """,
+        return self._query(
+            f"SELECT {self._COLUMNS} FROM decisions WHERE decision_type = ? ORDER BY timestamp DESC LIMIT ?",
             (decision_type, limit),
         )
-        
-        records = [self._row_to_record(row) for row in cursor.fetchall()]
-        conn.close()
-        return records
     
     def query_recent(self, limit: int = 100) -> List[DecisionRecord]:
         """Query most recent records."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute(
-            """
-            SELECT * FROM decisions ORDER BY timestamp DESC LIMIT ?
-        """,
+        return self._query(
+            f"SELECT {self._COLUMNS} FROM decisions ORDER BY timestamp DESC LIMIT ?",
             (limit,),
         )
-        
-        records = [self._row_to_record(row) for row in cursor.fetchall()]
-        conn.close()
-        return records
 
 
 class AuditTrail:
@@ -399,6 +740,7 @@ class AuditTrail:
         backend: Optional[AuditBackend] = None,
         backend_type: str = "json",
         storage_path: Optional[Path | str] = None,
+        write_behind: bool = False,
     ):
         """
         Initialize audit trail.
@@ -407,6 +749,7 @@ class AuditTrail:
             backend: Explicit backend instance (overrides backend_type/storage_path)
             backend_type: Backend type ("json" or "sqlite")
             storage_path: Storage path (default: ./audit/decisions.{json|db})
+            write_behind: Buffer SQLite writes in a background writer thread
         """
         if backend is not None:
             self.backend = backend
@@ -418,7 +761,7 @@ class AuditTrail:
                     storage_path = Path("audit/decisions.jsonl")
             
             if backend_type == "sqlite":
-                self.backend = SQLiteAuditBackend(storage_path)
+                self.backend = SQLiteAuditBackend(storage_path, write_behind=write_behind)
             else:
                 self.backend = JSONAuditBackend(storage_path)
     
@@ -470,12 +813,21 @@ class AuditTrail:
     def get_recent(self, limit: int = 100) -> List[DecisionRecord]:
         """Get most recent decisions."""
         return self.backend.query_recent(limit)
+    
+    def flush(self) -> None:
+        """Persist records buffered by the backend."""
+        self.backend.flush()
+    
+    def close(self) -> None:
+        """Flush and close the backend."""
+        self.backend.close()
 
 
 # Convenience function for creating default audit trail
 def create_audit_trail(
     backend_type: str = "sqlite",
     storage_path: Optional[Path | str] = None,
+    write_behind: Optional[bool] = None,
 ) -> AuditTrail:
     """
     Create audit trail with default configuration.
@@ -483,6 +835,7 @@ def create_audit_trail(
     Args:
         backend_type: Backend type ("json" or "sqlite")
         storage_path: Storage path (default based on backend_type)
+        write_behind: Buffer SQLite writes (default: CUGA_AUDIT_WRITE_BEHIND)
         
     Returns:
         Configured AuditTrail instance
@@ -491,5 +844,7 @@ def create_audit_trail(
     env_path = os.environ.get("CUGA_AUDIT_PATH")
     if env_path:
         storage_path = Path(env_path)
+    if write_behind is None:
+        write_behind = os.environ.get("CUGA_AUDIT_WRITE_BEHIND", "false").lower() == "true"
     
-    return AuditTrail(backend_type=backend_type, storage_path=storage_path)
+    return AuditTrail(backend_type=backend_type, storage_path=storage_path, write_behind=write_behind)
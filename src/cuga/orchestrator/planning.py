@@ -19,9 +19,11 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 from datetime import datetime, timezone
 
+from .tool_index import ToolRankingIndex
+
 
 class PlanningStage(str, Enum):
     """State machine stages for Plan → Route → Execute transitions."""
@@ -342,12 +344,21 @@ class ToolRankingPlanner(PlanningAuthority):
     
     Ranks available tools by capability overlap with goal, then
     selects top-k tools within budget constraints.
+    
+    Ranking goes through a ToolRankingIndex so tool text is tokenized once.
+    A shared index (e.g. a ToolRegistry's) is used when constraints do not
+    list available tools; listed tools are synced into a private index that
+    only re-tokenizes tools whose name/description changed. The shared index
+    may be given as a provider (e.g. ``lambda: registry.ranking_index``) so
+    every plan sees the owner's reconciled index.
     """
     
     def __init__(
         self,
         max_steps: int = 10,
         default_budget: Optional[ToolBudget] = None,
+        tool_index: Optional[Union[ToolRankingIndex, Callable[[], ToolRankingIndex]]] = None,
+        scoring: str = "overlap",
     ):
         """
         Initialize tool ranking planner.
@@ -355,9 +366,22 @@ class ToolRankingPlanner(PlanningAuthority):
         Args:
             max_steps: Maximum steps per plan
             default_budget: Default budget if none provided
+            tool_index: Shared ranking index (or provider of it) used when no tools
+                are passed in constraints
+            scoring: Scoring mode for ranking ("overlap", "tfidf", "bm25")
         """
         self.max_steps = max_steps
         self.default_budget = default_budget or ToolBudget()
+        self._tool_index = tool_index
+        self.scoring = scoring
+        self._constraint_index = ToolRankingIndex(scoring=scoring)
+    
+    @property
+    def tool_index(self) -> Optional[ToolRankingIndex]:
+        """Shared ranking index (resolved through its provider, if one was given)."""
+        if callable(self._tool_index):
+            return self._tool_index()
+        return self._tool_index
     
     def create_plan(
         self,
@@ -369,7 +393,6 @@ class ToolRankingPlanner(PlanningAuthority):
     ) -> Plan:
         """Create plan by ranking tools by goal similarity."""
         import uuid
-        import re
         
         if not goal:
             raise ValueError("Goal cannot be empty")
@@ -377,13 +400,21 @@ class ToolRankingPlanner(PlanningAuthority):
         budget = budget or self.default_budget
         constraints = constraints or {}
         
-        # Extract keywords from goal
-        keywords = set(re.split(r"\W+", goal.lower()))
-        keywords.discard("")
-        
-        # Get available tools from constraints (or use default)
+        # Get available tools from constraints, the shared index, or default
         available_tools = constraints.get("available_tools", [])
-        if not available_tools:
+        if available_tools:
+            index = self._constraint_index
+            index.sync(
+                (
+                    tool.get("name", ""),
+                    f"{tool.get('name', '')} {tool.get('description', '')}",
+                    tool,
+                )
+                for tool in available_tools
+            )
+        elif (shared_index := self.tool_index) is not None and len(shared_index):
+            index = shared_index
+        else:
             # Default fallback tool
             available_tools = [
                 {
@@ -393,19 +424,20 @@ class ToolRankingPlanner(PlanningAuthority):
                     "tokens": 10,
                 }
             ]
+            index = self._constraint_index
+            index.sync(
+                (tool["name"], f"{tool['name']} {tool['description']}", tool)
+                for tool in available_tools
+            )
         
-        # Rank tools by keyword overlap
-        ranked_tools = []
-        for tool in available_tools:
-            tool_text = f"{tool.get('name', '')} {tool.get('description', '')}".lower()
-            tool_words = set(re.split(r"\W+", tool_text))
-            overlap = len(keywords.intersection(tool_words))
-            score = overlap / max(len(keywords), 1)
-            
-            if score > 0 or not ranked_tools:  # Include at least one tool
-                ranked_tools.append((score, tool))
-        
-        ranked_tools.sort(key=lambda x: x[0], reverse=True)
+        # Rank tools by indexed keyword scoring
+        ranked_tools = [
+            (score, _tool_as_dict(payload))
+            for payload, score in index.rank(goal, scoring=self.scoring)
+        ]
+        first_tool = _tool_as_dict(index.first())
+        if not any(tool["name"] == first_tool["name"] for _, tool in ranked_tools):
+            ranked_tools.append((0.0, first_tool))  # Include at least one tool
         
         # Select tools within budget
         steps: List[PlanStep] = []
@@ -460,7 +492,7 @@ class ToolRankingPlanner(PlanningAuthority):
             trace_id=trace_id,
             profile=profile,
             metadata={
-                "available_tool_count": len(available_tools),
+                "available_tool_count": len(available_tools) or len(index),
                 "selected_step_count": len(steps),
                 "estimated_cost": cumulative_cost,
                 "estimated_tokens": cumulative_tokens,
@@ -483,10 +515,24 @@ class ToolRankingPlanner(PlanningAuthority):
         return True
 
 
+def _tool_as_dict(tool: Any) -> Dict[str, Any]:
+    """Normalize indexed payloads (dicts or ToolSpec-like objects) to planner dicts."""
+    if isinstance(tool, dict):
+        return tool
+    return {
+        "name": getattr(tool, "name", "unknown"),
+        "description": getattr(tool, "description", ""),
+        "cost": getattr(tool, "cost", 0.1),
+        "tokens": getattr(tool, "tokens", 10),
+    }
+
+
 # Convenience function for creating default planning authority
 def create_planning_authority(
     max_steps: int = 10,
     budget: Optional[ToolBudget] = None,
+    tool_index: Optional[Union[ToolRankingIndex, Callable[[], ToolRankingIndex]]] = None,
+    scoring: str = "overlap",
 ) -> PlanningAuthority:
     """
     Create planning authority with default configuration.
@@ -494,8 +540,16 @@ def create_planning_authority(
     Args:
         max_steps: Maximum steps per plan
         budget: Default budget
+        tool_index: Shared tool ranking index, or a provider of it
+            (e.g. ``lambda: registry.ranking_index``)
+        scoring: Tool scoring mode ("overlap", "tfidf", "bm25")
         
     Returns:
         Configured PlanningAuthority instance
     """
-    return ToolRankingPlanner(max_steps=max_steps, default_budget=budget)
+    return ToolRankingPlanner(
+        max_steps=max_steps,
+        default_budget=budget,
+        tool_index=tool_index,
+        scoring=scoring,
+    )
@@ -0,0 +1,229 @@
+"""
+Tool Ranking Index
+
+Inverted index used by planners to rank tools against a goal without
+re-tokenizing every tool description on each planning call.
+
+Key Principles:
+1. Tokenize Once: Tool text is tokenized when a tool is added, never per query
+2. Incremental Updates: Adding/removing a tool touches only that tool's postings
+3. Deterministic Ranking: Ties are broken by insertion order (registry order)
+4. Pluggable Scoring: "overlap" (legacy keyword overlap), "tfidf", or "bm25"
+
+Query cost is O(query terms × postings length) instead of
+O(tools × description length).
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+_TOKEN_SPLIT = re.compile(r"\W+")
+
+SCORING_MODES = ("overlap", "tfidf", "bm25")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase and split text on non-word characters, dropping empty tokens."""
+    return [token for token in _TOKEN_SPLIT.split(text.lower()) if token]
+
+
+@dataclass
+class _IndexedTool:
+    """Per-tool document statistics (computed once at insert time)."""
+
+    text: str
+    payload: Any
+    term_counts: Dict[str, int]
+    length: int
+    order: int
+
+
+class ToolRankingIndex:
+    """
+    Token → tool postings with precomputed corpus statistics.
+
+    Keys are any hashable identifying a tool (registry object id, tool name).
+    Payloads are returned from `rank()` untouched, so callers can index
+    ToolSpec objects, dicts, or anything else.
+    """
+
+    def __init__(self, scoring: str = "overlap", k1: float = 1.2, b: float = 0.75):
+        """
+        Initialize empty index.
+
+        Args:
+            scoring: Default scoring mode ("overlap", "tfidf", "bm25")
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalization
+        """
+        if scoring not in SCORING_MODES:
+            raise ValueError(f"Unknown scoring mode '{scoring}', expected one of {SCORING_MODES}")
+        self.scoring = scoring
+        self.k1 = k1
+        self.b = b
+        self._docs: Dict[Hashable, _IndexedTool] = {}
+        self._postings: Dict[str, Dict[Hashable, int]] = {}
+        self._total_length = 0
+        self._next_order = 0
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._docs
+
+    def add(self, key: Hashable, text: str, payload: Any = None) -> None:
+        """
+        Add or replace a tool.
+
+        Replacing a tool with unchanged text only swaps the payload and
+        keeps its position; changed text re-tokenizes that tool only.
+        """
+        existing = self._docs.get(key)
+        if existing is not None:
+            if existing.text == text:
+                existing.payload = payload
+                return
+            order = existing.order
+            self._remove_postings(key, existing)
+        else:
+            order = self._next_order
+            self._next_order += 1
+
+        tokens = tokenize(text)
+        term_counts: Dict[str, int] = {}
+        for token in tokens:
+            term_counts[token] = term_counts.get(token, 0) + 1
+
+        self._docs[key] = _IndexedTool(
+            text=text,
+            payload=payload,
+            term_counts=term_counts,
+            length=len(tokens),
+            order=order,
+        )
+        for token, count in term_counts.items():
+            self._postings.setdefault(token, {})[key] = count
+        self._total_length += len(tokens)
+        self.version += 1
+
+    def remove(self, key: Hashable) -> bool:
+        """Remove a tool. Returns False if the key was not indexed."""
+        doc = self._docs.pop(key, None)
+        if doc is None:
+            return False
+        self._remove_postings(key, doc)
+        self.version += 1
+        return True
+
+    def sync(self, entries: Iterable[Tuple[Hashable, str, Any]]) -> None:
+        """
+        Reconcile the index with an ordered collection of (key, text, payload).
+
+        Only added, removed, or re-described tools are re-tokenized. Ranking
+        tie-break order follows the order of `entries`.
+        """
+        seen: Dict[Hashable, int] = {}
+        for position, (key, text, payload) in enumerate(entries):
+            if key in seen:
+                continue
+            seen[key] = position
+            self.add(key, text, payload)
+
+        for key in [key for key in self._docs if key not in seen]:
+            self.remove(key)
+
+        for key, position in seen.items():
+            self._docs[key].order = position
+        self._next_order = len(seen)
+
+    def clear(self) -> None:
+        """Drop all indexed tools."""
+        self._docs.clear()
+        self._postings.clear()
+        self._total_length = 0
+        self._next_order = 0
+        self.version += 1
+
+    def first(self) -> Optional[Any]:
+        """Return the payload of the earliest-ordered tool, if any."""
+        if not self._docs:
+            return None
+        return min(self._docs.values(), key=lambda doc: doc.order).payload
+
+    def rank(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        scoring: Optional[str] = None,
+    ) -> List[Tuple[Any, float]]:
+        """
+        Rank tools against a query.
+
+        Args:
+            query: Free-text goal
+            limit: Return at most this many results
+            scoring: Override default scoring mode
+
+        Returns:
+            (payload, score) pairs with score > 0, best first, ties in index order
+        """
+        mode = scoring or self.scoring
+        if mode not in SCORING_MODES:
+            raise ValueError(f"Unknown scoring mode '{mode}', expected one of {SCORING_MODES}")
+
+        terms = set(tokenize(query))
+        if not terms or not self._docs:
+            return []
+
+        scores: Dict[Hashable, float] = {}
+        if mode == "overlap":
+            for term in terms:
+                for key in self._postings.get(term, ()):
+                    scores[key] = scores.get(key, 0.0) + 1.0
+            norm = float(len(terms))
+            for key in scores:
+                scores[key] /= norm
+        else:
+            doc_count = len(self._docs)
+            avg_length = self._total_length / doc_count if doc_count else 0.0
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                df = len(postings)
+                if mode == "tfidf":
+                    idf = math.log(1.0 + doc_count / df)
+                    for key, tf in postings.items():
+                        scores[key] = scores.get(key, 0.0) + tf * idf
+                else:
+                    idf = math.log(1.0 + (doc_count - df + 0.5) / (df + 0.5))
+                    for key, tf in postings.items():
+                        length = self._docs[key].length
+                        denom = tf + self.k1 * (
+                            1.0 - self.b + self.b * (length / avg_length if avg_length else 0.0)
+                        )
+                        scores[key] = scores.get(key, 0.0) + idf * (tf * (self.k1 + 1.0)) / denom
+
+        ranked_keys = sorted(
+            (key for key, score in scores.items() if score > 0),
+            key=lambda key: (-scores[key], self._docs[key].order),
+        )
+        if limit is not None:
+            ranked_keys = ranked_keys[:limit]
+        return [(self._docs[key].payload, scores[key]) for key in ranked_keys]
+
+    def _remove_postings(self, key: Hashable, doc: _IndexedTool) -> None:
+        for token in doc.term_counts:
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(key, None)
+            if not postings:
+                del self._postings[token]
+        self._total_length -= doc.length
@@ -76,6 +76,16 @@ class SafeClient:
             f"follow_redirects={follow_redirects}"
         )
     
+    @property
+    def base_url(self) -> httpx.URL:
+        """Base URL prepended to relative request URLs."""
+        return self._client.base_url
+    
+    @property
+    def headers(self) -> httpx.Headers:
+        """Default headers sent with every request."""
+        return self._client.headers
+    
     @RETRY_POLICY
     def get(self, url: str, **kwargs: Any) -> httpx.Response:
         """
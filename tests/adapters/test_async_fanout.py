@@ -0,0 +1,136 @@
+"""
+Unit tests for async adapters and multi-vendor fan-out.
+
+Tests cover:
+- AsyncAdapter over synchronous adapters
+- Concurrent execution across vendors (max instead of sum of latencies)
+- Per-vendor concurrency caps, including calls abandoned at a deadline
+- Deadline with partial results
+- Per-vendor/key error reporting
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from cuga.adapters.sales.async_adapter import AsyncAdapter, as_async, fan_out
+from cuga.adapters.sales.mock_adapter import MockAdapter
+from cuga.adapters.sales.protocol import AdapterConfig, AdapterMode
+
+
+class SlowAdapter:
+    """Synchronous adapter with a fixed latency per call."""
+    
+    def __init__(self, delay: float, fail_for=()):
+        self.delay = delay
+        self.fail_for = set(fail_for)
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+    
+    def fetch_contacts(self, account_id):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if account_id in self.fail_for:
+                raise ValueError(f"unknown account {account_id}")
+            return [{"id": f"{account_id}-contact"}]
+        finally:
+            with self._lock:
+                self.active -= 1
+    
+    def get_mode(self):
+        return AdapterMode.LIVE
+
+
+def test_async_adapter_wraps_mock_adapter():
+    """Test AsyncAdapter exposes the sync adapter through awaitables."""
+    mock = MockAdapter(vendor="ibm_sales_cloud", config=AdapterConfig(mode=AdapterMode.MOCK, credentials={}))
+    adapter = AsyncAdapter(mock)
+    
+    async def run():
+        return await adapter.fetch_accounts(), await adapter.validate_connection()
+    
+    accounts, valid = asyncio.run(run())
+    
+    assert accounts == mock.fetch_accounts()
+    assert valid is True
+    assert adapter.get_mode() == AdapterMode.MOCK
+    assert as_async(adapter) is adapter
+
+
+def test_vendors_run_concurrently():
+    """Test fan-out latency is close to the slowest vendor, not the sum."""
+    adapters = {"a": SlowAdapter(0.2), "b": SlowAdapter(0.2), "c": SlowAdapter(0.2)}
+    
+    result = asyncio.run(fan_out(adapters, "fetch_contacts", ["acct1", "acct2"], concurrency=2))
+    
+    assert result.complete
+    assert result.elapsed_seconds < 0.5  # serial would take 1.2s
+    assert result.for_key("acct1") == {vendor: [{"id": "acct1-contact"}] for vendor in adapters}
+
+
+def test_per_vendor_concurrency_cap():
+    """Test no vendor sees more in-flight calls than its cap."""
+    capped, uncapped = SlowAdapter(0.05), SlowAdapter(0.05)
+    keys = [f"acct{i}" for i in range(8)]
+    
+    result = asyncio.run(
+        fan_out({"capped": capped, "uncapped": uncapped}, "fetch_contacts", keys, concurrency={"capped": 1, "uncapped": 8})
+    )
+    
+    assert result.complete
+    assert capped.max_active == 1
+    assert uncapped.max_active > 1
+
+
+def test_abandoned_calls_count_against_the_cap():
+    """Test calls still running after a deadline keep their vendor slot."""
+    adapter = SlowAdapter(0.4)
+    
+    first = asyncio.run(fan_out({"crm": adapter}, "fetch_contacts", ["acct1"], concurrency=1, deadline=0.05))
+    second = asyncio.run(fan_out({"crm": adapter}, "fetch_contacts", ["acct2"], concurrency=1, deadline=2.0))
+    
+    assert first.timed_out == [("crm", "acct1")]
+    assert second.complete
+    assert adapter.max_active == 1
+    assert second.elapsed_seconds >= 0.3
+
+
+def test_deadline_returns_partial_results():
+    """Test slow vendors are reported as timed out while fast results are kept."""
+    adapters = {"fast": SlowAdapter(0.01), "slow": SlowAdapter(1.0)}
+    
+    result = asyncio.run(fan_out(adapters, "fetch_contacts", ["acct1"], deadline=0.3))
+    
+    assert result.results["fast"] == {"acct1": [{"id": "acct1-contact"}]}
+    assert result.results["slow"] == {}
+    assert result.timed_out == [("slow", "acct1")]
+    assert not result.complete
+    assert result.elapsed_seconds < 0.9
+
+
+def test_errors_are_reported_per_vendor_and_key():
+    """Test a failing call does not affect other vendors or keys."""
+    adapters = {"crm": SlowAdapter(0.0, fail_for={"bad"}), "intent": SlowAdapter(0.0)}
+    
+    result = asyncio.run(fan_out(adapters, "fetch_contacts", ["good", "bad"]))
+    
+    assert set(result.results["crm"]) == {"good"}
+    assert set(result.results["intent"]) == {"good", "bad"}
+    assert result.errors == {"crm": {"bad": "ValueError: unknown account bad"}}
+
+
+def test_unsupported_method_is_an_error():
+    """Test vendors without the requested method are reported, not raised."""
+    result = asyncio.run(fan_out({"crm": SlowAdapter(0.0)}, "enrich_company", ["acme.com"]))
+    
+    assert "NotImplementedError" in result.errors["crm"]["acme.com"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
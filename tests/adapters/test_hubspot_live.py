@@ -393,23 +393,19 @@ def test_fetch_contacts_success(mock_safe_client, valid_config):
         "results": [{"id": "contact1"}, {"id": "contact2"}],
     }
     
-    # Mock contact details responses
-    contact1_response = Mock()
-    contact1_response.status_code = 200
-    contact1_response.json.return_value = {
-        "id": "contact1",
-        "properties": {"email": "john@acme.com", "firstname": "John", "lastname": "Doe"},
-    }
-    
-    contact2_response = Mock()
-    contact2_response.status_code = 200
-    contact2_response.json.return_value = {
-        "id": "contact2",
-        "properties": {"email": "jane@acme.com", "firstname": "Jane", "lastname": "Smith"},
+    # Mock batch read response (results in arbitrary order)
+    batch_response = Mock()
+    batch_response.status_code = 200
+    batch_response.json.return_value = {
+        "results": [
+            {"id": "contact2", "properties": {"email": "jane@acme.com", "firstname": "Jane", "lastname": "Smith"}},
+            {"id": "contact1", "properties": {"email": "john@acme.com", "firstname": "John", "lastname": "Doe"}},
+        ],
     }
     
     mock_client_instance = Mock()
-    mock_client_instance.get.side_effect = [assoc_response, contact1_response, contact2_response]
+    mock_client_instance.get.return_value = assoc_response
+    mock_client_instance.post.return_value = batch_response
     mock_safe_client.return_value = mock_client_instance
     
     adapter = HubSpotLiveAdapter(valid_config)
@@ -420,6 +416,14 @@ def test_fetch_contacts_success(mock_safe_client, valid_config):
     assert len(contacts) == 2
     assert contacts[0]["email"] == "john@acme.com"
     assert contacts[1]["email"] == "jane@acme.com"
+    
+    # One association read + one batch read (no per-contact requests)
+    assert mock_client_instance.get.call_count == 1
+    mock_client_instance.post.assert_called_once()
+    path = mock_client_instance.post.call_args[0][0]
+    body = mock_client_instance.post.call_args[1]["json"]
+    assert path == "/crm/v3/objects/contacts/batch/read"
+    assert body["inputs"] == [{"id": "contact1"}, {"id": "contact2"}]
 
 
 @patch("cuga.adapters.sales.hubspot_live.SafeClient")
@@ -451,31 +455,33 @@ def test_fetch_opportunities_success(mock_safe_client, valid_config):
         "results": [{"id": "deal1"}, {"id": "deal2"}],
     }
     
-    # Mock deal details responses
-    deal1_response = Mock()
-    deal1_response.status_code = 200
-    deal1_response.json.return_value = {
-        "id": "deal1",
-        "properties": {
-            "dealname": "Enterprise Deal",
-            "amount": "250000",
-            "dealstage": "negotiation",
-        },
-    }
-    
-    deal2_response = Mock()
-    deal2_response.status_code = 200
-    deal2_response.json.return_value = {
-        "id": "deal2",
-        "properties": {
-            "dealname": "SMB Deal",
-            "amount": "50000",
-            "dealstage": "proposal",
-        },
+    # Mock deal batch read response
+    batch_response = Mock()
+    batch_response.status_code = 200
+    batch_response.json.return_value = {
+        "results": [
+            {
+                "id": "deal1",
+                "properties": {
+                    "dealname": "Enterprise Deal",
+                    "amount": "250000",
+                    "dealstage": "negotiation",
+                },
+            },
+            {
+                "id": "deal2",
+                "properties": {
+                    "dealname": "SMB Deal",
+                    "amount": "50000",
+                    "dealstage": "proposal",
+                },
+            },
+        ],
     }
     
     mock_client_instance = Mock()
-    mock_client_instance.get.side_effect = [assoc_response, deal1_response, deal2_response]
+    mock_client_instance.get.return_value = assoc_response
+    mock_client_instance.post.return_value = batch_response
     mock_safe_client.return_value = mock_client_instance
     
     adapter = HubSpotLiveAdapter(valid_config)
@@ -489,6 +495,107 @@ def test_fetch_opportunities_success(mock_safe_client, valid_config):
     assert deals[1]["name"] == "SMB Deal"
 
 
+def _batch_post(associations, records):
+    """Fake POST handler for association and object batch reads."""
+    calls = []
+    
+    def post(path, json=None):
+        calls.append((path, json))
+        response = Mock()
+        response.status_code = 200
+        ids = [item["id"] for item in json["inputs"]]
+        if "/associations/" in path:
+            results = [
+                {"from": {"id": company_id}, "to": [{"toObjectId": int(to)} for to in associations[company_id]]}
+                for company_id in ids if company_id in associations
+            ]
+        else:
+            results = [records[object_id] for object_id in ids if object_id in records]
+        response.json.return_value = {"results": results}
+        return response
+    
+    return post, calls
+
+
+@patch("cuga.adapters.sales.hubspot_live.SafeClient")
+def test_fetch_contacts_for_accounts_batches_requests(mock_safe_client, valid_config):
+    """Test multi-company contact loads use batch association and batch object reads."""
+    associations = {"1": ["11", "12"], "2": ["12", "21"]}
+    records = {
+        object_id: {"id": object_id, "properties": {"email": f"{object_id}@acme.com"}}
+        for object_id in ("11", "12", "21")
+    }
+    post, calls = _batch_post(associations, records)
+    
+    adapter = HubSpotLiveAdapter(valid_config)
+    adapter.client = Mock()
+    adapter.client.post.side_effect = post
+    
+    grouped = adapter.fetch_contacts_for_accounts(["1", "2", "3"])
+    
+    assert [c["id"] for c in grouped["1"]] == ["11", "12"]
+    assert [c["id"] for c in grouped["2"]] == ["12", "21"]
+    assert grouped["3"] == []
+    assert [path for path, _ in calls] == [
+        "/crm/v4/associations/companies/contacts/batch/read",
+        "/crm/v3/objects/contacts/batch/read",
+    ]
+    assert calls[1][1]["inputs"] == [{"id": "11"}, {"id": "12"}, {"id": "21"}]
+    adapter.client.get.assert_not_called()
+
+
+@patch("cuga.adapters.sales.hubspot_live.SafeClient")
+def test_batch_read_is_chunked_at_api_maximum(mock_safe_client, valid_config):
+    """Test batch reads never exceed 100 inputs per request."""
+    records = {str(i): {"id": str(i), "properties": {}} for i in range(250)}
+    post, calls = _batch_post({}, records)
+    
+    adapter = HubSpotLiveAdapter(valid_config)
+    adapter.client = Mock()
+    adapter.client.post.side_effect = post
+    
+    results = adapter._batch_read("contacts", list(records), ["email"], concurrent=True)
+    
+    assert [r["id"] for r in results] == list(records)
+    assert sorted(len(body["inputs"]) for _, body in calls) == [50, 100, 100]
+
+
+@patch("cuga.adapters.sales.hubspot_live.time.sleep")
+@patch("cuga.adapters.sales.hubspot_live.SafeClient")
+def test_rate_limit_honors_retry_after(mock_safe_client, mock_sleep, valid_config):
+    """Test 429 responses are waited out using Retry-After instead of raising."""
+    limited = Mock()
+    limited.status_code = 429
+    limited.headers = {"Retry-After": "2"}
+    ok = Mock()
+    ok.status_code = 200
+    ok.json.return_value = {"results": []}
+    
+    adapter = HubSpotLiveAdapter(valid_config)
+    adapter.client = Mock()
+    adapter.client.post.side_effect = [limited, ok]
+    
+    assert adapter._batch_read("contacts", ["1"], ["email"]) == []
+    assert adapter.client.post.call_count == 2
+    assert 0 < mock_sleep.call_args[0][0] <= 2
+
+
+@patch("cuga.adapters.sales.hubspot_live.time.sleep")
+@patch("cuga.adapters.sales.hubspot_live.SafeClient")
+def test_rate_limit_gives_up_after_retries(mock_safe_client, mock_sleep, valid_config):
+    """Test persistent 429 responses still fail after bounded retries."""
+    limited = Mock()
+    limited.status_code = 429
+    limited.headers = {"Retry-After": "1"}
+    
+    adapter = HubSpotLiveAdapter(valid_config)
+    adapter.client = Mock()
+    adapter.client.post.return_value = limited
+    
+    with pytest.raises(Exception, match="Rate limit exceeded"):
+        adapter._batch_read("contacts", ["1"], ["email"])
+
+
 @patch("cuga.adapters.sales.hubspot_live.SafeClient")
 def test_fetch_buying_signals(mock_safe_client, valid_config):
     """Test buying signals derived from deals."""
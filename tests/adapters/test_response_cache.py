@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared sales adapter response cache.
+
+Tests cache keys, TTL/stale-while-revalidate, conditional revalidation,
+the SQLite tier and golden signal metrics without real vendor calls.
+"""
+
+import time
+
+import httpx
+import pytest
+
+from cuga.adapters.sales.response_cache import (
+    CachedClient,
+    CachePolicy,
+    ResponseCache,
+    canonicalize,
+)
+from cuga.observability.golden_signals import GoldenSignals
+
+
+class FakeClient:
+    """SafeClient double returning scripted responses and recording requests."""
+
+    base_url = httpx.URL("https://api.vendor.test")
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        return self._send("GET", url, kwargs)
+
+    def post(self, url, **kwargs):
+        return self._send("POST", url, kwargs)
+
+    def _send(self, method, url, kwargs):
+        self.calls.append((method, url, kwargs))
+        return self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+
+
+def _response(payload=None, status_code=200, headers=None):
+    return httpx.Response(status_code, json=payload, headers=headers)
+
+
+POLICIES = [
+    (r"^/companies$", CachePolicy("companies", ttl=60, stale_ttl=60, credits=2.0)),
+    (r"^/search$", CachePolicy("search", ttl=60, methods=("POST",))),
+]
+
+
+@pytest.fixture
+def signals(monkeypatch):
+    """Golden signals receiving cache metrics."""
+    signals = GoldenSignals()
+    collector = type("Collector", (), {"signals": signals})()
+    monkeypatch.setattr("cuga.observability.get_collector", lambda: collector)
+    return signals
+
+
+def _cached(client, tmp_path, policies=POLICIES):
+    return CachedClient(client, "vendor", cache=ResponseCache(str(tmp_path / "cache.db")), policies=policies)
+
+
+def test_repeated_read_is_served_from_cache(tmp_path, signals):
+    client = FakeClient(_response({"name": "Acme"}))
+    cached = _cached(client, tmp_path)
+
+    first = cached.get("/companies", params={"domain": "acme.com"})
+    second = cached.get("/companies", params={"domain": "acme.com"})
+
+    assert first.json() == second.json() == {"name": "Acme"}
+    assert len(client.calls) == 1
+    assert str(second.request.url) == "https://api.vendor.test/companies"
+    assert signals.adapter_cache_requests[("vendor", "companies", "miss")].get() == 1
+    assert signals.adapter_cache_requests[("vendor", "companies", "hit")].get() == 1
+    assert signals.adapter_cache_credits_saved["vendor"] == 2.0
+
+
+def test_key_ignores_param_order_and_case(tmp_path, signals):
+    client = FakeClient(_response({"name": "Acme"}))
+    cached = _cached(client, tmp_path)
+
+    cached.get("/companies", params={"domain": "Acme.com ", "size": 10, "key": "secret"})
+    cached.get("/companies", params={"key": "secret", "size": 10, "domain": "acme.com", "region": None})
+
+    assert len(client.calls) == 1
+
+
+def test_entries_are_not_shared_between_credentials(tmp_path, signals):
+    client = FakeClient(_response({"name": "Acme"}))
+    cache = ResponseCache(str(tmp_path / "cache.db"))
+    first = CachedClient(client, "vendor", cache=cache, policies=POLICIES, credential="key-1")
+    second = CachedClient(client, "vendor", cache=cache, policies=POLICIES, credential="key-2")
+
+    first.get("/companies")
+    second.get("/companies")
+    first.get("/companies", params={"key": "param-key-1"})
+    first.get("/companies", params={"key": "param-key-2"})
+    first.get("/companies", headers={"X-Api-Key": "header-key"})
+    first.get("/companies")
+
+    assert len(client.calls) == 5
+
+
+def test_canonicalize():
+    assert canonicalize({"b": [" X "], "email": "A@B.COM", "api_key": "k", "a": None}) == {
+        "b": ["X"],
+        "email": "a@b.com",
+    }
+
+
+def test_unmatched_requests_and_no_cache_bypass(tmp_path, signals):
+    client = FakeClient(_response({"ok": True}))
+    cached = _cached(client, tmp_path)
+
+    cached.get("/health")
+    cached.get("/health")
+    cached.get("/search")
+    cached.get("/companies", headers={"Cache-Control": "no-cache"})
+    cached.get("/companies", headers={"Cache-Control": "no-cache"})
+
+    assert len(client.calls) == 5
+    assert not signals.adapter_cache_requests
+
+
+def test_post_policy(tmp_path, signals):
+    client = FakeClient(_response({"results": [1]}))
+    cached = _cached(client, tmp_path)
+
+    cached.post("/search", json={"q": "acme", "page": 1})
+    cached.post("/search", json={"page": 1, "q": "acme"})
+    cached.post("/search", json={"page": 2, "q": "acme"})
+
+    assert len(client.calls) == 2
+
+
+def test_errors_are_not_cached(tmp_path, signals):
+    client = FakeClient(_response({"error": "rate limited"}, status_code=429), _response({"name": "Acme"}))
+    cached = _cached(client, tmp_path)
+
+    assert cached.get("/companies").status_code == 429
+    assert cached.get("/companies").json() == {"name": "Acme"}
+    assert len(client.calls) == 2
+
+
+def test_stale_entry_is_served_and_refreshed_in_background(tmp_path, signals):
+    client = FakeClient(_response({"v": 1}), _response({"v": 2}))
+    policies = [(r"^/companies$", CachePolicy("companies", ttl=0.05, stale_ttl=60))]
+    cached = _cached(client, tmp_path, policies)
+
+    cached.get("/companies")
+    time.sleep(0.1)
+
+    assert cached.get("/companies").json() == {"v": 1}
+    deadline = time.time() + 5
+    while not signals.adapter_cache_requests[("vendor", "companies", "refreshed")].get():
+        assert time.time() < deadline
+        time.sleep(0.01)
+    assert cached.get("/companies").json() == {"v": 2}
+    assert len(client.calls) == 2
+    assert signals.adapter_cache_requests[("vendor", "companies", "stale")].get() == 1
+
+
+def test_expired_entry_is_revalidated_with_etag(tmp_path, signals):
+    client = FakeClient(_response({"v": 1}, headers={"ETag": '"abc"'}), _response(status_code=304))
+    policies = [(r"^/companies$", CachePolicy("companies", ttl=0.05))]
+    cached = _cached(client, tmp_path, policies)
+
+    cached.get("/companies")
+    time.sleep(0.1)
+    response = cached.get("/companies")
+
+    assert response.status_code == 200
+    assert response.json() == {"v": 1}
+    assert client.calls[1][2]["headers"] == {"If-None-Match": '"abc"'}
+    assert signals.adapter_cache_requests[("vendor", "companies", "revalidated")].get() == 1
+    assert cached.get("/companies").json() == {"v": 1}
+    assert len(client.calls) == 2
+
+
+def test_disk_tier_survives_new_cache(tmp_path, signals):
+    client = FakeClient(_response({"name": "Acme"}))
+    _cached(client, tmp_path).get("/companies", params={"domain": "acme.com"})
+
+    again = _cached(client, tmp_path)
+
+    assert again.get("/companies", params={"domain": "acme.com"}).json() == {"name": "Acme"}
+    assert len(client.calls) == 1
+
+
+def test_invalidate_vendor(tmp_path, signals):
+    client = FakeClient(_response({"name": "Acme"}))
+    cached = _cached(client, tmp_path)
+
+    cached.get("/companies")
+    cached.cache.invalidate("vendor")
+    cached.get("/companies")
+
+    assert len(client.calls) == 2
+
+
+def test_ttl_override(tmp_path, monkeypatch):
+    monkeypatch.setenv("SALES_CACHE_TTL_VENDOR_COMPANIES", "5")
+
+    cached = _cached(FakeClient(_response({})), tmp_path)
+
+    assert cached._policies[0][1].ttl == 5.0
+
+
+def test_metrics_export(signals):
+    signals.record_adapter_cache("clearbit", "companies", "hit", 1.0)
+    signals.record_adapter_cache("clearbit", "companies", "miss")
+
+    assert signals.adapter_cache_hit_rate() == 50.0
+    assert signals.to_dict()["adapter_cache"]["credits_saved"] == {"clearbit": 1.0}
+    prometheus = signals.to_prometheus_format()
+    assert 'cuga_adapter_cache_requests_total{vendor="clearbit",entity="companies",outcome="hit"} 1' in prometheus
+    assert 'cuga_adapter_cache_credits_saved_total{vendor="clearbit"} 1' in prometheus
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -11,6 +11,7 @@ from datetime import datetime
 
 from cuga.adapters.sales.salesforce_live import SalesforceLiveAdapter
 from cuga.adapters.sales.protocol import AdapterConfig, AdapterMode
+from cuga.observability.events import EventType, StructuredEvent
 
 
 @pytest.fixture
@@ -264,5 +265,209 @@ class TestSalesforceAdapter:
         assert "SELECT" in call_args[1]["params"]["q"]
 
 
+class FakeSalesforceClient:
+    """SafeClient stand-in serving paged query results."""
+    
+    def __init__(self, pages, bulk_pages=None):
+        self.pages = pages
+        self.bulk_pages = bulk_pages or []
+        self.requests = []
+    
+    def get(self, url, params=None, headers=None):
+        self.requests.append((url, params))
+        response = Mock(status_code=200, headers={})
+        response.raise_for_status = Mock()
+        if url.endswith("/query"):
+            response.json.return_value = self.pages[0]
+        elif "/query/next-" in url:
+            response.json.return_value = self.pages[int(url.rsplit("-", 1)[1])]
+        elif url.endswith("/results"):
+            index = int(params.get("locator", 0))
+            response.text = self.bulk_pages[index]
+            response.headers = {"Sforce-Locator": str(index + 1) if index + 1 < len(self.bulk_pages) else "null"}
+        else:
+            response.json.return_value = {"id": "750JOB", "state": "JobComplete"}
+        return response
+    
+    def post(self, url, json=None):
+        self.requests.append((url, json))
+        response = Mock(status_code=200)
+        response.raise_for_status = Mock()
+        response.json.return_value = {"id": "750JOB", "state": "UploadComplete"}
+        return response
+
+
+def _query_pages(*record_pages):
+    return [
+        {
+            "records": records,
+            **({"nextRecordsUrl": f"/services/data/v58.0/query/next-{i + 1}"} if i + 1 < len(record_pages) else {}),
+        }
+        for i, records in enumerate(record_pages)
+    ]
+
+
+@pytest.fixture
+def emitted(monkeypatch):
+    """Observability events emitted by the adapter."""
+    events = []
+    monkeypatch.setattr("cuga.observability.emit_event", events.append)
+    return events
+
+
+@pytest.fixture
+def streaming_adapter(mock_adapter, emitted):
+    """Adapter whose observability events are captured instead of exported."""
+    return mock_adapter
+
+
+class TestSalesforceStreaming:
+    """Test paginated, batched and bulk reads."""
+    
+    def test_fetch_accounts_follows_next_records_url(self, streaming_adapter):
+        """Test all result pages are returned, not just the first."""
+        streaming_adapter.client = FakeSalesforceClient(
+            _query_pages([{"Id": "001A"}], [{"Id": "001B"}], [{"Id": "001C"}])
+        )
+        
+        accounts = streaming_adapter.fetch_accounts({"limit": 3})
+        
+        assert [a["id"] for a in accounts] == ["001A", "001B", "001C"]
+        assert len(streaming_adapter.client.requests) == 3
+    
+    def test_iter_accounts_is_lazy_and_unlimited(self, streaming_adapter):
+        """Test streaming pulls pages on demand and applies no default LIMIT."""
+        streaming_adapter.client = FakeSalesforceClient(
+            _query_pages([{"Id": "001A"}], [{"Id": "001B"}], [{"Id": "001C"}])
+        )
+        
+        stream = streaming_adapter.iter_accounts()
+        first = next(stream)
+        stream.close()
+        
+        assert first["id"] == "001A"
+        assert "LIMIT" not in streaming_adapter.client.requests[0][1]["q"]
+        assert len(streaming_adapter.client.requests) <= 2  # first page + prefetch
+    
+    def test_contacts_for_many_accounts_use_in_clause(self, streaming_adapter):
+        """Test multi-account loads are batched into IN queries."""
+        streaming_adapter.client = FakeSalesforceClient(
+            _query_pages([
+                {"Id": "003A", "AccountId": "001A"},
+                {"Id": "003B", "AccountId": "001B"},
+            ])
+        )
+        
+        grouped = streaming_adapter.fetch_contacts_for_accounts(["001A", "001B", "001C"])
+        
+        assert len(streaming_adapter.client.requests) == 1
+        assert "AccountId IN ('001A', '001B', '001C')" in streaming_adapter.client.requests[0][1]["q"]
+        assert [c["id"] for c in grouped["001A"]] == ["003A"]
+        assert grouped["001C"] == []
+    
+    def test_account_ids_are_chunked(self, streaming_adapter, monkeypatch):
+        """Test large account lists are split into several IN queries."""
+        monkeypatch.setattr("cuga.adapters.sales.salesforce_live.SOQL_IN_CHUNK_SIZE", 2)
+        streaming_adapter.client = FakeSalesforceClient(_query_pages([]))
+        
+        list(streaming_adapter.iter_opportunities(["001A", "001B", "001C", "001A"]))
+        
+        queries = [params["q"] for _, params in streaming_adapter.client.requests]
+        assert len(queries) == 2
+        assert "AccountId IN ('001A', '001B')" in queries[0]
+        assert "AccountId = '001C'" in queries[1]
+    
+    def test_account_ids_are_escaped(self, streaming_adapter):
+        """Test quotes in IDs cannot break out of the SOQL literal."""
+        query = streaming_adapter._build_contacts_query(["001' OR Name != '"])
+        
+        assert "AccountId = '001\\' OR Name != \\''" in query
+    
+    def test_bulk_query_parses_csv_pages(self, streaming_adapter):
+        """Test Bulk API 2.0 results are read page by page from CSV."""
+        streaming_adapter.client = FakeSalesforceClient(
+            pages=[],
+            bulk_pages=[
+                "Id,Name,Industry\n001A,Acme,Software\n",
+                "Id,Name,Industry\n001B,Globex,\n",
+            ],
+        )
+        
+        accounts = list(streaming_adapter.iter_accounts({"industry": "Software"}, bulk=True))
+        
+        assert [a["name"] for a in accounts] == ["Acme", "Globex"]
+        assert accounts[1]["industry"] is None
+        job_url, job = streaming_adapter.client.requests[0]
+        assert job_url.endswith("/jobs/query")
+        assert job["operation"] == "query"
+        assert "Industry = 'Software'" in job["query"]
+    
+    def test_bulk_and_rest_records_match(self, streaming_adapter):
+        """Test bulk CSV values are coerced to the types REST JSON returns."""
+        rest_record = {
+            "Id": "006A", "Name": "Renewal", "AccountId": "001A", "StageName": "Closed Lost",
+            "Amount": 15000.0, "Probability": 0.0, "CloseDate": "2024-03-31", "Type": None,
+            "LeadSource": None, "Description": None, "CreatedDate": "2024-01-01T00:00:00.000+0000",
+            "LastModifiedDate": "2024-03-31T00:00:00.000+0000", "IsClosed": True, "IsWon": False,
+        }
+        csv_page = (
+            "Id,Name,AccountId,StageName,Amount,Probability,CloseDate,Type,LeadSource,Description,"
+            "CreatedDate,LastModifiedDate,IsClosed,IsWon\n"
+            "006A,Renewal,001A,Closed Lost,15000.0,0,2024-03-31,,,,"
+            "2024-01-01T00:00:00.000+0000,2024-03-31T00:00:00.000+0000,true,false\n"
+        )
+        streaming_adapter.client = FakeSalesforceClient(_query_pages([rest_record]), bulk_pages=[csv_page])
+        
+        rest = list(streaming_adapter.iter_opportunities("001A"))
+        bulk = list(streaming_adapter.iter_opportunities("001A", bulk=True))
+        
+        assert bulk == rest
+        assert bulk[0]["is_won"] is False
+    
+    def test_bulk_account_numbers_are_coerced(self, streaming_adapter):
+        """Test revenue and employee counts from bulk CSV are numbers."""
+        streaming_adapter.client = FakeSalesforceClient(
+            pages=[],
+            bulk_pages=["Id,AnnualRevenue,NumberOfEmployees\n001A,2.5E7,120\n001B,,\n"],
+        )
+        
+        accounts = list(streaming_adapter.iter_accounts(bulk=True))
+        
+        assert accounts[0]["revenue"] == 25000000.0
+        assert accounts[0]["employee_count"] == 120
+        assert accounts[1]["revenue"] is None
+    
+    def test_bulk_query_emits_structured_events(self, streaming_adapter, emitted):
+        """Test bulk job events reach the collector as StructuredEvents."""
+        streaming_adapter.client = FakeSalesforceClient(pages=[], bulk_pages=["Id,Name\n001A,Acme\n"])
+        
+        list(streaming_adapter.iter_accounts(bulk=True))
+        
+        assert all(isinstance(event, StructuredEvent) for event in emitted)
+        bulk_events = [e for e in emitted if e.attributes["original_event_type"].startswith("adapter_bulk_job")]
+        assert [e.event_type for e in bulk_events] == [EventType.TOOL_CALL_START, EventType.TOOL_CALL_COMPLETE]
+        assert bulk_events[0].attributes["job_id"] == "750JOB"
+    
+    def test_exporter_errors_do_not_fail_bulk_query(self, mock_adapter, monkeypatch):
+        """Test a failing exporter does not break the bulk read."""
+        monkeypatch.setattr("cuga.observability.emit_event", Mock(side_effect=RuntimeError("exporter down")))
+        mock_adapter.client = FakeSalesforceClient(pages=[], bulk_pages=["Id,Name\n001A,Acme\n"])
+        
+        accounts = list(mock_adapter.iter_accounts(bulk=True))
+        
+        assert [a["name"] for a in accounts] == ["Acme"]
+    
+    def test_failed_bulk_job_raises(self, streaming_adapter):
+        """Test a failed bulk job surfaces its error."""
+        client = FakeSalesforceClient(pages=[])
+        failed = Mock(status_code=200)
+        failed.json.return_value = {"state": "Failed", "errorMessage": "INVALID_FIELD"}
+        client.get = Mock(return_value=failed)
+        streaming_adapter.client = client
+        
+        with pytest.raises(RuntimeError, match="INVALID_FIELD"):
+            list(streaming_adapter.iter_accounts(bulk=True))
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
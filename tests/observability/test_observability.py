@@ -22,6 +22,7 @@ from cuga.observability import (
     ConsoleExporter,
     GoldenSignals,
 )
+from cuga.observability.golden_signals import LatencyHistogram
 
 
 class TestStructuredEvents:
@@ -224,6 +225,46 @@ class TestGoldenSignals:
         assert 90 <= p95 <= 99
         assert 95 <= p99 <= 99
     
+    def test_latency_window_evicts_oldest(self):
+        """Rolling window should evict oldest samples and keep percentiles windowed."""
+        hist = LatencyHistogram(max_samples=4)
+        
+        for value in (1000.0, 1000.0, 10.0, 10.0, 10.0, 10.0):
+            hist.add(value)
+        
+        assert hist.samples == [10.0, 10.0, 10.0, 10.0]
+        assert hist.mean() == pytest.approx(10.0)
+        assert 9.5 <= hist.percentile(99) <= 10.5
+        assert hist.total_count == 6
+        assert hist.total_sum == pytest.approx(2040.0)
+    
+    def test_latency_percentiles_relative_error(self):
+        """Bucketed percentiles should stay within a few percent of exact values."""
+        hist = LatencyHistogram(max_samples=10000)
+        values = [1.0 + i * 0.37 for i in range(10000)]
+        for value in values:
+            hist.add(value)
+        
+        for p, estimate in zip((50, 90, 99), hist.percentiles((50, 90, 99))):
+            exact = values[int(p / 100 * (len(values) - 1))]
+            assert estimate == pytest.approx(exact, rel=0.04)
+    
+    def test_prometheus_histogram_buckets(self):
+        """Per-tool and per-profile histograms should export cumulative buckets."""
+        signals = GoldenSignals()
+        signals.record_request_success(40.0, profile="sales")
+        signals.record_request_failure(700.0, profile="sales")
+        signals.record_tool_call_complete("crm_lookup", 3.0)
+        
+        text = signals.to_prometheus_format()
+        
+        assert "# TYPE cuga_request_duration_ms histogram" in text
+        assert 'cuga_request_duration_ms_bucket{le="50"} 1' in text
+        assert 'cuga_request_duration_ms_bucket{le="+Inf"} 2' in text
+        assert 'cuga_tool_duration_ms_bucket{tool="crm_lookup",le="5"} 1' in text
+        assert 'cuga_profile_request_duration_ms_count{profile="sales"} 2' in text
+        assert signals.to_dict()["latency"]["profiles"]["sales"]["mean"] == pytest.approx(370.0)
+    
     def test_tool_error_rate(self):
         """Test tool-specific error tracking."""
         signals = GoldenSignals()
@@ -490,6 +531,141 @@ class TestObservabilityCollector:
         assert metrics["successful_requests"] == 0
 
 
+class _RecordingExporter:
+    """Exporter that records batches and can block to simulate slow I/O."""
+    
+    def __init__(self, gate=None):
+        self.batches: List[list] = []
+        self.gate = gate
+    
+    def export_event(self, event):
+        raise AssertionError("async collector should only export batches")
+    
+    def export_events_batch(self, events):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.batches.append(list(events))
+    
+    def export_metrics(self, signals):
+        pass
+    
+    def shutdown(self):
+        pass
+
+
+def _plan_event(i: int):
+    return PlanEvent.create(
+        trace_id=f"test-{i}",
+        goal="Test",
+        steps_count=2,
+        tools_selected=["tool1"],
+        duration_ms=100.0,
+    )
+
+
+class TestAsyncExport:
+    """Test background batched export pipeline."""
+    
+    def test_events_exported_in_size_batches(self):
+        """Events should be exported by the worker in batches of export_batch_size."""
+        exporter = _RecordingExporter()
+        collector = ObservabilityCollector(
+            exporters=[exporter],
+            export_batch_size=4,
+            export_interval_s=60.0,
+        )
+        
+        for i in range(10):
+            collector.emit_event(_plan_event(i))
+        collector.flush()
+        
+        assert [len(batch) for batch in exporter.batches] == [4, 4, 2]
+        assert collector.export_stats["exported"] == 10
+        assert collector.signals.mean_steps_per_task() == 2.0
+        collector.shutdown()
+    
+    def test_interval_triggers_export(self):
+        """A partial batch should be exported once the interval elapses."""
+        exporter = _RecordingExporter()
+        collector = ObservabilityCollector(exporters=[exporter], export_batch_size=100, export_interval_s=0.05)
+        
+        collector.emit_event(_plan_event(0))
+        deadline = time.time() + 2.0
+        while not exporter.batches and time.time() < deadline:
+            time.sleep(0.01)
+        
+        assert [len(batch) for batch in exporter.batches] == [1]
+        collector.shutdown()
+    
+    def test_full_queue_drops_and_counts(self):
+        """A full queue should drop events under the drop policy and count them."""
+        import threading
+        
+        gate = threading.Event()
+        exporter = _RecordingExporter(gate=gate)
+        collector = ObservabilityCollector(
+            exporters=[exporter],
+            queue_size=2,
+            export_batch_size=1,
+            drop_policy="drop_newest",
+        )
+        
+        for i in range(20):
+            collector.emit_event(_plan_event(i))
+        gate.set()
+        collector.shutdown()
+        
+        stats = collector.export_stats
+        assert stats["dropped"] > 0
+        assert stats["dropped"] + stats["exported"] == 20
+    
+    def test_drop_oldest_never_evicts_flush_or_stop(self):
+        """Flush and stop markers survive a full drop_oldest queue."""
+        import threading
+        
+        gate = threading.Event()
+        exporter = _RecordingExporter(gate=gate)
+        collector = ObservabilityCollector(
+            exporters=[exporter],
+            queue_size=2,
+            export_batch_size=1,
+            drop_policy="drop_oldest",
+        )
+        for i in range(5):
+            collector.emit_event(_plan_event(i))
+        flusher = threading.Thread(target=collector.flush)
+        flusher.start()
+        for i in range(5, 20):
+            collector.emit_event(_plan_event(i))
+        
+        started = time.monotonic()
+        gate.set()
+        flusher.join(timeout=5.0)
+        collector.shutdown()
+        
+        assert time.monotonic() - started < 2.0
+        assert not collector._export_thread.is_alive()
+        stats = collector.export_stats
+        assert stats["dropped"] + stats["exported"] == 20
+        assert stats["queued"] == 0
+    
+    def test_shutdown_flushes_pending_events(self):
+        """shutdown() should export queued events and stop the worker."""
+        exporter = _RecordingExporter()
+        collector = ObservabilityCollector(exporters=[exporter], export_batch_size=50, export_interval_s=60.0)
+        
+        for i in range(3):
+            collector.emit_event(_plan_event(i))
+        collector.shutdown()
+        
+        assert sum(len(batch) for batch in exporter.batches) == 3
+        assert not collector._export_thread.is_alive()
+    
+    def test_invalid_drop_policy(self):
+        with pytest.raises(ValueError):
+            ObservabilityCollector(drop_policy="spill")
+
+
 class TestIntegration:
     """Integration tests for full observability flow."""
     
@@ -0,0 +1,251 @@
+"""
+Tests for audit storage backends.
+
+Validates:
+1. SQLite write-behind mode batches rows and stays read-your-writes
+2. Composite indexes back trace/type queries
+3. Retention and max-row compaction
+4. JSON segment rotation, sidecar offset index and tail reads
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from cuga.orchestrator.audit import AuditTrail, DecisionRecord, JSONAuditBackend, SQLiteAuditBackend
+
+
+def _record(trace_id: str = "trace-1", decision_type: str = "routing", age_days: float = 0.0) -> DecisionRecord:
+    timestamp = datetime.now(timezone.utc) - timedelta(days=age_days)
+    return DecisionRecord(
+        record_id=str(uuid.uuid4()),
+        timestamp=timestamp.isoformat(),
+        trace_id=trace_id,
+        decision_type=decision_type,
+        stage="route",
+        target="worker-0",
+        reason="test",
+        alternatives=["worker-1"],
+        metadata={"k": "v"},
+    )
+
+
+def _row_count(db_path) -> int:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM decisions").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestSQLiteAuditBackend:
+    """Test SQLite backend persistence modes."""
+
+    def test_write_behind_buffers_until_flush(self, tmp_path):
+        db_path = tmp_path / "audit.db"
+        backend = SQLiteAuditBackend(db_path, write_behind=True, flush_interval_s=60.0, batch_size=1000)
+
+        for _ in range(5):
+            backend.store_record(_record())
+
+        assert _row_count(db_path) == 0
+        backend.flush()
+        assert _row_count(db_path) == 5
+        backend.close()
+
+    def test_queries_see_buffered_records(self, tmp_path):
+        backend = SQLiteAuditBackend(tmp_path / "audit.db", write_behind=True, flush_interval_s=60.0)
+        record = _record(trace_id="trace-x")
+
+        backend.store_record(record)
+
+        assert backend.query_by_trace("trace-x") == [record]
+        backend.close()
+
+    def test_writer_thread_flushes_full_batches(self, tmp_path):
+        db_path = tmp_path / "audit.db"
+        backend = SQLiteAuditBackend(db_path, write_behind=True, flush_interval_s=60.0, batch_size=3)
+
+        for _ in range(3):
+            backend.store_record(_record())
+        deadline = time.monotonic() + 2.0
+        while _row_count(db_path) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert _row_count(db_path) == 3
+        backend.close()
+
+    def test_close_persists_pending_records(self, tmp_path):
+        db_path = tmp_path / "audit.db"
+        backend = SQLiteAuditBackend(db_path, write_behind=True, flush_interval_s=60.0)
+        backend.store_record(_record())
+
+        backend.close()
+
+        assert _row_count(db_path) == 1
+
+    def test_pending_records_are_flushed_at_exit(self, tmp_path):
+        db_path = tmp_path / "audit.db"
+        script = (
+            "import sys, uuid\n"
+            "from cuga.orchestrator.audit import DecisionRecord, SQLiteAuditBackend\n"
+            "backend = SQLiteAuditBackend(sys.argv[1], write_behind=True, flush_interval_s=60.0)\n"
+            "for _ in range(3):\n"
+            "    backend.store_record(DecisionRecord(record_id=str(uuid.uuid4()), timestamp='t', trace_id='t',\n"
+            "        decision_type='routing', stage='route', target='w', reason='r'))\n"
+        )
+
+        subprocess.run([sys.executable, "-c", script, str(db_path)], check=True)
+
+        assert _row_count(db_path) == 3
+
+    def test_writer_survives_unexpected_errors(self, tmp_path, monkeypatch):
+        db_path = tmp_path / "audit.db"
+        backend = SQLiteAuditBackend(db_path, write_behind=True, flush_interval_s=0.01)
+        flush = backend.flush
+        failures = iter([ValueError("boom")])
+
+        def flaky_flush():
+            error = next(failures, None)
+            if error is not None:
+                raise error
+            flush()
+
+        monkeypatch.setattr(backend, "flush", flaky_flush)
+        backend.store_record(_record())
+        deadline = time.monotonic() + 2.0
+        while _row_count(db_path) < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert _row_count(db_path) == 1
+        assert backend._writer.is_alive()
+        backend.close()
+
+    def test_rejected_rows_do_not_wedge_write_behind_queue(self, tmp_path):
+        db_path = tmp_path / "audit.db"
+        backend = SQLiteAuditBackend(db_path, write_behind=True, flush_interval_s=60.0, max_batch_failures=2)
+        good = _record(trace_id="trace-ok")
+        bad = DecisionRecord(
+            record_id="bad", timestamp="t", trace_id=None, decision_type="routing",
+            stage="route", target="w", reason="r",
+        )
+        backend.store_record(good)
+        backend.store_record(bad)
+
+        assert backend.query_by_trace("trace-ok") == []
+        assert backend.query_by_trace("trace-ok") == [good]
+        assert not backend._pending
+        dead = [json.loads(line) for line in backend.dead_letter_path.read_text().splitlines()]
+        assert [entry["record"]["record_id"] for entry in dead] == ["bad"]
+        assert "NOT NULL" in dead[0]["error"]
+        backend.close()
+
+    def test_sync_writes_ignore_duplicates_and_dead_letter_rejects(self, tmp_path):
+        backend = SQLiteAuditBackend(tmp_path / "audit.db")
+        record = _record()
+        backend.store_record(record)
+        backend.store_record(record)
+
+        with pytest.raises(sqlite3.IntegrityError):
+            backend.store_record(DecisionRecord(
+                record_id="bad", timestamp="t", trace_id="t", decision_type="routing",
+                stage="route", target=None, reason="r",
+            ))
+
+        assert _row_count(tmp_path / "audit.db") == 1
+        assert "bad" in backend.dead_letter_path.read_text()
+        backend.close()
+
+    def test_wal_mode_and_composite_indexes(self, tmp_path):
+        backend = SQLiteAuditBackend(tmp_path / "audit.db")
+
+        conn = backend._conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(decisions)")}
+        assert {"idx_trace_timestamp", "idx_type_timestamp", "idx_timestamp"} <= indexes
+        plan = " ".join(
+            str(row) for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM decisions WHERE trace_id = ? ORDER BY timestamp", ("t",)
+            )
+        )
+        assert "idx_trace_timestamp" in plan and "TEMP B-TREE" not in plan
+        backend.close()
+
+    def test_compact_applies_retention_and_max_rows(self, tmp_path):
+        backend = SQLiteAuditBackend(tmp_path / "audit.db", retention_days=7, max_rows=2)
+        for age in (30, 10, 3, 2, 1):
+            backend.store_record(_record(age_days=age))
+
+        deleted = backend.compact()
+
+        assert deleted == 3
+        assert len(backend.query_recent(10)) == 2
+        backend.close()
+
+    def test_audit_trail_write_behind_option(self, tmp_path):
+        trail = AuditTrail(backend_type="sqlite", storage_path=tmp_path / "audit.db", write_behind=True)
+
+        assert trail.backend.write_behind is True
+        trail.close()
+
+
+class TestJSONAuditBackend:
+    """Test segmented, indexed JSONL backend."""
+
+    def _fill(self, backend, count=12):
+        records = [
+            _record(trace_id=f"trace-{i % 3}", decision_type="routing" if i % 2 else "planning")
+            for i in range(count)
+        ]
+        for record in records:
+            backend.store_record(record)
+        return records
+
+    def test_rotates_segments_and_queries_across_them(self, tmp_path):
+        backend = JSONAuditBackend(tmp_path / "decisions.jsonl", max_segment_bytes=1024)
+        records = self._fill(backend)
+
+        assert sorted(p.name for p in tmp_path.glob("decisions.0*.jsonl"))
+        assert backend.query_by_trace("trace-1") == [r for r in records if r.trace_id == "trace-1"]
+        assert backend.query_by_type("routing", limit=2) == [r for r in records if r.decision_type == "routing"][-2:]
+        assert backend.query_recent(5) == records[-5:]
+        assert backend.query_recent(100) == records
+        assert backend._read_records() == records
+
+    def test_reopen_uses_sidecar_index(self, tmp_path):
+        path = tmp_path / "decisions.jsonl"
+        records = self._fill(JSONAuditBackend(path, max_segment_bytes=1024))
+
+        reopened = JSONAuditBackend(path, max_segment_bytes=1024)
+
+        assert (tmp_path / "decisions.jsonl.idx").exists()
+        assert reopened.query_by_trace("trace-2") == [r for r in records if r.trace_id == "trace-2"]
+
+    def test_indexes_legacy_file_and_external_appends(self, tmp_path):
+        path = tmp_path / "decisions.jsonl"
+        legacy = _record(trace_id="legacy")
+        path.write_text(json.dumps(legacy.to_dict()) + "\n")
+        backend = JSONAuditBackend(path)
+
+        external = _record(trace_id="legacy")
+        with open(path, "a") as f:
+            f.write(json.dumps(external.to_dict()) + "\n")
+
+        assert backend.query_by_trace("legacy") == [legacy, external]
+
+    def test_query_recent_ignores_partial_trailing_line(self, tmp_path):
+        path = tmp_path / "decisions.jsonl"
+        backend = JSONAuditBackend(path)
+        records = self._fill(backend, count=3)
+        with open(path, "a") as f:
+            f.write('{"record_id": "partial')
+
+        assert backend.query_recent(10) == records
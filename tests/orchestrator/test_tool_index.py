@@ -0,0 +1,188 @@
+"""
+Tests for the precomputed tool ranking index.
+
+Validates:
+1. Overlap scoring matches legacy keyword-overlap ranking
+2. Incremental add/remove/sync keeps postings consistent
+3. TF-IDF/BM25 scoring prefers rarer matching terms
+4. ToolRegistry and ToolRankingPlanner share one index
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from cuga.modular.agents import CoordinatorAgent, PlannerAgent, WorkerAgent
+from cuga.modular.config import AgentConfig
+from cuga.modular.memory import VectorMemory
+from cuga.modular import tools as tools_module
+from cuga.modular.tools import ToolRegistry, ToolSpec
+from cuga.orchestrator import ToolRankingIndex, ToolRankingPlanner
+
+
+def _spec(name: str, description: str) -> ToolSpec:
+    return ToolSpec(name=name, description=description, handler=lambda inputs, ctx: inputs)
+
+
+class TestToolRankingIndex:
+    """Test index maintenance and scoring."""
+
+    def test_overlap_scoring_matches_legacy(self):
+        """Overlap score is matched terms / query terms, ties in insertion order."""
+        index = ToolRankingIndex()
+        index.add("a", "search_web search the web", "a")
+        index.add("b", "query_db query database", "b")
+        index.add("c", "scrape web pages", "c")
+        index.add("d", "crawl web sites", "d")
+
+        assert index.rank("search web for docs") == [("a", 0.5), ("c", 0.25), ("d", 0.25)]
+
+    def test_remove_drops_postings(self):
+        """Removed tools no longer match and unused postings are cleaned up."""
+        index = ToolRankingIndex()
+        index.add("a", "echo text", "a")
+        index.add("b", "echo json", "b")
+
+        assert index.remove("a") is True
+        assert index.remove("a") is False
+        assert [payload for payload, _ in index.rank("echo text")] == ["b"]
+        assert "text" not in index._postings
+
+    def test_sync_only_retokenizes_changed_tools(self):
+        """Sync keeps unchanged docs, updates payloads, and follows entry order."""
+        index = ToolRankingIndex()
+        index.sync([("a", "alpha tool", 1), ("b", "beta tool", 2)])
+        doc_a = index._docs["a"]
+        version = index.version
+
+        index.sync([("b", "beta tool", 20), ("a", "alpha tool", 10), ("c", "gamma tool", 30)])
+
+        assert index._docs["a"] is doc_a
+        assert index.version == version + 1
+        assert [payload for payload, _ in index.rank("tool")] == [20, 10, 30]
+        assert index.first() == 20
+
+        index.sync([("c", "gamma tool", 30)])
+        assert len(index) == 1
+        assert "alpha" not in index._postings
+
+    @pytest.mark.parametrize("scoring", ["tfidf", "bm25"])
+    def test_weighted_scoring_prefers_rare_terms(self, scoring):
+        """Rare matching terms outweigh terms shared by every tool."""
+        index = ToolRankingIndex(scoring=scoring)
+        index.add("common", "sales tool", "common")
+        index.add("rare", "sales forecast tool", "rare")
+        index.add("other", "sales report tool", "other")
+
+        ranked = index.rank("sales forecast")
+
+        assert ranked[0][0] == "rare"
+
+    def test_unknown_scoring_rejected(self):
+        """Unknown scoring modes raise ValueError."""
+        with pytest.raises(ValueError):
+            ToolRankingIndex(scoring="cosine")
+
+
+class TestSharedIndex:
+    """Test registry/planner index sharing."""
+
+    def test_registry_index_tracks_register_and_unregister(self):
+        """Registry maintains its index incrementally."""
+        registry = ToolRegistry([_spec("echo", "Echo text")])
+        index = registry.ranking_index
+        registry.register(_spec("summarize", "Summarize text"))
+
+        assert registry.ranking_index is index
+        assert len(index) == 2
+
+        removed = registry.unregister("echo")
+        assert removed is not None and removed.name == "echo"
+        assert [tool.name for tool, _ in index.rank("echo text")] == ["summarize"]
+
+    def test_registry_index_reconciles_direct_mutation(self):
+        """Tools appended directly to the list are picked up on next access."""
+        registry = ToolRegistry([_spec("echo", "Echo text")])
+        registry.tools.append(_spec("search", "Search records"))
+
+        assert [tool.name for tool, _ in registry.ranking_index.rank("search")] == ["search"]
+
+    def test_registry_index_reconciles_in_place_replacement(self):
+        """Replacing a tool in place (same list, same length) is picked up."""
+        registry = ToolRegistry([_spec("alpha", "Search records"), _spec("beta", "Send email")])
+        assert [tool.name for tool, _ in registry.ranking_index.rank("email")] == ["beta"]
+
+        registry.tools[1] = _spec("gamma", "Draft proposal")
+
+        assert registry.ranking_index.rank("email") == []
+        assert [tool.name for tool, _ in registry.ranking_index.rank("proposal")] == ["gamma"]
+
+    def test_registry_index_access_does_not_rescan_descriptions(self, monkeypatch):
+        registry = ToolRegistry([_spec("echo", "Echo text"), _spec("search", "Search records")])
+        registry.ranking_index
+        calls = []
+        real_index_text = tools_module._index_text
+        monkeypatch.setattr(tools_module, "_index_text", lambda tool: calls.append(tool) or real_index_text(tool))
+
+        for _ in range(5):
+            registry.ranking_index
+        registry.register(_spec("draft", "Draft proposal"))
+        registry.ranking_index
+
+        assert [tool.name for tool in calls] == ["draft"]
+
+    def test_registry_reindex_picks_up_edited_descriptions(self):
+        registry = ToolRegistry([_spec("echo", "Echo text")])
+        registry.ranking_index
+
+        registry.tools[0].description = "Send email"
+        registry.reindex()
+
+        assert [tool.name for tool, _ in registry.ranking_index.rank("email")] == ["echo"]
+
+    def test_planner_agent_ranks_via_registry_index(self):
+        """PlannerAgent uses the registry index for tool selection."""
+        registry = ToolRegistry([_spec("echo", "Echo text"), _spec("search", "Search records")])
+        planner = PlannerAgent(
+            registry=registry,
+            memory=VectorMemory(),
+            config=AgentConfig(max_steps=2),
+        )
+
+        plan = planner.plan("search records")
+
+        assert plan.steps[0]["tool"] == "search"
+
+    def test_coordinator_shares_registry_index(self):
+        """Default planning authority reuses the planner registry's index."""
+        registry = ToolRegistry([_spec("echo", "Echo text")])
+        memory = VectorMemory()
+        planner = PlannerAgent(registry=registry, memory=memory, config=AgentConfig())
+        coordinator = CoordinatorAgent(
+            planner=planner,
+            workers=[WorkerAgent(registry=registry, memory=memory)],
+            memory=memory,
+        )
+
+        assert isinstance(coordinator.planning_authority, ToolRankingPlanner)
+        assert coordinator.planning_authority.tool_index is registry.ranking_index
+
+        plan = coordinator.planning_authority.create_plan("echo this", trace_id="trace-1")
+        assert plan.steps[0].tool == "echo"
+
+    def test_planning_authority_sees_in_place_replacement(self):
+        """The shared index is resolved through the registry on every plan."""
+        registry = ToolRegistry([_spec("echo", "Echo text")])
+        memory = VectorMemory()
+        planner = PlannerAgent(registry=registry, memory=memory, config=AgentConfig())
+        coordinator = CoordinatorAgent(
+            planner=planner,
+            workers=[WorkerAgent(registry=registry, memory=memory)],
+            memory=memory,
+        )
+        coordinator.planning_authority.create_plan("echo this", trace_id="trace-1")
+
+        registry.tools[0] = _spec("summarize", "Summarize text")
+
+        plan = coordinator.planning_authority.create_plan("summarize text", trace_id="trace-2")
+        assert plan.steps[0].tool == "summarize"
@@ -0,0 +1,141 @@
+"""
+tests/unit/test_agent_cache.py
+
+Tests for the CugaLite agent cache: reuse across invocations, version-based
+invalidation, LRU bounding and single initialization under concurrency.
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("pandas")
+
+from cuga.backend.cuga_graph.nodes.cuga_lite.agent_cache import AgentCache, make_agent_key  # noqa: E402
+
+
+class FakeAgent:
+    def __init__(self, number):
+        self.number = number
+        self.tools = ["tool"]
+        self.langfuse_handler = None
+
+
+class Factory:
+    def __init__(self, delay=0):
+        self.calls = 0
+        self.delay = delay
+
+    async def __call__(self):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return FakeAgent(self.calls)
+
+
+def _key(apps=("crm",), instructions="be brief"):
+    return make_agent_key(list(apps), instructions, {"model_name": "m"}, False, False, "template")
+
+
+class TestAgentKey:
+    """Test cache key construction."""
+
+    def test_app_order_does_not_matter(self):
+        assert _key(("crm", "mail")) == _key(("mail", "crm"))
+
+    def test_instructions_change_key(self):
+        assert _key(instructions="a") != _key(instructions="b")
+
+    def test_model_settings_change_key(self):
+        first = make_agent_key(None, "", {"model_name": "a"}, False, False)
+        second = make_agent_key(None, "", {"model_name": "b"}, False, False)
+        assert first != second
+
+
+class TestAgentCache:
+    """Test reuse and invalidation of cached agents."""
+
+    def test_reuses_agent_for_same_key_and_version(self):
+        cache = AgentCache(max_entries=4)
+        factory = Factory()
+
+        async def run():
+            first = await cache.get_or_create(_key(), 1, factory, langfuse_handler="a")
+            second = await cache.get_or_create(_key(), 1, factory, langfuse_handler="b")
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert factory.calls == 1
+        assert first.number == second.number
+        assert first.tools is second.tools
+        assert (first.langfuse_handler, second.langfuse_handler) == ("a", "b")
+        assert cache.stats()["hits"] == 1
+
+    def test_version_change_rebuilds(self):
+        cache = AgentCache(max_entries=4)
+        factory = Factory()
+
+        async def run():
+            await cache.get_or_create(_key(), (0, "v1"), factory)
+            return await cache.get_or_create(_key(), (0, "v2"), factory)
+
+        agent = asyncio.run(run())
+
+        assert factory.calls == 2
+        assert agent.number == 2
+        assert cache.stats()["invalidations"] == 1
+
+    def test_lru_bound(self):
+        cache = AgentCache(max_entries=2)
+        factory = Factory()
+
+        async def run():
+            for apps in (("a",), ("b",), ("c",), ("a",)):
+                await cache.get_or_create(_key(apps), 1, factory)
+
+        asyncio.run(run())
+
+        assert factory.calls == 4
+        assert cache.stats()["entries"] == 2
+
+    def test_concurrent_misses_initialize_once(self):
+        cache = AgentCache(max_entries=4)
+        factory = Factory(delay=0.05)
+
+        async def run():
+            return await asyncio.gather(*(cache.get_or_create(_key(), 1, factory) for _ in range(5)))
+
+        agents = asyncio.run(run())
+
+        assert factory.calls == 1
+        assert {agent.number for agent in agents} == {1}
+
+    def test_disabled_cache_always_builds(self):
+        cache = AgentCache(max_entries=0)
+        factory = Factory()
+
+        async def run():
+            await cache.get_or_create(_key(), 1, factory)
+            await cache.get_or_create(_key(), 1, factory)
+
+        asyncio.run(run())
+
+        assert factory.calls == 2
+
+    def test_failed_initialization_is_not_cached(self):
+        cache = AgentCache(max_entries=4)
+        factory = Factory()
+
+        async def failing():
+            raise RuntimeError("registry down")
+
+        async def run():
+            with pytest.raises(RuntimeError):
+                await cache.get_or_create(_key(), 1, failing)
+            return await cache.get_or_create(_key(), 1, factory)
+
+        agent = asyncio.run(run())
+
+        assert agent.number == 1
+        assert cache.stats()["entries"] == 1
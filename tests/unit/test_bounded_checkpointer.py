@@ -0,0 +1,179 @@
+"""
+tests/unit/test_bounded_checkpointer.py
+
+Tests for the bounded LangGraph checkpointer: LRU/TTL eviction to SQLite,
+reload on access, restart survival, append-only storage, history pruning
+and write-through sharing.
+"""
+
+import sqlite3
+import time
+from typing import TypedDict
+
+import pytest
+
+pytest.importorskip("langgraph")
+
+from langgraph.checkpoint.base import empty_checkpoint  # noqa: E402
+from langgraph.graph import END, START, StateGraph  # noqa: E402
+
+from cuga.backend.cuga_graph.checkpointer import BoundedCheckpointer  # noqa: E402
+
+
+def _config(thread_id):
+    return {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+
+
+def _put(saver, thread_id, value):
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = {"value": value}
+    checkpoint["channel_versions"] = {"value": saver.get_next_version(None, None)}
+    return saver.put(_config(thread_id), checkpoint, {}, checkpoint["channel_versions"])
+
+
+def _put_versioned(saver, thread_id, value, previous=None):
+    """Put a checkpoint whose channel gets a new version, like a real graph step."""
+    checkpoint = empty_checkpoint()
+    version = saver.get_next_version(previous, None)
+    checkpoint["channel_values"] = {"value": value}
+    checkpoint["channel_versions"] = {"value": version}
+    saver.put(_config(thread_id), checkpoint, {}, {"value": version})
+    return version
+
+
+def _rows(db_path, table):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def _value(saver, thread_id):
+    checkpoint_tuple = saver.get_tuple(_config(thread_id))
+    return checkpoint_tuple.checkpoint["channel_values"]["value"] if checkpoint_tuple else None
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "checkpoints.db")
+
+
+class TestResidency:
+    """Test eviction and reload."""
+
+    def test_lru_bound_spills_and_reloads(self, db_path):
+        saver = BoundedCheckpointer(db_path, max_threads=2)
+        for thread_id in ("a", "b", "c"):
+            _put(saver, thread_id, thread_id.upper())
+
+        assert saver.stats()["resident_threads"] == 2
+        assert saver.stats()["evictions"] == 1
+        assert "a" not in saver.storage
+
+        assert _value(saver, "a") == "A"
+        assert saver.stats()["loads"] == 1
+        assert saver.stats()["resident_threads"] == 2
+
+    def test_idle_threads_expire(self, db_path):
+        saver = BoundedCheckpointer(db_path, max_threads=10, idle_ttl_s=0.05)
+        _put(saver, "old", 1)
+        time.sleep(0.1)
+        _put(saver, "new", 2)
+
+        assert "old" not in saver.storage
+        assert _value(saver, "old") == 1
+
+    def test_survives_restart(self, db_path):
+        saver = BoundedCheckpointer(db_path)
+        _put(saver, "a", "kept")
+        saver.close()
+
+        restarted = BoundedCheckpointer(db_path)
+
+        assert _value(restarted, "a") == "kept"
+        assert restarted.stats()["stored_threads"] == 1
+
+    def test_delete_thread_removes_spilled_copy(self, db_path):
+        saver = BoundedCheckpointer(db_path)
+        _put(saver, "a", 1)
+        saver.flush()
+
+        saver.delete_thread("a")
+
+        assert _value(saver, "a") is None
+        assert saver.stats()["stored_threads"] == 0
+
+
+class TestStorage:
+    """Test per-row storage and the history cap."""
+
+    def test_spill_appends_only_new_checkpoints(self, db_path):
+        saver = BoundedCheckpointer(db_path)
+        _put(saver, "a", 1)
+        saver.flush()
+        _put(saver, "a", 2)
+        saver.flush()
+
+        with sqlite3.connect(db_path) as conn:
+            versions = [row[0] for row in conn.execute("SELECT version FROM checkpoints ORDER BY checkpoint_id")]
+        assert versions == [1, 2]
+
+    def test_history_is_capped_with_unused_blobs(self, db_path):
+        saver = BoundedCheckpointer(db_path, max_history=2)
+        version = None
+        for value in range(5):
+            version = _put_versioned(saver, "a", value, version)
+        saver.flush()
+
+        assert len(saver.storage["a"][""]) == 2
+        assert len(saver.blobs) == 2
+        assert _rows(db_path, "checkpoints") == 2
+        assert _rows(db_path, "checkpoint_blobs") == 2
+        assert saver.stats()["pruned"] == 3
+        assert _value(BoundedCheckpointer(db_path), "a") == 4
+
+
+class TestSharing:
+    """Test write-through sharing between processes."""
+
+    def test_workers_see_each_others_checkpoints(self, db_path):
+        worker_a = BoundedCheckpointer(db_path, shared=True)
+        worker_b = BoundedCheckpointer(db_path, shared=True)
+
+        _put(worker_a, "t", 1)
+        assert _value(worker_b, "t") == 1
+
+        _put(worker_a, "t", 2)
+        assert _value(worker_b, "t") == 2
+
+    def test_concurrent_workers_do_not_overwrite_each_other(self, db_path, monkeypatch):
+        worker_a = BoundedCheckpointer(db_path, shared=True)
+        worker_b = BoundedCheckpointer(db_path, shared=True)
+        _put(worker_a, "t", "a1")
+        # worker_b writes after worker_a's freshness check but before its write
+        monkeypatch.setattr(worker_a, "_touch", lambda thread_id: _put(worker_b, "t", "b1"))
+        _put(worker_a, "t", "a2")
+        monkeypatch.undo()
+
+        for saver in (worker_a, BoundedCheckpointer(db_path)):
+            values = [item.checkpoint["channel_values"]["value"] for item in saver.list(_config("t"))]
+            assert sorted(values) == ["a1", "a2", "b1"]
+
+
+class TestGraphIntegration:
+    """Test the checkpointer under a compiled graph."""
+
+    def test_graph_state_persists_across_evictions(self, db_path):
+        class State(TypedDict):
+            count: int
+
+        graph = StateGraph(State)
+        graph.add_node("inc", lambda state: {"count": state["count"] + 1})
+        graph.add_edge(START, "inc")
+        graph.add_edge("inc", END)
+        app = graph.compile(checkpointer=BoundedCheckpointer(db_path, max_threads=1))
+
+        for thread_id in ("x", "y", "z"):
+            app.invoke({"count": 0}, {"configurable": {"thread_id": thread_id}})
+        app.invoke({"count": 10}, {"configurable": {"thread_id": "x"}})
+
+        assert app.get_state({"configurable": {"thread_id": "y"}}).values == {"count": 1}
+        assert app.get_state({"configurable": {"thread_id": "x"}}).values == {"count": 11}
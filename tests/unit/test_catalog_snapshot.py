@@ -0,0 +1,123 @@
+"""
+tests/unit/test_catalog_snapshot.py
+
+Tests for registry catalog loading: the versioned on-disk snapshot and the
+bulk/concurrent fetch used by the CugaLite tool providers.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from cuga.backend.tools_env.registry.utils.catalog_snapshot import load_catalog_snapshot, save_catalog_snapshot
+
+
+def _apis(app):
+    return {f"{app}_list": {"app_name": app, "description": f"List {app}"}}
+
+
+class TestCatalogSnapshot:
+    """Test the versioned catalog snapshot."""
+
+    def test_roundtrip_for_same_version(self, tmp_path):
+        path = str(tmp_path / "catalog.json")
+        save_catalog_snapshot("v1", {"crm": _apis("crm")}, path=path)
+
+        assert load_catalog_snapshot("v1", ["crm", "mail"], path=path) == {"crm": _apis("crm")}
+
+    def test_other_version_is_ignored(self, tmp_path):
+        path = str(tmp_path / "catalog.json")
+        save_catalog_snapshot("v1", {"crm": _apis("crm")}, path=path)
+
+        assert load_catalog_snapshot("v2", ["crm"], path=path) == {}
+        assert load_catalog_snapshot(None, ["crm"], path=path) == {}
+
+    def test_same_version_merges_and_new_version_replaces(self, tmp_path):
+        path = str(tmp_path / "catalog.json")
+        save_catalog_snapshot("v1", {"crm": _apis("crm")}, path=path)
+        save_catalog_snapshot("v1", {"mail": _apis("mail")}, path=path)
+        assert set(load_catalog_snapshot("v1", ["crm", "mail"], path=path)) == {"crm", "mail"}
+
+        save_catalog_snapshot("v2", {"mail": _apis("mail")}, path=path)
+        with open(path) as f:
+            assert json.load(f) == {"version": "v2", "apps": {"mail": _apis("mail")}}
+
+    def test_corrupt_snapshot_is_ignored(self, tmp_path):
+        path = tmp_path / "catalog.json"
+        path.write_text("{not json")
+
+        assert load_catalog_snapshot("v1", ["crm"], path=str(path)) == {}
+        save_catalog_snapshot("v1", {"crm": _apis("crm")}, path=str(path))
+        assert load_catalog_snapshot("v1", ["crm"], path=str(path)) == {"crm": _apis("crm")}
+
+
+class TestFetchRegistryCatalog:
+    """Test bulk and concurrent catalog fetching against a stub registry."""
+
+    @pytest.fixture
+    def api_utils(self, tmp_path, monkeypatch):
+        pytest.importorskip("pandas")
+        from cuga.backend.tools_env.registry.utils import api_utils, catalog_snapshot
+
+        monkeypatch.setattr(api_utils, "settings", SimpleNamespace(advanced_features=SimpleNamespace(registry=True)))
+        path = str(tmp_path / "catalog.json")
+        monkeypatch.setattr(
+            api_utils, "load_catalog_snapshot", lambda v, names: catalog_snapshot.load_catalog_snapshot(v, names, path)
+        )
+        monkeypatch.setattr(
+            api_utils, "save_catalog_snapshot", lambda v, c: catalog_snapshot.save_catalog_snapshot(v, c, path)
+        )
+        return api_utils
+
+    def _run(self, api_utils, monkeypatch, app_names, bulk_apps=("crm", "mail")):
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        requests = []
+
+        async def catalog_version(request):
+            return web.json_response({"version": "v1"})
+
+        async def all_apis(request):
+            requests.append("/apis")
+            return web.json_response({app: _apis(app) for app in bulk_apps})
+
+        async def app_apis(request):
+            app = request.match_info["app"]
+            requests.append(app)
+            if app == "broken":
+                return web.Response(status=500, text="boom")
+            return web.json_response(_apis(app))
+
+        async def run():
+            app = web.Application()
+            app.router.add_get("/catalog/version", catalog_version)
+            app.router.add_get("/apis", all_apis)
+            app.router.add_get("/applications/{app}/apis", app_apis)
+            async with TestServer(app) as server:
+                monkeypatch.setattr(api_utils, "get_registry_base_url", lambda: str(server.make_url("")).rstrip("/"))
+                return await api_utils.fetch_registry_catalog(app_names)
+
+        return asyncio.run(run()), requests
+
+    def test_bulk_request_then_per_app_fallback(self, api_utils, monkeypatch):
+        catalog, requests = self._run(api_utils, monkeypatch, ["crm", "mail", "web", "broken"])
+
+        assert set(catalog) == {"crm", "mail", "web"}
+        assert requests[0] == "/apis"
+        assert sorted(requests[1:]) == ["broken", "web"]
+
+    def test_snapshot_serves_warm_restart(self, api_utils, monkeypatch):
+        self._run(api_utils, monkeypatch, ["crm", "mail"])
+        catalog, requests = self._run(api_utils, monkeypatch, ["crm", "mail"])
+
+        assert set(catalog) == {"crm", "mail"}
+        assert requests == []
+
+    def test_single_app_skips_bulk_request(self, api_utils, monkeypatch):
+        catalog, requests = self._run(api_utils, monkeypatch, ["crm"])
+
+        assert catalog == {"crm": _apis("crm")}
+        assert requests == ["crm"]
@@ -403,6 +403,14 @@ class TestAgentConfigEdgeCases:
         result = _parse_float("MODEL_TEMPERATURE", default=0.3, min_value=0.0, max_value=2.0)
         assert result == 0.3
     
+    def test_invalid_tool_scoring_uses_default(self, clean_env):
+        """Unknown PLANNER_TOOL_SCORING values fall back to overlap."""
+        clean_env.setenv("PLANNER_TOOL_SCORING", "cosine")
+        assert AgentConfig.from_env().tool_scoring == "overlap"
+        
+        clean_env.setenv("PLANNER_TOOL_SCORING", "BM25")
+        assert AgentConfig.from_env().tool_scoring == "bm25"
+    
     def test_agent_config_from_env_defaults(self, clean_env):
         """AgentConfig.from_env() provides sensible defaults."""
         config = AgentConfig.from_env()
@@ -0,0 +1,109 @@
+"""
+tests/unit/test_dom_serializer.py
+
+Tests for DOM tree flattening: output format, deep trees, the character
+budget and incremental re-serialization of unchanged nodes.
+"""
+
+from cuga.backend.browser_env.page_understanding.tranformer_utils.dom_transform_utils import (
+    DomTreeSerializer,
+    flatten_domtree_to_str,
+)
+from cuga.backend.browser_env.page_understanding.types.dom_tree_types import (
+    DomTreeResult,
+    NodeData,
+    TextNodeData,
+)
+
+
+def _element(tag, children=(), bid=None, highlight=1, **attributes):
+    return NodeData(
+        tagName=tag,
+        attributes=attributes,
+        xpath=f"/{tag}",
+        domTreeId=bid,
+        children=list(children),
+        highlightIndex=highlight,
+    )
+
+
+def _page(button_title="Save"):
+    return DomTreeResult(
+        rootId="root",
+        map={
+            "root": _element("body", ["form", "footer"], highlight=None),
+            "form": _element("form", ["button", "label"], bid=1, id="login"),
+            "button": _element("button", ["button-text"], bid=2, title=button_title),
+            "button-text": TextNodeData(type="TEXT_NODE", text=button_title, isVisible=True),
+            "label": TextNodeData(type="TEXT_NODE", text="Remember me", isVisible=True),
+            "footer": _element("div", ["copyright"], bid=3, highlight=None),
+            "copyright": TextNodeData(type="TEXT_NODE", text="(c) CUGA", isVisible=False),
+        },
+    )
+
+
+class TestFlattenDomTree:
+    """Test the flattened DOM string."""
+
+    def test_format(self):
+        assert flatten_domtree_to_str(_page()) == (
+            "[1] form 'login'\n\t[2] button 'Save'\n\ttext \"Remember me\"\ntext \"(c) CUGA\""
+        )
+
+    def test_filter_visible_only(self):
+        output = flatten_domtree_to_str(_page(), filter_visible_only=True)
+
+        assert "(c) CUGA" not in output
+
+    def test_deep_tree_does_not_recurse(self):
+        depth = 5000
+        nodes = {
+            str(i): _element("a", [str(i + 1)] if i < depth - 1 else [], bid=i, title=f"n{i}")
+            for i in range(depth)
+        }
+        output = flatten_domtree_to_str(DomTreeResult(rootId="0", map=nodes))
+
+        lines = output.split("\n")
+        assert len(lines) == depth
+        assert lines[-1] == "\t" * (depth - 1) + f"[{depth - 1}] a 'n{depth - 1}'"
+
+    def test_max_chars_stops_at_line_boundary(self):
+        full = flatten_domtree_to_str(_page())
+
+        truncated = flatten_domtree_to_str(_page(), max_chars=35)
+
+        assert len(truncated) <= 35
+        assert full.startswith(truncated)
+        assert truncated == "[1] form 'login'\n\t[2] button 'Save'"
+
+
+class TestIncrementalSerializer:
+    """Test reuse of unchanged nodes between observations."""
+
+    def test_only_changed_nodes_are_rendered(self):
+        serializer = DomTreeSerializer()
+        serializer.serialize(_page())
+        assert serializer.reused_nodes == 0
+
+        output = serializer.serialize(_page(button_title="Submit"))
+
+        assert output == flatten_domtree_to_str(_page(button_title="Submit"))
+        assert serializer.rendered_nodes == 2
+        assert serializer.reused_nodes == 5
+
+    def test_extra_properties_change_rerenders(self):
+        serializer = DomTreeSerializer(with_visible=True, filter_visible_only=True)
+        visible = {2: {"visibility": 1.0, "bbox": None, "clickable": True, "set_of_marks": False}}
+        hidden = {2: {"visibility": 0.0, "bbox": None, "clickable": True, "set_of_marks": False}}
+
+        assert "button" in serializer.serialize(_page(), extra_properties=visible)
+        assert "button" not in serializer.serialize(_page(), extra_properties=hidden)
+
+    def test_reset_forgets_previous_observation(self):
+        serializer = DomTreeSerializer()
+        serializer.serialize(_page())
+        serializer.reset()
+
+        serializer.serialize(_page())
+
+        assert serializer.reused_nodes == 0
@@ -0,0 +1,199 @@
+"""
+tests/unit/test_faiss_backend_persistence.py
+
+Tests for the persistent FaissBackend mode: saved index + on-disk record
+store, incremental append, read-only (mmap) loading and IVF/HNSW index types.
+"""
+
+import pytest
+
+pytest.importorskip("faiss")
+pytest.importorskip("numpy")
+
+from cuga.modular.embeddings.hashing import HashingEmbedder
+from cuga.modular.types import MemoryRecord
+from cuga.modular.vector_backends.base import EmbeddedRecord
+from cuga.modular.vector_backends.faiss_backend import FaissBackend
+
+TEXTS = [
+    "renewal risk for enterprise accounts",
+    "territory plan for the west region",
+    "qualification notes for acme pipeline",
+    "outreach sequence for new leads",
+]
+
+
+def _records(texts, source="test"):
+    embedder = HashingEmbedder()
+    return [
+        EmbeddedRecord(embedding=embedder.embed(text), record=MemoryRecord(text=text, metadata={"source": source}))
+        for text in texts
+    ]
+
+
+def _open(path, **kwargs):
+    backend = FaissBackend(index_path=path, **kwargs)
+    backend.connect()
+    return backend
+
+
+class TestFaissPersistence:
+    """Persistent FaissBackend behavior."""
+
+    def test_in_memory_mode_unchanged(self):
+        backend = FaissBackend()
+        backend.connect()
+        backend.upsert(_records(TEXTS))
+
+        hits = backend.search(HashingEmbedder().embed(TEXTS[1]), top_k=2)
+
+        assert hits[0].text == TEXTS[1]
+        assert hits[0].score == pytest.approx(1.0)
+        assert backend.records_path is None
+
+    def test_reload_after_save(self, tmp_path):
+        path = tmp_path / "index.faiss"
+        writer = _open(path)
+        writer.upsert(_records(TEXTS))
+        writer.close()
+
+        reader = _open(path)
+        hits = reader.search(HashingEmbedder().embed(TEXTS[2]), top_k=1)
+
+        assert [(hit.text, hit.metadata) for hit in hits] == [(TEXTS[2], {"source": "test"})]
+
+    def test_incremental_append_catches_up_unsaved_records(self, tmp_path):
+        path = tmp_path / "index.faiss"
+        writer = _open(path)
+        writer.upsert(_records(TEXTS[:2]))
+        writer.save()
+        writer.upsert(_records(TEXTS[2:]))  # appended to the record store but not saved
+
+        reader = _open(path, read_only=True)
+
+        assert reader._index.ntotal == 4
+        assert reader.search(HashingEmbedder().embed(TEXTS[3]), top_k=1)[0].text == TEXTS[3]
+
+    def test_read_only_rejects_upsert(self, tmp_path):
+        path = tmp_path / "index.faiss"
+        writer = _open(path)
+        writer.upsert(_records(TEXTS))
+        writer.close()
+
+        reader = _open(path, read_only=True)
+
+        with pytest.raises(RuntimeError, match="read-only"):
+            reader.upsert(_records(TEXTS[:1]))
+
+    def test_read_only_without_store_raises(self, tmp_path):
+        with pytest.raises(RuntimeError, match="No FAISS record store"):
+            _open(tmp_path / "missing.faiss", read_only=True)
+
+    @pytest.mark.parametrize("index_type", ["ivf", "hnsw"])
+    def test_approximate_index_types_round_trip(self, tmp_path, index_type):
+        path = tmp_path / f"{index_type}.faiss"
+        writer = _open(path, index_type=index_type, nlist=2)
+        writer.upsert(_records(TEXTS))
+        writer.close()
+
+        reader = _open(path, index_type=index_type, read_only=True)
+        hits = reader.search(HashingEmbedder().embed(TEXTS[0]), top_k=4)
+
+        assert TEXTS[0] in [hit.text for hit in hits]
+
+    def test_ivf_is_trained_once_corpus_is_large_enough(self, tmp_path):
+        path = tmp_path / "ivf.faiss"
+        writer = _open(path, index_type="ivf", nlist=2)
+        texts = [f"account note {i} for region {i % 7}" for i in range(80)]
+        for text in texts[:77]:
+            writer.upsert(_records([text]))
+
+        assert writer._faiss.try_extract_index_ivf(writer._index) is None
+
+        writer.upsert(_records(texts[77:]))
+        ivf = writer._faiss.try_extract_index_ivf(writer._index)
+        assert ivf is not None and ivf.nlist == 2 and ivf.is_trained
+        assert writer._index.ntotal == 80
+        writer.close()
+
+        reader = _open(path, index_type="ivf", read_only=True)
+        hits = reader.search(HashingEmbedder().embed(texts[5]), top_k=1)
+        assert hits[0].text == texts[5]
+
+    def test_deleted_records_are_not_returned(self, tmp_path):
+        path = tmp_path / "delete.faiss"
+        writer = _open(path, compact_ratio=1.0)
+        writer.upsert(_records(TEXTS[:2], source="old") + _records(TEXTS[2:], source="new"))
+        writer.delete({"source": "old"})
+
+        hits = writer.search(HashingEmbedder().embed(TEXTS[0]), top_k=4)
+        assert [hit.metadata["source"] for hit in hits] == ["new", "new"]
+        writer.close()
+
+        reader = _open(path, read_only=True)
+        assert TEXTS[0] not in [hit.text for hit in reader.search(HashingEmbedder().embed(TEXTS[0]), top_k=2)]
+        assert len(reader.search(HashingEmbedder().embed(TEXTS[0]), top_k=2)) == 2
+
+    def test_tombstones_are_compacted_past_threshold(self, tmp_path):
+        path = tmp_path / "compact.faiss"
+        writer = _open(path, compact_ratio=0.4)
+        writer.upsert(_records(TEXTS[:1], source="a") + _records(TEXTS[1:2], source="b") + _records(TEXTS[2:], source="c"))
+
+        writer.delete({"source": "a"})
+        assert writer._index.ntotal == 4 and writer._deleted_count() == 1
+
+        writer.delete({"source": "b"})
+        assert writer._index.ntotal == 2 and writer._deleted_count() == 0
+        hits = writer.search(HashingEmbedder().embed(TEXTS[3]), top_k=4)
+        assert [hit.text for hit in hits][0] == TEXTS[3]
+        assert {hit.metadata["source"] for hit in hits} == {"c"}
+
+        reader = _open(path, read_only=True)
+        assert reader._index.ntotal == 2
+        assert reader.search(HashingEmbedder().embed(TEXTS[2]), top_k=1)[0].text == TEXTS[2]
+
+    def test_in_memory_compaction(self):
+        backend = FaissBackend(compact_ratio=0.1)
+        backend.connect()
+        backend.upsert(_records(TEXTS[:2], source="old") + _records(TEXTS[2:], source="new"))
+
+        backend.delete({"source": "old"})
+
+        assert backend._index.ntotal == 2
+        assert [hit.text for hit in backend.search(HashingEmbedder().embed(TEXTS[2]), top_k=4)][0] == TEXTS[2]
+
+    def test_index_saved_before_compaction_is_rebuilt(self, tmp_path):
+        path = tmp_path / "stale.faiss"
+        writer = _open(path, compact_ratio=1.0)
+        writer.upsert(_records(TEXTS[:2], source="old") + _records(TEXTS[2:], source="new"))
+        writer.save()
+        writer.delete({"source": "old"})
+        writer._store.compact()  # records renumbered, index file still has four vectors
+
+        reader = _open(path, read_only=True)
+
+        assert reader._index.ntotal == 2
+        assert reader.search(HashingEmbedder().embed(TEXTS[3]), top_k=1)[0].text == TEXTS[3]
+
+    def test_ivf_nprobe(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("FAISS_NPROBE", "3")
+        writer = _open(tmp_path / "ivf.faiss", index_type="ivf", nlist=4)
+        writer.upsert(_records([f"account note {i} for region {i % 7}" for i in range(160)]))
+
+        assert writer._faiss.try_extract_index_ivf(writer._index).nprobe == 3
+        writer.close()
+
+        reader = _open(tmp_path / "ivf.faiss", index_type="ivf", read_only=True, nprobe=2)
+        assert reader._faiss.try_extract_index_ivf(reader._index).nprobe == 2
+
+    def test_env_configuration(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("FAISS_INDEX_PATH", str(tmp_path / "env.faiss"))
+        monkeypatch.setenv("FAISS_INDEX_TYPE", "hnsw")
+
+        backend = FaissBackend()
+
+        assert backend.index_path == tmp_path / "env.faiss"
+        assert backend.index_type == "hnsw"
+        assert backend.read_only is False
+        with pytest.raises(ValueError):
+            FaissBackend(index_type="pq")
@@ -0,0 +1,230 @@
+"""
+tests/unit/test_mcp_stdio_multiplexing.py
+
+Tests for request-id multiplexing over SubprocessStdioRunner and the warm
+runner pool in LifecycleManager.
+"""
+
+import asyncio
+import sys
+import textwrap
+
+import pytest
+
+from cuga.mcp.config import MCPConfig, PoolConfig
+from cuga.mcp.errors import CallTimeout
+from cuga.mcp.interfaces import ToolRequest, ToolSpec
+from cuga.mcp.lifecycle import LifecycleManager
+from cuga.mcp.registry import MCPRegistry
+from cuga.mcp.runners.subprocess_stdio import SubprocessStdioRunner
+
+# Answers "sleep" requests from worker threads, so responses come back out of order
+CONCURRENT_SERVER = textwrap.dedent(
+    """
+    import json, os, sys, threading, time
+
+    lock = threading.Lock()
+
+    def reply(message):
+        with lock:
+            sys.stdout.write(json.dumps(message) + "\\n")
+            sys.stdout.flush()
+
+    def handle(request):
+        params = request.get("params", {})
+        time.sleep(params.get("delay", 0))
+        reply({"id": request.get("id"), "result": {"echo": params.get("value"), "pid": os.getpid()}})
+
+    for line in sys.stdin:
+        request = json.loads(line)
+        if request["method"] == "health":
+            reply({"result": "ok"})
+        else:
+            threading.Thread(target=handle, args=(request,)).start()
+    """
+)
+
+# Answers strictly in order and never echoes ids
+IN_ORDER_SERVER = textwrap.dedent(
+    """
+    import json, sys
+
+    for line in sys.stdin:
+        request = json.loads(line)
+        sys.stdout.write(json.dumps({"result": request.get("params", {}).get("value")}) + "\\n")
+        sys.stdout.flush()
+    """
+)
+
+# Answers in order without ids, interleaving garbage lines and notifications
+NOISY_SERVER = textwrap.dedent(
+    """
+    import json, sys, time
+
+    def write(message):
+        sys.stdout.write(message + "\\n")
+        sys.stdout.flush()
+
+    for line in sys.stdin:
+        request = json.loads(line)
+        params = request.get("params", {})
+        if request["method"] == "health":
+            write(json.dumps({"result": "ok"}))
+            continue
+        time.sleep(params.get("delay", 0))
+        write("not json")
+        write(json.dumps({"method": "notifications/progress", "params": {"progress": 1}}))
+        write(json.dumps({"result": params.get("value")}))
+    """
+)
+
+
+@pytest.fixture
+def server_script(tmp_path):
+    def _write(source):
+        path = tmp_path / "server.py"
+        path.write_text(source)
+        return str(path)
+
+    return _write
+
+
+def _runner(script, **kwargs):
+    return SubprocessStdioRunner(command=sys.executable, args=[script], **kwargs)
+
+
+class TestStdioMultiplexing:
+    """Test concurrent requests over one runner process."""
+
+    @pytest.mark.asyncio
+    async def test_out_of_order_responses_reach_their_callers(self, server_script):
+        runner = _runner(server_script(CONCURRENT_SERVER))
+        await runner.start()
+        try:
+            delays = [0.3, 0.1, 0.2, 0.0]
+            responses = await asyncio.gather(
+                *(
+                    runner.request({"method": "sleep", "params": {"delay": d, "value": i}}, timeout=5)
+                    for i, d in enumerate(delays)
+                )
+            )
+        finally:
+            await runner.stop()
+
+        assert [response["result"]["echo"] for response in responses] == [0, 1, 2, 3]
+        assert runner.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_pipelines_requests_to_in_order_server(self, server_script):
+        runner = _runner(server_script(IN_ORDER_SERVER))
+        await runner.start()
+        try:
+            responses = await asyncio.gather(
+                *(runner.request({"method": "echo", "params": {"value": i}}, timeout=5) for i in range(20))
+            )
+        finally:
+            await runner.stop()
+
+        assert [response["result"] for response in responses] == list(range(20))
+
+    @pytest.mark.asyncio
+    async def test_notifications_and_invalid_lines_are_not_responses(self, server_script):
+        runner = _runner(server_script(NOISY_SERVER))
+        await runner.start()
+        try:
+            first = await runner.request({"method": "echo", "params": {"value": 1}}, timeout=5)
+            second = await runner.request({"method": "echo", "params": {"value": 2}}, timeout=5)
+        finally:
+            await runner.stop()
+
+        assert (first, second) == ({"result": 1}, {"result": 2})
+
+    @pytest.mark.asyncio
+    async def test_late_reply_to_timed_out_request_is_dropped(self, server_script):
+        runner = _runner(server_script(NOISY_SERVER))
+        await runner.start()
+        try:
+            with pytest.raises(CallTimeout):
+                await runner.request({"method": "echo", "params": {"value": "late", "delay": 0.3}}, timeout=0.05)
+            assert runner.in_flight == 0
+            response = await runner.request({"method": "echo", "params": {"value": "next"}}, timeout=5)
+        finally:
+            await runner.stop()
+
+        assert response == {"result": "next"}
+
+    @pytest.mark.asyncio
+    async def test_in_flight_limit(self, server_script):
+        runner = _runner(server_script(CONCURRENT_SERVER), max_in_flight=2)
+        await runner.start()
+        peak = 0
+
+        async def watch():
+            nonlocal peak
+            while True:
+                peak = max(peak, runner.in_flight)
+                await asyncio.sleep(0.005)
+
+        watcher = asyncio.create_task(watch())
+        try:
+            await asyncio.gather(
+                *(runner.request({"method": "sleep", "params": {"delay": 0.05}}, timeout=5) for _ in range(6))
+            )
+        finally:
+            watcher.cancel()
+            await runner.stop()
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_process_exit_fails_pending_requests(self, server_script):
+        runner = _runner(server_script(CONCURRENT_SERVER))
+        await runner.start()
+        call = asyncio.create_task(runner.request({"method": "sleep", "params": {"delay": 5}}, timeout=10))
+        await asyncio.sleep(0.1)
+
+        runner.process.kill()
+
+        with pytest.raises(Exception, match="EOF before response"):
+            await call
+        await runner.stop()
+
+
+class TestLifecyclePool:
+    """Test the warm per-alias runner pool."""
+
+    def _manager(self, script, pool=None):
+        spec = ToolSpec(alias="echo", name="echo", command=sys.executable, args=[script], pool=pool)
+        config = MCPConfig(
+            allow_commands=[sys.executable],
+            tools={"echo": spec},
+            pools={"wide": PoolConfig(name="wide", max_active=2, min_idle=2)},
+        )
+        return LifecycleManager(MCPRegistry(config))
+
+    @pytest.mark.asyncio
+    async def test_warm_pool_spreads_calls_across_processes(self, server_script):
+        manager = self._manager(server_script(CONCURRENT_SERVER), pool="wide")
+        request = ToolRequest(method="sleep", params={"delay": 0.1, "value": "x"})
+        try:
+            responses = await asyncio.gather(*(manager.call("echo", request) for _ in range(4)))
+        finally:
+            pool_size = len(manager.pool["echo"])
+            await manager.stop_all()
+
+        assert all(response.ok for response in responses)
+        assert pool_size == 2
+        assert len({response.result["pid"] for response in responses}) == 2
+
+    @pytest.mark.asyncio
+    async def test_single_runner_without_pool_config(self, server_script):
+        manager = self._manager(server_script(CONCURRENT_SERVER))
+        request = ToolRequest(method="sleep", params={"delay": 0.05, "value": 1})
+        try:
+            responses = await asyncio.gather(*(manager.call("echo", request) for _ in range(5)))
+            assert len(manager.pool["echo"]) == 1
+        finally:
+            await manager.stop_all()
+
+        assert [response.result["echo"] for response in responses] == [1] * 5
+        assert manager.pool == {}
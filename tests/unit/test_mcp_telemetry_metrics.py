@@ -0,0 +1,110 @@
+"""
+tests/unit/test_mcp_telemetry_metrics.py
+
+Tests for the bounded cuga.mcp metrics registry: fixed-size labeled
+histograms, per-thread counters and Prometheus/OpenTelemetry export.
+"""
+
+import threading
+
+import pytest
+
+from cuga.mcp.telemetry.metrics import DEFAULT_BUCKETS_MS, Metrics
+
+
+class TestHistogram:
+    """Test fixed-size bucketed histograms."""
+
+    def test_memory_is_bounded(self):
+        registry = Metrics()
+        histogram = registry.histogram("mcp.latency_ms", {"alias": "echo"})
+
+        for value in range(10_000):
+            histogram.observe(value % 200)
+
+        assert len(histogram.counts) == len(DEFAULT_BUCKETS_MS) + 1
+        assert histogram.count == 10_000
+        assert histogram.buckets()[-1][1] == 10_000
+
+    def test_percentiles_interpolate_within_buckets(self):
+        histogram = Metrics().histogram("mcp.latency_ms")
+        for _ in range(90):
+            histogram.observe(3.0)
+        for _ in range(10):
+            histogram.observe(400.0)
+
+        p50, p99 = histogram.percentiles([50, 99])
+
+        assert 2.5 <= p50 <= 5.0
+        assert 250.0 <= p99 <= 500.0
+        assert Metrics().histogram("empty").percentile(95) == 0.0
+
+    def test_labels_separate_series(self):
+        registry = Metrics()
+
+        registry.histogram("mcp.latency_ms", {"alias": "a"}).observe(1)
+        registry.histogram("mcp.latency_ms", {"alias": "b"}).observe(1)
+
+        assert registry.histogram("mcp.latency_ms", {"alias": "a"}).count == 1
+        assert len(registry.histograms) == 2
+
+
+class TestCounter:
+    """Test per-thread sharded counters."""
+
+    def test_concurrent_increments_are_not_lost(self):
+        counter = Metrics().counter("mcp.calls", {"alias": "echo"})
+
+        def work():
+            for _ in range(10_000):
+                counter.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counter.count == 40_000
+
+
+class TestExport:
+    """Test Prometheus and OpenTelemetry export."""
+
+    def test_prometheus_text(self):
+        registry = Metrics()
+        registry.counter("mcp.calls", {"alias": "echo"}).inc(3)
+        registry.histogram("mcp.latency_ms", {"alias": 'we"ird'}).observe(7.0)
+
+        text = registry.to_prometheus()
+
+        assert "# TYPE mcp_calls_total counter" in text
+        assert 'mcp_calls_total{alias="echo"} 3' in text
+        assert "# TYPE mcp_latency_ms histogram" in text
+        assert 'mcp_latency_ms_bucket{alias="we\\"ird",le="10"} 1' in text
+        assert 'mcp_latency_ms_bucket{alias="we\\"ird",le="+Inf"} 1' in text
+        assert 'mcp_latency_ms_count{alias="we\\"ird"} 1' in text
+        assert Metrics().to_prometheus() == ""
+
+    def test_register_otel_observes_series(self):
+        pytest.importorskip("opentelemetry.metrics")
+        instruments = {}
+
+        class FakeMeter:
+            def create_observable_counter(self, name, callbacks):
+                instruments[name] = callbacks[0]
+
+            def create_observable_gauge(self, name, callbacks):
+                instruments[name] = callbacks[0]
+
+        registry = Metrics()
+        registry.counter("mcp.calls", {"alias": "echo"}).inc(2)
+
+        assert registry.register_otel(FakeMeter()) is True
+        registry.histogram("mcp.latency_ms", {"alias": "echo"}).observe(12.0)
+
+        calls = instruments["mcp.calls"](None)
+        assert [(point.value, dict(point.attributes)) for point in calls] == [(2, {"alias": "echo"})]
+        assert instruments["mcp.latency_ms.count"](None)[0].value == 1
+        quantiles = instruments["mcp.latency_ms.quantiles"](None)
+        assert {point.attributes["quantile"] for point in quantiles} == {"p50", "p95", "p99"}
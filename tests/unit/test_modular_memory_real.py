@@ -305,6 +305,62 @@ class TestVectorMemorySearch:
         for i in range(len(results) - 1):
             assert results[i].score >= results[i + 1].score
 
+    def test_local_search_ties_keep_insertion_order(self):
+        """Equal scores should be returned in insertion order, even at the top_k cut."""
+        memory = VectorMemory()
+        for i in range(6):
+            memory.remember(f"Sales note {i}")
+        memory.remember("Sales pipeline note")
+
+        results = memory.search(query="sales pipeline", top_k=3)
+
+        assert [hit.text for hit in results] == ["Sales pipeline note", "Sales note 0", "Sales note 1"]
+        assert results[0].score == 1.0
+        assert results[1].score == 0.5
+
+    def test_search_batch_matches_single_queries(self):
+        """Batch search should return the same hits as per-query search."""
+        memory = VectorMemory()
+        memory.remember("Python programming language")
+        memory.remember("JavaScript programming language")
+        memory.remember("Docker containerization platform")
+        queries = ["Python programming", "docker", "unknown terms", ""]
+
+        batch = memory.search_batch(queries, top_k=2)
+
+        assert batch == [memory.search(query, top_k=2) for query in queries]
+        assert batch[2] == [] and batch[3] == []
+
+    def test_local_search_sees_records_appended_to_store(self):
+        """Records appended to store directly should still be searchable."""
+        memory = VectorMemory()
+        memory.remember("Python programming")
+        memory.store.append(MemoryRecord(text="Rust programming", metadata={"profile": "default"}))
+
+        results = memory.search(query="rust", top_k=5)
+
+        assert [hit.text for hit in results] == ["Rust programming"]
+
+    def test_local_search_sees_records_replaced_in_store(self):
+        """Replacing a record mid-store (same length, same tail) should reindex."""
+        memory = VectorMemory()
+        memory.remember("Python programming")
+        memory.remember("Go programming")
+        memory.search(query="python", top_k=5)
+        memory.store[0] = MemoryRecord(text="Rust programming", metadata={"profile": "default"})
+
+        assert [hit.text for hit in memory.search(query="rust", top_k=5)] == ["Rust programming"]
+        assert memory.search(query="python", top_k=5) == []
+
+    def test_local_search_with_plain_list_store(self):
+        """A caller-supplied plain list is still kept in sync slot by slot."""
+        store = [MemoryRecord(text="Python programming", metadata={"profile": "default"})]
+        memory = VectorMemory(store=store)
+        memory.search(query="python", top_k=5)
+        store[0] = MemoryRecord(text="Rust programming", metadata={"profile": "default"})
+
+        assert [hit.text for hit in memory.search(query="rust", top_k=5)] == ["Rust programming"]
+
 
 # ============================================================================
 # TestMemoryRecord: MemoryRecord dataclass tests
@@ -392,9 +448,46 @@ class TestHashingEmbedder:
         embedder = HashingEmbedder()
         
         embedding = embedder.embed("Test")
-        
+
         assert len(embedding) == 64
 
+    def test_embedder_matches_legacy_sha256_buckets(self):
+        """Default mode should reproduce first-byte SHA-256 bucketing exactly."""
+        import hashlib
+
+        embedder = HashingEmbedder()
+        text = "Renewal risk for ACME renewal"
+        expected = [0.0] * 64
+        for token in text.lower().split():
+            expected[hashlib.sha256(token.encode("utf-8")).digest()[0] % 64] += 1.0
+        norm = sum(v * v for v in expected) ** 0.5
+
+        assert embedder.embed(text) == [v / norm for v in expected]
+
+    def test_embed_batch_matches_embed(self):
+        """embed_batch should return a float32 matrix with the same rows as embed()."""
+        np = pytest.importorskip("numpy")
+        embedder = HashingEmbedder()
+        texts = ["Python programming", "", "Docker containerization platform"]
+
+        matrix = embedder.embed_batch(texts)
+
+        assert matrix.shape == (3, 64)
+        assert matrix.dtype == np.float32
+        assert np.allclose(matrix, np.array([embedder.embed(t) for t in texts], dtype=np.float32))
+        assert embedder.embed_batch([]).shape == (0, 64)
+
+    def test_embedder_configurable_dim_and_hash(self):
+        """Dimension and non-cryptographic hash should be configurable."""
+        embedder = HashingEmbedder(dim=512, hash_name="crc32", cache_size=8)
+
+        embedding = embedder.embed("territory plan for enterprise accounts")
+
+        assert len(embedding) == 512
+        assert abs(sum(v * v for v in embedding) ** 0.5 - 1.0) < 1e-9
+        with pytest.raises(ValueError):
+            HashingEmbedder(hash_name="md5")
+
 
 # ============================================================================
 # TestProfileIsolation: Profile isolation tests (real implementation)
@@ -0,0 +1,205 @@
+"""
+tests/unit/test_modular_rag_ingest.py
+
+Tests for the streaming RagLoader ingest path: overlapping chunking, batched
+upserts, size/mtime/content-hash manifest skips and progress reporting.
+"""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from cuga.modular.memory import VectorMemory, _BACKEND_REGISTRY
+from cuga.modular.rag import IngestStats, RagLoader, chunk_text
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Three small documents plus a directory that must be ignored."""
+    (tmp_path / "a.md").write_text("alpha beta gamma delta epsilon")
+    (tmp_path / "b.md").write_text("renewal risk for enterprise accounts")
+    (tmp_path / "c.md").write_text("")
+    (tmp_path / "nested").mkdir()
+    return sorted(tmp_path.iterdir())
+
+
+class TestChunkText:
+    """Test word-window chunking."""
+
+    def test_chunks_overlap(self):
+        chunks = chunk_text("one two three four five six seven", chunk_size=3, overlap=1)
+
+        assert chunks == ["one two three", "three four five", "five six seven"]
+
+    def test_short_and_empty_text(self):
+        assert chunk_text("one two", chunk_size=3, overlap=1) == ["one two"]
+        assert chunk_text("   ", chunk_size=3, overlap=1) == []
+
+    def test_invalid_overlap_raises(self):
+        with pytest.raises(ValueError):
+            chunk_text("text", chunk_size=2, overlap=2)
+
+
+class TestIngestStream:
+    """Test RagLoader.ingest_stream."""
+
+    def test_ingests_chunks_with_metadata(self, corpus):
+        loader = RagLoader(profile="sales")
+
+        stats = loader.ingest_stream(corpus, chunk_size=3, overlap=1)
+
+        assert stats.files_seen == 3
+        assert stats.files_ingested == 3
+        assert stats.chunks == len(loader.memory.store) == 4
+        first = loader.memory.store[0]
+        assert first.text == "alpha beta gamma"
+        assert first.metadata == {"profile": "sales", "path": str(corpus[0]), "chunk": "0"}
+        assert loader.memory.search("enterprise renewal", top_k=1)[0].text.startswith("renewal")
+
+    def test_manifest_skips_unchanged_files(self, corpus, tmp_path):
+        manifest = tmp_path / "manifest.json"
+        RagLoader().ingest_stream(corpus, manifest_path=manifest)
+        corpus[1].write_text("changed content")
+
+        loader = RagLoader()
+        stats = loader.ingest_stream(corpus, manifest_path=manifest)
+
+        assert stats.files_skipped == 2
+        assert stats.files_ingested == 1
+        assert [record.text for record in loader.memory.store] == ["changed content"]
+        assert set(json.loads(manifest.read_text())) == {str(path) for path in corpus[:3]}
+
+    def test_manifest_skips_unchanged_files_without_reading_them(self, corpus, tmp_path):
+        manifest = tmp_path / "manifest.json"
+        RagLoader().ingest_stream(corpus, manifest_path=manifest)
+
+        with patch.object(Path, "read_bytes", side_effect=AssertionError("unchanged file was read")):
+            stats = RagLoader().ingest_stream(corpus, manifest_path=manifest)
+
+        assert stats.files_skipped == 3
+        assert stats.bytes_read == 0
+
+    def test_touched_file_is_hashed_once_and_manifest_refreshed(self, corpus, tmp_path):
+        manifest = tmp_path / "manifest.json"
+        RagLoader().ingest_stream(corpus, manifest_path=manifest)
+        stat = corpus[0].stat()
+        os.utime(corpus[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        loader = RagLoader()
+        stats = loader.ingest_stream(corpus, manifest_path=manifest)
+
+        assert stats.files_skipped == 3
+        assert loader.memory.store == []
+        assert json.loads(manifest.read_text())[str(corpus[0])][:2] == [stat.st_size, stat.st_mtime_ns + 10**9]
+
+    def test_digest_only_manifest_is_upgraded(self, corpus, tmp_path):
+        manifest = tmp_path / "manifest.json"
+        RagLoader().ingest_stream(corpus, manifest_path=manifest)
+        legacy = {key: entry[2] for key, entry in json.loads(manifest.read_text()).items()}
+        manifest.write_text(json.dumps(legacy))
+
+        stats = RagLoader().ingest_stream(corpus, manifest_path=manifest)
+
+        assert stats.files_skipped == 3
+        assert all(isinstance(entry, list) for entry in json.loads(manifest.read_text()).values())
+
+    def test_deleted_files_are_pruned_and_forgotten(self, corpus, tmp_path):
+        manifest = tmp_path / "manifest.json"
+        loader = RagLoader()
+        loader.ingest_stream(corpus, manifest_path=manifest)
+        corpus[1].unlink()
+
+        stats = loader.ingest_stream(corpus, manifest_path=manifest)
+
+        assert stats.files_removed == 1
+        assert str(corpus[1]) not in json.loads(manifest.read_text())
+        assert all(record.metadata["path"] != str(corpus[1]) for record in loader.memory.store)
+
+    def test_changed_file_replaces_its_previous_chunks(self, corpus, tmp_path):
+        manifest = tmp_path / "manifest.json"
+        loader = RagLoader()
+        loader.ingest_stream(corpus, chunk_size=3, overlap=1, manifest_path=manifest)
+        corpus[1].write_text("changed content")
+
+        loader.ingest_stream(corpus, chunk_size=3, overlap=1, manifest_path=manifest)
+
+        texts = [record.text for record in loader.memory.store if record.metadata["path"] == str(corpus[1])]
+        assert texts == ["changed content"]
+        assert loader.memory.search("enterprise renewal", top_k=1) == []
+
+    def test_manifest_only_records_upserted_files(self, corpus, tmp_path):
+        manifest = tmp_path / "manifest.json"
+        backend = Mock()
+        backend.upsert.side_effect = [None, None, RuntimeError("store unavailable")]
+        with patch.dict(_BACKEND_REGISTRY, {"faiss": Mock(return_value=backend)}):
+            loader = RagLoader(backend="faiss")
+            with pytest.raises(RuntimeError):
+                loader.ingest_stream(corpus, chunk_size=2, overlap=0, batch_size=2, manifest_path=manifest)
+
+        assert set(json.loads(manifest.read_text())) == {str(corpus[0])}
+
+    def test_batches_backend_upserts_and_reports_progress(self, corpus):
+        backend = Mock()
+        with patch.dict(_BACKEND_REGISTRY, {"faiss": Mock(return_value=backend)}):
+            loader = RagLoader(backend="faiss")
+            snapshots = []
+
+            stats = loader.ingest_stream(
+                corpus, chunk_size=2, overlap=0, batch_size=2, progress=lambda s: snapshots.append(s.chunks)
+            )
+
+        assert stats.chunks == 6
+        assert [len(call.args[0]) for call in backend.upsert.call_args_list] == [2, 2, 2]
+        assert snapshots == [2, 4, 6]
+        assert all(len(rec.embedding) == 64 for call in backend.upsert.call_args_list for rec in call.args[0])
+        assert stats.embed_seconds > 0
+        assert set(stats.throughput()) == {
+            "read_bytes_per_s",
+            "embed_chunks_per_s",
+            "upsert_chunks_per_s",
+            "files_per_s",
+        }
+
+    def test_saves_backend_index_after_ingest(self, corpus, tmp_path, monkeypatch):
+        monkeypatch.setenv("FAISS_INDEX_PATH", str(tmp_path / "rag.faiss"))
+        pytest.importorskip("faiss")
+
+        RagLoader(backend="faiss").ingest_stream(corpus, chunk_size=3, overlap=1)
+
+        assert (tmp_path / "rag.faiss").exists()
+
+    def test_process_pool_matches_inline(self, corpus):
+        inline = RagLoader()
+        pooled = RagLoader()
+
+        inline.ingest_stream(corpus, chunk_size=3, overlap=1)
+        pooled.ingest_stream(corpus, chunk_size=3, overlap=1, workers=2)
+
+        assert pooled.memory.store == inline.memory.store
+
+
+class TestRememberMany:
+    """Test VectorMemory.remember_many."""
+
+    def test_single_upsert_with_precomputed_embeddings(self):
+        backend = Mock()
+        memory = VectorMemory(backend_name="qdrant")
+        memory.backend = backend
+
+        records = memory.remember_many(["a", "b"], [{"k": "1"}, None], embeddings=[[1.0], [2.0]])
+
+        backend.upsert.assert_called_once()
+        upserted = backend.upsert.call_args.args[0]
+        assert [rec.embedding for rec in upserted] == [[1.0], [2.0]]
+        assert [rec.metadata for rec in records] == [{"profile": "default", "k": "1"}, {"profile": "default"}]
+
+    def test_length_mismatch_raises(self):
+        with pytest.raises(ValueError):
+            VectorMemory().remember_many(["a"], embeddings=[])
+
+
+def test_ingest_stats_throughput_handles_zero_time():
+    assert IngestStats().throughput()["embed_chunks_per_s"] == 0.0
@@ -0,0 +1,152 @@
+"""
+tests/unit/test_results_store.py
+
+Tests for the SQLite-backed experiment results store: dict semantics,
+indexed lookups, statistics and incremental results.json/results.csv export.
+"""
+
+import csv
+import json
+
+import pytest
+
+from cuga.backend.activity_tracker.results_store import RESULT_COLUMNS, ResultsStore
+
+
+def _task(site="crm", score=1.0, exception=False, agent_v="v1", **extra):
+    return {"site": site, "intent": "do it", "score": score, "exception": exception, "agent_v": agent_v, **extra}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ResultsStore(str(tmp_path / "results.db"))
+    yield store
+    store.close()
+
+
+class TestMapping:
+    """Test dict-compatible behaviour."""
+
+    def test_round_trip_and_insertion_order(self, store):
+        store["b"] = _task(extra_field={"nested": [1, 2]})
+        store["a"] = _task(score=0)
+        store["b"] = _task(score=0.5)
+
+        assert list(store) == ["b", "a"]
+        assert store["b"]["score"] == 0.5
+        assert store["a"]["exception"] is False
+        assert "a" in store and "missing" not in store
+        assert len(store) == 2
+        assert store.get("missing") is None
+
+    def test_delete_and_clear(self, store):
+        store["a"] = _task()
+        store["b"] = _task()
+
+        del store["a"]
+        with pytest.raises(KeyError):
+            del store["a"]
+        assert list(store) == ["b"]
+
+        store.clear()
+        assert len(store) == 0
+
+    def test_items_streams_past_fetch_size(self):
+        store = ResultsStore()
+        for index in range(1200):
+            store[f"t{index}"] = _task()
+
+        assert [task_id for task_id, _ in store.items()] == [f"t{index}" for index in range(1200)]
+
+
+class TestQueries:
+    """Test indexed lookups and statistics."""
+
+    def test_find_by_indexed_fields(self, store):
+        store["a"] = _task(site="crm", score=1.0, exception=False, agent_v="v1")
+        store["b"] = _task(site="erp", score=0.0, exception=True, agent_v="v2")
+        store["c"] = _task(site="crm", score=0.0, exception=None, agent_v="v1")
+
+        assert list(store.find("site", "crm")) == ["a", "c"]
+        assert list(store.find("score", 0.0)) == ["b", "c"]
+        assert list(store.find("exception", True)) == ["b"]
+        assert list(store.find("exception", False)) == ["a"]
+        assert list(store.find("agent_v", "v2")) == ["b"]
+        with pytest.raises(ValueError):
+            store.find("intent", "do it")
+
+    def test_statistics(self, store):
+        assert store.statistics() == {"total_tasks": 0}
+
+        store["a"] = _task(site="crm", score=1, exception=False)
+        store["b"] = _task(site="erp", score=0, exception=True, agent_v="v2")
+        store["c"] = _task(site="", score=None, exception=None)
+
+        assert store.statistics() == {
+            "total_tasks": 3,
+            "tasks_with_exceptions": 1,
+            "tasks_without_exceptions": 1,
+            "unique_sites": 2,
+            "unique_agent_versions": 2,
+            "average_score": 0.5,
+            "min_score": 0,
+            "max_score": 1,
+        }
+
+
+class TestExport:
+    """Test results.json and results.csv export."""
+
+    def test_appended_json_matches_full_dump(self, store, tmp_path):
+        path = tmp_path / "results.json"
+        path.write_text("{}")
+        for task_id in ("a", "b", "c"):
+            store[task_id] = _task(agent_answer=f"answer ü {task_id}")
+            store.append_json(str(path), task_id)
+
+        expected = json.dumps(dict(store.items()), indent=2, ensure_ascii=False)
+        assert path.read_text(encoding="utf-8") == expected
+
+        store["a"] = _task(score=0.0)
+        store.write_json(str(path))
+        assert json.loads(path.read_text(encoding="utf-8"))["a"]["score"] == 0.0
+
+    def test_empty_json_export(self, store, tmp_path):
+        path = tmp_path / "results.json"
+        store.write_json(str(path))
+        assert path.read_text() == "{}"
+
+    def test_csv_append_and_rewrite(self, store, tmp_path):
+        path = tmp_path / "results.csv"
+        path.write_text("task_id,site\n")
+        store["a"] = _task(num_steps=3)
+        store.append_csv(str(path), "a")
+        store["b"] = _task(exception=None)
+        store.append_csv(str(path), "b")
+
+        with open(path, newline="") as f:
+            rows = list(csv.DictReader(f))
+
+        assert list(rows[0]) == RESULT_COLUMNS
+        assert [row["task_id"] for row in rows] == ["a", "b"]
+        assert rows[0]["num_steps"] == "3"
+        assert rows[1]["exception"] == ""
+
+
+class TestIterExperiment:
+    """Test streaming the results of an experiment folder."""
+
+    def test_prefers_database_and_falls_back_to_json(self, tmp_path):
+        db_folder = tmp_path / "with_db"
+        db_folder.mkdir()
+        store = ResultsStore(str(db_folder / "results.db"))
+        store["a"] = _task()
+        store.close()
+        json_folder = tmp_path / "legacy"
+        json_folder.mkdir()
+        (json_folder / "results.json").write_text(json.dumps({"b": _task()}))
+
+        assert [task_id for task_id, _ in ResultsStore.iter_experiment(str(db_folder))] == ["a"]
+        assert [task_id for task_id, _ in ResultsStore.iter_experiment(str(json_folder))] == ["b"]
+        with pytest.raises(FileNotFoundError):
+            list(ResultsStore.iter_experiment(str(tmp_path / "missing")))
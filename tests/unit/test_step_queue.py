@@ -0,0 +1,155 @@
+"""
+tests/unit/test_step_queue.py
+
+Tests for background memory step ingestion: per-run batching, ordering of
+run ends after their steps, retries and the durable SQLite journal.
+"""
+
+import sqlite3
+import threading
+
+from cuga.backend.memory.step_queue import StepIngestionQueue
+
+DEAD_PID = 2**22 + 12345
+
+
+class RecordingClient:
+    """Memory client double recording the requests it receives."""
+
+    def __init__(self, failures=0, unparseable=()):
+        self.calls = []
+        self.attempted_ids = []
+        self.failures = failures
+        self.unparseable = set(unparseable)
+        self.release = threading.Event()
+        self.release.set()
+
+    def add_steps(self, namespace_id, run_id, steps):
+        self.release.wait()
+        self.attempted_ids.append([s["step_id"] for s in steps])
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("memory service unavailable")
+        self.calls.append(("add_steps", run_id, [s["step"]["n"] for s in steps]))
+        return [None if s["step"]["n"] in self.unparseable else str(s["step"]["n"]) for s in steps]
+
+    def end_run(self, namespace_id, run_id):
+        self.calls.append(("end_run", run_id))
+
+
+def _queue(tmp_path, client, **kwargs):
+    kwargs.setdefault("retry_delay_s", 0.01)
+    return StepIngestionQueue(client, db_path=str(tmp_path / "steps.db"), **kwargs)
+
+
+class TestStepIngestionQueue:
+    """Test batching and ordering of queued steps."""
+
+    def test_steps_are_batched_per_run_and_runs_end_last(self, tmp_path):
+        client = RecordingClient()
+        client.release.clear()
+        queue = _queue(tmp_path, client, batch_size=3)
+
+        for n in range(4):
+            queue.enqueue_step("ns", "run-a", {"n": n}, "task")
+        queue.enqueue_end_run("ns", "run-a")
+        queue.enqueue_step("ns", "run-b", {"n": 10}, "task")
+        client.release.set()
+
+        assert queue.flush(timeout=5)
+        assert client.calls[-2:] == [("end_run", "run-a"), ("add_steps", "run-b", [10])]
+        sent = [n for call in client.calls if call[0] == "add_steps" and call[1] == "run-a" for n in call[2]]
+        assert sent == [0, 1, 2, 3]
+        assert all(len(call[2]) <= 3 for call in client.calls if call[0] == "add_steps")
+
+    def test_enqueue_does_not_wait_for_service(self, tmp_path):
+        client = RecordingClient()
+        client.release.clear()
+        queue = _queue(tmp_path, client)
+
+        queue.enqueue_step("ns", "run", {"n": 1}, "task")
+
+        assert queue.stats()["pending_steps"] == 1
+        client.release.set()
+        assert queue.flush(timeout=5)
+        assert queue.stats()["pending"] == 0
+
+    def test_failed_batch_is_retried(self, tmp_path):
+        client = RecordingClient(failures=2)
+        queue = _queue(tmp_path, client, max_attempts=5)
+
+        queue.enqueue_step("ns", "run", {"n": 1}, "task")
+
+        assert queue.flush(timeout=5)
+        assert client.calls == [("add_steps", "run", [1])]
+        stats = queue.stats()
+        assert stats["retries"] == 2
+        assert stats["sent_steps"] == 1
+        assert stats["last_error"] == "memory service unavailable"
+
+    def test_retried_batch_keeps_step_ids(self, tmp_path):
+        client = RecordingClient(failures=1)
+        queue = _queue(tmp_path, client)
+
+        queue.enqueue_step("ns", "run", {"n": 1}, "task")
+        queue.enqueue_step("ns", "run", {"n": 2}, "task")
+
+        assert queue.flush(timeout=5)
+        first, retry = client.attempted_ids
+        assert first == retry
+        assert len(set(first)) == 2
+
+    def test_unsummarized_steps_do_not_fail_the_batch(self, tmp_path):
+        client = RecordingClient(unparseable={2})
+        queue = _queue(tmp_path, client)
+
+        for n in range(1, 4):
+            queue.enqueue_step("ns", "run", {"n": n}, "task")
+
+        assert queue.flush(timeout=5)
+        stats = queue.stats()
+        assert stats["retries"] == 0
+        assert stats["sent_steps"] == 2
+        assert stats["failed_steps"] == 1
+
+    def test_batch_is_dropped_after_max_attempts(self, tmp_path):
+        client = RecordingClient(failures=10)
+        queue = _queue(tmp_path, client, max_attempts=2)
+
+        queue.enqueue_step("ns", "run", {"n": 1}, "task")
+        queue.enqueue_end_run("ns", "run")
+
+        assert queue.flush(timeout=5)
+        assert client.calls == [("end_run", "run")]
+        assert queue.stats()["failed_steps"] == 1
+
+
+class TestJournal:
+    """Test that unsent steps survive the process that queued them."""
+
+    def test_orphaned_entries_are_resumed(self, tmp_path):
+        client = RecordingClient()
+        client.release.clear()
+        _queue(tmp_path, client).enqueue_step("ns", "run", {"n": 7}, "task")
+        with sqlite3.connect(str(tmp_path / "steps.db")) as conn:
+            conn.execute("UPDATE pending SET owner = ?", (DEAD_PID,))
+
+        other = RecordingClient()
+        queue = _queue(tmp_path, other)
+
+        assert queue.flush(timeout=5)
+        assert other.calls == [("add_steps", "run", [7])]
+        client.release.set()
+
+    def test_entries_of_live_process_are_left_alone(self, tmp_path):
+        client = RecordingClient()
+        client.release.clear()
+        first = _queue(tmp_path, client)
+        first.enqueue_step("ns", "run", {"n": 1}, "task")
+        with sqlite3.connect(str(tmp_path / "steps.db")) as conn:
+            conn.execute("UPDATE pending SET owner = 1")
+
+        second = _queue(tmp_path, RecordingClient())
+
+        assert second.stats()["pending"] == 0
+        client.release.set()
@@ -0,0 +1,143 @@
+"""
+tests/unit/test_trajectory_writer.py
+
+Tests for the append-only trajectory log behind ActivityTracker: segmented
+JSONL records, out-of-line blobs and compaction back to the legacy JSON.
+"""
+
+import json
+import os
+
+import pytest
+
+from cuga.backend.activity_tracker.trajectory_writer import (
+    BLOB_PREFIX,
+    TrajectoryWriter,
+    log_dir,
+    read_trajectory,
+)
+
+HEADER = {"intent": "find leads", "dataset_name": "", "actions_count": 0, "task_id": "t1", "eval": None, "score": 0.0}
+
+
+def _step(name, image=""):
+    return {"name": name, "data": "{}", "prompts": [], "image_before": image}
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "t1.json")
+
+
+class TestTrajectoryLog:
+    """Test appending and reading the segmented log."""
+
+    def test_steps_append_without_rewriting(self, path):
+        writer = TrajectoryWriter()
+        for index in range(3):
+            writer.append_step(path, HEADER, _step(f"step{index}"))
+        writer.flush()
+
+        segments = [name for name in os.listdir(log_dir(path)) if name.endswith(".jsonl")]
+        document = read_trajectory(path)
+
+        assert len(segments) == 1
+        assert not os.path.exists(path)
+        assert [step["name"] for step in document["steps"]] == ["step0", "step1", "step2"]
+        assert document["intent"] == "find leads"
+
+    def test_segments_rotate(self, path):
+        writer = TrajectoryWriter(segment_max_bytes=200)
+        for index in range(5):
+            writer.append_step(path, HEADER, _step(f"step{index}"), wait=True)
+
+        segments = [name for name in os.listdir(log_dir(path)) if name.endswith(".jsonl")]
+
+        assert len(segments) > 1
+        assert len(read_trajectory(path)["steps"]) == 5
+
+    def test_large_images_are_stored_once_by_hash(self, path):
+        writer = TrajectoryWriter(blob_min_chars=100)
+        image = "data:image/png;base64," + "A" * 1000
+        writer.append_step(path, HEADER, _step("a", image))
+        writer.append_step(path, HEADER, _step("b", image))
+        writer.flush()
+
+        segment = next(name for name in os.listdir(log_dir(path)) if name.endswith(".jsonl"))
+        with open(os.path.join(log_dir(path), segment)) as f:
+            logged = [json.loads(line) for line in f]
+
+        assert len(os.listdir(os.path.join(log_dir(path), "blobs"))) == 1
+        assert all(r["step"]["image_before"].startswith(BLOB_PREFIX) for r in logged if r["kind"] == "step")
+        assert [step["image_before"] for step in read_trajectory(path)["steps"]] == [image, image]
+
+    def test_fresh_discards_previous_run(self, path):
+        writer = TrajectoryWriter()
+        writer.append_step(path, HEADER, _step("old"))
+        writer.append_step(path, HEADER, _step("new"), fresh=True)
+        writer.flush()
+
+        assert [step["name"] for step in read_trajectory(path)["steps"]] == ["new"]
+
+    def test_owner_header_wins_over_external(self, path):
+        owner, registry = TrajectoryWriter(), TrajectoryWriter()
+        owner.append_step(path, HEADER, _step("agent"))
+        owner.flush()
+        registry.append_step(path, {**HEADER, "intent": ""}, _step("api_call"), external=True, wait=True)
+        owner.append_header(path, {**HEADER, "score": 1.0})
+        owner.flush()
+
+        document = read_trajectory(path)
+
+        assert [step["name"] for step in document["steps"]] == ["agent", "api_call"]
+        assert document["intent"] == "find leads"
+        assert document["score"] == 1.0
+
+
+class TestCompaction:
+    """Test folding the log into the legacy JSON document."""
+
+    def test_compact_writes_legacy_json(self, path):
+        writer = TrajectoryWriter(blob_min_chars=10)
+        writer.append_step(path, HEADER, _step("a", "x" * 50))
+        writer.append_header(path, {**HEADER, "score": 0.5})
+
+        document = writer.compact(path)
+
+        with open(path) as f:
+            on_disk = json.load(f)
+        assert on_disk == document
+        assert list(on_disk) == ["intent", "dataset_name", "actions_count", "task_id", "eval", "steps", "score"]
+        assert on_disk["steps"][0]["image_before"] == "x" * 50
+        assert on_disk["score"] == 0.5
+        assert not os.path.exists(log_dir(path))
+
+    def test_append_after_compaction_continues_trajectory(self, path):
+        writer = TrajectoryWriter()
+        writer.append_step(path, HEADER, _step("a"))
+        writer.compact(path)
+
+        writer.append_step(path, HEADER, _step("b"))
+        writer.compact(path)
+
+        assert [step["name"] for step in read_trajectory(path)["steps"]] == ["a", "b"]
+
+    def test_close_compacts_logs_left_uncompacted(self, path, tmp_path):
+        other = str(tmp_path / "t2.json")
+        writer = TrajectoryWriter()
+        writer.append_step(path, HEADER, _step("a"))
+        writer.compact(path)
+        writer.append_step(path, HEADER, _step("b"))
+        writer.append_step(other, HEADER, _step("c"))
+
+        writer.close()
+
+        assert not os.path.exists(log_dir(path)) and not os.path.exists(log_dir(other))
+        with open(path) as f:
+            assert [step["name"] for step in json.load(f)["steps"]] == ["a", "b"]
+        with open(other) as f:
+            assert [step["name"] for step in json.load(f)["steps"]] == ["c"]
+
+    def test_compact_without_log_is_noop(self, path):
+        assert TrajectoryWriter().compact(path) is None
+        assert read_trajectory(path) is None